@@ -1,6 +1,6 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "4c4b15573d985d4dd22886118300bbb53ad094f5c88dbd6cc5bdcc47703957a9"
+# from-spec-sha256 = "6f6610207b40b252a812eca88281cd1df80c5adf84889a9cab23d5d5671987c7"
 
 
 import json
@@ -15,7 +15,9 @@ from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field, SecretStr
+from ecoscope_workflows_core.checkpoint import CheckpointSettings, new_run_id
 from ecoscope_workflows_core.tasks.results import DashboardJson
+from ecoscope_workflows_core.validation import ValidationMode
 
 from .dispatch import dispatch
 from .formdata import FormData
@@ -25,7 +27,7 @@ from .params import Params
 app = FastAPI(
     title="events",
     debug=True,
-    version="4c4b155",
+    version="6f66102",
 )
 app.add_middleware(
     CORSMiddleware,
@@ -67,6 +69,7 @@ class ResponseModel(BaseModel):
     result: DashboardJson | None = None
     error: str | None = None
     traceback: list[str] | None = None
+    run_id: str | None = None
 
 
 @app.post("/", status_code=200, response_model=ResponseModel)
@@ -75,14 +78,26 @@ def run(
     response: Response,
     # user (http) inputs
     params: Params,
-    execution_mode: Literal["async", "sequential"],
+    execution_mode: Literal["async", "sequential", "threads"],
     mock_io: bool,
     results_url: str,
     data_connections_env_vars: dict[str, SecretStr] | None = None,
     lithops_config: LithopsConfig | None = None,
+    resume_run_id: str | None = None,
+    validation_mode: ValidationMode | None = None,
 ):
     yaml = ruamel.yaml.YAML(typ="safe")
+    # if checkpointing is enabled for this deployment (via `ECOSCOPE_WORKFLOWS_CHECKPOINT_DIR`),
+    # a failed run can be resumed by passing its `run_id` back as the `resume_run_id`.
+    # otherwise, there is no run to resume, so no `run_id` is returned
+    run_id = (resume_run_id or new_run_id()) if CheckpointSettings().dir else None
     update_env = {"ECOSCOPE_WORKFLOWS_RESULTS": results_url}
+    if run_id:
+        update_env["ECOSCOPE_WORKFLOWS_CHECKPOINT_RUN_ID"] = run_id
+    # the depth to which frames are validated between tasks; user parameters are always
+    # validated in full
+    if validation_mode:
+        update_env["ECOSCOPE_WORKFLOWS_VALIDATION_MODE"] = validation_mode
 
     if execution_mode == "async":
         if not lithops_config:
@@ -97,18 +112,24 @@ def run(
         update_env |= {
             k: v.get_secret_value() for k, v in data_connections_env_vars.items()
         }
+    # values which are set for the whole deployment (e.g. the validation mode) are restored,
+    # rather than removed, once this run is done
+    previous_env = {k: os.environ.get(k) for k in update_env}
     os.environ.update(update_env)
     try:
         result = dispatch(execution_mode, mock_io, params)
     except Exception as e:
         response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
         trace = traceback.format_exc().splitlines()
-        return {"error": str(e), "traceback": trace}
+        return {"error": str(e), "traceback": trace, "run_id": run_id}
     finally:
-        for k in update_env:
-            del os.environ[k]
+        for k, v in previous_env.items():
+            if v is None:
+                del os.environ[k]
+            else:
+                os.environ[k] = v
 
-    return {"result": result.model_dump()}
+    return {"result": result.model_dump(), "run_id": run_id}
 
 
 @app.get("/rjsf", status_code=200)
@@ -1,10 +1,27 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "4c4b15573d985d4dd22886118300bbb53ad094f5c88dbd6cc5bdcc47703957a9"
+# from-spec-sha256 = "6f6610207b40b252a812eca88281cd1df80c5adf84889a9cab23d5d5671987c7"
 import json
 import os
 
-from ecoscope_workflows_core.graph import DependsOn, DependsOnSequence, Graph, Node
+from ecoscope_workflows_core.cache import ResultCache
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.dataplane import DataPlane
+from ecoscope_workflows_core.executors import (
+    AsyncExecutorName,
+    BoundedExecutor,
+    SpeculativeExecutor,
+    get_async_executor,
+)
+from ecoscope_workflows_core.graph import (
+    DependsOn,
+    DependsOnSequence,
+    Graph,
+    Node,
+    RunSettings,
+)
+from ecoscope_workflows_core.placement import CostPlacement
+from ecoscope_workflows_core.priority import CriticalPathPriority
 
 from ecoscope_workflows_core.tasks.groupby import set_groupers
 from ecoscope_workflows_core.tasks.filter import set_time_range
@@ -30,8 +47,12 @@ from ecoscope_workflows_core.tasks.results import gather_dashboard
 from ..params import Params
 
 
-def main(params: Params):
+def main(params: Params, executor: AsyncExecutorName = "lithops"):
     params_dict = json.loads(params.model_dump_json(exclude_unset=True))
+    # a single executor session is shared by all nodes, and closed by the graph when done
+    session = SpeculativeExecutor.from_env(
+        BoundedExecutor.from_env(get_async_executor(executor))
+    )
 
     dependencies = {
         "groupers": [],
@@ -85,17 +106,17 @@ def main(params: Params):
 
     nodes = {
         "groupers": Node(
-            async_task=set_groupers.validate().set_executor("lithops"),
+            async_task=set_groupers.validate().set_executor(session),
             partial=params_dict["groupers"],
             method="call",
         ),
         "time_range": Node(
-            async_task=set_time_range.validate().set_executor("lithops"),
+            async_task=set_time_range.validate().set_executor(session),
             partial=params_dict["time_range"],
             method="call",
         ),
         "get_events_data": Node(
-            async_task=get_events.validate().set_executor("lithops"),
+            async_task=get_events.validate().set_executor(session),
             partial={
                 "time_range": DependsOn("time_range"),
             }
@@ -103,7 +124,7 @@ def main(params: Params):
             method="call",
         ),
         "filter_events": Node(
-            async_task=apply_reloc_coord_filter.validate().set_executor("lithops"),
+            async_task=apply_reloc_coord_filter.validate().set_executor(session),
             partial={
                 "df": DependsOn("get_events_data"),
             }
@@ -111,7 +132,7 @@ def main(params: Params):
             method="call",
         ),
         "events_add_temporal_index": Node(
-            async_task=add_temporal_index.validate().set_executor("lithops"),
+            async_task=add_temporal_index.validate().set_executor(session),
             partial={
                 "df": DependsOn("filter_events"),
             }
@@ -119,7 +140,7 @@ def main(params: Params):
             method="call",
         ),
         "events_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial={
                 "df": DependsOn("events_add_temporal_index"),
             }
@@ -127,7 +148,7 @@ def main(params: Params):
             method="call",
         ),
         "events_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial={
                 "geodataframe": DependsOn("events_colormap"),
             }
@@ -135,7 +156,7 @@ def main(params: Params):
             method="call",
         ),
         "events_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial={
                 "geo_layers": DependsOn("events_map_layer"),
             }
@@ -143,7 +164,7 @@ def main(params: Params):
             method="call",
         ),
         "events_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "text": DependsOn("events_ecomap"),
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
@@ -152,7 +173,7 @@ def main(params: Params):
             method="call",
         ),
         "events_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial={
                 "data": DependsOn("events_ecomap_html_url"),
             }
@@ -160,7 +181,7 @@ def main(params: Params):
             method="call",
         ),
         "events_bar_chart": Node(
-            async_task=draw_time_series_bar_chart.validate().set_executor("lithops"),
+            async_task=draw_time_series_bar_chart.validate().set_executor(session),
             partial={
                 "dataframe": DependsOn("events_colormap"),
             }
@@ -168,7 +189,7 @@ def main(params: Params):
             method="call",
         ),
         "events_bar_chart_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "text": DependsOn("events_bar_chart"),
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
@@ -177,9 +198,7 @@ def main(params: Params):
             method="call",
         ),
         "events_bar_chart_widget": Node(
-            async_task=create_plot_widget_single_view.validate().set_executor(
-                "lithops"
-            ),
+            async_task=create_plot_widget_single_view.validate().set_executor(session),
             partial={
                 "data": DependsOn("events_bar_chart_html_url"),
             }
@@ -187,7 +206,7 @@ def main(params: Params):
             method="call",
         ),
         "events_meshgrid": Node(
-            async_task=create_meshgrid.validate().set_executor("lithops"),
+            async_task=create_meshgrid.validate().set_executor(session),
             partial={
                 "aoi": DependsOn("events_add_temporal_index"),
             }
@@ -195,7 +214,7 @@ def main(params: Params):
             method="call",
         ),
         "events_feature_density": Node(
-            async_task=calculate_feature_density.validate().set_executor("lithops"),
+            async_task=calculate_feature_density.validate().set_executor(session),
             partial={
                 "geodataframe": DependsOn("events_add_temporal_index"),
                 "meshgrid": DependsOn("events_meshgrid"),
@@ -204,7 +223,7 @@ def main(params: Params):
             method="call",
         ),
         "fd_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial={
                 "df": DependsOn("events_feature_density"),
             }
@@ -212,7 +231,7 @@ def main(params: Params):
             method="call",
         ),
         "fd_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial={
                 "geodataframe": DependsOn("fd_colormap"),
             }
@@ -220,7 +239,7 @@ def main(params: Params):
             method="call",
         ),
         "fd_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial={
                 "geo_layers": DependsOn("fd_map_layer"),
             }
@@ -228,7 +247,7 @@ def main(params: Params):
             method="call",
         ),
         "fd_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "text": DependsOn("fd_ecomap"),
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
@@ -237,7 +256,7 @@ def main(params: Params):
             method="call",
         ),
         "fd_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial={
                 "data": DependsOn("fd_ecomap_html_url"),
             }
@@ -245,7 +264,7 @@ def main(params: Params):
             method="call",
         ),
         "split_event_groups": Node(
-            async_task=split_groups.validate().set_executor("lithops"),
+            async_task=split_groups.validate().set_executor(session),
             partial={
                 "df": DependsOn("events_colormap"),
                 "groupers": DependsOn("groupers"),
@@ -254,7 +273,7 @@ def main(params: Params):
             method="call",
         ),
         "grouped_events_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["grouped_events_map_layer"],
             method="mapvalues",
             kwargs={
@@ -263,7 +282,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["grouped_events_ecomap"],
             method="mapvalues",
             kwargs={
@@ -272,7 +291,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -284,7 +303,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["grouped_events_map_widget"],
             method="map",
             kwargs={
@@ -293,7 +312,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_map_widget_merge": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("grouped_events_map_widget"),
             }
@@ -301,7 +320,7 @@ def main(params: Params):
             method="call",
         ),
         "grouped_events_pie_chart": Node(
-            async_task=draw_pie_chart.validate().set_executor("lithops"),
+            async_task=draw_pie_chart.validate().set_executor(session),
             partial=params_dict["grouped_events_pie_chart"],
             method="mapvalues",
             kwargs={
@@ -310,7 +329,7 @@ def main(params: Params):
             },
         ),
         "grouped_pie_chart_html_urls": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -322,9 +341,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_pie_chart_widgets": Node(
-            async_task=create_plot_widget_single_view.validate().set_executor(
-                "lithops"
-            ),
+            async_task=create_plot_widget_single_view.validate().set_executor(session),
             partial=params_dict["grouped_events_pie_chart_widgets"],
             method="map",
             kwargs={
@@ -333,7 +350,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_pie_widget_merge": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("grouped_events_pie_chart_widgets"),
             }
@@ -341,7 +358,7 @@ def main(params: Params):
             method="call",
         ),
         "grouped_events_feature_density": Node(
-            async_task=calculate_feature_density.validate().set_executor("lithops"),
+            async_task=calculate_feature_density.validate().set_executor(session),
             partial={
                 "meshgrid": DependsOn("events_meshgrid"),
             }
@@ -353,7 +370,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial=params_dict["grouped_fd_colormap"],
             method="mapvalues",
             kwargs={
@@ -362,7 +379,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["grouped_fd_map_layer"],
             method="mapvalues",
             kwargs={
@@ -371,7 +388,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["grouped_fd_ecomap"],
             method="mapvalues",
             kwargs={
@@ -380,7 +397,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -392,7 +409,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["grouped_fd_map_widget"],
             method="map",
             kwargs={
@@ -401,7 +418,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_map_widget_merge": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("grouped_fd_map_widget"),
             }
@@ -409,7 +426,7 @@ def main(params: Params):
             method="call",
         ),
         "events_dashboard": Node(
-            async_task=gather_dashboard.validate().set_executor("lithops"),
+            async_task=gather_dashboard.validate().set_executor(session),
             partial={
                 "widgets": DependsOnSequence(
                     [
@@ -428,6 +445,24 @@ def main(params: Params):
             method="call",
         ),
     }
-    graph = Graph(dependencies=dependencies, nodes=nodes)
+    graph = Graph(
+        dependencies=dependencies,
+        nodes=nodes,
+        scheduler="as-completed",
+        cache=ResultCache.from_env(),
+        checkpoint=Checkpoint.from_env(
+            inputs={
+                "spec": "6f6610207b40b252a812eca88281cd1df80c5adf84889a9cab23d5d5671987c7",
+                "params": params_dict,
+            }
+        ),
+        priority=CriticalPathPriority.from_env(),
+        fuse_chains=True,
+        executor=session,
+        dataplane=DataPlane.from_env(),
+        pipeline=True,
+        placement=CostPlacement.from_env(),
+        deadline=RunSettings().deadline,
+    )
     results = graph.execute()
     return results
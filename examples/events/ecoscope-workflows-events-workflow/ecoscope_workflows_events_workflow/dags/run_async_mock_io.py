@@ -1,6 +1,6 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "4c4b15573d985d4dd22886118300bbb53ad094f5c88dbd6cc5bdcc47703957a9"
+# from-spec-sha256 = "6f6610207b40b252a812eca88281cd1df80c5adf84889a9cab23d5d5671987c7"
 
 # ruff: noqa: E402
 
@@ -15,7 +15,24 @@ import warnings  # 🧪
 from ecoscope_workflows_core.testing import create_task_magicmock  # 🧪
 
 
-from ecoscope_workflows_core.graph import DependsOn, DependsOnSequence, Graph, Node
+from ecoscope_workflows_core.cache import ResultCache
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.dataplane import DataPlane
+from ecoscope_workflows_core.executors import (
+    AsyncExecutorName,
+    BoundedExecutor,
+    SpeculativeExecutor,
+    get_async_executor,
+)
+from ecoscope_workflows_core.graph import (
+    DependsOn,
+    DependsOnSequence,
+    Graph,
+    Node,
+    RunSettings,
+)
+from ecoscope_workflows_core.placement import CostPlacement
+from ecoscope_workflows_core.priority import CriticalPathPriority
 
 from ecoscope_workflows_core.tasks.groupby import set_groupers
 from ecoscope_workflows_core.tasks.filter import set_time_range
@@ -45,10 +62,14 @@ from ecoscope_workflows_core.tasks.results import gather_dashboard
 from ..params import Params
 
 
-def main(params: Params):
+def main(params: Params, executor: AsyncExecutorName = "lithops"):
     warnings.warn("This test script should not be used in production!")  # 🧪
 
     params_dict = json.loads(params.model_dump_json(exclude_unset=True))
+    # a single executor session is shared by all nodes, and closed by the graph when done
+    session = SpeculativeExecutor.from_env(
+        BoundedExecutor.from_env(get_async_executor(executor))
+    )
 
     dependencies = {
         "groupers": [],
@@ -102,17 +123,17 @@ def main(params: Params):
 
     nodes = {
         "groupers": Node(
-            async_task=set_groupers.validate().set_executor("lithops"),
+            async_task=set_groupers.validate().set_executor(session),
             partial=params_dict["groupers"],
             method="call",
         ),
         "time_range": Node(
-            async_task=set_time_range.validate().set_executor("lithops"),
+            async_task=set_time_range.validate().set_executor(session),
             partial=params_dict["time_range"],
             method="call",
         ),
         "get_events_data": Node(
-            async_task=get_events.validate().set_executor("lithops"),
+            async_task=get_events.validate().set_executor(session),
             partial={
                 "time_range": DependsOn("time_range"),
             }
@@ -120,7 +141,7 @@ def main(params: Params):
             method="call",
         ),
         "filter_events": Node(
-            async_task=apply_reloc_coord_filter.validate().set_executor("lithops"),
+            async_task=apply_reloc_coord_filter.validate().set_executor(session),
             partial={
                 "df": DependsOn("get_events_data"),
             }
@@ -128,7 +149,7 @@ def main(params: Params):
             method="call",
         ),
         "events_add_temporal_index": Node(
-            async_task=add_temporal_index.validate().set_executor("lithops"),
+            async_task=add_temporal_index.validate().set_executor(session),
             partial={
                 "df": DependsOn("filter_events"),
             }
@@ -136,7 +157,7 @@ def main(params: Params):
             method="call",
         ),
         "events_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial={
                 "df": DependsOn("events_add_temporal_index"),
             }
@@ -144,7 +165,7 @@ def main(params: Params):
             method="call",
         ),
         "events_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial={
                 "geodataframe": DependsOn("events_colormap"),
             }
@@ -152,7 +173,7 @@ def main(params: Params):
             method="call",
         ),
         "events_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial={
                 "geo_layers": DependsOn("events_map_layer"),
             }
@@ -160,7 +181,7 @@ def main(params: Params):
             method="call",
         ),
         "events_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "text": DependsOn("events_ecomap"),
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
@@ -169,7 +190,7 @@ def main(params: Params):
             method="call",
         ),
         "events_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial={
                 "data": DependsOn("events_ecomap_html_url"),
             }
@@ -177,7 +198,7 @@ def main(params: Params):
             method="call",
         ),
         "events_bar_chart": Node(
-            async_task=draw_time_series_bar_chart.validate().set_executor("lithops"),
+            async_task=draw_time_series_bar_chart.validate().set_executor(session),
             partial={
                 "dataframe": DependsOn("events_colormap"),
             }
@@ -185,7 +206,7 @@ def main(params: Params):
             method="call",
         ),
         "events_bar_chart_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "text": DependsOn("events_bar_chart"),
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
@@ -194,9 +215,7 @@ def main(params: Params):
             method="call",
         ),
         "events_bar_chart_widget": Node(
-            async_task=create_plot_widget_single_view.validate().set_executor(
-                "lithops"
-            ),
+            async_task=create_plot_widget_single_view.validate().set_executor(session),
             partial={
                 "data": DependsOn("events_bar_chart_html_url"),
             }
@@ -204,7 +223,7 @@ def main(params: Params):
             method="call",
         ),
         "events_meshgrid": Node(
-            async_task=create_meshgrid.validate().set_executor("lithops"),
+            async_task=create_meshgrid.validate().set_executor(session),
             partial={
                 "aoi": DependsOn("events_add_temporal_index"),
             }
@@ -212,7 +231,7 @@ def main(params: Params):
             method="call",
         ),
         "events_feature_density": Node(
-            async_task=calculate_feature_density.validate().set_executor("lithops"),
+            async_task=calculate_feature_density.validate().set_executor(session),
             partial={
                 "geodataframe": DependsOn("events_add_temporal_index"),
                 "meshgrid": DependsOn("events_meshgrid"),
@@ -221,7 +240,7 @@ def main(params: Params):
             method="call",
         ),
         "fd_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial={
                 "df": DependsOn("events_feature_density"),
             }
@@ -229,7 +248,7 @@ def main(params: Params):
             method="call",
         ),
         "fd_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial={
                 "geodataframe": DependsOn("fd_colormap"),
             }
@@ -237,7 +256,7 @@ def main(params: Params):
             method="call",
         ),
         "fd_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial={
                 "geo_layers": DependsOn("fd_map_layer"),
             }
@@ -245,7 +264,7 @@ def main(params: Params):
             method="call",
         ),
         "fd_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "text": DependsOn("fd_ecomap"),
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
@@ -254,7 +273,7 @@ def main(params: Params):
             method="call",
         ),
         "fd_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial={
                 "data": DependsOn("fd_ecomap_html_url"),
             }
@@ -262,7 +281,7 @@ def main(params: Params):
             method="call",
         ),
         "split_event_groups": Node(
-            async_task=split_groups.validate().set_executor("lithops"),
+            async_task=split_groups.validate().set_executor(session),
             partial={
                 "df": DependsOn("events_colormap"),
                 "groupers": DependsOn("groupers"),
@@ -271,7 +290,7 @@ def main(params: Params):
             method="call",
         ),
         "grouped_events_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["grouped_events_map_layer"],
             method="mapvalues",
             kwargs={
@@ -280,7 +299,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["grouped_events_ecomap"],
             method="mapvalues",
             kwargs={
@@ -289,7 +308,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -301,7 +320,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["grouped_events_map_widget"],
             method="map",
             kwargs={
@@ -310,7 +329,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_map_widget_merge": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("grouped_events_map_widget"),
             }
@@ -318,7 +337,7 @@ def main(params: Params):
             method="call",
         ),
         "grouped_events_pie_chart": Node(
-            async_task=draw_pie_chart.validate().set_executor("lithops"),
+            async_task=draw_pie_chart.validate().set_executor(session),
             partial=params_dict["grouped_events_pie_chart"],
             method="mapvalues",
             kwargs={
@@ -327,7 +346,7 @@ def main(params: Params):
             },
         ),
         "grouped_pie_chart_html_urls": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -339,9 +358,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_pie_chart_widgets": Node(
-            async_task=create_plot_widget_single_view.validate().set_executor(
-                "lithops"
-            ),
+            async_task=create_plot_widget_single_view.validate().set_executor(session),
             partial=params_dict["grouped_events_pie_chart_widgets"],
             method="map",
             kwargs={
@@ -350,7 +367,7 @@ def main(params: Params):
             },
         ),
         "grouped_events_pie_widget_merge": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("grouped_events_pie_chart_widgets"),
             }
@@ -358,7 +375,7 @@ def main(params: Params):
             method="call",
         ),
         "grouped_events_feature_density": Node(
-            async_task=calculate_feature_density.validate().set_executor("lithops"),
+            async_task=calculate_feature_density.validate().set_executor(session),
             partial={
                 "meshgrid": DependsOn("events_meshgrid"),
             }
@@ -370,7 +387,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial=params_dict["grouped_fd_colormap"],
             method="mapvalues",
             kwargs={
@@ -379,7 +396,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["grouped_fd_map_layer"],
             method="mapvalues",
             kwargs={
@@ -388,7 +405,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["grouped_fd_ecomap"],
             method="mapvalues",
             kwargs={
@@ -397,7 +414,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -409,7 +426,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["grouped_fd_map_widget"],
             method="map",
             kwargs={
@@ -418,7 +435,7 @@ def main(params: Params):
             },
         ),
         "grouped_fd_map_widget_merge": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("grouped_fd_map_widget"),
             }
@@ -426,7 +443,7 @@ def main(params: Params):
             method="call",
         ),
         "events_dashboard": Node(
-            async_task=gather_dashboard.validate().set_executor("lithops"),
+            async_task=gather_dashboard.validate().set_executor(session),
             partial={
                 "widgets": DependsOnSequence(
                     [
@@ -445,6 +462,24 @@ def main(params: Params):
             method="call",
         ),
     }
-    graph = Graph(dependencies=dependencies, nodes=nodes)
+    graph = Graph(
+        dependencies=dependencies,
+        nodes=nodes,
+        scheduler="as-completed",
+        cache=ResultCache.from_env(),
+        checkpoint=Checkpoint.from_env(
+            inputs={
+                "spec": "6f6610207b40b252a812eca88281cd1df80c5adf84889a9cab23d5d5671987c7",
+                "params": params_dict,
+            }
+        ),
+        priority=CriticalPathPriority.from_env(),
+        fuse_chains=True,
+        executor=session,
+        dataplane=DataPlane.from_env(),
+        pipeline=True,
+        placement=CostPlacement.from_env(),
+        deadline=RunSettings().deadline,
+    )
     results = graph.execute()
     return results
@@ -1,9 +1,12 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "4c4b15573d985d4dd22886118300bbb53ad094f5c88dbd6cc5bdcc47703957a9"
+# from-spec-sha256 = "6f6610207b40b252a812eca88281cd1df80c5adf84889a9cab23d5d5671987c7"
 import json
 import os
 
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.executors import PythonExecutor
+
 from ecoscope_workflows_core.tasks.groupby import set_groupers
 from ecoscope_workflows_core.tasks.filter import set_time_range
 from ecoscope_workflows_ext_ecoscope.tasks.io import get_events
@@ -30,261 +33,349 @@ from ..params import Params
 
 def main(params: Params):
     params_dict = json.loads(params.model_dump_json(exclude_unset=True))
+    checkpoint = Checkpoint.from_env(
+        inputs={
+            "spec": "6f6610207b40b252a812eca88281cd1df80c5adf84889a9cab23d5d5671987c7",
+            "params": params_dict,
+        }
+    )
+    executor = PythonExecutor.from_env()
 
-    groupers = set_groupers.validate().partial(**params_dict["groupers"]).call()
+    groupers = checkpoint.restore_or_call(
+        "groupers",
+        set_groupers.validate().partial(**params_dict["groupers"]).call,
+    )
 
-    time_range = set_time_range.validate().partial(**params_dict["time_range"]).call()
+    time_range = checkpoint.restore_or_call(
+        "time_range",
+        set_time_range.validate().partial(**params_dict["time_range"]).call,
+    )
 
-    get_events_data = (
+    get_events_data = checkpoint.restore_or_call(
+        "get_events_data",
         get_events.validate()
         .partial(time_range=time_range, **params_dict["get_events_data"])
-        .call()
+        .call,
     )
 
-    filter_events = (
+    filter_events = checkpoint.restore_or_call(
+        "filter_events",
         apply_reloc_coord_filter.validate()
         .partial(df=get_events_data, **params_dict["filter_events"])
-        .call()
+        .call,
     )
 
-    events_add_temporal_index = (
+    events_add_temporal_index = checkpoint.restore_or_call(
+        "events_add_temporal_index",
         add_temporal_index.validate()
         .partial(df=filter_events, **params_dict["events_add_temporal_index"])
-        .call()
+        .call,
     )
 
-    events_colormap = (
+    events_colormap = checkpoint.restore_or_call(
+        "events_colormap",
         apply_color_map.validate()
         .partial(df=events_add_temporal_index, **params_dict["events_colormap"])
-        .call()
+        .call,
     )
 
-    events_map_layer = (
+    events_map_layer = checkpoint.restore_or_call(
+        "events_map_layer",
         create_map_layer.validate()
         .partial(geodataframe=events_colormap, **params_dict["events_map_layer"])
-        .call()
+        .call,
     )
 
-    events_ecomap = (
+    events_ecomap = checkpoint.restore_or_call(
+        "events_ecomap",
         draw_ecomap.validate()
         .partial(geo_layers=events_map_layer, **params_dict["events_ecomap"])
-        .call()
+        .call,
     )
 
-    events_ecomap_html_url = (
+    events_ecomap_html_url = checkpoint.restore_or_call(
+        "events_ecomap_html_url",
         persist_text.validate()
         .partial(
             text=events_ecomap,
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["events_ecomap_html_url"],
         )
-        .call()
+        .call,
     )
 
-    events_map_widget = (
+    events_map_widget = checkpoint.restore_or_call(
+        "events_map_widget",
         create_map_widget_single_view.validate()
         .partial(data=events_ecomap_html_url, **params_dict["events_map_widget"])
-        .call()
+        .call,
     )
 
-    events_bar_chart = (
+    events_bar_chart = checkpoint.restore_or_call(
+        "events_bar_chart",
         draw_time_series_bar_chart.validate()
         .partial(dataframe=events_colormap, **params_dict["events_bar_chart"])
-        .call()
+        .call,
     )
 
-    events_bar_chart_html_url = (
+    events_bar_chart_html_url = checkpoint.restore_or_call(
+        "events_bar_chart_html_url",
         persist_text.validate()
         .partial(
             text=events_bar_chart,
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["events_bar_chart_html_url"],
         )
-        .call()
+        .call,
     )
 
-    events_bar_chart_widget = (
+    events_bar_chart_widget = checkpoint.restore_or_call(
+        "events_bar_chart_widget",
         create_plot_widget_single_view.validate()
         .partial(
             data=events_bar_chart_html_url, **params_dict["events_bar_chart_widget"]
         )
-        .call()
+        .call,
     )
 
-    events_meshgrid = (
+    events_meshgrid = checkpoint.restore_or_call(
+        "events_meshgrid",
         create_meshgrid.validate()
         .partial(aoi=events_add_temporal_index, **params_dict["events_meshgrid"])
-        .call()
+        .call,
     )
 
-    events_feature_density = (
+    events_feature_density = checkpoint.restore_or_call(
+        "events_feature_density",
         calculate_feature_density.validate()
         .partial(
             geodataframe=events_add_temporal_index,
             meshgrid=events_meshgrid,
             **params_dict["events_feature_density"],
         )
-        .call()
+        .call,
     )
 
-    fd_colormap = (
+    fd_colormap = checkpoint.restore_or_call(
+        "fd_colormap",
         apply_color_map.validate()
         .partial(df=events_feature_density, **params_dict["fd_colormap"])
-        .call()
+        .call,
     )
 
-    fd_map_layer = (
+    fd_map_layer = checkpoint.restore_or_call(
+        "fd_map_layer",
         create_map_layer.validate()
         .partial(geodataframe=fd_colormap, **params_dict["fd_map_layer"])
-        .call()
+        .call,
     )
 
-    fd_ecomap = (
+    fd_ecomap = checkpoint.restore_or_call(
+        "fd_ecomap",
         draw_ecomap.validate()
         .partial(geo_layers=fd_map_layer, **params_dict["fd_ecomap"])
-        .call()
+        .call,
     )
 
-    fd_ecomap_html_url = (
+    fd_ecomap_html_url = checkpoint.restore_or_call(
+        "fd_ecomap_html_url",
         persist_text.validate()
         .partial(
             text=fd_ecomap,
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["fd_ecomap_html_url"],
         )
-        .call()
+        .call,
     )
 
-    fd_map_widget = (
+    fd_map_widget = checkpoint.restore_or_call(
+        "fd_map_widget",
         create_map_widget_single_view.validate()
         .partial(data=fd_ecomap_html_url, **params_dict["fd_map_widget"])
-        .call()
+        .call,
     )
 
-    split_event_groups = (
+    split_event_groups = checkpoint.restore_or_call(
+        "split_event_groups",
         split_groups.validate()
         .partial(
             df=events_colormap, groupers=groupers, **params_dict["split_event_groups"]
         )
-        .call()
+        .call,
     )
 
-    grouped_events_map_layer = (
+    grouped_events_map_layer = checkpoint.restore_or_call(
+        "grouped_events_map_layer",
         create_map_layer.validate()
         .partial(**params_dict["grouped_events_map_layer"])
-        .mapvalues(argnames=["geodataframe"], argvalues=split_event_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geodataframe"],
+        argvalues=split_event_groups,
     )
 
-    grouped_events_ecomap = (
+    grouped_events_ecomap = checkpoint.restore_or_call(
+        "grouped_events_ecomap",
         draw_ecomap.validate()
         .partial(**params_dict["grouped_events_ecomap"])
-        .mapvalues(argnames=["geo_layers"], argvalues=grouped_events_map_layer)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geo_layers"],
+        argvalues=grouped_events_map_layer,
     )
 
-    grouped_events_ecomap_html_url = (
+    grouped_events_ecomap_html_url = checkpoint.restore_or_call(
+        "grouped_events_ecomap_html_url",
         persist_text.validate()
         .partial(
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["grouped_events_ecomap_html_url"],
         )
-        .mapvalues(argnames=["text"], argvalues=grouped_events_ecomap)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["text"],
+        argvalues=grouped_events_ecomap,
     )
 
-    grouped_events_map_widget = (
+    grouped_events_map_widget = checkpoint.restore_or_call(
+        "grouped_events_map_widget",
         create_map_widget_single_view.validate()
         .partial(**params_dict["grouped_events_map_widget"])
-        .map(argnames=["view", "data"], argvalues=grouped_events_ecomap_html_url)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=grouped_events_ecomap_html_url,
     )
 
-    grouped_events_map_widget_merge = (
+    grouped_events_map_widget_merge = checkpoint.restore_or_call(
+        "grouped_events_map_widget_merge",
         merge_widget_views.validate()
         .partial(
             widgets=grouped_events_map_widget,
             **params_dict["grouped_events_map_widget_merge"],
         )
-        .call()
+        .call,
     )
 
-    grouped_events_pie_chart = (
+    grouped_events_pie_chart = checkpoint.restore_or_call(
+        "grouped_events_pie_chart",
         draw_pie_chart.validate()
         .partial(**params_dict["grouped_events_pie_chart"])
-        .mapvalues(argnames=["dataframe"], argvalues=split_event_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["dataframe"],
+        argvalues=split_event_groups,
     )
 
-    grouped_pie_chart_html_urls = (
+    grouped_pie_chart_html_urls = checkpoint.restore_or_call(
+        "grouped_pie_chart_html_urls",
         persist_text.validate()
         .partial(
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["grouped_pie_chart_html_urls"],
         )
-        .mapvalues(argnames=["text"], argvalues=grouped_events_pie_chart)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["text"],
+        argvalues=grouped_events_pie_chart,
     )
 
-    grouped_events_pie_chart_widgets = (
+    grouped_events_pie_chart_widgets = checkpoint.restore_or_call(
+        "grouped_events_pie_chart_widgets",
         create_plot_widget_single_view.validate()
         .partial(**params_dict["grouped_events_pie_chart_widgets"])
-        .map(argnames=["view", "data"], argvalues=grouped_pie_chart_html_urls)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=grouped_pie_chart_html_urls,
     )
 
-    grouped_events_pie_widget_merge = (
+    grouped_events_pie_widget_merge = checkpoint.restore_or_call(
+        "grouped_events_pie_widget_merge",
         merge_widget_views.validate()
         .partial(
             widgets=grouped_events_pie_chart_widgets,
             **params_dict["grouped_events_pie_widget_merge"],
         )
-        .call()
+        .call,
     )
 
-    grouped_events_feature_density = (
+    grouped_events_feature_density = checkpoint.restore_or_call(
+        "grouped_events_feature_density",
         calculate_feature_density.validate()
         .partial(
             meshgrid=events_meshgrid, **params_dict["grouped_events_feature_density"]
         )
-        .mapvalues(argnames=["geodataframe"], argvalues=split_event_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geodataframe"],
+        argvalues=split_event_groups,
     )
 
-    grouped_fd_colormap = (
+    grouped_fd_colormap = checkpoint.restore_or_call(
+        "grouped_fd_colormap",
         apply_color_map.validate()
         .partial(**params_dict["grouped_fd_colormap"])
-        .mapvalues(argnames=["df"], argvalues=grouped_events_feature_density)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=grouped_events_feature_density,
     )
 
-    grouped_fd_map_layer = (
+    grouped_fd_map_layer = checkpoint.restore_or_call(
+        "grouped_fd_map_layer",
         create_map_layer.validate()
         .partial(**params_dict["grouped_fd_map_layer"])
-        .mapvalues(argnames=["geodataframe"], argvalues=grouped_fd_colormap)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geodataframe"],
+        argvalues=grouped_fd_colormap,
     )
 
-    grouped_fd_ecomap = (
+    grouped_fd_ecomap = checkpoint.restore_or_call(
+        "grouped_fd_ecomap",
         draw_ecomap.validate()
         .partial(**params_dict["grouped_fd_ecomap"])
-        .mapvalues(argnames=["geo_layers"], argvalues=grouped_fd_map_layer)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geo_layers"],
+        argvalues=grouped_fd_map_layer,
     )
 
-    grouped_fd_ecomap_html_url = (
+    grouped_fd_ecomap_html_url = checkpoint.restore_or_call(
+        "grouped_fd_ecomap_html_url",
         persist_text.validate()
         .partial(
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["grouped_fd_ecomap_html_url"],
         )
-        .mapvalues(argnames=["text"], argvalues=grouped_fd_ecomap)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["text"],
+        argvalues=grouped_fd_ecomap,
     )
 
-    grouped_fd_map_widget = (
+    grouped_fd_map_widget = checkpoint.restore_or_call(
+        "grouped_fd_map_widget",
         create_map_widget_single_view.validate()
         .partial(**params_dict["grouped_fd_map_widget"])
-        .map(argnames=["view", "data"], argvalues=grouped_fd_ecomap_html_url)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=grouped_fd_ecomap_html_url,
     )
 
-    grouped_fd_map_widget_merge = (
+    grouped_fd_map_widget_merge = checkpoint.restore_or_call(
+        "grouped_fd_map_widget_merge",
         merge_widget_views.validate()
         .partial(
             widgets=grouped_fd_map_widget, **params_dict["grouped_fd_map_widget_merge"]
         )
-        .call()
+        .call,
     )
 
-    events_dashboard = (
+    events_dashboard = checkpoint.restore_or_call(
+        "events_dashboard",
         gather_dashboard.validate()
         .partial(
             widgets=[
@@ -299,7 +390,8 @@ def main(params: Params):
             time_range=time_range,
             **params_dict["events_dashboard"],
         )
-        .call()
+        .call,
     )
 
+    checkpoint.complete()
     return events_dashboard
@@ -1,6 +1,6 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "4c4b15573d985d4dd22886118300bbb53ad094f5c88dbd6cc5bdcc47703957a9"
+# from-spec-sha256 = "6f6610207b40b252a812eca88281cd1df80c5adf84889a9cab23d5d5671987c7"
 
 
 from pathlib import Path
@@ -64,7 +64,7 @@ def formdata(case: TestCase) -> dict:
     return formdata
 
 
-@pytest.fixture(params=["async", "sequential"])
+@pytest.fixture(params=["async", "sequential", "threads"])
 def execution_mode(request: pytest.FixtureRequest) -> str:
     return request.param
 
@@ -1,12 +1,14 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "8a3657e3ebaa4bfbe1bbaaac414f150f77aaa86dfa1e7d1d71c3b10235974666"
+# from-spec-sha256 = "cba1bd64688fbb581d59fa00c2fa416bc3327dff1531bad63f205eefecebb692"
 
 
+import os
 from io import TextIOWrapper
 
 import click
 import ruamel.yaml
+from ecoscope_workflows_core.checkpoint import new_run_id
 
 from .dispatch import dispatch
 from .params import Params
@@ -22,7 +24,7 @@ from .params import Params
 @click.option(
     "--execution-mode",
     required=True,
-    type=click.Choice(["async", "sequential"]),
+    type=click.Choice(["async", "sequential", "threads"]),
 )
 @click.option(
     "--mock-io/--no-mock-io",
@@ -30,14 +32,46 @@ from .params import Params
     default=False,
     help="Whether or not to mock io with 3rd party services; for testing only.",
 )
+@click.option(
+    "--checkpoint-dir",
+    envvar="ECOSCOPE_WORKFLOWS_CHECKPOINT_DIR",
+    default=None,
+    help="Directory in which to checkpoint the results of completed tasks, by run ID.",
+)
+@click.option(
+    "--resume",
+    "resume_run_id",
+    default=None,
+    help="The run ID of a prior (failed) run to resume from its checkpoints.",
+)
+@click.option(
+    "--validation",
+    "validation_mode",
+    type=click.Choice(["full", "schema-only", "sample", "off"]),
+    envvar="ECOSCOPE_WORKFLOWS_VALIDATION_MODE",
+    default="full",
+    help="The depth to which dataframes are validated between tasks.",
+)
 def main(
     config_file: TextIOWrapper,
     execution_mode: str,
     mock_io: bool,
+    checkpoint_dir: str | None,
+    resume_run_id: str | None,
+    validation_mode: str,
 ) -> None:
     yaml = ruamel.yaml.YAML(typ="safe")
     params = Params(**yaml.load(config_file))
 
+    if resume_run_id and not checkpoint_dir:
+        raise click.UsageError("The `--resume` option requires a `--checkpoint-dir`.")
+    if checkpoint_dir:
+        run_id = resume_run_id or new_run_id()
+        os.environ["ECOSCOPE_WORKFLOWS_CHECKPOINT_DIR"] = checkpoint_dir
+        os.environ["ECOSCOPE_WORKFLOWS_CHECKPOINT_RUN_ID"] = run_id
+        click.echo(f"Checkpointing run ID: {run_id}", err=True)
+    os.environ["ECOSCOPE_WORKFLOWS_VALIDATION_MODE"] = validation_mode
+
     result = dispatch(execution_mode, mock_io, params)
 
     print(result)
@@ -1,6 +1,6 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "8a3657e3ebaa4bfbe1bbaaac414f150f77aaa86dfa1e7d1d71c3b10235974666"
+# from-spec-sha256 = "cba1bd64688fbb581d59fa00c2fa416bc3327dff1531bad63f205eefecebb692"
 
 
 # ruff: noqa: E402
@@ -1,10 +1,27 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "8a3657e3ebaa4bfbe1bbaaac414f150f77aaa86dfa1e7d1d71c3b10235974666"
+# from-spec-sha256 = "cba1bd64688fbb581d59fa00c2fa416bc3327dff1531bad63f205eefecebb692"
 import json
 import os
 
-from ecoscope_workflows_core.graph import DependsOn, DependsOnSequence, Graph, Node
+from ecoscope_workflows_core.cache import ResultCache
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.dataplane import DataPlane
+from ecoscope_workflows_core.executors import (
+    AsyncExecutorName,
+    BoundedExecutor,
+    SpeculativeExecutor,
+    get_async_executor,
+)
+from ecoscope_workflows_core.graph import (
+    DependsOn,
+    DependsOnSequence,
+    Graph,
+    Node,
+    RunSettings,
+)
+from ecoscope_workflows_core.placement import CostPlacement
+from ecoscope_workflows_core.priority import CriticalPathPriority
 
 from ecoscope_workflows_core.tasks.groupby import set_groupers
 from ecoscope_workflows_core.tasks.filter import set_time_range
@@ -41,8 +58,12 @@ from ecoscope_workflows_core.tasks.results import gather_dashboard
 from ..params import Params
 
 
-def main(params: Params):
+def main(params: Params, executor: AsyncExecutorName = "lithops"):
     params_dict = json.loads(params.model_dump_json(exclude_unset=True))
+    # a single executor session is shared by all nodes, and closed by the graph when done
+    session = SpeculativeExecutor.from_env(
+        BoundedExecutor.from_env(get_async_executor(executor))
+    )
 
     dependencies = {
         "groupers": [],
@@ -116,17 +137,17 @@ def main(params: Params):
 
     nodes = {
         "groupers": Node(
-            async_task=set_groupers.validate().set_executor("lithops"),
+            async_task=set_groupers.validate().set_executor(session),
             partial=params_dict["groupers"],
             method="call",
         ),
         "time_range": Node(
-            async_task=set_time_range.validate().set_executor("lithops"),
+            async_task=set_time_range.validate().set_executor(session),
             partial=params_dict["time_range"],
             method="call",
         ),
         "patrol_obs": Node(
-            async_task=get_patrol_observations.validate().set_executor("lithops"),
+            async_task=get_patrol_observations.validate().set_executor(session),
             partial={
                 "time_range": DependsOn("time_range"),
             }
@@ -134,7 +155,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_reloc": Node(
-            async_task=process_relocations.validate().set_executor("lithops"),
+            async_task=process_relocations.validate().set_executor(session),
             partial={
                 "observations": DependsOn("patrol_obs"),
             }
@@ -142,7 +163,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_traj": Node(
-            async_task=relocations_to_trajectory.validate().set_executor("lithops"),
+            async_task=relocations_to_trajectory.validate().set_executor(session),
             partial={
                 "relocations": DependsOn("patrol_reloc"),
             }
@@ -150,7 +171,7 @@ def main(params: Params):
             method="call",
         ),
         "traj_add_temporal_index": Node(
-            async_task=add_temporal_index.validate().set_executor("lithops"),
+            async_task=add_temporal_index.validate().set_executor(session),
             partial={
                 "df": DependsOn("patrol_traj"),
             }
@@ -158,7 +179,7 @@ def main(params: Params):
             method="call",
         ),
         "split_patrol_traj_groups": Node(
-            async_task=split_groups.validate().set_executor("lithops"),
+            async_task=split_groups.validate().set_executor(session),
             partial={
                 "df": DependsOn("traj_add_temporal_index"),
                 "groupers": DependsOn("groupers"),
@@ -167,7 +188,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_traj_map_layers": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["patrol_traj_map_layers"],
             method="mapvalues",
             kwargs={
@@ -176,7 +197,7 @@ def main(params: Params):
             },
         ),
         "patrol_events": Node(
-            async_task=get_patrol_events.validate().set_executor("lithops"),
+            async_task=get_patrol_events.validate().set_executor(session),
             partial={
                 "time_range": DependsOn("time_range"),
             }
@@ -184,7 +205,7 @@ def main(params: Params):
             method="call",
         ),
         "filter_patrol_events": Node(
-            async_task=apply_reloc_coord_filter.validate().set_executor("lithops"),
+            async_task=apply_reloc_coord_filter.validate().set_executor(session),
             partial={
                 "df": DependsOn("patrol_events"),
             }
@@ -192,7 +213,7 @@ def main(params: Params):
             method="call",
         ),
         "pe_add_temporal_index": Node(
-            async_task=add_temporal_index.validate().set_executor("lithops"),
+            async_task=add_temporal_index.validate().set_executor(session),
             partial={
                 "df": DependsOn("filter_patrol_events"),
             }
@@ -200,7 +221,7 @@ def main(params: Params):
             method="call",
         ),
         "pe_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial={
                 "df": DependsOn("pe_add_temporal_index"),
             }
@@ -208,7 +229,7 @@ def main(params: Params):
             method="call",
         ),
         "split_pe_groups": Node(
-            async_task=split_groups.validate().set_executor("lithops"),
+            async_task=split_groups.validate().set_executor(session),
             partial={
                 "df": DependsOn("pe_colormap"),
                 "groupers": DependsOn("groupers"),
@@ -217,7 +238,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_events_map_layers": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["patrol_events_map_layers"],
             method="mapvalues",
             kwargs={
@@ -226,7 +247,7 @@ def main(params: Params):
             },
         ),
         "combined_traj_and_pe_map_layers": Node(
-            async_task=groupbykey.validate().set_executor("lithops"),
+            async_task=groupbykey.validate().set_executor(session),
             partial={
                 "iterables": DependsOnSequence(
                     [
@@ -239,7 +260,7 @@ def main(params: Params):
             method="call",
         ),
         "traj_patrol_events_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["traj_patrol_events_ecomap"],
             method="mapvalues",
             kwargs={
@@ -248,7 +269,7 @@ def main(params: Params):
             },
         ),
         "traj_pe_ecomap_html_urls": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -260,7 +281,7 @@ def main(params: Params):
             },
         ),
         "traj_pe_map_widgets_single_views": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["traj_pe_map_widgets_single_views"],
             method="map",
             kwargs={
@@ -269,7 +290,7 @@ def main(params: Params):
             },
         ),
         "traj_pe_grouped_map_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("traj_pe_map_widgets_single_views"),
             }
@@ -277,7 +298,7 @@ def main(params: Params):
             method="call",
         ),
         "total_patrols": Node(
-            async_task=dataframe_column_nunique.validate().set_executor("lithops"),
+            async_task=dataframe_column_nunique.validate().set_executor(session),
             partial=params_dict["total_patrols"],
             method="mapvalues",
             kwargs={
@@ -287,7 +308,7 @@ def main(params: Params):
         ),
         "total_patrols_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["total_patrols_sv_widgets"],
             method="map",
@@ -297,7 +318,7 @@ def main(params: Params):
             },
         ),
         "total_patrols_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("total_patrols_sv_widgets"),
             }
@@ -305,7 +326,7 @@ def main(params: Params):
             method="call",
         ),
         "total_patrol_time": Node(
-            async_task=dataframe_column_sum.validate().set_executor("lithops"),
+            async_task=dataframe_column_sum.validate().set_executor(session),
             partial=params_dict["total_patrol_time"],
             method="mapvalues",
             kwargs={
@@ -314,7 +335,7 @@ def main(params: Params):
             },
         ),
         "total_patrol_time_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["total_patrol_time_converted"],
             method="mapvalues",
             kwargs={
@@ -324,7 +345,7 @@ def main(params: Params):
         ),
         "total_patrol_time_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["total_patrol_time_sv_widgets"],
             method="map",
@@ -334,7 +355,7 @@ def main(params: Params):
             },
         ),
         "patrol_time_grouped_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("total_patrol_time_sv_widgets"),
             }
@@ -342,7 +363,7 @@ def main(params: Params):
             method="call",
         ),
         "total_patrol_dist": Node(
-            async_task=dataframe_column_sum.validate().set_executor("lithops"),
+            async_task=dataframe_column_sum.validate().set_executor(session),
             partial=params_dict["total_patrol_dist"],
             method="mapvalues",
             kwargs={
@@ -351,7 +372,7 @@ def main(params: Params):
             },
         ),
         "total_patrol_dist_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["total_patrol_dist_converted"],
             method="mapvalues",
             kwargs={
@@ -361,7 +382,7 @@ def main(params: Params):
         ),
         "total_patrol_dist_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["total_patrol_dist_sv_widgets"],
             method="map",
@@ -371,7 +392,7 @@ def main(params: Params):
             },
         ),
         "patrol_dist_grouped_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("total_patrol_dist_sv_widgets"),
             }
@@ -379,7 +400,7 @@ def main(params: Params):
             method="call",
         ),
         "avg_speed": Node(
-            async_task=dataframe_column_mean.validate().set_executor("lithops"),
+            async_task=dataframe_column_mean.validate().set_executor(session),
             partial=params_dict["avg_speed"],
             method="mapvalues",
             kwargs={
@@ -388,7 +409,7 @@ def main(params: Params):
             },
         ),
         "average_speed_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["average_speed_converted"],
             method="mapvalues",
             kwargs={
@@ -398,7 +419,7 @@ def main(params: Params):
         ),
         "avg_speed_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["avg_speed_sv_widgets"],
             method="map",
@@ -408,7 +429,7 @@ def main(params: Params):
             },
         ),
         "avg_speed_grouped_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("avg_speed_sv_widgets"),
             }
@@ -416,7 +437,7 @@ def main(params: Params):
             method="call",
         ),
         "max_speed": Node(
-            async_task=dataframe_column_max.validate().set_executor("lithops"),
+            async_task=dataframe_column_max.validate().set_executor(session),
             partial=params_dict["max_speed"],
             method="mapvalues",
             kwargs={
@@ -425,7 +446,7 @@ def main(params: Params):
             },
         ),
         "max_speed_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["max_speed_converted"],
             method="mapvalues",
             kwargs={
@@ -435,7 +456,7 @@ def main(params: Params):
         ),
         "max_speed_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["max_speed_sv_widgets"],
             method="map",
@@ -445,7 +466,7 @@ def main(params: Params):
             },
         ),
         "max_speed_grouped_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("max_speed_sv_widgets"),
             }
@@ -453,7 +474,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_events_bar_chart": Node(
-            async_task=draw_time_series_bar_chart.validate().set_executor("lithops"),
+            async_task=draw_time_series_bar_chart.validate().set_executor(session),
             partial={
                 "dataframe": DependsOn("filter_patrol_events"),
             }
@@ -461,7 +482,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_events_bar_chart_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "text": DependsOn("patrol_events_bar_chart"),
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
@@ -470,9 +491,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_events_bar_chart_widget": Node(
-            async_task=create_plot_widget_single_view.validate().set_executor(
-                "lithops"
-            ),
+            async_task=create_plot_widget_single_view.validate().set_executor(session),
             partial={
                 "data": DependsOn("patrol_events_bar_chart_html_url"),
             }
@@ -480,7 +499,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_events_pie_chart": Node(
-            async_task=draw_pie_chart.validate().set_executor("lithops"),
+            async_task=draw_pie_chart.validate().set_executor(session),
             partial=params_dict["patrol_events_pie_chart"],
             method="mapvalues",
             kwargs={
@@ -489,7 +508,7 @@ def main(params: Params):
             },
         ),
         "pe_pie_chart_html_urls": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -501,9 +520,7 @@ def main(params: Params):
             },
         ),
         "patrol_events_pie_chart_widgets": Node(
-            async_task=create_plot_widget_single_view.validate().set_executor(
-                "lithops"
-            ),
+            async_task=create_plot_widget_single_view.validate().set_executor(session),
             partial=params_dict["patrol_events_pie_chart_widgets"],
             method="map",
             kwargs={
@@ -512,7 +529,7 @@ def main(params: Params):
             },
         ),
         "patrol_events_pie_widget_grouped": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("patrol_events_pie_chart_widgets"),
             }
@@ -520,7 +537,7 @@ def main(params: Params):
             method="call",
         ),
         "td": Node(
-            async_task=calculate_time_density.validate().set_executor("lithops"),
+            async_task=calculate_time_density.validate().set_executor(session),
             partial={
                 "trajectory_gdf": DependsOn("patrol_traj"),
             }
@@ -528,7 +545,7 @@ def main(params: Params):
             method="call",
         ),
         "td_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial={
                 "df": DependsOn("td"),
             }
@@ -536,7 +553,7 @@ def main(params: Params):
             method="call",
         ),
         "td_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial={
                 "geodataframe": DependsOn("td_colormap"),
             }
@@ -544,7 +561,7 @@ def main(params: Params):
             method="call",
         ),
         "td_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial={
                 "geo_layers": DependsOn("td_map_layer"),
             }
@@ -552,7 +569,7 @@ def main(params: Params):
             method="call",
         ),
         "td_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "text": DependsOn("td_ecomap"),
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
@@ -561,7 +578,7 @@ def main(params: Params):
             method="call",
         ),
         "td_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial={
                 "data": DependsOn("td_ecomap_html_url"),
             }
@@ -569,7 +586,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_dashboard": Node(
-            async_task=gather_dashboard.validate().set_executor("lithops"),
+            async_task=gather_dashboard.validate().set_executor(session),
             partial={
                 "widgets": DependsOnSequence(
                     [
@@ -591,6 +608,24 @@ def main(params: Params):
             method="call",
         ),
     }
-    graph = Graph(dependencies=dependencies, nodes=nodes)
+    graph = Graph(
+        dependencies=dependencies,
+        nodes=nodes,
+        scheduler="as-completed",
+        cache=ResultCache.from_env(),
+        checkpoint=Checkpoint.from_env(
+            inputs={
+                "spec": "cba1bd64688fbb581d59fa00c2fa416bc3327dff1531bad63f205eefecebb692",
+                "params": params_dict,
+            }
+        ),
+        priority=CriticalPathPriority.from_env(),
+        fuse_chains=True,
+        executor=session,
+        dataplane=DataPlane.from_env(),
+        pipeline=True,
+        placement=CostPlacement.from_env(),
+        deadline=RunSettings().deadline,
+    )
     results = graph.execute()
     return results
@@ -1,6 +1,6 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "8a3657e3ebaa4bfbe1bbaaac414f150f77aaa86dfa1e7d1d71c3b10235974666"
+# from-spec-sha256 = "cba1bd64688fbb581d59fa00c2fa416bc3327dff1531bad63f205eefecebb692"
 
 # ruff: noqa: E402
 
@@ -15,7 +15,24 @@ import warnings  # 🧪
 from ecoscope_workflows_core.testing import create_task_magicmock  # 🧪
 
 
-from ecoscope_workflows_core.graph import DependsOn, DependsOnSequence, Graph, Node
+from ecoscope_workflows_core.cache import ResultCache
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.dataplane import DataPlane
+from ecoscope_workflows_core.executors import (
+    AsyncExecutorName,
+    BoundedExecutor,
+    SpeculativeExecutor,
+    get_async_executor,
+)
+from ecoscope_workflows_core.graph import (
+    DependsOn,
+    DependsOnSequence,
+    Graph,
+    Node,
+    RunSettings,
+)
+from ecoscope_workflows_core.placement import CostPlacement
+from ecoscope_workflows_core.priority import CriticalPathPriority
 
 from ecoscope_workflows_core.tasks.groupby import set_groupers
 from ecoscope_workflows_core.tasks.filter import set_time_range
@@ -60,10 +77,14 @@ from ecoscope_workflows_core.tasks.results import gather_dashboard
 from ..params import Params
 
 
-def main(params: Params):
+def main(params: Params, executor: AsyncExecutorName = "lithops"):
     warnings.warn("This test script should not be used in production!")  # 🧪
 
     params_dict = json.loads(params.model_dump_json(exclude_unset=True))
+    # a single executor session is shared by all nodes, and closed by the graph when done
+    session = SpeculativeExecutor.from_env(
+        BoundedExecutor.from_env(get_async_executor(executor))
+    )
 
     dependencies = {
         "groupers": [],
@@ -137,17 +158,17 @@ def main(params: Params):
 
     nodes = {
         "groupers": Node(
-            async_task=set_groupers.validate().set_executor("lithops"),
+            async_task=set_groupers.validate().set_executor(session),
             partial=params_dict["groupers"],
             method="call",
         ),
         "time_range": Node(
-            async_task=set_time_range.validate().set_executor("lithops"),
+            async_task=set_time_range.validate().set_executor(session),
             partial=params_dict["time_range"],
             method="call",
         ),
         "patrol_obs": Node(
-            async_task=get_patrol_observations.validate().set_executor("lithops"),
+            async_task=get_patrol_observations.validate().set_executor(session),
             partial={
                 "time_range": DependsOn("time_range"),
             }
@@ -155,7 +176,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_reloc": Node(
-            async_task=process_relocations.validate().set_executor("lithops"),
+            async_task=process_relocations.validate().set_executor(session),
             partial={
                 "observations": DependsOn("patrol_obs"),
             }
@@ -163,7 +184,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_traj": Node(
-            async_task=relocations_to_trajectory.validate().set_executor("lithops"),
+            async_task=relocations_to_trajectory.validate().set_executor(session),
             partial={
                 "relocations": DependsOn("patrol_reloc"),
             }
@@ -171,7 +192,7 @@ def main(params: Params):
             method="call",
         ),
         "traj_add_temporal_index": Node(
-            async_task=add_temporal_index.validate().set_executor("lithops"),
+            async_task=add_temporal_index.validate().set_executor(session),
             partial={
                 "df": DependsOn("patrol_traj"),
             }
@@ -179,7 +200,7 @@ def main(params: Params):
             method="call",
         ),
         "split_patrol_traj_groups": Node(
-            async_task=split_groups.validate().set_executor("lithops"),
+            async_task=split_groups.validate().set_executor(session),
             partial={
                 "df": DependsOn("traj_add_temporal_index"),
                 "groupers": DependsOn("groupers"),
@@ -188,7 +209,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_traj_map_layers": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["patrol_traj_map_layers"],
             method="mapvalues",
             kwargs={
@@ -197,7 +218,7 @@ def main(params: Params):
             },
         ),
         "patrol_events": Node(
-            async_task=get_patrol_events.validate().set_executor("lithops"),
+            async_task=get_patrol_events.validate().set_executor(session),
             partial={
                 "time_range": DependsOn("time_range"),
             }
@@ -205,7 +226,7 @@ def main(params: Params):
             method="call",
         ),
         "filter_patrol_events": Node(
-            async_task=apply_reloc_coord_filter.validate().set_executor("lithops"),
+            async_task=apply_reloc_coord_filter.validate().set_executor(session),
             partial={
                 "df": DependsOn("patrol_events"),
             }
@@ -213,7 +234,7 @@ def main(params: Params):
             method="call",
         ),
         "pe_add_temporal_index": Node(
-            async_task=add_temporal_index.validate().set_executor("lithops"),
+            async_task=add_temporal_index.validate().set_executor(session),
             partial={
                 "df": DependsOn("filter_patrol_events"),
             }
@@ -221,7 +242,7 @@ def main(params: Params):
             method="call",
         ),
         "pe_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial={
                 "df": DependsOn("pe_add_temporal_index"),
             }
@@ -229,7 +250,7 @@ def main(params: Params):
             method="call",
         ),
         "split_pe_groups": Node(
-            async_task=split_groups.validate().set_executor("lithops"),
+            async_task=split_groups.validate().set_executor(session),
             partial={
                 "df": DependsOn("pe_colormap"),
                 "groupers": DependsOn("groupers"),
@@ -238,7 +259,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_events_map_layers": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["patrol_events_map_layers"],
             method="mapvalues",
             kwargs={
@@ -247,7 +268,7 @@ def main(params: Params):
             },
         ),
         "combined_traj_and_pe_map_layers": Node(
-            async_task=groupbykey.validate().set_executor("lithops"),
+            async_task=groupbykey.validate().set_executor(session),
             partial={
                 "iterables": DependsOnSequence(
                     [
@@ -260,7 +281,7 @@ def main(params: Params):
             method="call",
         ),
         "traj_patrol_events_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["traj_patrol_events_ecomap"],
             method="mapvalues",
             kwargs={
@@ -269,7 +290,7 @@ def main(params: Params):
             },
         ),
         "traj_pe_ecomap_html_urls": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -281,7 +302,7 @@ def main(params: Params):
             },
         ),
         "traj_pe_map_widgets_single_views": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["traj_pe_map_widgets_single_views"],
             method="map",
             kwargs={
@@ -290,7 +311,7 @@ def main(params: Params):
             },
         ),
         "traj_pe_grouped_map_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("traj_pe_map_widgets_single_views"),
             }
@@ -298,7 +319,7 @@ def main(params: Params):
             method="call",
         ),
         "total_patrols": Node(
-            async_task=dataframe_column_nunique.validate().set_executor("lithops"),
+            async_task=dataframe_column_nunique.validate().set_executor(session),
             partial=params_dict["total_patrols"],
             method="mapvalues",
             kwargs={
@@ -308,7 +329,7 @@ def main(params: Params):
         ),
         "total_patrols_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["total_patrols_sv_widgets"],
             method="map",
@@ -318,7 +339,7 @@ def main(params: Params):
             },
         ),
         "total_patrols_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("total_patrols_sv_widgets"),
             }
@@ -326,7 +347,7 @@ def main(params: Params):
             method="call",
         ),
         "total_patrol_time": Node(
-            async_task=dataframe_column_sum.validate().set_executor("lithops"),
+            async_task=dataframe_column_sum.validate().set_executor(session),
             partial=params_dict["total_patrol_time"],
             method="mapvalues",
             kwargs={
@@ -335,7 +356,7 @@ def main(params: Params):
             },
         ),
         "total_patrol_time_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["total_patrol_time_converted"],
             method="mapvalues",
             kwargs={
@@ -345,7 +366,7 @@ def main(params: Params):
         ),
         "total_patrol_time_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["total_patrol_time_sv_widgets"],
             method="map",
@@ -355,7 +376,7 @@ def main(params: Params):
             },
         ),
         "patrol_time_grouped_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("total_patrol_time_sv_widgets"),
             }
@@ -363,7 +384,7 @@ def main(params: Params):
             method="call",
         ),
         "total_patrol_dist": Node(
-            async_task=dataframe_column_sum.validate().set_executor("lithops"),
+            async_task=dataframe_column_sum.validate().set_executor(session),
             partial=params_dict["total_patrol_dist"],
             method="mapvalues",
             kwargs={
@@ -372,7 +393,7 @@ def main(params: Params):
             },
         ),
         "total_patrol_dist_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["total_patrol_dist_converted"],
             method="mapvalues",
             kwargs={
@@ -382,7 +403,7 @@ def main(params: Params):
         ),
         "total_patrol_dist_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["total_patrol_dist_sv_widgets"],
             method="map",
@@ -392,7 +413,7 @@ def main(params: Params):
             },
         ),
         "patrol_dist_grouped_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("total_patrol_dist_sv_widgets"),
             }
@@ -400,7 +421,7 @@ def main(params: Params):
             method="call",
         ),
         "avg_speed": Node(
-            async_task=dataframe_column_mean.validate().set_executor("lithops"),
+            async_task=dataframe_column_mean.validate().set_executor(session),
             partial=params_dict["avg_speed"],
             method="mapvalues",
             kwargs={
@@ -409,7 +430,7 @@ def main(params: Params):
             },
         ),
         "average_speed_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["average_speed_converted"],
             method="mapvalues",
             kwargs={
@@ -419,7 +440,7 @@ def main(params: Params):
         ),
         "avg_speed_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["avg_speed_sv_widgets"],
             method="map",
@@ -429,7 +450,7 @@ def main(params: Params):
             },
         ),
         "avg_speed_grouped_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("avg_speed_sv_widgets"),
             }
@@ -437,7 +458,7 @@ def main(params: Params):
             method="call",
         ),
         "max_speed": Node(
-            async_task=dataframe_column_max.validate().set_executor("lithops"),
+            async_task=dataframe_column_max.validate().set_executor(session),
             partial=params_dict["max_speed"],
             method="mapvalues",
             kwargs={
@@ -446,7 +467,7 @@ def main(params: Params):
             },
         ),
         "max_speed_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["max_speed_converted"],
             method="mapvalues",
             kwargs={
@@ -456,7 +477,7 @@ def main(params: Params):
         ),
         "max_speed_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["max_speed_sv_widgets"],
             method="map",
@@ -466,7 +487,7 @@ def main(params: Params):
             },
         ),
         "max_speed_grouped_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("max_speed_sv_widgets"),
             }
@@ -474,7 +495,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_events_bar_chart": Node(
-            async_task=draw_time_series_bar_chart.validate().set_executor("lithops"),
+            async_task=draw_time_series_bar_chart.validate().set_executor(session),
             partial={
                 "dataframe": DependsOn("filter_patrol_events"),
             }
@@ -482,7 +503,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_events_bar_chart_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "text": DependsOn("patrol_events_bar_chart"),
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
@@ -491,9 +512,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_events_bar_chart_widget": Node(
-            async_task=create_plot_widget_single_view.validate().set_executor(
-                "lithops"
-            ),
+            async_task=create_plot_widget_single_view.validate().set_executor(session),
             partial={
                 "data": DependsOn("patrol_events_bar_chart_html_url"),
             }
@@ -501,7 +520,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_events_pie_chart": Node(
-            async_task=draw_pie_chart.validate().set_executor("lithops"),
+            async_task=draw_pie_chart.validate().set_executor(session),
             partial=params_dict["patrol_events_pie_chart"],
             method="mapvalues",
             kwargs={
@@ -510,7 +529,7 @@ def main(params: Params):
             },
         ),
         "pe_pie_chart_html_urls": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -522,9 +541,7 @@ def main(params: Params):
             },
         ),
         "patrol_events_pie_chart_widgets": Node(
-            async_task=create_plot_widget_single_view.validate().set_executor(
-                "lithops"
-            ),
+            async_task=create_plot_widget_single_view.validate().set_executor(session),
             partial=params_dict["patrol_events_pie_chart_widgets"],
             method="map",
             kwargs={
@@ -533,7 +550,7 @@ def main(params: Params):
             },
         ),
         "patrol_events_pie_widget_grouped": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("patrol_events_pie_chart_widgets"),
             }
@@ -541,7 +558,7 @@ def main(params: Params):
             method="call",
         ),
         "td": Node(
-            async_task=calculate_time_density.validate().set_executor("lithops"),
+            async_task=calculate_time_density.validate().set_executor(session),
             partial={
                 "trajectory_gdf": DependsOn("patrol_traj"),
             }
@@ -549,7 +566,7 @@ def main(params: Params):
             method="call",
         ),
         "td_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial={
                 "df": DependsOn("td"),
             }
@@ -557,7 +574,7 @@ def main(params: Params):
             method="call",
         ),
         "td_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial={
                 "geodataframe": DependsOn("td_colormap"),
             }
@@ -565,7 +582,7 @@ def main(params: Params):
             method="call",
         ),
         "td_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial={
                 "geo_layers": DependsOn("td_map_layer"),
             }
@@ -573,7 +590,7 @@ def main(params: Params):
             method="call",
         ),
         "td_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "text": DependsOn("td_ecomap"),
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
@@ -582,7 +599,7 @@ def main(params: Params):
             method="call",
         ),
         "td_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial={
                 "data": DependsOn("td_ecomap_html_url"),
             }
@@ -590,7 +607,7 @@ def main(params: Params):
             method="call",
         ),
         "patrol_dashboard": Node(
-            async_task=gather_dashboard.validate().set_executor("lithops"),
+            async_task=gather_dashboard.validate().set_executor(session),
             partial={
                 "widgets": DependsOnSequence(
                     [
@@ -612,6 +629,24 @@ def main(params: Params):
             method="call",
         ),
     }
-    graph = Graph(dependencies=dependencies, nodes=nodes)
+    graph = Graph(
+        dependencies=dependencies,
+        nodes=nodes,
+        scheduler="as-completed",
+        cache=ResultCache.from_env(),
+        checkpoint=Checkpoint.from_env(
+            inputs={
+                "spec": "cba1bd64688fbb581d59fa00c2fa416bc3327dff1531bad63f205eefecebb692",
+                "params": params_dict,
+            }
+        ),
+        priority=CriticalPathPriority.from_env(),
+        fuse_chains=True,
+        executor=session,
+        dataplane=DataPlane.from_env(),
+        pipeline=True,
+        placement=CostPlacement.from_env(),
+        deadline=RunSettings().deadline,
+    )
     results = graph.execute()
     return results
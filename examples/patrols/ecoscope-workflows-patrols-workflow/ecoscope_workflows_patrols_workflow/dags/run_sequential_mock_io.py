@@ -1,6 +1,6 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "8a3657e3ebaa4bfbe1bbaaac414f150f77aaa86dfa1e7d1d71c3b10235974666"
+# from-spec-sha256 = "cba1bd64688fbb581d59fa00c2fa416bc3327dff1531bad63f205eefecebb692"
 
 # ruff: noqa: E402
 
@@ -15,6 +15,9 @@ import warnings  # 🧪
 from ecoscope_workflows_core.testing import create_task_magicmock  # 🧪
 
 
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.executors import PythonExecutor
+
 from ecoscope_workflows_core.tasks.groupby import set_groupers
 from ecoscope_workflows_core.tasks.filter import set_time_range
 
@@ -62,349 +65,478 @@ def main(params: Params):
     warnings.warn("This test script should not be used in production!")  # 🧪
 
     params_dict = json.loads(params.model_dump_json(exclude_unset=True))
+    checkpoint = Checkpoint.from_env(
+        inputs={
+            "spec": "cba1bd64688fbb581d59fa00c2fa416bc3327dff1531bad63f205eefecebb692",
+            "params": params_dict,
+        }
+    )
+    executor = PythonExecutor.from_env()
 
-    groupers = set_groupers.validate().partial(**params_dict["groupers"]).call()
+    groupers = checkpoint.restore_or_call(
+        "groupers",
+        set_groupers.validate().partial(**params_dict["groupers"]).call,
+    )
 
-    time_range = set_time_range.validate().partial(**params_dict["time_range"]).call()
+    time_range = checkpoint.restore_or_call(
+        "time_range",
+        set_time_range.validate().partial(**params_dict["time_range"]).call,
+    )
 
-    patrol_obs = (
+    patrol_obs = checkpoint.restore_or_call(
+        "patrol_obs",
         get_patrol_observations.validate()
         .partial(time_range=time_range, **params_dict["patrol_obs"])
-        .call()
+        .call,
     )
 
-    patrol_reloc = (
+    patrol_reloc = checkpoint.restore_or_call(
+        "patrol_reloc",
         process_relocations.validate()
         .partial(observations=patrol_obs, **params_dict["patrol_reloc"])
-        .call()
+        .call,
     )
 
-    patrol_traj = (
+    patrol_traj = checkpoint.restore_or_call(
+        "patrol_traj",
         relocations_to_trajectory.validate()
         .partial(relocations=patrol_reloc, **params_dict["patrol_traj"])
-        .call()
+        .call,
     )
 
-    traj_add_temporal_index = (
+    traj_add_temporal_index = checkpoint.restore_or_call(
+        "traj_add_temporal_index",
         add_temporal_index.validate()
         .partial(df=patrol_traj, **params_dict["traj_add_temporal_index"])
-        .call()
+        .call,
     )
 
-    split_patrol_traj_groups = (
+    split_patrol_traj_groups = checkpoint.restore_or_call(
+        "split_patrol_traj_groups",
         split_groups.validate()
         .partial(
             df=traj_add_temporal_index,
             groupers=groupers,
             **params_dict["split_patrol_traj_groups"],
         )
-        .call()
+        .call,
     )
 
-    patrol_traj_map_layers = (
+    patrol_traj_map_layers = checkpoint.restore_or_call(
+        "patrol_traj_map_layers",
         create_map_layer.validate()
         .partial(**params_dict["patrol_traj_map_layers"])
-        .mapvalues(argnames=["geodataframe"], argvalues=split_patrol_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geodataframe"],
+        argvalues=split_patrol_traj_groups,
     )
 
-    patrol_events = (
+    patrol_events = checkpoint.restore_or_call(
+        "patrol_events",
         get_patrol_events.validate()
         .partial(time_range=time_range, **params_dict["patrol_events"])
-        .call()
+        .call,
     )
 
-    filter_patrol_events = (
+    filter_patrol_events = checkpoint.restore_or_call(
+        "filter_patrol_events",
         apply_reloc_coord_filter.validate()
         .partial(df=patrol_events, **params_dict["filter_patrol_events"])
-        .call()
+        .call,
     )
 
-    pe_add_temporal_index = (
+    pe_add_temporal_index = checkpoint.restore_or_call(
+        "pe_add_temporal_index",
         add_temporal_index.validate()
         .partial(df=filter_patrol_events, **params_dict["pe_add_temporal_index"])
-        .call()
+        .call,
     )
 
-    pe_colormap = (
+    pe_colormap = checkpoint.restore_or_call(
+        "pe_colormap",
         apply_color_map.validate()
         .partial(df=pe_add_temporal_index, **params_dict["pe_colormap"])
-        .call()
+        .call,
     )
 
-    split_pe_groups = (
+    split_pe_groups = checkpoint.restore_or_call(
+        "split_pe_groups",
         split_groups.validate()
         .partial(df=pe_colormap, groupers=groupers, **params_dict["split_pe_groups"])
-        .call()
+        .call,
     )
 
-    patrol_events_map_layers = (
+    patrol_events_map_layers = checkpoint.restore_or_call(
+        "patrol_events_map_layers",
         create_map_layer.validate()
         .partial(**params_dict["patrol_events_map_layers"])
-        .mapvalues(argnames=["geodataframe"], argvalues=split_pe_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geodataframe"],
+        argvalues=split_pe_groups,
     )
 
-    combined_traj_and_pe_map_layers = (
+    combined_traj_and_pe_map_layers = checkpoint.restore_or_call(
+        "combined_traj_and_pe_map_layers",
         groupbykey.validate()
         .partial(
             iterables=[patrol_traj_map_layers, patrol_events_map_layers],
             **params_dict["combined_traj_and_pe_map_layers"],
         )
-        .call()
+        .call,
     )
 
-    traj_patrol_events_ecomap = (
+    traj_patrol_events_ecomap = checkpoint.restore_or_call(
+        "traj_patrol_events_ecomap",
         draw_ecomap.validate()
         .partial(**params_dict["traj_patrol_events_ecomap"])
-        .mapvalues(argnames=["geo_layers"], argvalues=combined_traj_and_pe_map_layers)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geo_layers"],
+        argvalues=combined_traj_and_pe_map_layers,
     )
 
-    traj_pe_ecomap_html_urls = (
+    traj_pe_ecomap_html_urls = checkpoint.restore_or_call(
+        "traj_pe_ecomap_html_urls",
         persist_text.validate()
         .partial(
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["traj_pe_ecomap_html_urls"],
         )
-        .mapvalues(argnames=["text"], argvalues=traj_patrol_events_ecomap)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["text"],
+        argvalues=traj_patrol_events_ecomap,
     )
 
-    traj_pe_map_widgets_single_views = (
+    traj_pe_map_widgets_single_views = checkpoint.restore_or_call(
+        "traj_pe_map_widgets_single_views",
         create_map_widget_single_view.validate()
         .partial(**params_dict["traj_pe_map_widgets_single_views"])
-        .map(argnames=["view", "data"], argvalues=traj_pe_ecomap_html_urls)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=traj_pe_ecomap_html_urls,
     )
 
-    traj_pe_grouped_map_widget = (
+    traj_pe_grouped_map_widget = checkpoint.restore_or_call(
+        "traj_pe_grouped_map_widget",
         merge_widget_views.validate()
         .partial(
             widgets=traj_pe_map_widgets_single_views,
             **params_dict["traj_pe_grouped_map_widget"],
         )
-        .call()
+        .call,
     )
 
-    total_patrols = (
+    total_patrols = checkpoint.restore_or_call(
+        "total_patrols",
         dataframe_column_nunique.validate()
         .partial(**params_dict["total_patrols"])
-        .mapvalues(argnames=["df"], argvalues=split_patrol_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_patrol_traj_groups,
     )
 
-    total_patrols_sv_widgets = (
+    total_patrols_sv_widgets = checkpoint.restore_or_call(
+        "total_patrols_sv_widgets",
         create_single_value_widget_single_view.validate()
         .partial(**params_dict["total_patrols_sv_widgets"])
-        .map(argnames=["view", "data"], argvalues=total_patrols)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=total_patrols,
     )
 
-    total_patrols_grouped_sv_widget = (
+    total_patrols_grouped_sv_widget = checkpoint.restore_or_call(
+        "total_patrols_grouped_sv_widget",
         merge_widget_views.validate()
         .partial(
             widgets=total_patrols_sv_widgets,
             **params_dict["total_patrols_grouped_sv_widget"],
         )
-        .call()
+        .call,
     )
 
-    total_patrol_time = (
+    total_patrol_time = checkpoint.restore_or_call(
+        "total_patrol_time",
         dataframe_column_sum.validate()
         .partial(**params_dict["total_patrol_time"])
-        .mapvalues(argnames=["df"], argvalues=split_patrol_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_patrol_traj_groups,
     )
 
-    total_patrol_time_converted = (
+    total_patrol_time_converted = checkpoint.restore_or_call(
+        "total_patrol_time_converted",
         with_unit.validate()
         .partial(**params_dict["total_patrol_time_converted"])
-        .mapvalues(argnames=["value"], argvalues=total_patrol_time)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["value"],
+        argvalues=total_patrol_time,
     )
 
-    total_patrol_time_sv_widgets = (
+    total_patrol_time_sv_widgets = checkpoint.restore_or_call(
+        "total_patrol_time_sv_widgets",
         create_single_value_widget_single_view.validate()
         .partial(**params_dict["total_patrol_time_sv_widgets"])
-        .map(argnames=["view", "data"], argvalues=total_patrol_time_converted)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=total_patrol_time_converted,
     )
 
-    patrol_time_grouped_widget = (
+    patrol_time_grouped_widget = checkpoint.restore_or_call(
+        "patrol_time_grouped_widget",
         merge_widget_views.validate()
         .partial(
             widgets=total_patrol_time_sv_widgets,
             **params_dict["patrol_time_grouped_widget"],
         )
-        .call()
+        .call,
     )
 
-    total_patrol_dist = (
+    total_patrol_dist = checkpoint.restore_or_call(
+        "total_patrol_dist",
         dataframe_column_sum.validate()
         .partial(**params_dict["total_patrol_dist"])
-        .mapvalues(argnames=["df"], argvalues=split_patrol_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_patrol_traj_groups,
     )
 
-    total_patrol_dist_converted = (
+    total_patrol_dist_converted = checkpoint.restore_or_call(
+        "total_patrol_dist_converted",
         with_unit.validate()
         .partial(**params_dict["total_patrol_dist_converted"])
-        .mapvalues(argnames=["value"], argvalues=total_patrol_dist)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["value"],
+        argvalues=total_patrol_dist,
     )
 
-    total_patrol_dist_sv_widgets = (
+    total_patrol_dist_sv_widgets = checkpoint.restore_or_call(
+        "total_patrol_dist_sv_widgets",
         create_single_value_widget_single_view.validate()
         .partial(**params_dict["total_patrol_dist_sv_widgets"])
-        .map(argnames=["view", "data"], argvalues=total_patrol_dist_converted)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=total_patrol_dist_converted,
     )
 
-    patrol_dist_grouped_widget = (
+    patrol_dist_grouped_widget = checkpoint.restore_or_call(
+        "patrol_dist_grouped_widget",
         merge_widget_views.validate()
         .partial(
             widgets=total_patrol_dist_sv_widgets,
             **params_dict["patrol_dist_grouped_widget"],
         )
-        .call()
+        .call,
     )
 
-    avg_speed = (
+    avg_speed = checkpoint.restore_or_call(
+        "avg_speed",
         dataframe_column_mean.validate()
         .partial(**params_dict["avg_speed"])
-        .mapvalues(argnames=["df"], argvalues=split_patrol_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_patrol_traj_groups,
     )
 
-    average_speed_converted = (
+    average_speed_converted = checkpoint.restore_or_call(
+        "average_speed_converted",
         with_unit.validate()
         .partial(**params_dict["average_speed_converted"])
-        .mapvalues(argnames=["value"], argvalues=avg_speed)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["value"],
+        argvalues=avg_speed,
     )
 
-    avg_speed_sv_widgets = (
+    avg_speed_sv_widgets = checkpoint.restore_or_call(
+        "avg_speed_sv_widgets",
         create_single_value_widget_single_view.validate()
         .partial(**params_dict["avg_speed_sv_widgets"])
-        .map(argnames=["view", "data"], argvalues=average_speed_converted)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=average_speed_converted,
     )
 
-    avg_speed_grouped_widget = (
+    avg_speed_grouped_widget = checkpoint.restore_or_call(
+        "avg_speed_grouped_widget",
         merge_widget_views.validate()
         .partial(
             widgets=avg_speed_sv_widgets, **params_dict["avg_speed_grouped_widget"]
         )
-        .call()
+        .call,
     )
 
-    max_speed = (
+    max_speed = checkpoint.restore_or_call(
+        "max_speed",
         dataframe_column_max.validate()
         .partial(**params_dict["max_speed"])
-        .mapvalues(argnames=["df"], argvalues=split_patrol_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_patrol_traj_groups,
     )
 
-    max_speed_converted = (
+    max_speed_converted = checkpoint.restore_or_call(
+        "max_speed_converted",
         with_unit.validate()
         .partial(**params_dict["max_speed_converted"])
-        .mapvalues(argnames=["value"], argvalues=max_speed)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["value"],
+        argvalues=max_speed,
     )
 
-    max_speed_sv_widgets = (
+    max_speed_sv_widgets = checkpoint.restore_or_call(
+        "max_speed_sv_widgets",
         create_single_value_widget_single_view.validate()
         .partial(**params_dict["max_speed_sv_widgets"])
-        .map(argnames=["view", "data"], argvalues=max_speed_converted)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=max_speed_converted,
     )
 
-    max_speed_grouped_widget = (
+    max_speed_grouped_widget = checkpoint.restore_or_call(
+        "max_speed_grouped_widget",
         merge_widget_views.validate()
         .partial(
             widgets=max_speed_sv_widgets, **params_dict["max_speed_grouped_widget"]
         )
-        .call()
+        .call,
     )
 
-    patrol_events_bar_chart = (
+    patrol_events_bar_chart = checkpoint.restore_or_call(
+        "patrol_events_bar_chart",
         draw_time_series_bar_chart.validate()
         .partial(
             dataframe=filter_patrol_events, **params_dict["patrol_events_bar_chart"]
         )
-        .call()
+        .call,
     )
 
-    patrol_events_bar_chart_html_url = (
+    patrol_events_bar_chart_html_url = checkpoint.restore_or_call(
+        "patrol_events_bar_chart_html_url",
         persist_text.validate()
         .partial(
             text=patrol_events_bar_chart,
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["patrol_events_bar_chart_html_url"],
         )
-        .call()
+        .call,
     )
 
-    patrol_events_bar_chart_widget = (
+    patrol_events_bar_chart_widget = checkpoint.restore_or_call(
+        "patrol_events_bar_chart_widget",
         create_plot_widget_single_view.validate()
         .partial(
             data=patrol_events_bar_chart_html_url,
             **params_dict["patrol_events_bar_chart_widget"],
         )
-        .call()
+        .call,
     )
 
-    patrol_events_pie_chart = (
+    patrol_events_pie_chart = checkpoint.restore_or_call(
+        "patrol_events_pie_chart",
         draw_pie_chart.validate()
         .partial(**params_dict["patrol_events_pie_chart"])
-        .mapvalues(argnames=["dataframe"], argvalues=split_pe_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["dataframe"],
+        argvalues=split_pe_groups,
     )
 
-    pe_pie_chart_html_urls = (
+    pe_pie_chart_html_urls = checkpoint.restore_or_call(
+        "pe_pie_chart_html_urls",
         persist_text.validate()
         .partial(
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["pe_pie_chart_html_urls"],
         )
-        .mapvalues(argnames=["text"], argvalues=patrol_events_pie_chart)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["text"],
+        argvalues=patrol_events_pie_chart,
     )
 
-    patrol_events_pie_chart_widgets = (
+    patrol_events_pie_chart_widgets = checkpoint.restore_or_call(
+        "patrol_events_pie_chart_widgets",
         create_plot_widget_single_view.validate()
         .partial(**params_dict["patrol_events_pie_chart_widgets"])
-        .map(argnames=["view", "data"], argvalues=pe_pie_chart_html_urls)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=pe_pie_chart_html_urls,
     )
 
-    patrol_events_pie_widget_grouped = (
+    patrol_events_pie_widget_grouped = checkpoint.restore_or_call(
+        "patrol_events_pie_widget_grouped",
         merge_widget_views.validate()
         .partial(
             widgets=patrol_events_pie_chart_widgets,
             **params_dict["patrol_events_pie_widget_grouped"],
         )
-        .call()
+        .call,
     )
 
-    td = (
+    td = checkpoint.restore_or_call(
+        "td",
         calculate_time_density.validate()
         .partial(trajectory_gdf=patrol_traj, **params_dict["td"])
-        .call()
+        .call,
     )
 
-    td_colormap = (
-        apply_color_map.validate().partial(df=td, **params_dict["td_colormap"]).call()
+    td_colormap = checkpoint.restore_or_call(
+        "td_colormap",
+        apply_color_map.validate().partial(df=td, **params_dict["td_colormap"]).call,
     )
 
-    td_map_layer = (
+    td_map_layer = checkpoint.restore_or_call(
+        "td_map_layer",
         create_map_layer.validate()
         .partial(geodataframe=td_colormap, **params_dict["td_map_layer"])
-        .call()
+        .call,
     )
 
-    td_ecomap = (
+    td_ecomap = checkpoint.restore_or_call(
+        "td_ecomap",
         draw_ecomap.validate()
         .partial(geo_layers=td_map_layer, **params_dict["td_ecomap"])
-        .call()
+        .call,
     )
 
-    td_ecomap_html_url = (
+    td_ecomap_html_url = checkpoint.restore_or_call(
+        "td_ecomap_html_url",
         persist_text.validate()
         .partial(
             text=td_ecomap,
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["td_ecomap_html_url"],
         )
-        .call()
+        .call,
     )
 
-    td_map_widget = (
+    td_map_widget = checkpoint.restore_or_call(
+        "td_map_widget",
         create_map_widget_single_view.validate()
         .partial(data=td_ecomap_html_url, **params_dict["td_map_widget"])
-        .call()
+        .call,
     )
 
-    patrol_dashboard = (
+    patrol_dashboard = checkpoint.restore_or_call(
+        "patrol_dashboard",
         gather_dashboard.validate()
         .partial(
             widgets=[
@@ -422,7 +554,8 @@ def main(params: Params):
             time_range=time_range,
             **params_dict["patrol_dashboard"],
         )
-        .call()
+        .call,
     )
 
+    checkpoint.complete()
     return patrol_dashboard
@@ -1,6 +1,6 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "0d1105f115cdc90bd410b5ba170adfc21fb0b9d91af21f80eb7fac7ae90281bb"
+# from-spec-sha256 = "31ce40fc19879718938f55361e7c0339f08fdf44972fd1b2d4bdf8cdb50c0092"
 
 
 from .run_async import main as run_async
@@ -1,10 +1,27 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "0d1105f115cdc90bd410b5ba170adfc21fb0b9d91af21f80eb7fac7ae90281bb"
+# from-spec-sha256 = "31ce40fc19879718938f55361e7c0339f08fdf44972fd1b2d4bdf8cdb50c0092"
 import json
 import os
 
-from ecoscope_workflows_core.graph import DependsOn, DependsOnSequence, Graph, Node
+from ecoscope_workflows_core.cache import ResultCache
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.dataplane import DataPlane
+from ecoscope_workflows_core.executors import (
+    AsyncExecutorName,
+    BoundedExecutor,
+    SpeculativeExecutor,
+    get_async_executor,
+)
+from ecoscope_workflows_core.graph import (
+    DependsOn,
+    DependsOnSequence,
+    Graph,
+    Node,
+    RunSettings,
+)
+from ecoscope_workflows_core.placement import CostPlacement
+from ecoscope_workflows_core.priority import CriticalPathPriority
 
 from ecoscope_workflows_core.tasks.groupby import set_groupers
 from ecoscope_workflows_core.tasks.filter import set_time_range
@@ -37,8 +54,12 @@ from ecoscope_workflows_core.tasks.results import gather_dashboard
 from ..params import Params
 
 
-def main(params: Params):
+def main(params: Params, executor: AsyncExecutorName = "lithops"):
     params_dict = json.loads(params.model_dump_json(exclude_unset=True))
+    # a single executor session is shared by all nodes, and closed by the graph when done
+    session = SpeculativeExecutor.from_env(
+        BoundedExecutor.from_env(get_async_executor(executor))
+    )
 
     dependencies = {
         "groupers": [],
@@ -109,17 +130,17 @@ def main(params: Params):
 
     nodes = {
         "groupers": Node(
-            async_task=set_groupers.validate().set_executor("lithops"),
+            async_task=set_groupers.validate().set_executor(session),
             partial=params_dict["groupers"],
             method="call",
         ),
         "time_range": Node(
-            async_task=set_time_range.validate().set_executor("lithops"),
+            async_task=set_time_range.validate().set_executor(session),
             partial=params_dict["time_range"],
             method="call",
         ),
         "subject_obs": Node(
-            async_task=get_subjectgroup_observations.validate().set_executor("lithops"),
+            async_task=get_subjectgroup_observations.validate().set_executor(session),
             partial={
                 "time_range": DependsOn("time_range"),
             }
@@ -127,7 +148,7 @@ def main(params: Params):
             method="call",
         ),
         "subject_reloc": Node(
-            async_task=process_relocations.validate().set_executor("lithops"),
+            async_task=process_relocations.validate().set_executor(session),
             partial={
                 "observations": DependsOn("subject_obs"),
             }
@@ -135,7 +156,7 @@ def main(params: Params):
             method="call",
         ),
         "day_night_labels": Node(
-            async_task=classify_is_night.validate().set_executor("lithops"),
+            async_task=classify_is_night.validate().set_executor(session),
             partial={
                 "relocations": DependsOn("subject_reloc"),
             }
@@ -143,7 +164,7 @@ def main(params: Params):
             method="call",
         ),
         "subject_traj": Node(
-            async_task=relocations_to_trajectory.validate().set_executor("lithops"),
+            async_task=relocations_to_trajectory.validate().set_executor(session),
             partial={
                 "relocations": DependsOn("day_night_labels"),
             }
@@ -151,7 +172,7 @@ def main(params: Params):
             method="call",
         ),
         "traj_add_temporal_index": Node(
-            async_task=add_temporal_index.validate().set_executor("lithops"),
+            async_task=add_temporal_index.validate().set_executor(session),
             partial={
                 "df": DependsOn("subject_traj"),
             }
@@ -159,7 +180,7 @@ def main(params: Params):
             method="call",
         ),
         "split_subject_traj_groups": Node(
-            async_task=split_groups.validate().set_executor("lithops"),
+            async_task=split_groups.validate().set_executor(session),
             partial={
                 "df": DependsOn("traj_add_temporal_index"),
                 "groupers": DependsOn("groupers"),
@@ -168,7 +189,7 @@ def main(params: Params):
             method="call",
         ),
         "classify_traj_speed": Node(
-            async_task=apply_classification.validate().set_executor("lithops"),
+            async_task=apply_classification.validate().set_executor(session),
             partial=params_dict["classify_traj_speed"],
             method="mapvalues",
             kwargs={
@@ -177,7 +198,7 @@ def main(params: Params):
             },
         ),
         "colormap_traj_speed": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial=params_dict["colormap_traj_speed"],
             method="mapvalues",
             kwargs={
@@ -186,7 +207,7 @@ def main(params: Params):
             },
         ),
         "speedmap_legend_with_unit": Node(
-            async_task=map_values_with_unit.validate().set_executor("lithops"),
+            async_task=map_values_with_unit.validate().set_executor(session),
             partial=params_dict["speedmap_legend_with_unit"],
             method="mapvalues",
             kwargs={
@@ -195,7 +216,7 @@ def main(params: Params):
             },
         ),
         "traj_map_layers": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["traj_map_layers"],
             method="mapvalues",
             kwargs={
@@ -204,7 +225,7 @@ def main(params: Params):
             },
         ),
         "traj_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["traj_ecomap"],
             method="mapvalues",
             kwargs={
@@ -213,7 +234,7 @@ def main(params: Params):
             },
         ),
         "ecomap_html_urls": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -225,7 +246,7 @@ def main(params: Params):
             },
         ),
         "traj_map_widgets_single_views": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["traj_map_widgets_single_views"],
             method="map",
             kwargs={
@@ -234,7 +255,7 @@ def main(params: Params):
             },
         ),
         "traj_grouped_map_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("traj_map_widgets_single_views"),
             }
@@ -242,7 +263,7 @@ def main(params: Params):
             method="call",
         ),
         "colormap_traj_night": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial=params_dict["colormap_traj_night"],
             method="mapvalues",
             kwargs={
@@ -251,7 +272,7 @@ def main(params: Params):
             },
         ),
         "traj_map_night_layers": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["traj_map_night_layers"],
             method="mapvalues",
             kwargs={
@@ -260,7 +281,7 @@ def main(params: Params):
             },
         ),
         "traj_daynight_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["traj_daynight_ecomap"],
             method="mapvalues",
             kwargs={
@@ -269,7 +290,7 @@ def main(params: Params):
             },
         ),
         "ecomap_daynight_html_urls": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -281,7 +302,7 @@ def main(params: Params):
             },
         ),
         "traj_map_daynight_widgets_sv": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["traj_map_daynight_widgets_sv"],
             method="map",
             kwargs={
@@ -290,7 +311,7 @@ def main(params: Params):
             },
         ),
         "traj_daynight_grouped_map_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("traj_map_daynight_widgets_sv"),
             }
@@ -298,7 +319,7 @@ def main(params: Params):
             method="call",
         ),
         "mean_speed": Node(
-            async_task=dataframe_column_mean.validate().set_executor("lithops"),
+            async_task=dataframe_column_mean.validate().set_executor(session),
             partial=params_dict["mean_speed"],
             method="mapvalues",
             kwargs={
@@ -307,7 +328,7 @@ def main(params: Params):
             },
         ),
         "average_speed_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["average_speed_converted"],
             method="mapvalues",
             kwargs={
@@ -317,7 +338,7 @@ def main(params: Params):
         ),
         "mean_speed_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["mean_speed_sv_widgets"],
             method="map",
@@ -327,7 +348,7 @@ def main(params: Params):
             },
         ),
         "mean_speed_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("mean_speed_sv_widgets"),
             }
@@ -335,7 +356,7 @@ def main(params: Params):
             method="call",
         ),
         "max_speed": Node(
-            async_task=dataframe_column_max.validate().set_executor("lithops"),
+            async_task=dataframe_column_max.validate().set_executor(session),
             partial=params_dict["max_speed"],
             method="mapvalues",
             kwargs={
@@ -344,7 +365,7 @@ def main(params: Params):
             },
         ),
         "max_speed_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["max_speed_converted"],
             method="mapvalues",
             kwargs={
@@ -354,7 +375,7 @@ def main(params: Params):
         ),
         "max_speed_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["max_speed_sv_widgets"],
             method="map",
@@ -364,7 +385,7 @@ def main(params: Params):
             },
         ),
         "max_speed_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("max_speed_sv_widgets"),
             }
@@ -372,7 +393,7 @@ def main(params: Params):
             method="call",
         ),
         "num_location": Node(
-            async_task=dataframe_count.validate().set_executor("lithops"),
+            async_task=dataframe_count.validate().set_executor(session),
             partial=params_dict["num_location"],
             method="mapvalues",
             kwargs={
@@ -382,7 +403,7 @@ def main(params: Params):
         ),
         "num_location_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["num_location_sv_widgets"],
             method="map",
@@ -392,7 +413,7 @@ def main(params: Params):
             },
         ),
         "num_location_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("num_location_sv_widgets"),
             }
@@ -400,7 +421,7 @@ def main(params: Params):
             method="call",
         ),
         "daynight_ratio": Node(
-            async_task=get_day_night_ratio.validate().set_executor("lithops"),
+            async_task=get_day_night_ratio.validate().set_executor(session),
             partial=params_dict["daynight_ratio"],
             method="mapvalues",
             kwargs={
@@ -410,7 +431,7 @@ def main(params: Params):
         ),
         "daynight_ratio_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["daynight_ratio_sv_widgets"],
             method="map",
@@ -420,7 +441,7 @@ def main(params: Params):
             },
         ),
         "daynight_ratio_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("daynight_ratio_sv_widgets"),
             }
@@ -428,7 +449,7 @@ def main(params: Params):
             method="call",
         ),
         "total_distance": Node(
-            async_task=dataframe_column_sum.validate().set_executor("lithops"),
+            async_task=dataframe_column_sum.validate().set_executor(session),
             partial=params_dict["total_distance"],
             method="mapvalues",
             kwargs={
@@ -437,7 +458,7 @@ def main(params: Params):
             },
         ),
         "total_dist_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["total_dist_converted"],
             method="mapvalues",
             kwargs={
@@ -447,7 +468,7 @@ def main(params: Params):
         ),
         "total_distance_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["total_distance_sv_widgets"],
             method="map",
@@ -457,7 +478,7 @@ def main(params: Params):
             },
         ),
         "total_dist_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("total_distance_sv_widgets"),
             }
@@ -465,7 +486,7 @@ def main(params: Params):
             method="call",
         ),
         "total_time": Node(
-            async_task=dataframe_column_sum.validate().set_executor("lithops"),
+            async_task=dataframe_column_sum.validate().set_executor(session),
             partial=params_dict["total_time"],
             method="mapvalues",
             kwargs={
@@ -474,7 +495,7 @@ def main(params: Params):
             },
         ),
         "total_time_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["total_time_converted"],
             method="mapvalues",
             kwargs={
@@ -484,7 +505,7 @@ def main(params: Params):
         ),
         "total_time_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["total_time_sv_widgets"],
             method="map",
@@ -494,7 +515,7 @@ def main(params: Params):
             },
         ),
         "total_time_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("total_time_sv_widgets"),
             }
@@ -502,7 +523,7 @@ def main(params: Params):
             method="call",
         ),
         "td": Node(
-            async_task=calculate_time_density.validate().set_executor("lithops"),
+            async_task=calculate_time_density.validate().set_executor(session),
             partial=params_dict["td"],
             method="mapvalues",
             kwargs={
@@ -511,7 +532,7 @@ def main(params: Params):
             },
         ),
         "td_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial=params_dict["td_colormap"],
             method="mapvalues",
             kwargs={
@@ -520,7 +541,7 @@ def main(params: Params):
             },
         ),
         "td_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["td_map_layer"],
             method="mapvalues",
             kwargs={
@@ -529,7 +550,7 @@ def main(params: Params):
             },
         ),
         "td_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["td_ecomap"],
             method="mapvalues",
             kwargs={
@@ -538,7 +559,7 @@ def main(params: Params):
             },
         ),
         "td_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -550,7 +571,7 @@ def main(params: Params):
             },
         ),
         "td_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["td_map_widget"],
             method="map",
             kwargs={
@@ -559,7 +580,7 @@ def main(params: Params):
             },
         ),
         "td_grouped_map_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("td_map_widget"),
             }
@@ -567,7 +588,7 @@ def main(params: Params):
             method="call",
         ),
         "subject_tracking_dashboard": Node(
-            async_task=gather_dashboard.validate().set_executor("lithops"),
+            async_task=gather_dashboard.validate().set_executor(session),
             partial={
                 "widgets": DependsOnSequence(
                     [
@@ -589,6 +610,24 @@ def main(params: Params):
             method="call",
         ),
     }
-    graph = Graph(dependencies=dependencies, nodes=nodes)
+    graph = Graph(
+        dependencies=dependencies,
+        nodes=nodes,
+        scheduler="as-completed",
+        cache=ResultCache.from_env(),
+        checkpoint=Checkpoint.from_env(
+            inputs={
+                "spec": "31ce40fc19879718938f55361e7c0339f08fdf44972fd1b2d4bdf8cdb50c0092",
+                "params": params_dict,
+            }
+        ),
+        priority=CriticalPathPriority.from_env(),
+        fuse_chains=True,
+        executor=session,
+        dataplane=DataPlane.from_env(),
+        pipeline=True,
+        placement=CostPlacement.from_env(),
+        deadline=RunSettings().deadline,
+    )
     results = graph.execute()
     return results
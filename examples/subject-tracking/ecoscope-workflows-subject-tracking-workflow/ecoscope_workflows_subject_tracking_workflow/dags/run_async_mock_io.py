@@ -1,6 +1,6 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "0d1105f115cdc90bd410b5ba170adfc21fb0b9d91af21f80eb7fac7ae90281bb"
+# from-spec-sha256 = "31ce40fc19879718938f55361e7c0339f08fdf44972fd1b2d4bdf8cdb50c0092"
 
 # ruff: noqa: E402
 
@@ -15,7 +15,24 @@ import warnings  # 🧪
 from ecoscope_workflows_core.testing import create_task_magicmock  # 🧪
 
 
-from ecoscope_workflows_core.graph import DependsOn, DependsOnSequence, Graph, Node
+from ecoscope_workflows_core.cache import ResultCache
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.dataplane import DataPlane
+from ecoscope_workflows_core.executors import (
+    AsyncExecutorName,
+    BoundedExecutor,
+    SpeculativeExecutor,
+    get_async_executor,
+)
+from ecoscope_workflows_core.graph import (
+    DependsOn,
+    DependsOnSequence,
+    Graph,
+    Node,
+    RunSettings,
+)
+from ecoscope_workflows_core.placement import CostPlacement
+from ecoscope_workflows_core.priority import CriticalPathPriority
 
 from ecoscope_workflows_core.tasks.groupby import set_groupers
 from ecoscope_workflows_core.tasks.filter import set_time_range
@@ -52,10 +69,14 @@ from ecoscope_workflows_core.tasks.results import gather_dashboard
 from ..params import Params
 
 
-def main(params: Params):
+def main(params: Params, executor: AsyncExecutorName = "lithops"):
     warnings.warn("This test script should not be used in production!")  # 🧪
 
     params_dict = json.loads(params.model_dump_json(exclude_unset=True))
+    # a single executor session is shared by all nodes, and closed by the graph when done
+    session = SpeculativeExecutor.from_env(
+        BoundedExecutor.from_env(get_async_executor(executor))
+    )
 
     dependencies = {
         "groupers": [],
@@ -126,17 +147,17 @@ def main(params: Params):
 
     nodes = {
         "groupers": Node(
-            async_task=set_groupers.validate().set_executor("lithops"),
+            async_task=set_groupers.validate().set_executor(session),
             partial=params_dict["groupers"],
             method="call",
         ),
         "time_range": Node(
-            async_task=set_time_range.validate().set_executor("lithops"),
+            async_task=set_time_range.validate().set_executor(session),
             partial=params_dict["time_range"],
             method="call",
         ),
         "subject_obs": Node(
-            async_task=get_subjectgroup_observations.validate().set_executor("lithops"),
+            async_task=get_subjectgroup_observations.validate().set_executor(session),
             partial={
                 "time_range": DependsOn("time_range"),
             }
@@ -144,7 +165,7 @@ def main(params: Params):
             method="call",
         ),
         "subject_reloc": Node(
-            async_task=process_relocations.validate().set_executor("lithops"),
+            async_task=process_relocations.validate().set_executor(session),
             partial={
                 "observations": DependsOn("subject_obs"),
             }
@@ -152,7 +173,7 @@ def main(params: Params):
             method="call",
         ),
         "day_night_labels": Node(
-            async_task=classify_is_night.validate().set_executor("lithops"),
+            async_task=classify_is_night.validate().set_executor(session),
             partial={
                 "relocations": DependsOn("subject_reloc"),
             }
@@ -160,7 +181,7 @@ def main(params: Params):
             method="call",
         ),
         "subject_traj": Node(
-            async_task=relocations_to_trajectory.validate().set_executor("lithops"),
+            async_task=relocations_to_trajectory.validate().set_executor(session),
             partial={
                 "relocations": DependsOn("day_night_labels"),
             }
@@ -168,7 +189,7 @@ def main(params: Params):
             method="call",
         ),
         "traj_add_temporal_index": Node(
-            async_task=add_temporal_index.validate().set_executor("lithops"),
+            async_task=add_temporal_index.validate().set_executor(session),
             partial={
                 "df": DependsOn("subject_traj"),
             }
@@ -176,7 +197,7 @@ def main(params: Params):
             method="call",
         ),
         "split_subject_traj_groups": Node(
-            async_task=split_groups.validate().set_executor("lithops"),
+            async_task=split_groups.validate().set_executor(session),
             partial={
                 "df": DependsOn("traj_add_temporal_index"),
                 "groupers": DependsOn("groupers"),
@@ -185,7 +206,7 @@ def main(params: Params):
             method="call",
         ),
         "classify_traj_speed": Node(
-            async_task=apply_classification.validate().set_executor("lithops"),
+            async_task=apply_classification.validate().set_executor(session),
             partial=params_dict["classify_traj_speed"],
             method="mapvalues",
             kwargs={
@@ -194,7 +215,7 @@ def main(params: Params):
             },
         ),
         "colormap_traj_speed": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial=params_dict["colormap_traj_speed"],
             method="mapvalues",
             kwargs={
@@ -203,7 +224,7 @@ def main(params: Params):
             },
         ),
         "speedmap_legend_with_unit": Node(
-            async_task=map_values_with_unit.validate().set_executor("lithops"),
+            async_task=map_values_with_unit.validate().set_executor(session),
             partial=params_dict["speedmap_legend_with_unit"],
             method="mapvalues",
             kwargs={
@@ -212,7 +233,7 @@ def main(params: Params):
             },
         ),
         "traj_map_layers": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["traj_map_layers"],
             method="mapvalues",
             kwargs={
@@ -221,7 +242,7 @@ def main(params: Params):
             },
         ),
         "traj_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["traj_ecomap"],
             method="mapvalues",
             kwargs={
@@ -230,7 +251,7 @@ def main(params: Params):
             },
         ),
         "ecomap_html_urls": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -242,7 +263,7 @@ def main(params: Params):
             },
         ),
         "traj_map_widgets_single_views": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["traj_map_widgets_single_views"],
             method="map",
             kwargs={
@@ -251,7 +272,7 @@ def main(params: Params):
             },
         ),
         "traj_grouped_map_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("traj_map_widgets_single_views"),
             }
@@ -259,7 +280,7 @@ def main(params: Params):
             method="call",
         ),
         "colormap_traj_night": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial=params_dict["colormap_traj_night"],
             method="mapvalues",
             kwargs={
@@ -268,7 +289,7 @@ def main(params: Params):
             },
         ),
         "traj_map_night_layers": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["traj_map_night_layers"],
             method="mapvalues",
             kwargs={
@@ -277,7 +298,7 @@ def main(params: Params):
             },
         ),
         "traj_daynight_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["traj_daynight_ecomap"],
             method="mapvalues",
             kwargs={
@@ -286,7 +307,7 @@ def main(params: Params):
             },
         ),
         "ecomap_daynight_html_urls": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -298,7 +319,7 @@ def main(params: Params):
             },
         ),
         "traj_map_daynight_widgets_sv": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["traj_map_daynight_widgets_sv"],
             method="map",
             kwargs={
@@ -307,7 +328,7 @@ def main(params: Params):
             },
         ),
         "traj_daynight_grouped_map_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("traj_map_daynight_widgets_sv"),
             }
@@ -315,7 +336,7 @@ def main(params: Params):
             method="call",
         ),
         "mean_speed": Node(
-            async_task=dataframe_column_mean.validate().set_executor("lithops"),
+            async_task=dataframe_column_mean.validate().set_executor(session),
             partial=params_dict["mean_speed"],
             method="mapvalues",
             kwargs={
@@ -324,7 +345,7 @@ def main(params: Params):
             },
         ),
         "average_speed_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["average_speed_converted"],
             method="mapvalues",
             kwargs={
@@ -334,7 +355,7 @@ def main(params: Params):
         ),
         "mean_speed_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["mean_speed_sv_widgets"],
             method="map",
@@ -344,7 +365,7 @@ def main(params: Params):
             },
         ),
         "mean_speed_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("mean_speed_sv_widgets"),
             }
@@ -352,7 +373,7 @@ def main(params: Params):
             method="call",
         ),
         "max_speed": Node(
-            async_task=dataframe_column_max.validate().set_executor("lithops"),
+            async_task=dataframe_column_max.validate().set_executor(session),
             partial=params_dict["max_speed"],
             method="mapvalues",
             kwargs={
@@ -361,7 +382,7 @@ def main(params: Params):
             },
         ),
         "max_speed_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["max_speed_converted"],
             method="mapvalues",
             kwargs={
@@ -371,7 +392,7 @@ def main(params: Params):
         ),
         "max_speed_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["max_speed_sv_widgets"],
             method="map",
@@ -381,7 +402,7 @@ def main(params: Params):
             },
         ),
         "max_speed_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("max_speed_sv_widgets"),
             }
@@ -389,7 +410,7 @@ def main(params: Params):
             method="call",
         ),
         "num_location": Node(
-            async_task=dataframe_count.validate().set_executor("lithops"),
+            async_task=dataframe_count.validate().set_executor(session),
             partial=params_dict["num_location"],
             method="mapvalues",
             kwargs={
@@ -399,7 +420,7 @@ def main(params: Params):
         ),
         "num_location_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["num_location_sv_widgets"],
             method="map",
@@ -409,7 +430,7 @@ def main(params: Params):
             },
         ),
         "num_location_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("num_location_sv_widgets"),
             }
@@ -417,7 +438,7 @@ def main(params: Params):
             method="call",
         ),
         "daynight_ratio": Node(
-            async_task=get_day_night_ratio.validate().set_executor("lithops"),
+            async_task=get_day_night_ratio.validate().set_executor(session),
             partial=params_dict["daynight_ratio"],
             method="mapvalues",
             kwargs={
@@ -427,7 +448,7 @@ def main(params: Params):
         ),
         "daynight_ratio_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["daynight_ratio_sv_widgets"],
             method="map",
@@ -437,7 +458,7 @@ def main(params: Params):
             },
         ),
         "daynight_ratio_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("daynight_ratio_sv_widgets"),
             }
@@ -445,7 +466,7 @@ def main(params: Params):
             method="call",
         ),
         "total_distance": Node(
-            async_task=dataframe_column_sum.validate().set_executor("lithops"),
+            async_task=dataframe_column_sum.validate().set_executor(session),
             partial=params_dict["total_distance"],
             method="mapvalues",
             kwargs={
@@ -454,7 +475,7 @@ def main(params: Params):
             },
         ),
         "total_dist_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["total_dist_converted"],
             method="mapvalues",
             kwargs={
@@ -464,7 +485,7 @@ def main(params: Params):
         ),
         "total_distance_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["total_distance_sv_widgets"],
             method="map",
@@ -474,7 +495,7 @@ def main(params: Params):
             },
         ),
         "total_dist_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("total_distance_sv_widgets"),
             }
@@ -482,7 +503,7 @@ def main(params: Params):
             method="call",
         ),
         "total_time": Node(
-            async_task=dataframe_column_sum.validate().set_executor("lithops"),
+            async_task=dataframe_column_sum.validate().set_executor(session),
             partial=params_dict["total_time"],
             method="mapvalues",
             kwargs={
@@ -491,7 +512,7 @@ def main(params: Params):
             },
         ),
         "total_time_converted": Node(
-            async_task=with_unit.validate().set_executor("lithops"),
+            async_task=with_unit.validate().set_executor(session),
             partial=params_dict["total_time_converted"],
             method="mapvalues",
             kwargs={
@@ -501,7 +522,7 @@ def main(params: Params):
         ),
         "total_time_sv_widgets": Node(
             async_task=create_single_value_widget_single_view.validate().set_executor(
-                "lithops"
+                session
             ),
             partial=params_dict["total_time_sv_widgets"],
             method="map",
@@ -511,7 +532,7 @@ def main(params: Params):
             },
         ),
         "total_time_grouped_sv_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("total_time_sv_widgets"),
             }
@@ -519,7 +540,7 @@ def main(params: Params):
             method="call",
         ),
         "td": Node(
-            async_task=calculate_time_density.validate().set_executor("lithops"),
+            async_task=calculate_time_density.validate().set_executor(session),
             partial=params_dict["td"],
             method="mapvalues",
             kwargs={
@@ -528,7 +549,7 @@ def main(params: Params):
             },
         ),
         "td_colormap": Node(
-            async_task=apply_color_map.validate().set_executor("lithops"),
+            async_task=apply_color_map.validate().set_executor(session),
             partial=params_dict["td_colormap"],
             method="mapvalues",
             kwargs={
@@ -537,7 +558,7 @@ def main(params: Params):
             },
         ),
         "td_map_layer": Node(
-            async_task=create_map_layer.validate().set_executor("lithops"),
+            async_task=create_map_layer.validate().set_executor(session),
             partial=params_dict["td_map_layer"],
             method="mapvalues",
             kwargs={
@@ -546,7 +567,7 @@ def main(params: Params):
             },
         ),
         "td_ecomap": Node(
-            async_task=draw_ecomap.validate().set_executor("lithops"),
+            async_task=draw_ecomap.validate().set_executor(session),
             partial=params_dict["td_ecomap"],
             method="mapvalues",
             kwargs={
@@ -555,7 +576,7 @@ def main(params: Params):
             },
         ),
         "td_ecomap_html_url": Node(
-            async_task=persist_text.validate().set_executor("lithops"),
+            async_task=persist_text.validate().set_executor(session),
             partial={
                 "root_path": os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             }
@@ -567,7 +588,7 @@ def main(params: Params):
             },
         ),
         "td_map_widget": Node(
-            async_task=create_map_widget_single_view.validate().set_executor("lithops"),
+            async_task=create_map_widget_single_view.validate().set_executor(session),
             partial=params_dict["td_map_widget"],
             method="map",
             kwargs={
@@ -576,7 +597,7 @@ def main(params: Params):
             },
         ),
         "td_grouped_map_widget": Node(
-            async_task=merge_widget_views.validate().set_executor("lithops"),
+            async_task=merge_widget_views.validate().set_executor(session),
             partial={
                 "widgets": DependsOn("td_map_widget"),
             }
@@ -584,7 +605,7 @@ def main(params: Params):
             method="call",
         ),
         "subject_tracking_dashboard": Node(
-            async_task=gather_dashboard.validate().set_executor("lithops"),
+            async_task=gather_dashboard.validate().set_executor(session),
             partial={
                 "widgets": DependsOnSequence(
                     [
@@ -606,6 +627,24 @@ def main(params: Params):
             method="call",
         ),
     }
-    graph = Graph(dependencies=dependencies, nodes=nodes)
+    graph = Graph(
+        dependencies=dependencies,
+        nodes=nodes,
+        scheduler="as-completed",
+        cache=ResultCache.from_env(),
+        checkpoint=Checkpoint.from_env(
+            inputs={
+                "spec": "31ce40fc19879718938f55361e7c0339f08fdf44972fd1b2d4bdf8cdb50c0092",
+                "params": params_dict,
+            }
+        ),
+        priority=CriticalPathPriority.from_env(),
+        fuse_chains=True,
+        executor=session,
+        dataplane=DataPlane.from_env(),
+        pipeline=True,
+        placement=CostPlacement.from_env(),
+        deadline=RunSettings().deadline,
+    )
     results = graph.execute()
     return results
@@ -1,9 +1,12 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "0d1105f115cdc90bd410b5ba170adfc21fb0b9d91af21f80eb7fac7ae90281bb"
+# from-spec-sha256 = "31ce40fc19879718938f55361e7c0339f08fdf44972fd1b2d4bdf8cdb50c0092"
 import json
 import os
 
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.executors import PythonExecutor
+
 from ecoscope_workflows_core.tasks.groupby import set_groupers
 from ecoscope_workflows_core.tasks.filter import set_time_range
 from ecoscope_workflows_ext_ecoscope.tasks.io import get_subjectgroup_observations
@@ -37,340 +40,505 @@ from ..params import Params
 
 def main(params: Params):
     params_dict = json.loads(params.model_dump_json(exclude_unset=True))
+    checkpoint = Checkpoint.from_env(
+        inputs={
+            "spec": "31ce40fc19879718938f55361e7c0339f08fdf44972fd1b2d4bdf8cdb50c0092",
+            "params": params_dict,
+        }
+    )
+    executor = PythonExecutor.from_env()
 
-    groupers = set_groupers.validate().partial(**params_dict["groupers"]).call()
+    groupers = checkpoint.restore_or_call(
+        "groupers",
+        set_groupers.validate().partial(**params_dict["groupers"]).call,
+    )
 
-    time_range = set_time_range.validate().partial(**params_dict["time_range"]).call()
+    time_range = checkpoint.restore_or_call(
+        "time_range",
+        set_time_range.validate().partial(**params_dict["time_range"]).call,
+    )
 
-    subject_obs = (
+    subject_obs = checkpoint.restore_or_call(
+        "subject_obs",
         get_subjectgroup_observations.validate()
         .partial(time_range=time_range, **params_dict["subject_obs"])
-        .call()
+        .call,
     )
 
-    subject_reloc = (
+    subject_reloc = checkpoint.restore_or_call(
+        "subject_reloc",
         process_relocations.validate()
         .partial(observations=subject_obs, **params_dict["subject_reloc"])
-        .call()
+        .call,
     )
 
-    day_night_labels = (
+    day_night_labels = checkpoint.restore_or_call(
+        "day_night_labels",
         classify_is_night.validate()
         .partial(relocations=subject_reloc, **params_dict["day_night_labels"])
-        .call()
+        .call,
     )
 
-    subject_traj = (
+    subject_traj = checkpoint.restore_or_call(
+        "subject_traj",
         relocations_to_trajectory.validate()
         .partial(relocations=day_night_labels, **params_dict["subject_traj"])
-        .call()
+        .call,
     )
 
-    traj_add_temporal_index = (
+    traj_add_temporal_index = checkpoint.restore_or_call(
+        "traj_add_temporal_index",
         add_temporal_index.validate()
         .partial(df=subject_traj, **params_dict["traj_add_temporal_index"])
-        .call()
+        .call,
     )
 
-    split_subject_traj_groups = (
+    split_subject_traj_groups = checkpoint.restore_or_call(
+        "split_subject_traj_groups",
         split_groups.validate()
         .partial(
             df=traj_add_temporal_index,
             groupers=groupers,
             **params_dict["split_subject_traj_groups"],
         )
-        .call()
+        .call,
     )
 
-    classify_traj_speed = (
+    classify_traj_speed = checkpoint.restore_or_call(
+        "classify_traj_speed",
         apply_classification.validate()
         .partial(**params_dict["classify_traj_speed"])
-        .mapvalues(argnames=["df"], argvalues=split_subject_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_subject_traj_groups,
     )
 
-    colormap_traj_speed = (
+    colormap_traj_speed = checkpoint.restore_or_call(
+        "colormap_traj_speed",
         apply_color_map.validate()
         .partial(**params_dict["colormap_traj_speed"])
-        .mapvalues(argnames=["df"], argvalues=classify_traj_speed)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=classify_traj_speed,
     )
 
-    speedmap_legend_with_unit = (
+    speedmap_legend_with_unit = checkpoint.restore_or_call(
+        "speedmap_legend_with_unit",
         map_values_with_unit.validate()
         .partial(**params_dict["speedmap_legend_with_unit"])
-        .mapvalues(argnames=["df"], argvalues=colormap_traj_speed)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=colormap_traj_speed,
     )
 
-    traj_map_layers = (
+    traj_map_layers = checkpoint.restore_or_call(
+        "traj_map_layers",
         create_map_layer.validate()
         .partial(**params_dict["traj_map_layers"])
-        .mapvalues(argnames=["geodataframe"], argvalues=speedmap_legend_with_unit)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geodataframe"],
+        argvalues=speedmap_legend_with_unit,
     )
 
-    traj_ecomap = (
+    traj_ecomap = checkpoint.restore_or_call(
+        "traj_ecomap",
         draw_ecomap.validate()
         .partial(**params_dict["traj_ecomap"])
-        .mapvalues(argnames=["geo_layers"], argvalues=traj_map_layers)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geo_layers"],
+        argvalues=traj_map_layers,
     )
 
-    ecomap_html_urls = (
+    ecomap_html_urls = checkpoint.restore_or_call(
+        "ecomap_html_urls",
         persist_text.validate()
         .partial(
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["ecomap_html_urls"],
         )
-        .mapvalues(argnames=["text"], argvalues=traj_ecomap)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["text"],
+        argvalues=traj_ecomap,
     )
 
-    traj_map_widgets_single_views = (
+    traj_map_widgets_single_views = checkpoint.restore_or_call(
+        "traj_map_widgets_single_views",
         create_map_widget_single_view.validate()
         .partial(**params_dict["traj_map_widgets_single_views"])
-        .map(argnames=["view", "data"], argvalues=ecomap_html_urls)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=ecomap_html_urls,
     )
 
-    traj_grouped_map_widget = (
+    traj_grouped_map_widget = checkpoint.restore_or_call(
+        "traj_grouped_map_widget",
         merge_widget_views.validate()
         .partial(
             widgets=traj_map_widgets_single_views,
             **params_dict["traj_grouped_map_widget"],
         )
-        .call()
+        .call,
     )
 
-    colormap_traj_night = (
+    colormap_traj_night = checkpoint.restore_or_call(
+        "colormap_traj_night",
         apply_color_map.validate()
         .partial(**params_dict["colormap_traj_night"])
-        .mapvalues(argnames=["df"], argvalues=split_subject_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_subject_traj_groups,
     )
 
-    traj_map_night_layers = (
+    traj_map_night_layers = checkpoint.restore_or_call(
+        "traj_map_night_layers",
         create_map_layer.validate()
         .partial(**params_dict["traj_map_night_layers"])
-        .mapvalues(argnames=["geodataframe"], argvalues=colormap_traj_night)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geodataframe"],
+        argvalues=colormap_traj_night,
     )
 
-    traj_daynight_ecomap = (
+    traj_daynight_ecomap = checkpoint.restore_or_call(
+        "traj_daynight_ecomap",
         draw_ecomap.validate()
         .partial(**params_dict["traj_daynight_ecomap"])
-        .mapvalues(argnames=["geo_layers"], argvalues=traj_map_night_layers)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geo_layers"],
+        argvalues=traj_map_night_layers,
     )
 
-    ecomap_daynight_html_urls = (
+    ecomap_daynight_html_urls = checkpoint.restore_or_call(
+        "ecomap_daynight_html_urls",
         persist_text.validate()
         .partial(
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["ecomap_daynight_html_urls"],
         )
-        .mapvalues(argnames=["text"], argvalues=traj_daynight_ecomap)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["text"],
+        argvalues=traj_daynight_ecomap,
     )
 
-    traj_map_daynight_widgets_sv = (
+    traj_map_daynight_widgets_sv = checkpoint.restore_or_call(
+        "traj_map_daynight_widgets_sv",
         create_map_widget_single_view.validate()
         .partial(**params_dict["traj_map_daynight_widgets_sv"])
-        .map(argnames=["view", "data"], argvalues=ecomap_daynight_html_urls)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=ecomap_daynight_html_urls,
     )
 
-    traj_daynight_grouped_map_widget = (
+    traj_daynight_grouped_map_widget = checkpoint.restore_or_call(
+        "traj_daynight_grouped_map_widget",
         merge_widget_views.validate()
         .partial(
             widgets=traj_map_daynight_widgets_sv,
             **params_dict["traj_daynight_grouped_map_widget"],
         )
-        .call()
+        .call,
     )
 
-    mean_speed = (
+    mean_speed = checkpoint.restore_or_call(
+        "mean_speed",
         dataframe_column_mean.validate()
         .partial(**params_dict["mean_speed"])
-        .mapvalues(argnames=["df"], argvalues=split_subject_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_subject_traj_groups,
     )
 
-    average_speed_converted = (
+    average_speed_converted = checkpoint.restore_or_call(
+        "average_speed_converted",
         with_unit.validate()
         .partial(**params_dict["average_speed_converted"])
-        .mapvalues(argnames=["value"], argvalues=mean_speed)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["value"],
+        argvalues=mean_speed,
     )
 
-    mean_speed_sv_widgets = (
+    mean_speed_sv_widgets = checkpoint.restore_or_call(
+        "mean_speed_sv_widgets",
         create_single_value_widget_single_view.validate()
         .partial(**params_dict["mean_speed_sv_widgets"])
-        .map(argnames=["view", "data"], argvalues=average_speed_converted)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=average_speed_converted,
     )
 
-    mean_speed_grouped_sv_widget = (
+    mean_speed_grouped_sv_widget = checkpoint.restore_or_call(
+        "mean_speed_grouped_sv_widget",
         merge_widget_views.validate()
         .partial(
             widgets=mean_speed_sv_widgets, **params_dict["mean_speed_grouped_sv_widget"]
         )
-        .call()
+        .call,
     )
 
-    max_speed = (
+    max_speed = checkpoint.restore_or_call(
+        "max_speed",
         dataframe_column_max.validate()
         .partial(**params_dict["max_speed"])
-        .mapvalues(argnames=["df"], argvalues=split_subject_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_subject_traj_groups,
     )
 
-    max_speed_converted = (
+    max_speed_converted = checkpoint.restore_or_call(
+        "max_speed_converted",
         with_unit.validate()
         .partial(**params_dict["max_speed_converted"])
-        .mapvalues(argnames=["value"], argvalues=max_speed)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["value"],
+        argvalues=max_speed,
     )
 
-    max_speed_sv_widgets = (
+    max_speed_sv_widgets = checkpoint.restore_or_call(
+        "max_speed_sv_widgets",
         create_single_value_widget_single_view.validate()
         .partial(**params_dict["max_speed_sv_widgets"])
-        .map(argnames=["view", "data"], argvalues=max_speed_converted)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=max_speed_converted,
     )
 
-    max_speed_grouped_sv_widget = (
+    max_speed_grouped_sv_widget = checkpoint.restore_or_call(
+        "max_speed_grouped_sv_widget",
         merge_widget_views.validate()
         .partial(
             widgets=max_speed_sv_widgets, **params_dict["max_speed_grouped_sv_widget"]
         )
-        .call()
+        .call,
     )
 
-    num_location = (
+    num_location = checkpoint.restore_or_call(
+        "num_location",
         dataframe_count.validate()
         .partial(**params_dict["num_location"])
-        .mapvalues(argnames=["df"], argvalues=split_subject_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_subject_traj_groups,
     )
 
-    num_location_sv_widgets = (
+    num_location_sv_widgets = checkpoint.restore_or_call(
+        "num_location_sv_widgets",
         create_single_value_widget_single_view.validate()
         .partial(**params_dict["num_location_sv_widgets"])
-        .map(argnames=["view", "data"], argvalues=num_location)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=num_location,
     )
 
-    num_location_grouped_sv_widget = (
+    num_location_grouped_sv_widget = checkpoint.restore_or_call(
+        "num_location_grouped_sv_widget",
         merge_widget_views.validate()
         .partial(
             widgets=num_location_sv_widgets,
             **params_dict["num_location_grouped_sv_widget"],
         )
-        .call()
+        .call,
     )
 
-    daynight_ratio = (
+    daynight_ratio = checkpoint.restore_or_call(
+        "daynight_ratio",
         get_day_night_ratio.validate()
         .partial(**params_dict["daynight_ratio"])
-        .mapvalues(argnames=["df"], argvalues=split_subject_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_subject_traj_groups,
     )
 
-    daynight_ratio_sv_widgets = (
+    daynight_ratio_sv_widgets = checkpoint.restore_or_call(
+        "daynight_ratio_sv_widgets",
         create_single_value_widget_single_view.validate()
         .partial(**params_dict["daynight_ratio_sv_widgets"])
-        .map(argnames=["view", "data"], argvalues=daynight_ratio)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=daynight_ratio,
     )
 
-    daynight_ratio_grouped_sv_widget = (
+    daynight_ratio_grouped_sv_widget = checkpoint.restore_or_call(
+        "daynight_ratio_grouped_sv_widget",
         merge_widget_views.validate()
         .partial(
             widgets=daynight_ratio_sv_widgets,
             **params_dict["daynight_ratio_grouped_sv_widget"],
         )
-        .call()
+        .call,
     )
 
-    total_distance = (
+    total_distance = checkpoint.restore_or_call(
+        "total_distance",
         dataframe_column_sum.validate()
         .partial(**params_dict["total_distance"])
-        .mapvalues(argnames=["df"], argvalues=split_subject_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_subject_traj_groups,
     )
 
-    total_dist_converted = (
+    total_dist_converted = checkpoint.restore_or_call(
+        "total_dist_converted",
         with_unit.validate()
         .partial(**params_dict["total_dist_converted"])
-        .mapvalues(argnames=["value"], argvalues=total_distance)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["value"],
+        argvalues=total_distance,
     )
 
-    total_distance_sv_widgets = (
+    total_distance_sv_widgets = checkpoint.restore_or_call(
+        "total_distance_sv_widgets",
         create_single_value_widget_single_view.validate()
         .partial(**params_dict["total_distance_sv_widgets"])
-        .map(argnames=["view", "data"], argvalues=total_dist_converted)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=total_dist_converted,
     )
 
-    total_dist_grouped_sv_widget = (
+    total_dist_grouped_sv_widget = checkpoint.restore_or_call(
+        "total_dist_grouped_sv_widget",
         merge_widget_views.validate()
         .partial(
             widgets=total_distance_sv_widgets,
             **params_dict["total_dist_grouped_sv_widget"],
         )
-        .call()
+        .call,
     )
 
-    total_time = (
+    total_time = checkpoint.restore_or_call(
+        "total_time",
         dataframe_column_sum.validate()
         .partial(**params_dict["total_time"])
-        .mapvalues(argnames=["df"], argvalues=split_subject_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=split_subject_traj_groups,
     )
 
-    total_time_converted = (
+    total_time_converted = checkpoint.restore_or_call(
+        "total_time_converted",
         with_unit.validate()
         .partial(**params_dict["total_time_converted"])
-        .mapvalues(argnames=["value"], argvalues=total_time)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["value"],
+        argvalues=total_time,
     )
 
-    total_time_sv_widgets = (
+    total_time_sv_widgets = checkpoint.restore_or_call(
+        "total_time_sv_widgets",
         create_single_value_widget_single_view.validate()
         .partial(**params_dict["total_time_sv_widgets"])
-        .map(argnames=["view", "data"], argvalues=total_time_converted)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=total_time_converted,
     )
 
-    total_time_grouped_sv_widget = (
+    total_time_grouped_sv_widget = checkpoint.restore_or_call(
+        "total_time_grouped_sv_widget",
         merge_widget_views.validate()
         .partial(
             widgets=total_time_sv_widgets, **params_dict["total_time_grouped_sv_widget"]
         )
-        .call()
+        .call,
     )
 
-    td = (
+    td = checkpoint.restore_or_call(
+        "td",
         calculate_time_density.validate()
         .partial(**params_dict["td"])
-        .mapvalues(argnames=["trajectory_gdf"], argvalues=split_subject_traj_groups)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["trajectory_gdf"],
+        argvalues=split_subject_traj_groups,
     )
 
-    td_colormap = (
+    td_colormap = checkpoint.restore_or_call(
+        "td_colormap",
         apply_color_map.validate()
         .partial(**params_dict["td_colormap"])
-        .mapvalues(argnames=["df"], argvalues=td)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["df"],
+        argvalues=td,
     )
 
-    td_map_layer = (
+    td_map_layer = checkpoint.restore_or_call(
+        "td_map_layer",
         create_map_layer.validate()
         .partial(**params_dict["td_map_layer"])
-        .mapvalues(argnames=["geodataframe"], argvalues=td_colormap)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geodataframe"],
+        argvalues=td_colormap,
     )
 
-    td_ecomap = (
+    td_ecomap = checkpoint.restore_or_call(
+        "td_ecomap",
         draw_ecomap.validate()
         .partial(**params_dict["td_ecomap"])
-        .mapvalues(argnames=["geo_layers"], argvalues=td_map_layer)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["geo_layers"],
+        argvalues=td_map_layer,
     )
 
-    td_ecomap_html_url = (
+    td_ecomap_html_url = checkpoint.restore_or_call(
+        "td_ecomap_html_url",
         persist_text.validate()
         .partial(
             root_path=os.environ["ECOSCOPE_WORKFLOWS_RESULTS"],
             **params_dict["td_ecomap_html_url"],
         )
-        .mapvalues(argnames=["text"], argvalues=td_ecomap)
+        .set_executor(executor)
+        .mapvalues,
+        argnames=["text"],
+        argvalues=td_ecomap,
     )
 
-    td_map_widget = (
+    td_map_widget = checkpoint.restore_or_call(
+        "td_map_widget",
         create_map_widget_single_view.validate()
         .partial(**params_dict["td_map_widget"])
-        .map(argnames=["view", "data"], argvalues=td_ecomap_html_url)
+        .set_executor(executor)
+        .map,
+        argnames=["view", "data"],
+        argvalues=td_ecomap_html_url,
     )
 
-    td_grouped_map_widget = (
+    td_grouped_map_widget = checkpoint.restore_or_call(
+        "td_grouped_map_widget",
         merge_widget_views.validate()
         .partial(widgets=td_map_widget, **params_dict["td_grouped_map_widget"])
-        .call()
+        .call,
     )
 
-    subject_tracking_dashboard = (
+    subject_tracking_dashboard = checkpoint.restore_or_call(
+        "subject_tracking_dashboard",
         gather_dashboard.validate()
         .partial(
             widgets=[
@@ -388,7 +556,8 @@ def main(params: Params):
             time_range=time_range,
             **params_dict["subject_tracking_dashboard"],
         )
-        .call()
+        .call,
     )
 
+    checkpoint.complete()
     return subject_tracking_dashboard
@@ -1,6 +1,6 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "0d1105f115cdc90bd410b5ba170adfc21fb0b9d91af21f80eb7fac7ae90281bb"
+# from-spec-sha256 = "31ce40fc19879718938f55361e7c0339f08fdf44972fd1b2d4bdf8cdb50c0092"
 
 
 from typing import Any
@@ -24,6 +24,10 @@ def dispatch(
             result = run_async_mock_io(params=params)
         case ("async", False):
             result = run_async(params=params)
+        case ("threads", True):
+            result = run_async_mock_io(params=params, executor="threads")
+        case ("threads", False):
+            result = run_async(params=params, executor="threads")
         case ("sequential", True):
             result = run_sequential_mock_io(params=params)
         case ("sequential", False):
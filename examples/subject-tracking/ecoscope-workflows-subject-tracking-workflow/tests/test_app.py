@@ -1,8 +1,9 @@
 # [generated]
 # by = { compiler = "ecoscope-workflows-core", version = "9999" }
-# from-spec-sha256 = "0d1105f115cdc90bd410b5ba170adfc21fb0b9d91af21f80eb7fac7ae90281bb"
+# from-spec-sha256 = "31ce40fc19879718938f55361e7c0339f08fdf44972fd1b2d4bdf8cdb50c0092"
 
 
+import os
 from pathlib import Path
 
 import pytest
@@ -20,12 +21,16 @@ def test_run(
     mock_io: bool,
     case: TestCase,
     tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
 ):
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_VALIDATION_MODE", "schema-only")
+    monkeypatch.delenv("ECOSCOPE_WORKFLOWS_RESULTS", raising=False)
     request = {"params": case.params}
     query_params = {
         "execution_mode": execution_mode,
         "mock_io": mock_io,
         "results_url": tmp_path.as_uri(),
+        "validation_mode": "full",
     }
     headers = {"Content-Type": "application/json"}
     response = client.post(
@@ -35,6 +40,9 @@ def test_run(
         headers=headers,
     )
     assert response.status_code == 200
+    # the environment is as it was before the run, whether or not the run set each variable
+    assert os.environ["ECOSCOPE_WORKFLOWS_VALIDATION_MODE"] == "schema-only"
+    assert "ECOSCOPE_WORKFLOWS_RESULTS" not in os.environ
 
 
 def test_get_params(client: TestClient):
@@ -1 +1,10 @@
-from . import tasks as tasks
+import importlib
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    # tasks are imported on first access, rather than with the package, so that (e.g.) the
+    # compiler can start from the cached registry manifest without importing any task code
+    if name == "tasks":
+        return importlib.import_module(f"{__name__}.tasks")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,150 @@
+import glob
+import os
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from io import TextIOWrapper
+from pathlib import Path
+from typing import Callable, Sequence
 
 import click
 import ruamel.yaml
 
+from ecoscope_workflows_core.artifacts import (
+    get_release_dir,
+    load_fingerprints,
+    lock_release_dir,
+    save_fingerprints,
+    stale_artifacts,
+)
 from ecoscope_workflows_core.compiler import DagCompiler, Spec
 
-yaml = ruamel.yaml.YAML(typ="safe")
-
 CARRYOVER_LOCKFILE_WARNING = (
     "Warning: it is much safer to always re-lock the package, as the lockfile may be out of "
     "date or otherwise incorrect. This option is given as a convenience for development purposes."
 )
 
 
+def compile_spec(
+    spec_text: str,
+    spec_relpath: str,
+    clobber: bool,
+    lock: bool,
+    carryover_lockfile: bool,
+    incremental: bool = False,
+) -> None:
+    # the release directory is resolved from the spec's path once, up front, as the working
+    # directory may change while the spec is compiled (see `compiler._dcg_lock`)
+    spec_relpath = str(Path(spec_relpath).absolute())
+    # a `YAML` instance may not be shared between threads (see `compile_many`)
+    yaml = ruamel.yaml.YAML(typ="safe")
+    compilation_spec = Spec(**yaml.load(spec_text))
+    dc = DagCompiler(spec=compilation_spec)
+    if not incremental:
+        wa = dc.generate_artifacts(spec_relpath=spec_relpath)
+        wa.dump(clobber=clobber, carryover_lockfile=carryover_lockfile)
+        if lock:
+            wa.lock()
+        return
+
+    release_dir = get_release_dir(spec_relpath, dc.release_name)
+    fingerprints = dc.get_artifact_fingerprints()
+    previous = load_fingerprints(release_dir)
+    if not previous:
+        # the release directory (if any) was not compiled incrementally, so is rewritten
+        stale = set(fingerprints)
+    else:
+        stale = stale_artifacts(release_dir, fingerprints)
+    regenerate = stale - {"pixi.lock"}
+    relock = lock and "pixi.lock" in stale
+    if not regenerate and not relock:
+        click.echo(f"'{release_dir}' is up to date.")
+        return
+    if regenerate:
+        wa = dc.generate_artifacts(spec_relpath=spec_relpath)
+        if not previous:
+            wa.dump(clobber=clobber)
+        else:
+            wa.update(regenerate)
+            for relpath in previous.keys() - fingerprints.keys():
+                release_dir.joinpath(relpath).unlink(missing_ok=True)
+        click.echo(
+            f"Regenerated {len(regenerate)} stale artifact(s) in '{release_dir}'."
+        )
+    if relock:
+        lock_release_dir(release_dir)
+    if "pixi.lock" in stale and not (
+        relock and release_dir.joinpath("pixi.lock").exists()
+    ):
+        # the lockfile remains stale until the package is (successfully) re-locked
+        del fingerprints["pixi.lock"]
+        if "pixi.lock" in previous:
+            fingerprints["pixi.lock"] = previous["pixi.lock"]
+    save_fingerprints(release_dir, fingerprints)
+
+
+def compile_options(command: Callable) -> Callable:
+    """The options shared by the `compile` and `compile-many` commands."""
+    options = [
+        click.option(
+            "--clobber/--no-clobber",
+            is_flag=True,
+            default=False,
+            help="Whether or not to clobber an existing build directory.",
+        ),
+        click.option(
+            "--lock/--no-lock",
+            is_flag=True,
+            default=True,
+            help="Whether or not to generate a pixi lockfile for the package.",
+        ),
+        click.option(
+            "--carryover-lockfile/--no-carryover-lockfile",
+            is_flag=True,
+            default=False,
+            help=(
+                "In the case of combining the options `--clobber` + `--no-lock`, whether or not to "
+                "carryover the lockfile from the clobbered directory. If true, this option allows for "
+                "rebuilding the package with a (potentially!) functional lockfile, without paying the "
+                "cost of actually re-locking the package. " + CARRYOVER_LOCKFILE_WARNING
+            ),
+        ),
+        click.option(
+            "--incremental/--no-incremental",
+            is_flag=True,
+            default=False,
+            help=(
+                "Whether or not to only regenerate the artifacts whose inputs (the spec, templates, "
+                "task parameters, or compiler) have changed since the package was last compiled "
+                "incrementally, and to only re-lock the package if its dependencies have changed."
+            ),
+        ),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def check_compile_options(
+    clobber: bool,
+    lock: bool,
+    carryover_lockfile: bool,
+    incremental: bool,
+) -> None:
+    if carryover_lockfile and not (clobber and not lock):
+        raise ValueError(
+            "The `--carryover-lockfile` option is only valid when used in conjunction with "
+            "both `--clobber` option and `--no-lock` option."
+        )
+    if carryover_lockfile and incremental:
+        raise ValueError(
+            "The `--carryover-lockfile` option is not valid with the `--incremental` option, "
+            "which always keeps the existing lockfile unless the dependencies have changed."
+        )
+    if carryover_lockfile:
+        warnings.warn(CARRYOVER_LOCKFILE_WARNING)
+
+
 @click.command()
 @click.option(
     "--spec",
@@ -21,49 +152,98 @@ CARRYOVER_LOCKFILE_WARNING = (
     required=True,
     help="A workflow compilation YAML spec.",
 )
-@click.option(
-    "--clobber/--no-clobber",
-    is_flag=True,
-    default=False,
-    help="Whether or not to clobber an existing build directory.",
-)
-@click.option(
-    "--lock/--no-lock",
-    is_flag=True,
-    default=True,
-    help="Whether or not to generate a pixi lockfile for the package.",
-)
-@click.option(
-    "--carryover-lockfile/--no-carryover-lockfile",
-    is_flag=True,
-    default=False,
-    help=(
-        "In the case of combining the options `--clobber` + `--no-lock`, whether or not to "
-        "carryover the lockfile from the clobbered directory. If true, this option allows for "
-        "rebuilding the package with a (potentially!) functional lockfile, without paying the "
-        "cost of actually re-locking the package. " + CARRYOVER_LOCKFILE_WARNING
-    ),
-)
+@compile_options
 def compile(
     spec: TextIOWrapper,
     clobber: bool,
     lock: bool,
     carryover_lockfile: bool,
+    incremental: bool,
 ):
-    if carryover_lockfile and not (clobber and not lock):
-        raise ValueError(
-            "The `--carryover-lockfile` option is only valid when used in conjunction with "
-            "both `--clobber` option and `--no-lock` option."
-        )
-    if carryover_lockfile:
-        warnings.warn(CARRYOVER_LOCKFILE_WARNING)
-    spec_text = spec.read()
-    compilation_spec = Spec(**yaml.load(spec_text))
-    dc = DagCompiler(spec=compilation_spec)
-    wa = dc.generate_artifacts(spec_relpath=spec.name)
-    wa.dump(clobber=clobber, carryover_lockfile=carryover_lockfile)
-    if lock:
-        wa.lock()
+    check_compile_options(clobber, lock, carryover_lockfile, incremental)
+    compile_spec(spec.read(), spec.name, clobber, lock, carryover_lockfile, incremental)
+
+
+def find_specs(patterns: Sequence[str]) -> list[str]:
+    """The paths of the specs given by each of `patterns`, which may be the path of a spec,
+    a directory containing a `spec.yaml` (or whose immediate subdirectories do, such as the
+    `examples/` directory), or a glob of either."""
+    specs: list[str] = []
+    for pattern in patterns:
+        matches = []
+        for path in map(Path, sorted(glob.glob(pattern, recursive=True))):
+            if path.is_file():
+                matches.append(path)
+            elif path.joinpath("spec.yaml").is_file():
+                matches.append(path.joinpath("spec.yaml"))
+            elif path.is_dir():
+                matches.extend(sorted(path.glob("*/spec.yaml")))
+        if not matches:
+            raise click.BadParameter(f"No specs found for '{pattern}'.")
+        specs.extend(str(m) for m in matches if str(m) not in specs)
+    return specs
+
+
+@click.command(name="compile-many")
+@click.argument("specs", nargs=-1, required=True)
+@compile_options
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="The number of specs to compile concurrently. Defaults to the number of CPUs.",
+)
+def compile_many(
+    specs: tuple[str, ...],
+    clobber: bool,
+    lock: bool,
+    carryover_lockfile: bool,
+    incremental: bool,
+    workers: int | None,
+):
+    """Compile each of the SPECS (paths, directories, or globs of workflow compilation YAML
+    specs) in one process, such that the registry of known tasks, the templates, and the
+    schemas of tasks are loaded once and shared by all specs. The specs are compiled (and
+    locked) concurrently, and the time taken by each is summarized once all are done."""
+    check_compile_options(clobber, lock, carryover_lockfile, incremental)
+    spec_paths = find_specs(specs)
+    workers = min(workers or os.cpu_count() or 1, len(spec_paths))
+
+    def timed_compile(spec_path: str) -> tuple[float, Exception | None]:
+        start = time.perf_counter()
+        try:
+            compile_spec(
+                Path(spec_path).read_text(),
+                spec_path,
+                clobber,
+                lock,
+                carryover_lockfile,
+                incremental,
+            )
+        except Exception as e:
+            return time.perf_counter() - start, e
+        return time.perf_counter() - start, None
+
+    start = time.perf_counter()
+    # release directories are resolved relative to the working directory, which may change
+    # while another spec is compiled (see `compiler._dcg_lock`), so each spec is given to the
+    # pool by its absolute path, resolved before any compiles start
+    spec_abspaths = [str(Path(p).absolute()) for p in spec_paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(timed_compile, spec_abspaths))
+    elapsed = time.perf_counter() - start
+
+    width = max(len(p) for p in spec_paths)
+    click.echo(f"\n{'spec':<{width}}  {'seconds':>8}  result")
+    for spec_path, (seconds, error) in zip(spec_paths, results):
+        result = "ok" if error is None else f"failed: {error!r}"
+        click.echo(f"{spec_path:<{width}}  {seconds:>8.2f}  {result}")
+    click.echo(
+        f"Compiled {len(spec_paths)} spec(s) with {workers} worker(s) in {elapsed:.2f}s."
+    )
+    failed = [p for p, (_, error) in zip(spec_paths, results) if error is not None]
+    if failed:
+        raise click.ClickException(f"Failed to compile: {', '.join(failed)}")
 
 
 @click.group()
@@ -72,6 +252,7 @@ def main():
 
 
 main.add_command(compile)
+main.add_command(compile_many)
 
 if __name__ == "__main__":
     main()
@@ -3,7 +3,9 @@ import json
 import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
+from typing import Collection
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -146,6 +148,51 @@ class PackageDirectory(BaseModel):
             dst.joinpath("dags").joinpath(fname).write_text(content)
 
 
+FINGERPRINTS_FILENAME = ".fingerprints.json"
+
+
+def get_release_dir(spec_relpath: str, release_name: str) -> Path:
+    return Path().cwd().joinpath(spec_relpath).parent.joinpath(release_name)
+
+
+def lock_release_dir(release_dir: Path) -> None:
+    # run in the release directory, rather than whatever the working directory happens to be
+    subprocess.run(
+        f"pixi install -a --manifest-path {release_dir.joinpath('pixi.toml')}".split(),
+        cwd=release_dir,
+    )
+
+
+def load_fingerprints(release_dir: Path) -> dict[str, str]:
+    """The fingerprints of the artifacts last written to `release_dir` (see
+    `DagCompiler.get_artifact_fingerprints`), or an empty dict if there are none."""
+    path = release_dir.joinpath(FINGERPRINTS_FILENAME)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return {}
+
+
+def save_fingerprints(release_dir: Path, fingerprints: dict[str, str]) -> None:
+    with release_dir.joinpath(FINGERPRINTS_FILENAME).open("w") as f:
+        json.dump(fingerprints, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def stale_artifacts(release_dir: Path, fingerprints: dict[str, str]) -> set[str]:
+    """The artifacts (by their path relative to `release_dir`) which are missing from
+    `release_dir`, or whose fingerprint differs from that with which they were written."""
+    previous = load_fingerprints(release_dir)
+    return {
+        relpath
+        for relpath, fingerprint in fingerprints.items()
+        if previous.get(relpath) != fingerprint
+        or not release_dir.joinpath(relpath).exists()
+    }
+
+
 class WorkflowArtifacts(_AllowArbitraryTypes):
     spec_relpath: str
     release_name: str
@@ -161,14 +208,10 @@ class WorkflowArtifacts(_AllowArbitraryTypes):
 
     @property
     def release_dir(self) -> Path:
-        return (
-            Path().cwd().joinpath(self.spec_relpath).parent.joinpath(self.release_name)
-        )
+        return get_release_dir(self.spec_relpath, self.release_name)
 
     def lock(self):
-        subprocess.run(
-            f"pixi install -a --manifest-path {self.release_dir.joinpath('pixi.toml')}".split()
-        )
+        lock_release_dir(self.release_dir)
 
     def dump(self, clobber: bool = False, carryover_lockfile: bool = False):
         """Dump the artifacts to disk.
@@ -199,22 +242,39 @@ class WorkflowArtifacts(_AllowArbitraryTypes):
             shutil.rmtree(self.release_dir)
 
         self.release_dir.mkdir(parents=True)
-
-        # root artifacts
-        self.pixi_toml.dump(self.release_dir.joinpath("pixi.toml"))
-        self.pydot_graph.write_png(path=self.release_dir.joinpath("graph.png"))
         if carryover_lockfile:
             self.release_dir.joinpath("pixi.lock").write_text(original_lockfile)
+        self._write(self.release_dir)
+
+    def _write(self, dst: Path, graph: bool = True):
+        # root artifacts
+        self.pixi_toml.dump(dst.joinpath("pixi.toml"))
+        if graph:
+            self.pydot_graph.write_png(path=dst.joinpath("graph.png"))
         for k, v in {
             "pyproject.toml": self.pyproject_toml,
             "Dockerfile": self.dockerfile,
             ".dockerignore": self.dockerignore,
             "README.md": self.readme_md,
         }.items():
-            self.release_dir.joinpath(k).write_text(v)
+            dst.joinpath(k).write_text(v)
         # tests
-        self.tests.dump(self.release_dir)
+        self.tests.dump(dst)
         # package artifacts
-        pkg = self.release_dir.joinpath(self.package_name)
+        pkg = dst.joinpath(self.package_name)
         pkg.mkdir(parents=True)
         self.package.dump(pkg)
+
+    def update(self, stale: Collection[str]):
+        """Write only the `stale` artifacts (by their path relative to the release directory)
+        to an existing release directory, leaving all other files in it untouched."""
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write(Path(tmp), graph="graph.png" in stale)
+            for relpath in stale:
+                src = Path(tmp).joinpath(relpath)
+                if not src.exists():
+                    # e.g. `pixi.lock`, which is written by `lock`
+                    continue
+                dst = self.release_dir.joinpath(relpath)
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(src, dst)
@@ -0,0 +1,416 @@
+"""Content-addressed caching of `Graph` node results.
+
+A node's cache key is derived from the importable reference of its task function, the static
+(i.e. non-`DependsOn`) arguments it is called with, and the cache keys of its upstream nodes.
+Keys therefore change whenever any input to a node, or any input to any of its ancestors,
+changes; and re-running a workflow with only (e.g.) styling parameters changed will reuse the
+results of every node which does not depend on those parameters.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, fields, is_dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Literal
+
+from pydantic import BaseModel
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+if TYPE_CHECKING:
+    from ecoscope_workflows_core.dataplane import ResultRef
+
+logger = logging.getLogger(__name__)
+
+Format = Literal["geoparquet", "parquet", "json", "pickle"]
+
+
+def _unwrap(func: Callable) -> tuple[Callable, dict[str, Any]]:
+    keywords: dict[str, Any] = {}
+    while True:
+        if isinstance(func, functools.partial):
+            keywords = func.keywords | keywords
+            func = func.func
+        elif hasattr(func, "__wrapped__"):  # e.g. `pydantic.validate_call`
+            func = func.__wrapped__
+        else:
+            return func, keywords
+
+
+def task_reference(func: Callable) -> str:
+    """The importable reference of the function underlying a (possibly partial, possibly
+    validated) task function.
+
+    Examples:
+
+    ```python
+    >>> import functools
+    >>> task_reference(functools.partial(json.dumps, indent=2))
+    'json.dumps'
+
+    ```
+    """
+    func, _ = _unwrap(func)
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def task_names(func: Callable) -> list[str]:
+    """The function names of the tasks run by a (possibly partial, possibly validated) task
+    function: its own name, or for a chain of tasks fused into one (see `graph.FusedChain`),
+    the name of each task in the chain.
+
+    Examples:
+
+    ```python
+    >>> import functools
+    >>> task_names(functools.partial(json.dumps, indent=2))
+    ['dumps']
+
+    ```
+    """
+    func, _ = _unwrap(func)
+    if hasattr(func, "names"):
+        return list(func.names)
+    return [func.__qualname__.rsplit(".", 1)[-1]]
+
+
+def partial_keywords(func: Callable) -> dict[str, Any]:
+    """Keyword arguments bound to a task function by (possibly nested) `functools.partial`s."""
+    return _unwrap(func)[1]
+
+
+def _hash_default(obj: Any) -> str:
+    return hashlib.sha256(pickle.dumps(obj)).hexdigest()
+
+
+def _canonical(obj: Any) -> Any:
+    # containers are rebuilt such that equal values serialize identically: the iteration order
+    # of sets varies between processes (as strings hash differently in each), and json would
+    # both reorder and conflate (e.g. `1` and `"1"`) keys which are not strings
+    match obj:
+        case dict() if all(isinstance(k, str) for k in obj):
+            return {k: _canonical(v) for k, v in obj.items()}
+        case dict():
+            return {
+                "__items__": sorted(
+                    [_serialized(k), _serialized(v)] for k, v in obj.items()
+                )
+            }
+        case list() | tuple():
+            return [_canonical(v) for v in obj]
+        case set() | frozenset():
+            return {"__set__": sorted(_serialized(v) for v in obj)}
+        case BaseModel():
+            values = {k: getattr(obj, k) for k in type(obj).model_fields}
+            return {"__model__": _type_reference(obj), "fields": _canonical(values)}
+        case _ if is_dataclass(obj) and not isinstance(obj, type):
+            values = {f.name: getattr(obj, f.name) for f in fields(obj)}
+            return {"__dataclass__": _type_reference(obj), "fields": _canonical(values)}
+        case _:
+            return obj
+
+
+def _type_reference(obj: Any) -> str:
+    return f"{type(obj).__module__}.{type(obj).__qualname__}"
+
+
+def _serialized(obj: Any) -> str:
+    return json.dumps(_canonical(obj), sort_keys=True, default=_hash_default)
+
+
+def hash_key(*parts: Any) -> str:
+    """A stable sha256 hex digest of JSON-serializable (or otherwise picklable) parts. Sets,
+    dicts, dataclasses and pydantic models are hashed by their (ordered) contents, and any
+    other objects which json cannot serialize by their pickle.
+
+    Examples:
+
+    ```python
+    >>> hash_key("a", {"x": 1, "y": 2}) == hash_key("a", {"y": 2, "x": 1})
+    True
+    >>> hash_key("a", {"x": 1}) == hash_key("a", {"x": 2})
+    False
+    >>> hash_key({1: "a"}) == hash_key({"1": "a"})
+    False
+
+    ```
+    """
+    return hashlib.sha256(_serialized(parts).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    key: str
+    size: int
+    # when the entry was written, and when it was last read (or written)
+    mtime: float
+    atime: float
+
+
+class ResultStore(ABC):
+    """Persistent key-value storage for node results."""
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """Return the value stored under `key`, or raise `KeyError` if there is none."""
+
+    @abstractmethod
+    def put(self, key: str, value: Any) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def entries(self) -> list[CacheEntry]: ...
+
+    def entry(self, key: str) -> CacheEntry | None:
+        return next((e for e in self.entries() if e.key == key), None)
+
+    def references(self, key: str) -> list["ResultRef"]:
+        """The data plane references held by the value stored under `key`, which are owned by
+        the entry, and so are deleted along with it (see `ResultCache`)."""
+        from ecoscope_workflows_core.dataplane import find_refs
+
+        try:
+            return find_refs(self.get(key))
+        except KeyError:
+            return []
+
+    def __contains__(self, key: str) -> bool:
+        return self.entry(key) is not None
+
+
+def frame_format(value: Any) -> Literal["geoparquet", "parquet"] | None:
+    """The parquet flavor for `value` if it is a (Geo)DataFrame, otherwise None."""
+    # only check for (Geo)DataFrames if their libraries have already been imported,
+    # otherwise `value` could not possibly be an instance of either of them
+    gpd = sys.modules.get("geopandas")
+    if gpd is not None and isinstance(value, gpd.GeoDataFrame):
+        return "geoparquet"
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(value, pd.DataFrame):
+        return "parquet"
+    return None
+
+
+def _format_for(value: Any) -> Format:
+    if (fmt := frame_format(value)) is not None:
+        return fmt
+    try:
+        # tuples (e.g. from `mapvalues`) do not roundtrip through json as themselves
+        if json.loads(json.dumps(value)) == value:
+            return "json"
+    except (TypeError, ValueError):
+        pass
+    return "pickle"
+
+
+def _write(value: Any, fmt: Format, path: Path) -> None:
+    match fmt:
+        case "geoparquet" | "parquet":
+            value.to_parquet(path)
+        case "json":
+            path.write_text(json.dumps(value))
+        case "pickle":
+            path.write_bytes(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _read(fmt: Format, path: Path) -> Any:
+    match fmt:
+        case "geoparquet":
+            import geopandas as gpd  # type: ignore[import-not-found]
+
+            return gpd.read_parquet(path)
+        case "parquet":
+            import pandas as pd
+
+            return pd.read_parquet(path)
+        case "json":
+            return json.loads(path.read_text())
+        case "pickle":
+            return pickle.loads(path.read_bytes())
+
+
+@dataclass
+class LocalDirectoryResultStore(ResultStore):
+    """Stores each result in a file named for its key, with an extension indicating its format:
+    GeoParquet for GeoDataFrames, Parquet for DataFrames, JSON for values which roundtrip
+    through JSON unchanged, and pickle for everything else. (Geo)DataFrames which cannot be
+    written to parquet (e.g. due to mixed-type object columns) fall back to pickle.
+    """
+
+    root: Path
+
+    def __post_init__(self):
+        self.root = Path(self.root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, key: str) -> list[Path]:
+        return list(self.root.glob(f"{key}.*"))
+
+    def get(self, key: str) -> Any:
+        paths = self._paths(key)
+        if not paths:
+            raise KeyError(key)
+        path = paths[0]
+        value = _read(path.suffix.lstrip("."), path)  # type: ignore[arg-type]
+        # the access time is set explicitly, as filesystems are often mounted without (or
+        # with only coarse) access time updates; the write time is kept, for expiry
+        os.utime(path, (time.time(), path.stat().st_mtime))
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        fmt = _format_for(value)
+        # write to a temporary file first, so that a crash mid-write
+        # never leaves a truncated entry behind under a valid key
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        os.close(fd)
+        try:
+            try:
+                _write(value, fmt, Path(tmp))
+            except Exception:
+                if fmt not in ("geoparquet", "parquet"):
+                    raise
+                fmt = "pickle"
+                _write(value, fmt, Path(tmp))
+            self.delete(key)
+            os.replace(tmp, self.root / f"{key}.{fmt}")
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+
+    def delete(self, key: str) -> None:
+        for path in self._paths(key):
+            path.unlink(missing_ok=True)
+
+    def references(self, key: str) -> list["ResultRef"]:
+        # references are only ever pickled, so (Geo)Parquet and JSON entries need not be read
+        paths = self._paths(key)
+        if not paths or paths[0].suffix != ".pickle":
+            return []
+        return super().references(key)
+
+    def _entry(self, path: Path) -> CacheEntry:
+        stat = path.stat()
+        return CacheEntry(path.stem, stat.st_size, stat.st_mtime, stat.st_atime)
+
+    def entry(self, key: str) -> CacheEntry | None:
+        paths = self._paths(key)
+        return self._entry(paths[0]) if paths else None
+
+    def entries(self) -> list[CacheEntry]:
+        return [
+            self._entry(path)
+            for path in self.root.iterdir()
+            if path.is_file() and not path.name.startswith(".tmp-")
+        ]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheSettings(BaseSettings):
+    """Configures the result cache of generated workflows from the environment, e.g.
+    `ECOSCOPE_WORKFLOWS_CACHE_DIR=/tmp/cache`. Caching is disabled if `dir` is unset."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ecoscope_workflows_cache_",
+        case_sensitive=False,
+    )
+
+    dir: str | None = None
+    max_size_bytes: int | None = None
+    max_age_seconds: float | None = None
+
+
+@dataclass
+class ResultCache:
+    """A `ResultStore` with hit/miss accounting, and eviction of entries written more than
+    `max_age_seconds` ago, or (least recently used first) in excess of `max_size_bytes` total.
+    """
+
+    store: ResultStore
+    max_size_bytes: int | None = None
+    max_age_seconds: float | None = None
+    stats: CacheStats = field(default_factory=CacheStats)
+
+    @classmethod
+    def from_env(cls) -> "ResultCache | None":
+        settings = CacheSettings()
+        if not settings.dir:
+            return None
+        return cls(
+            store=LocalDirectoryResultStore(Path(settings.dir)),
+            max_size_bytes=settings.max_size_bytes,
+            max_age_seconds=settings.max_age_seconds,
+        )
+
+    def _expired(self, entry: CacheEntry, now: float) -> bool:
+        return (
+            self.max_age_seconds is not None
+            and now - entry.mtime > self.max_age_seconds
+        )
+
+    def __contains__(self, key: str) -> bool:
+        """Whether `get` would (currently) hit, without reading the value or counting a hit."""
+        entry = self.store.entry(key)
+        return entry is not None and not self._expired(entry, time.time())
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return `(True, value)` on a cache hit, and `(False, None)` on a miss."""
+        entry = self.store.entry(key)
+        if entry is not None and self._expired(entry, time.time()):
+            self._delete(key)
+            self.stats.evictions += 1
+        try:
+            value = self.store.get(key)
+        except KeyError:
+            self.stats.misses += 1
+            return False, None
+        self.stats.hits += 1
+        return True, value
+
+    def put(self, key: str, value: Any) -> None:
+        self.store.put(key, value)
+        self.stats.writes += 1
+
+    def _delete(self, key: str) -> None:
+        from ecoscope_workflows_core.dataplane import delete
+
+        refs = self.store.references(key)
+        self.store.delete(key)
+        delete(refs)
+
+    def evict(self) -> list[str]:
+        """Delete expired entries, followed by the least recently used entries until the total
+        size of the store is within `max_size_bytes`. Returns the evicted keys."""
+        now = time.time()
+        entries = sorted(self.store.entries(), key=lambda e: e.atime)
+        evicted = [e for e in entries if self._expired(e, now)]
+        remaining = [e for e in entries if e not in evicted]
+        if self.max_size_bytes is not None:
+            total = sum(e.size for e in remaining)
+            while remaining and total > self.max_size_bytes:
+                least_recent = remaining.pop(0)
+                total -= least_recent.size
+                evicted.append(least_recent)
+        for e in evicted:
+            self._delete(e.key)
+        self.stats.evictions += len(evicted)
+        return [e.key for e in evicted]
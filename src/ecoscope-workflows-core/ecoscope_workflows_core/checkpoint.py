@@ -0,0 +1,189 @@
+"""Checkpointing of completed node results under a run ID, such that a failed run can be
+resumed by re-running it with the same run ID: every node which completed in a prior
+attempt is then restored from its checkpoint, and only the failed tail is recomputed.
+A run may only be resumed with the same inputs (e.g. params and spec) as it was first run
+with, so that results computed from other inputs are never restored (see `verify`). Once
+a run completes, there is nothing left to resume, so its checkpoint is discarded (unless
+`keep_completed`).
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, ParamSpec, TypeVar
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ecoscope_workflows_core.cache import (
+    LocalDirectoryResultStore,
+    ResultStore,
+    hash_key,
+)
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# the key under which the fingerprint of a run's inputs is checkpointed (see `verify`)
+INPUTS_KEY = "__inputs__"
+
+
+class CheckpointSettings(BaseSettings):
+    """Configures checkpointing from the environment. Checkpointing is enabled if
+    `ECOSCOPE_WORKFLOWS_CHECKPOINT_DIR` is set, in which case the checkpoints of each run
+    are written under `<dir>/<run_id>`. To resume a prior run, set the run ID of that run
+    as `ECOSCOPE_WORKFLOWS_CHECKPOINT_RUN_ID`; otherwise, a new run ID is generated.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="ecoscope_workflows_checkpoint_",
+        case_sensitive=False,
+    )
+
+    dir: str | None = None
+    run_id: str | None = None
+    keep_completed: bool = False
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex
+
+
+@dataclass
+class Checkpoint:
+    """Node result checkpoints for one run. If `store` is None, checkpointing is disabled
+    and `restore_or_call` simply calls through to the wrapped callable.
+
+    Examples:
+
+    ```python
+    >>> import tempfile
+    >>> ckpt = Checkpoint.from_dir(tempfile.mkdtemp(), run_id="abc")
+    >>> ckpt.restore_or_call("x", lambda a: a + 1, a=1)
+    2
+    >>> ckpt.restore_or_call("x", lambda a: a + 1, a=100)  # restored from checkpoint
+    2
+    >>> ckpt.verify({"params": {"a": 1}})
+    >>> ckpt.verify({"params": {"a": 2}})
+    Traceback (most recent call last):
+    ...
+    ValueError: Cannot resume run 'abc', as its inputs (e.g. params or spec) have changed.
+
+    ```
+    """
+
+    run_id: str = field(default_factory=new_run_id)
+    store: ResultStore | None = None
+    keep_completed: bool = False
+
+    @classmethod
+    def from_dir(
+        cls,
+        root: str | Path,
+        run_id: str | None = None,
+        keep_completed: bool = False,
+    ) -> "Checkpoint":
+        run_id = run_id or new_run_id()
+        return cls(
+            run_id=run_id,
+            store=LocalDirectoryResultStore(Path(root) / run_id),
+            keep_completed=keep_completed,
+        )
+
+    @classmethod
+    def from_env(cls, inputs: Any = None) -> "Checkpoint":
+        """The checkpoint configured by the environment (see `CheckpointSettings`), for a run
+        with the given `inputs`, if any (see `verify`)."""
+        settings = CheckpointSettings()
+        if not settings.dir:
+            return cls()
+        checkpoint = cls.from_dir(
+            settings.dir,
+            run_id=settings.run_id,
+            keep_completed=settings.keep_completed,
+        )
+        logger.info(f"Checkpointing node results for run ID '{checkpoint.run_id}'")
+        if inputs is not None:
+            checkpoint.verify(inputs)
+        return checkpoint
+
+    @property
+    def enabled(self) -> bool:
+        return self.store is not None
+
+    def __contains__(self, name: str) -> bool:
+        """Whether node `name` was checkpointed (without restoring its result)."""
+        return self.store is not None and name in self.store
+
+    def restore(self, name: str) -> tuple[bool, Any]:
+        """Return `(True, value)` if node `name` was checkpointed, otherwise `(False, None)`."""
+        if self.store is None:
+            return False, None
+        try:
+            value = self.store.get(name)
+        except KeyError:
+            return False, None
+        logger.info(f"Restored node from checkpoint of run '{self.run_id}': '{name}'")
+        return True, value
+
+    def save(self, name: str, value: Any) -> None:
+        if self.store is not None:
+            self.store.put(name, value)
+
+    def verify(self, inputs: Any) -> None:
+        """Checkpoint a fingerprint of the `inputs` of this run, or if the run is being
+        resumed, check that they match those it was first run with. Raises `ValueError` if
+        they do not, as the results checkpointed for other inputs must not be restored."""
+        if self.store is None:
+            return
+        fingerprint = hash_key(inputs)
+        try:
+            previous = self.store.get(INPUTS_KEY)
+        except KeyError:
+            self.store.put(INPUTS_KEY, fingerprint)
+            return
+        if previous != fingerprint:
+            raise ValueError(
+                f"Cannot resume run '{self.run_id}', as its inputs (e.g. params or spec) "
+                "have changed."
+            )
+
+    def discard(self) -> None:
+        """Delete all checkpoints of this run, along with the data plane results which they
+        reference (see `DataPlane.adopt`)."""
+        from ecoscope_workflows_core.dataplane import delete
+
+        if self.store is None:
+            return
+        for entry in self.store.entries():
+            refs = self.store.references(entry.key)
+            self.store.delete(entry.key)
+            delete(refs)
+        if isinstance(self.store, LocalDirectoryResultStore):
+            try:
+                self.store.root.rmdir()
+            except OSError:
+                pass
+        logger.info(f"Discarded checkpoint of completed run '{self.run_id}'")
+
+    def complete(self) -> None:
+        """Mark the run as completed, discarding its checkpoint unless `keep_completed`."""
+        if not self.keep_completed:
+            self.discard()
+
+    def restore_or_call(
+        self,
+        name: str,
+        func: Callable[P, R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """Restore the result of node `name`, or call `func` and checkpoint its result."""
+        restored, value = self.restore(name)
+        if restored:
+            return value
+        result = func(*args, **kwargs)
+        self.save(name, result)
+        return result
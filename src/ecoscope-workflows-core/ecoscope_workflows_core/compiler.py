@@ -1,9 +1,11 @@
 import builtins
+import functools
 import hashlib
 import json
 import keyword
 import pathlib
 import sys
+import threading
 from pathlib import Path
 import tempfile
 from importlib.metadata import version
@@ -38,7 +40,7 @@ from ecoscope_workflows_core.artifacts import (
     Tests,
     WorkflowArtifacts,
 )
-from ecoscope_workflows_core.formatting import ruff_formatted
+from ecoscope_workflows_core.formatting import deferred_formatting, ruff_formatted
 from ecoscope_workflows_core.jsonschema import ReactJSONSchemaFormConfiguration
 from ecoscope_workflows_core.registry import KnownTask, known_tasks
 from ecoscope_workflows_core.requirements import (
@@ -50,6 +52,7 @@ from ecoscope_workflows_core.requirements import (
 
 
 T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
 
 TEMPLATES = pathlib.Path(__file__).parent / "templates"
 
@@ -532,6 +535,51 @@ class Spec(_ForbidExtra):
 DagTypes = Literal["jupytext", "async", "sequential"]
 
 
+@functools.cache
+def _compiler_fingerprint() -> str:
+    # the version of the compiler alone does not change with edits to an editable install,
+    # so the whole source of the package is fingerprinted as well, as artifacts depend on
+    # many modules besides this one (e.g. `requirements`, `jsonschema`, and `artifacts`)
+    from ecoscope_workflows_core import formatting
+
+    h = hashlib.sha256(version("ecoscope-workflows-core").encode())
+    h.update(formatting._ruff_version().encode())
+    package = Path(__file__).parent
+    for path in sorted(package.rglob("*.py")):
+        h.update(path.relative_to(package).as_posix().encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+# datamodel-code-generator changes the (process-wide) working directory while generating, so
+# models may only be generated by one thread at a time (e.g. when compiling many specs)
+_dcg_lock = threading.Lock()
+
+
+@functools.cache
+def _jinja_environment(
+    templates_dir: pathlib.Path, keep_trailing_newline: bool = False
+) -> Environment:
+    # shared by all compilers (and so by all specs compiled in one process), such that each
+    # template is only parsed once (unless it changes on disk, as jinja checks for reloads)
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        keep_trailing_newline=keep_trailing_newline,
+    )
+
+
+def _with_formatted_sources(model: M, formatted: dict[str, str]) -> M:
+    """A copy of `model` (e.g. a `PackageDirectory`), with each of its (nested) sources which
+    were collected by `deferred_formatting` replaced by its formatted equivalent."""
+    update: dict[str, Any] = {}
+    for name, value in model:
+        if isinstance(value, BaseModel):
+            update[name] = _with_formatted_sources(value, formatted)
+        elif isinstance(value, str):
+            update[name] = formatted.get(value, value)
+    return model.model_copy(update=update)
+
+
 class DagCompiler(BaseModel):
     spec: Spec
     jinja_templates_dir: pathlib.Path = TEMPLATES
@@ -541,19 +589,22 @@ class DagCompiler(BaseModel):
             exclude={"jinja_templates_dir"},
             context={"mock_io": mock_io},
         )
+        # runs check that they resume checkpoints of the same spec (see `Checkpoint.verify`)
+        dag_config["spec_sha256"] = self.spec.sha256
         if dag_type == "jupytext":
             dag_config |= {
                 "per_taskinstance_params_notebook": self.get_per_taskinstance_params_notebook(),
             }
         return dag_config
 
-    @property
+    @functools.cached_property
     def per_taskinstance_omit_args(
         self,
     ) -> dict[TaskInstanceId, list[KnownTaskArgName]]:
         """For a given arg on a task instance, if it is dependent on another task's return
         value, we omit it from the user-facing parameters, so that it's not set twice (once
         as a dependency in the spec, and a second time by the user via the parameter form).
+        This is computed once per compiler (i.e. per compile), as the spec does not change.
         """
         return {
             t.id: (
@@ -689,6 +740,8 @@ class DagCompiler(BaseModel):
             test-app-sequential-mock-io = "python -m pytest -v tests/test_app.py -k 'sequential and mock-io'"
             test-cli-async-mock-io = "python -m pytest -v tests/test_cli.py -k 'async and mock-io'"
             test-cli-sequential-mock-io = "python -m pytest -v tests/test_cli.py -k 'sequential and mock-io'"
+            test-app-threads-mock-io = "python -m pytest -v tests/test_app.py -k 'threads and mock-io'"
+            test-cli-threads-mock-io = "python -m pytest -v tests/test_cli.py -k 'threads and mock-io'"
             """
             # todo: support build; push; deploy; run; test; etc. tasks
             # [feature.docker.tasks]
@@ -761,6 +814,86 @@ class DagCompiler(BaseModel):
             """
         )
 
+    def _fingerprint(self, *templates: str, tasks: bool = False, **extra: str) -> str:
+        # the fingerprint of an artifact rendered from the spec and `templates` (and, if
+        # `tasks`, the known tasks of the spec), by the current compiler
+        inputs = {
+            "compiler": _compiler_fingerprint(),
+            "spec": self.spec.sha256,
+            "templates": {
+                t: hashlib.sha256(
+                    self.jinja_templates_dir.joinpath(t).read_bytes()
+                ).hexdigest()
+                for t in templates
+            },
+            "tasks": self._tasks_fingerprint if tasks else None,
+        } | extra
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+    @functools.cached_property
+    def _tasks_fingerprint(self) -> str:
+        tasks = {
+            t.known_task_name: {
+                "importable_reference": t.known_task.importable_reference,
+                "tags": t.known_task.tags,
+                "resources": t.known_task.resources.model_dump(mode="json"),
+                "parameters": t.known_task.parameters_jsonschema(),
+            }
+            for t in self.spec.flat_workflow
+        }
+        return hashlib.sha256(
+            json.dumps(tasks, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def get_artifact_fingerprints(self) -> dict[str, str]:
+        """The fingerprint of each artifact generated by `generate_artifacts`, by its path
+        relative to the release directory. An artifact's fingerprint changes if, and only if,
+        any of its inputs (the spec, the templates it is rendered from, the parameters of the
+        spec's tasks, and the compiler itself) change. The fingerprint of `pixi.lock` is that
+        of the dependencies of `pixi.toml`, so that it only changes when re-locking is needed.
+        """
+        pkg, macros = self.package_name, "pkg/dags/_macros.jinja2"
+        dag_templates = {
+            "jupytext.py": "pkg/dags/jupytext.jinja2",
+            "run_async_mock_io.py": "pkg/dags/run_async.jinja2",
+            "run_async.py": "pkg/dags/run_async.jinja2",
+            "run_sequential_mock_io.py": "pkg/dags/run_sequential.jinja2",
+            "run_sequential.py": "pkg/dags/run_sequential.jinja2",
+        }
+        dependencies = self.get_pixi_toml().model_dump(
+            mode="json", by_alias=True, exclude={"file_header"}
+        )
+        return {
+            "pixi.toml": self._fingerprint(),
+            "pixi.lock": hashlib.sha256(
+                json.dumps(dependencies, sort_keys=True).encode()
+            ).hexdigest(),
+            "graph.png": self._fingerprint(),
+            "pyproject.toml": self._fingerprint(),
+            "Dockerfile": self._fingerprint("Dockerfile.jinja2"),
+            ".dockerignore": self._fingerprint("dockerignore.jinja2"),
+            "README.md": self._fingerprint("README.jinja2"),
+            "tests/conftest.py": self._fingerprint("tests/conftest.jinja2"),
+            "tests/test_app.py": self._fingerprint("tests/test_app.jinja2"),
+            "tests/test_cli.py": self._fingerprint("tests/test_cli.jinja2"),
+            f"{pkg}/__init__.py": self._fingerprint(),
+            f"{pkg}/app.py": self._fingerprint("pkg/app.jinja2"),
+            f"{pkg}/cli.py": self._fingerprint("pkg/cli.jinja2"),
+            f"{pkg}/dispatch.py": self._fingerprint("pkg/dispatch.jinja2"),
+            f"{pkg}/params-jsonschema.json": self._fingerprint(tasks=True),
+            **{
+                f"{pkg}/{fname}": self._fingerprint(
+                    tasks=True, dcg=version("datamodel-code-generator")
+                )
+                for fname in ("formdata.py", "params.py")
+            },
+            f"{pkg}/dags/__init__.py": self._fingerprint("pkg/dags/init.jinja2"),
+            **{
+                f"{pkg}/dags/{fname}": self._fingerprint(template, macros, tasks=True)
+                for fname, template in dag_templates.items()
+            },
+        }
+
     def get_pyproject_toml(self) -> str:
         return self.file_header + dedent(
             f"""
@@ -776,8 +909,7 @@ class DagCompiler(BaseModel):
 
     @ruff_formatted
     def render_dag(self, dag_type: DagTypes, mock_io: bool = False) -> str:
-        loader = FileSystemLoader(self.jinja_templates_dir / "pkg" / "dags")
-        env = Environment(loader=loader)
+        env = _jinja_environment(self.jinja_templates_dir / "pkg" / "dags")
         template = env.get_template(
             f"run_{dag_type}.jinja2" if dag_type != "jupytext" else "jupytext.jinja2"
         )
@@ -790,31 +922,26 @@ class DagCompiler(BaseModel):
     def generate_params_model(self, params_jsonschema: dict, file_header: str) -> str:
         with tempfile.NamedTemporaryFile(suffix=".py") as tmp:
             output = Path(tmp.name)
-            dcg.generate(
-                json.dumps(params_jsonschema),
-                input_file_type=dcg.InputFileType.JsonSchema,
-                input_filename="params-jsonschema.json",
-                output=output,
-                output_model_type=dcg.DataModelType.PydanticV2BaseModel,
-                use_subclass_enum=True,
-                custom_file_header=file_header,
-            )
+            with _dcg_lock:
+                dcg.generate(
+                    json.dumps(params_jsonschema),
+                    input_file_type=dcg.InputFileType.JsonSchema,
+                    input_filename="params-jsonschema.json",
+                    output=output,
+                    output_model_type=dcg.DataModelType.PydanticV2BaseModel,
+                    use_subclass_enum=True,
+                    custom_file_header=file_header,
+                )
             model: str = output.read_text()
         return model
 
     @ruff_formatted
     def ruffrender(self, template: str, **kws) -> str:
-        env = Environment(
-            loader=FileSystemLoader(self.jinja_templates_dir),
-            keep_trailing_newline=True,
-        )
+        env = _jinja_environment(self.jinja_templates_dir, keep_trailing_newline=True)
         return env.get_template(template).render(file_header=self.file_header, **kws)
 
     def plainrender(self, template: str, **kws) -> str:
-        env = Environment(
-            loader=FileSystemLoader(self.jinja_templates_dir),
-            keep_trailing_newline=True,
-        )
+        env = _jinja_environment(self.jinja_templates_dir, keep_trailing_newline=True)
         return env.get_template(template).render(file_header=self.file_header, **kws)
 
     def get_dags(self) -> Dags:
@@ -897,12 +1024,16 @@ class DagCompiler(BaseModel):
         return graph
 
     def generate_artifacts(self, spec_relpath: str) -> WorkflowArtifacts:
+        # the python sources of the package and tests are all formatted in one batch
+        with deferred_formatting() as deferred:
+            package, tests = self.get_package(), self.get_tests()
+        formatted = deferred.format()
         return WorkflowArtifacts(
             spec_relpath=spec_relpath,
             package_name=self.package_name,
             release_name=self.release_name,
-            package=self.get_package(),
-            tests=self.get_tests(),
+            package=_with_formatted_sources(package, formatted),
+            tests=_with_formatted_sources(tests, formatted),
             **{
                 "pixi.toml": self.get_pixi_toml(),
                 "graph.png": self.build_pydot_graph(),
@@ -0,0 +1,230 @@
+"""Pass-by-reference for large intermediate results.
+
+Without a data plane, every (Geo)DataFrame which flows along a `DependsOn` edge is returned to
+the driver by `Future.gather`, and then sent back out as call data for the next node. With a
+data plane, the worker which produces a large (Geo)DataFrame writes it once, as (Geo)Parquet, to
+a local directory or a GCS bucket shared by all workers, and returns a lightweight `ResultRef` in
+its place. The driver only ever handles references, and the worker which consumes a reference
+reads the frame directly from storage.
+"""
+
+import functools
+import inspect
+import logging
+import shutil
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Literal
+from urllib.parse import urlparse
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ecoscope_workflows_core.cache import frame_format
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_BYTES = 1 << 20
+
+
+@dataclass(frozen=True)
+class ResultRef:
+    """A reference to a (Geo)DataFrame written to the data plane."""
+
+    uri: str
+    format: Literal["geoparquet", "parquet"]
+
+
+def _is_gcs(uri: str) -> bool:
+    return urlparse(uri).scheme == "gs"
+
+
+def _open(uri: str, mode: Literal["rb", "wb"]) -> IO[bytes]:
+    if _is_gcs(uri):
+        from cloudpathlib.gs.gspath import GSPath
+
+        return GSPath(uri).open(mode)
+    path = Path(uri)
+    if mode == "wb":
+        path.parent.mkdir(parents=True, exist_ok=True)
+    return path.open(mode)
+
+
+def read(ref: ResultRef) -> Any:
+    with _open(ref.uri, "rb") as f:
+        match ref.format:
+            case "geoparquet":
+                import geopandas as gpd  # type: ignore[import-not-found]
+
+                return gpd.read_parquet(f)
+            case "parquet":
+                import pandas as pd
+
+                return pd.read_parquet(f)
+
+
+def _replace_refs(value: Any, replace: Callable[[ResultRef], Any]) -> Any:
+    match value:
+        case ResultRef():
+            return replace(value)
+        case list():
+            return [_replace_refs(v, replace) for v in value]
+        case tuple():
+            return tuple(_replace_refs(v, replace) for v in value)
+        case dict():
+            return {k: _replace_refs(v, replace) for k, v in value.items()}
+        case _:
+            return value
+
+
+def resolve(value: Any) -> Any:
+    """Replace each `ResultRef` in `value` (which may be nested in lists, tuples, or dicts,
+    as for the results of `map` and `mapvalues`) with the frame it refers to."""
+    return _replace_refs(value, read)
+
+
+def find_refs(value: Any) -> list[ResultRef]:
+    """All of the `ResultRef`s in `value` (which may be nested, as for `resolve`)."""
+    refs: list[ResultRef] = []
+    _replace_refs(value, refs.append)
+    return refs
+
+
+def delete(refs: Iterable[ResultRef]) -> None:
+    """Delete the frames referred to by `refs` from the data plane."""
+    for ref in refs:
+        if _is_gcs(ref.uri):
+            from cloudpathlib.gs.gspath import GSPath
+
+            GSPath(ref.uri).unlink(missing_ok=True)
+            continue
+        path = Path(ref.uri)
+        path.unlink(missing_ok=True)
+        try:
+            # i.e. the directory of a cache entry or checkpoint (see `DataPlane.adopt`)
+            path.parent.rmdir()
+        except OSError:
+            pass
+
+
+class DataPlaneSettings(BaseSettings):
+    """Configures the data plane from the environment. Pass-by-reference is enabled if
+    `ECOSCOPE_WORKFLOWS_DATAPLANE_ROOT` is set to a local path or `gs://` URL, which must be
+    readable and writable by all workers (e.g. a GCS bucket, for Lithops on Cloud Run)."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ecoscope_workflows_dataplane_",
+        case_sensitive=False,
+    )
+
+    root: str | None = None
+    min_bytes: int = DEFAULT_MIN_BYTES
+
+
+@dataclass(frozen=True)
+class DataPlane:
+    """Shared storage for the intermediate results of one run, under `<root>/<run_id>`.
+    (Geo)DataFrames of at least `min_bytes` (in memory) are offloaded; all other values are
+    passed by value as usual.
+
+    Examples:
+
+    ```python
+    >>> import tempfile
+    >>> import pandas as pd
+    >>> plane = DataPlane(tempfile.mkdtemp(), min_bytes=0)
+    >>> ref = plane.offload(pd.DataFrame({"x": [1, 2]}))
+    >>> ref.format
+    'parquet'
+    >>> [(k, df["x"].tolist()) for k, df in resolve([("a", ref)])]
+    [('a', [1, 2])]
+    >>> plane.cleanup()
+
+    ```
+    """
+
+    root: str
+    min_bytes: int = DEFAULT_MIN_BYTES
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    @classmethod
+    def from_env(cls) -> "DataPlane | None":
+        settings = DataPlaneSettings()
+        if not settings.root:
+            return None
+        return cls(settings.root, min_bytes=settings.min_bytes)
+
+    @property
+    def prefix(self) -> str:
+        return f"{self.root.rstrip('/')}/{self.run_id}"
+
+    def write(self, value: Any, fmt: Literal["geoparquet", "parquet"]) -> ResultRef:
+        ref = ResultRef(f"{self.prefix}/{uuid.uuid4().hex}.parquet", fmt)
+        with _open(ref.uri, "wb") as f:
+            value.to_parquet(f)
+        logger.debug(f"Offloaded result to data plane: '{ref.uri}'")
+        return ref
+
+    def offload(self, value: Any) -> Any:
+        """Replace each sufficiently large (Geo)DataFrame in `value` (which may be nested in
+        lists, tuples, or dicts) with a `ResultRef` to a copy of it written to the data plane.
+        """
+        match value:
+            case list():
+                return [self.offload(v) for v in value]
+            case tuple():
+                return tuple(self.offload(v) for v in value)
+            case dict():
+                return {k: self.offload(v) for k, v in value.items()}
+        fmt = frame_format(value)
+        if fmt is None or value.memory_usage(deep=True).sum() < self.min_bytes:
+            return value
+        return self.write(value, fmt)
+
+    def _copy(self, ref: ResultRef, owner: str) -> ResultRef:
+        copied = ResultRef(
+            f"{self.root.rstrip('/')}/{owner}/{uuid.uuid4().hex}.parquet", ref.format
+        )
+        if _is_gcs(ref.uri):
+            from cloudpathlib.gs.gspath import GSPath
+
+            GSPath(ref.uri).copy(GSPath(copied.uri))
+        else:
+            Path(copied.uri).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(ref.uri, copied.uri)
+        return copied
+
+    def adopt(self, value: Any, owner: str) -> Any:
+        """Replace each `ResultRef` in `value` with a reference to a copy of its frame under
+        `<root>/<owner>`, e.g. for a `value` which is persisted by a cache entry or checkpoint.
+        Unlike the results of the run, which are deleted by `cleanup`, the copies are owned
+        by (and must be deleted along with) the persisted `value`."""
+        return _replace_refs(value, lambda ref: self._copy(ref, owner))
+
+    def cleanup(self) -> None:
+        """Delete all results written to the data plane for this run."""
+        if _is_gcs(self.prefix):
+            from cloudpathlib.gs.gspath import GSPath
+
+            path = GSPath(self.prefix)
+            if path.exists():
+                path.rmtree()
+        else:
+            shutil.rmtree(self.prefix, ignore_errors=True)
+
+
+class ByReference:
+    """Wraps a task function to run on a worker, resolving any `ResultRef`s among its
+    arguments before the call, and offloading large (Geo)DataFrames in its result after it.
+    The wrapper takes on the signature of the function, so that executors (and `mapvalues`)
+    see the same parameters as for the function itself."""
+
+    def __init__(self, func: Callable, plane: DataPlane):
+        self.func = func
+        self.plane = plane
+        self.__signature__ = inspect.signature(func)
+        functools.update_wrapper(self, func, updated=())
+
+    def __call__(self, **kwargs):
+        result = self.func(**{k: resolve(v) for k, v in kwargs.items()})
+        return self.plane.offload(result)
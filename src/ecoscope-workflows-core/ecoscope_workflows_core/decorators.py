@@ -1,13 +1,16 @@
 import functools
 import inspect
 import sys
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, replace
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
     Generic,
     Literal,
+    Mapping,
     ParamSpec,
     Sequence,
     TypeVar,
@@ -22,14 +25,18 @@ else:
 
 from pydantic import validate_call
 
+from ecoscope_workflows_core.cache import task_names
 from ecoscope_workflows_core.executors import (
     AsyncExecutor,
     Future,
     FutureSequence,
     SyncExecutor,
+    TaskResources,
+    get_async_executor,
     mapvalues_wrapper,
 )
 from ecoscope_workflows_core.executors.python import PythonExecutor
+from ecoscope_workflows_core.validation import ValidationMode, with_validation_mode
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -37,10 +44,86 @@ K = TypeVar("K")
 V = TypeVar("V")
 
 
+class _CallPlan:
+    """What a task needs to know about its function to call it: the function's signature,
+    and the defaults of its parameters. The signature is only computed if it is needed."""
+
+    def __init__(self, func: Callable, defaults: Mapping[str, Any] | None = None):
+        # the plan must not keep its function alive, as it is cached weakly by function
+        try:
+            self._func = weakref.ref(func)
+        except TypeError:
+            self._func = lambda: func
+        if defaults is None:
+            defaults = {
+                k: v.default
+                for k, v in self.signature.parameters.items()
+                if v.default is not inspect.Parameter.empty
+            }
+        self.defaults = MappingProxyType(dict(defaults))
+
+    @functools.cached_property
+    def signature(self) -> inspect.Signature:
+        return inspect.signature(self._func())
+
+
+# keyed weakly by task function, so that plans live only as long as their functions, e.g. for
+# the duration of a single request for partial functions. (validators necessarily reference
+# their function, and so are only cached for plain functions, which typically live for the
+# duration of the process anyway)
+_call_plans: "weakref.WeakKeyDictionary[Callable, _CallPlan]" = (
+    weakref.WeakKeyDictionary()
+)
+_validators: "weakref.WeakKeyDictionary[Callable, Callable]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _memoized(cache: weakref.WeakKeyDictionary, func: Callable, create: Callable):
+    try:
+        return cache[func]
+    except KeyError:
+        pass
+    except TypeError:  # not weakly referenceable, or not hashable
+        return create(func)
+    value = cache[func] = create(func)
+    return value
+
+
+def _create_call_plan(func: Callable) -> _CallPlan:
+    if isinstance(func, functools.partial) and not func.args:
+        # as for `inspect.signature`, keywords bound by the partial become defaults
+        base = _call_plan(func.func)
+        return _CallPlan(func, defaults=base.defaults | func.keywords)
+    return _CallPlan(func)
+
+
+def _call_plan(func: Callable) -> _CallPlan:
+    """The call plan for `func`, which is only created once per function. The plans of
+    `functools.partial`s are derived from the plan of the function they wrap, without
+    inspecting the partial's signature."""
+    return _memoized(_call_plans, func, _create_call_plan)
+
+
+def _create_validator(func: Callable) -> Callable:
+    return validate_call(  # type: ignore[call-overload]
+        func,
+        validate_return=True,
+        config={"arbitrary_types_allowed": True},
+    )
+
+
 @dataclass(frozen=True)
 class _Task(Generic[P, R, K, V]):
     func: Callable[P, R]
     tags: list[str]
+    resources: TaskResources = field(default_factory=TaskResources, kw_only=True)
+
+    @property
+    def plan(self) -> _CallPlan:
+        """The (memoized) call plan of this task's function. Tasks which share a function,
+        e.g. as created by `set_executor`, share a plan."""
+        return _call_plan(self.func)
 
     def partial(
         self,
@@ -72,7 +155,7 @@ class _Task(Generic[P, R, K, V]):
             raise ValueError("Positional arguments are not supported in `partial`.")
         return replace(self, func=functools.partial(self.func, **kwargs))
 
-    def validate(self) -> Self:
+    def validate(self, mode: ValidationMode | None = None) -> Self:
         """Return a new Task with the same attributes, but with the function input
         parameters and return values validated by Pydantic's `validate_call` This
         is required in settings where the input parameters are given as strings that
@@ -98,15 +181,19 @@ class _Task(Generic[P, R, K, V]):
 
         ```
 
+        Parameters annotated as `annotations.DataFrame[...]` (and such return values) are
+        validated to the depth of the `mode`; see `validation` for the available modes. If no
+        `mode` is given, the mode configured by the environment is used, which by default is
+        `full`. Other parameters are validated in every mode.
+
         """
-        return replace(
-            self,
-            func=validate_call(  # type: ignore[call-overload]
-                self.func,
-                validate_return=True,
-                config={"arbitrary_types_allowed": True},
-            ),
+        # the validator for each (plain) function is only built once, and then reused
+        validator = (
+            _memoized(_validators, self.func, _create_validator)
+            if inspect.isfunction(self.func)
+            else _create_validator(self.func)
         )
+        return replace(self, func=with_validation_mode(validator, mode))
 
     @overload
     def set_executor(
@@ -117,7 +204,7 @@ class _Task(Generic[P, R, K, V]):
     @overload
     def set_executor(
         self,
-        name_or_executor: Literal["lithops"],
+        name_or_executor: Literal["lithops", "threads", "processes"],
     ) -> "AsyncTask[P, R, K, V]": ...
 
     @overload
@@ -134,7 +221,9 @@ class _Task(Generic[P, R, K, V]):
 
     def set_executor(
         self,
-        name_or_executor: Literal["python", "lithops"] | AsyncExecutor | SyncExecutor,
+        name_or_executor: Literal["python", "lithops", "threads", "processes"]
+        | AsyncExecutor
+        | SyncExecutor,
     ) -> "AsyncTask[P, R, K, V] | SyncTask[P, R, K, V]":
         """Return a new Task with the same attributes, but with the executor set to the
         given executor. This is useful for changing the executor for a task function
@@ -151,6 +240,8 @@ class _Task(Generic[P, R, K, V]):
         >>> f_new = f.set_executor("lithops")
         >>> type(f_new.executor)
         <class 'ecoscope_workflows_core.executors.lithops.LithopsExecutor'>
+        >>> type(f.set_executor("threads").executor)
+        <class 'ecoscope_workflows_core.executors.threads.ThreadPoolAsyncExecutor'>
 
         ```
 
@@ -160,31 +251,34 @@ class _Task(Generic[P, R, K, V]):
                 return SyncTask(
                     self.func,
                     tags=self.tags,
+                    resources=self.resources,
                     executor=PythonExecutor(),
                 )
-            case "lithops":
-                from ecoscope_workflows_core.executors.lithops import LithopsExecutor
-
+            case "lithops" | "threads" | "processes":
                 return AsyncTask(
                     self.func,
                     tags=self.tags,
-                    executor=LithopsExecutor(),
+                    resources=self.resources,
+                    executor=get_async_executor(name_or_executor),
                 )
             case AsyncExecutor():
                 return AsyncTask(
                     self.func,
                     tags=self.tags,
+                    resources=self.resources,
                     executor=name_or_executor,
                 )
             case SyncExecutor():
                 return SyncTask(
                     self.func,
                     tags=self.tags,
+                    resources=self.resources,
                     executor=name_or_executor,
                 )
             case _:
                 raise ValueError(
-                    "Executor name must be one of the literal strings 'python' or 'lithops', "
+                    "Executor name must be one of the literal strings 'python', 'lithops', 'threads' "
+                    "or 'processes', "
                     f"or an instance of a `AsyncExecutor` or `SyncExecutor`, not {name_or_executor}."
                 )
 
@@ -209,18 +303,10 @@ class _TaskMethodsMixinABC(ABC, Generic[P, R, K, V]):
     ) -> Sequence[tuple[K, R]] | FutureSequence[tuple[K, R]]: ...
 
 
-def _get_defaults(func: Callable) -> dict[str, Any]:
-    return {
-        k: v.default
-        for k, v in inspect.signature(func).parameters.items()
-        if v.default is not inspect.Parameter.empty
-    }
-
-
 def _create_kwargs_iterable(
     argnames: str | Sequence[str],
     argvalues: Sequence[V] | Sequence[tuple[V, ...]],
-    defaults: dict[str, Any],
+    defaults: Mapping[str, Any],
 ) -> list[dict[str, V | Any]]:
     if isinstance(argnames, str):
         argnames = [argnames]
@@ -353,7 +439,7 @@ class SyncTask(_TaskMethodsMixinABC, _Task[P, R, K, V]):
 
         ```
         """
-        defaults = _get_defaults(self.func)
+        defaults = self.plan.defaults
         kwargs_iterable = _create_kwargs_iterable(argnames, argvalues, defaults)
         return self.executor.map(lambda kw: self.func(**kw), kwargs_iterable)
 
@@ -393,7 +479,7 @@ class SyncTask(_TaskMethodsMixinABC, _Task[P, R, K, V]):
             )
         if isinstance(argnames, str):
             argnames = [argnames]
-        defaults = _get_defaults(self.func)
+        defaults = self.plan.defaults
         kwargs_iterable = [
             (k, defaults | {argnames[0]: argvalue}) for (k, argvalue) in argvalues
         ]
@@ -404,9 +490,18 @@ class SyncTask(_TaskMethodsMixinABC, _Task[P, R, K, V]):
 class AsyncTask(_TaskMethodsMixinABC, _Task[P, R, K, V]):
     executor: AsyncExecutor
 
+    @property
+    def _bound_executor(self) -> AsyncExecutor:
+        # lets executors which treat tasks differently (e.g. by limiting the concurrency of
+        # each task, or of each tag) know which task is submitting; a fused chain of tasks is
+        # submitted under the names of all of its members, so that each of their limits apply
+        names = task_names(self.func)
+        name = names[0] if len(names) == 1 else names
+        return self.executor.for_task(name, self.tags, self.resources)
+
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Future[R]:
-        defaults = _get_defaults(self.func)
-        return self.executor.call(self.func, *args, **defaults | kwargs)
+        defaults = self.plan.defaults
+        return self._bound_executor.call(self.func, *args, **defaults | kwargs)
 
     def call(self, *args: P.args, **kwargs: P.kwargs) -> Future[R]:
         return self(*args, **kwargs)
@@ -416,9 +511,9 @@ class AsyncTask(_TaskMethodsMixinABC, _Task[P, R, K, V]):
         argnames: str | Sequence[str],
         argvalues: Sequence[V] | Sequence[tuple[V, ...]],
     ) -> FutureSequence[R]:
-        defaults = _get_defaults(self.func)
+        defaults = self.plan.defaults
         kwargs_iterable = _create_kwargs_iterable(argnames, argvalues, defaults)
-        return self.executor.map(self.func, kwargs_iterable)
+        return self._bound_executor.map(self.func, kwargs_iterable)
 
     def mapvalues(
         self, argnames: str | Sequence[str], argvalues: Sequence[tuple[K, V]]
@@ -429,11 +524,11 @@ class AsyncTask(_TaskMethodsMixinABC, _Task[P, R, K, V]):
             )
         if isinstance(argnames, str):
             argnames = [argnames]
-        defaults = _get_defaults(self.func)
+        defaults = self.plan.defaults
         kwargs_iterable = [
             (k, defaults | {argnames[0]: argvalue}) for (k, argvalue) in argvalues
         ]
-        return self.executor.map(_wrap_for_mapvalues(self.func), kwargs_iterable)
+        return self._bound_executor.map(_wrap_for_mapvalues(self.func), kwargs_iterable)
 
 
 @overload  # @task style
@@ -441,6 +536,7 @@ def task(
     func: Callable[P, R],
     *,
     tags: list[str] | None = None,
+    resources: TaskResources | None = None,
 ) -> SyncTask[P, R, K, V]: ...
 
 
@@ -448,6 +544,7 @@ def task(
 def task(
     *,
     tags: list[str] | None = None,
+    resources: TaskResources | None = None,
 ) -> Callable[[Callable[P, R]], SyncTask[P, R, K, V]]: ...
 
 
@@ -455,6 +552,7 @@ def task(
     func: Callable[P, R] | None = None,
     *,
     tags: list[str] | None = None,
+    resources: TaskResources | None = None,
 ) -> Callable[[Callable[P, R]], SyncTask[P, R, K, V]] | SyncTask[P, R, K, V]:
     def wrapper(
         func: Callable[P, R],
@@ -462,6 +560,7 @@ def task(
         return SyncTask(
             func,
             tags=tags or [],
+            resources=resources or TaskResources(),
         )
 
     if func:
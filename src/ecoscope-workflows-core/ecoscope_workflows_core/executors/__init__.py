@@ -1,7 +1,15 @@
 from .base import AsyncExecutor as AsyncExecutor
+from .base import AsyncExecutorName as AsyncExecutorName
+from .base import get_async_executor as get_async_executor
 from .base import SyncExecutor as SyncExecutor
 from .base import Future as Future
 from .base import FutureSequence as FutureSequence
 from .base import mapvalues_wrapper as mapvalues_wrapper
+from .base import TaskResources as TaskResources
 from .lithops import LithopsExecutor as LithopsExecutor
 from .python import PythonExecutor as PythonExecutor
+from .threads import ThreadPoolAsyncExecutor as ThreadPoolAsyncExecutor
+from .processes import ProcessPoolAsyncExecutor as ProcessPoolAsyncExecutor
+from .bounded import BoundedExecutor as BoundedExecutor
+from .bounded import ConcurrencyLimits as ConcurrencyLimits
+from .speculative import SpeculativeExecutor as SpeculativeExecutor
@@ -1,5 +1,25 @@
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Callable, Generic, ParamSpec, Iterable, Sequence, TypeVar
+from typing import (
+    Callable,
+    Generic,
+    Iterator,
+    Literal,
+    ParamSpec,
+    Iterable,
+    Sequence,
+    TypeVar,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveInt,
+)
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -8,6 +28,68 @@ K = TypeVar("K")
 V = TypeVar("V")
 
 
+class TaskResources(BaseModel):
+    """Hints at the resources required by each invocation of a task, set with `@task(resources=...)`.
+    Executors size their invocations (or workers) by these hints where they can, and ignore them
+    where they cannot.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    memory: PositiveInt | None = Field(
+        default=None, description="Expected peak memory, in MB."
+    )
+    cpus: float | None = Field(
+        default=None, gt=0, description="Number of CPUs which the task can make use of."
+    )
+    timeout: PositiveInt | None = Field(
+        default=None, description="Maximum duration of an invocation, in seconds."
+    )
+    retries: NonNegativeInt | None = Field(
+        default=None, description="Number of times to retry a failed invocation."
+    )
+    backoff: NonNegativeFloat | None = Field(
+        default=None,
+        description="Seconds to wait before the first retry, doubling with each retry after.",
+    )
+    cheap: bool = Field(
+        default=False, description="Whether the task is cheap enough to run inline."
+    )
+    pure: bool = Field(
+        default=False,
+        description="Whether the task is free of side effects, and so safe to run twice.",
+    )
+
+
+def _total_memory() -> int | None:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1 << 20)
+    except (AttributeError, ValueError, OSError):  # e.g. on windows
+        return None
+
+
+def workers_for(resources: TaskResources) -> int | None:
+    """The number of concurrent invocations of a task which fit on this machine, given the
+    task's CPU and memory hints, or None if it has neither.
+
+    Examples:
+
+    ```python
+    >>> workers_for(TaskResources()) is None
+    True
+    >>> workers_for(TaskResources(cpus=os.cpu_count())) == 1
+    True
+
+    ```
+    """
+    limits = []
+    if resources.cpus is not None:
+        limits.append(int((os.cpu_count() or 1) // resources.cpus))
+    if resources.memory is not None and (total := _total_memory()) is not None:
+        limits.append(total // resources.memory)
+    return max(1, min(limits)) if limits else None
+
+
 class SyncExecutor(ABC, Generic[P, R]):
     @abstractmethod
     def call(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
@@ -23,12 +105,84 @@ class Future(ABC, Generic[R]):
     def gather(self, *args, **kwargs) -> R:
         pass
 
+    def done(self) -> bool:
+        """Return True if `gather` can return without blocking. Executors which cannot
+        report completion status may rely on this default, in which case schedulers
+        will simply block on `gather` the next time they poll this future.
+        """
+        return True
+
+    def cancel(self) -> None:
+        """Cancel the work of this future, if it has not yet completed, so that it no longer
+        consumes (or bills for) resources once its result is known to be unneeded. This is
+        best effort: executors which cannot cancel work may rely on this default, which lets
+        the work run out, and `gather` should not be called after cancelling.
+        """
+
 
 class FutureSequence(ABC, Generic[R]):
     @abstractmethod
     def gather(self, *args, **kwargs) -> Sequence[R]:
         pass
 
+    def done(self) -> bool:
+        """Return True if all elements of the sequence have completed, such that
+        `gather` can return without blocking. See `Future.done` for the default.
+        """
+        return True
+
+    def completed(self) -> Sequence[int]:
+        """Return the indices of the elements which have completed, such that `gather_at`
+        can return them without blocking. Executors which cannot report the status of
+        individual elements may rely on this default, which reports either all elements
+        (if the sequence is `done`) or none of them.
+        """
+        return range(len(self.gather())) if self.done() else []
+
+    def started(self) -> Sequence[int]:
+        """Return the indices of the elements which have started running (including those
+        which have since completed), as opposed to those still queued for a worker. Executors
+        which cannot tell queued elements from running ones may rely on this default, which
+        reports only the `completed` elements as started.
+        """
+        return self.completed()
+
+    def cancel(self) -> None:
+        """Cancel the work of all elements which have not yet completed. See `Future.cancel`."""
+
+    def gather_at(self, index: int, *args, **kwargs) -> R:
+        """Return the result of the element at `index`, blocking until it is available."""
+        return self.gather(*args, **kwargs)[index]
+
+    def as_completed(self, poll_interval: float = 0.05) -> Iterator[tuple[int, R]]:
+        """Yield an `(index, result)` pair for each element, in order of completion rather
+        than in order of index, so that consumers can start work on the first results
+        while other elements are still running. The completion status of the elements is
+        polled every `poll_interval` seconds; executors which can wait on their elements
+        directly may override this.
+
+        Examples:
+
+        ```python
+        >>> from ecoscope_workflows_core.executors import ThreadPoolAsyncExecutor
+        >>> futures = ThreadPoolAsyncExecutor().map(lambda a: a * 2, [{"a": 1}, {"a": 2}])
+        >>> sorted(futures.as_completed())
+        [(0, 2), (1, 4)]
+
+        ```
+        """
+        yielded: set[int] = set()
+        while True:
+            # checked before `completed`, so that no element can complete unreported
+            finished = self.done()
+            for i in self.completed():
+                if i not in yielded:
+                    yielded.add(i)
+                    yield i, self.gather_at(i)
+            if finished:
+                return
+            time.sleep(poll_interval)
+
 
 class AsyncExecutor(ABC, Generic[P, R]):
     @abstractmethod
@@ -48,6 +202,52 @@ class AsyncExecutor(ABC, Generic[P, R]):
     ) -> FutureSequence[R]:
         pass
 
+    def for_task(
+        self,
+        name: str | Sequence[str],
+        tags: Sequence[str],
+        resources: TaskResources,
+    ) -> "AsyncExecutor":
+        """Return the executor with which to submit invocations of the task `name` (or, for a
+        chain of tasks fused into one, of the tasks with each of the given names), which has
+        the given `tags` and `resources`. Executors which treat all tasks alike may rely on
+        this default, which returns the executor itself.
+        """
+        return self
+
+    def close(self) -> None:
+        """Release any resources (e.g. clients, or temporary storage) held by this executor.
+        Executors which hold no such resources may rely on this default, which does nothing.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+AsyncExecutorName = Literal["lithops", "threads", "processes"]
+
+
+def get_async_executor(name: AsyncExecutorName) -> AsyncExecutor:
+    """Create a new instance of the async executor with the given name."""
+    match name:
+        case "lithops":
+            from .lithops import LithopsExecutor
+
+            return LithopsExecutor()
+        case "threads":
+            from .threads import ThreadPoolAsyncExecutor
+
+            return ThreadPoolAsyncExecutor()
+        case "processes":
+            from .processes import ProcessPoolAsyncExecutor
+
+            return ProcessPoolAsyncExecutor()
+        case _:
+            raise ValueError(f"Unknown async executor name: {name}")
+
 
 class mapvalues_wrapper(Generic[K, V, R]):
     def __init__(self, func):
@@ -0,0 +1,261 @@
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Iterable, Sequence
+
+from pydantic import PositiveInt
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from .base import AsyncExecutor, Future, FutureSequence, TaskResources, P, R, T
+
+Key = tuple[str, ...]
+
+
+class ConcurrencySettings(BaseSettings):
+    """Configures `ConcurrencyLimits.from_env`, e.g.
+    `ECOSCOPE_WORKFLOWS_CONCURRENCY_MAX_IN_FLIGHT=64` and
+    `ECOSCOPE_WORKFLOWS_CONCURRENCY_TAGS='{"io": 8}'`."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ecoscope_workflows_concurrency_",
+        case_sensitive=False,
+    )
+
+    max_in_flight: PositiveInt | None = None
+    tags: dict[str, PositiveInt] = {}
+    tasks: dict[str, PositiveInt] = {}
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimits:
+    """Caps on the number of invocations in flight at once: `max_in_flight` across all tasks,
+    `tags` per task tag (e.g. `{"io": 8}`, for tasks tagged `registry.TaskTag.io`), and `tasks`
+    per task, by function name. An invocation counts against every cap which applies to it."""
+
+    max_in_flight: int | None = None
+    tags: dict[str, int] = field(default_factory=dict)
+    tasks: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_env(cls) -> "ConcurrencyLimits | None":
+        settings = ConcurrencySettings()
+        if not (settings.max_in_flight or settings.tags or settings.tasks):
+            return None
+        return cls(settings.max_in_flight, settings.tags, settings.tasks)
+
+    def caps(
+        self, name: str | Sequence[str] | None, tags: Sequence[str]
+    ) -> dict[Key, int]:
+        """The caps which apply to invocations of the task `name`, with the given `tags`. An
+        invocation of a fused chain of tasks (for which `name` is a sequence of names) runs
+        each of them, so is subject to the caps of all of them.
+
+        Examples:
+
+        ```python
+        >>> limits = ConcurrencyLimits(tags={"io": 8}, tasks={"load": 2, "save": 4})
+        >>> limits.caps("load", ["io"])
+        {('tag', 'io'): 8, ('task', 'load'): 2}
+        >>> limits.caps(["clean", "save"], [])
+        {('task', 'save'): 4}
+
+        ```
+        """
+        caps: dict[Key, int] = {}
+        if self.max_in_flight is not None:
+            caps[("global",)] = self.max_in_flight
+        for tag in tags:
+            if tag in self.tags:
+                caps[("tag", tag)] = self.tags[tag]
+        names = [] if name is None else [name] if isinstance(name, str) else name
+        for n in names:
+            if n in self.tasks:
+                caps[("task", n)] = self.tasks[n]
+        return caps
+
+
+@dataclass
+class _InFlight:
+    caps: dict[Key, int]
+    size: int
+    completed: Callable[[], int]
+    released: int = 0
+
+
+class Limiter:
+    """Counts the invocations in flight against each cap. Invocations are released as they are
+    observed to have completed, each time the available capacity is checked."""
+
+    def __init__(self, limits: ConcurrencyLimits):
+        self.limits = limits
+        self.in_flight: Counter[Key] = Counter()
+        self._entries: list[_InFlight] = []
+
+    def _reap(self) -> None:
+        for entry in self._entries:
+            completed = min(entry.completed(), entry.size)
+            for key in entry.caps:
+                self.in_flight[key] -= completed - entry.released
+            entry.released = completed
+        self._entries = [e for e in self._entries if e.released < e.size]
+
+    def available(self, caps: dict[Key, int]) -> int:
+        """The number of invocations which can be submitted without exceeding `caps`."""
+        self._reap()
+        return min(
+            (cap - self.in_flight[key] for key, cap in caps.items()),
+            default=sys.maxsize,
+        )
+
+    def acquire(
+        self,
+        caps: dict[Key, int],
+        size: int,
+        completed: Callable[[], int],
+    ) -> None:
+        """Count `size` newly submitted invocations against `caps`, until `completed` reports
+        them as done."""
+        if not caps:
+            return
+        self.in_flight.update({key: size for key in caps})
+        self._entries.append(_InFlight(caps, size, completed))
+
+
+class BoundedFutureSequence(FutureSequence[R]):
+    """The future for a `map` whose elements are submitted in batches, as capacity allows.
+    Elements which cannot yet be submitted are queued, and each poll (via `done` or
+    `completed`) submits as many of them as capacity has since become available."""
+
+    def __init__(
+        self, executor: "BoundedExecutor", func: Callable, elements: list[Any]
+    ):
+        self.executor = executor
+        self.func = func
+        self.queued = list(enumerate(elements))
+        self.parts: list[tuple[list[int], FutureSequence]] = []
+        self.feed()
+
+    def feed(self) -> None:
+        if not self.queued:
+            return
+        caps = self.executor.caps
+        n = min(len(self.queued), self.executor.limiter.available(caps))
+        if n <= 0:
+            return
+        batch, self.queued = self.queued[:n], self.queued[n:]
+        part = self.executor.executor.map(self.func, [e for _, e in batch])
+        self.executor.limiter.acquire(caps, n, lambda: len(part.completed()))
+        self.parts.append(([i for i, _ in batch], part))
+
+    def _wait_until_submitted(self, index: int | None = None) -> None:
+        while self.queued and (index is None or index >= self.queued[0][0]):
+            time.sleep(self.executor.poll_interval)
+            self.feed()
+
+    def done(self) -> bool:
+        self.feed()
+        return not self.queued and all(part.done() for _, part in self.parts)
+
+    def completed(self) -> Sequence[int]:
+        self.feed()
+        return [indices[j] for indices, part in self.parts for j in part.completed()]
+
+    def started(self) -> Sequence[int]:
+        # queued elements have not even been submitted, let alone started
+        self.feed()
+        return [indices[j] for indices, part in self.parts for j in part.started()]
+
+    def cancel(self) -> None:
+        self.queued = []
+        for _, part in self.parts:
+            part.cancel()
+
+    def gather_at(self, index: int, *args, **kwargs) -> R:
+        self._wait_until_submitted(index)
+        for indices, part in self.parts:
+            if index in indices:
+                return part.gather_at(indices.index(index), *args, **kwargs)
+        raise IndexError(index)
+
+    def gather(self, *args, **kwargs) -> Sequence[R]:
+        self._wait_until_submitted()
+        results: dict[int, R] = {}
+        for indices, part in self.parts:
+            results.update(zip(indices, part.gather(*args, **kwargs)))
+        return [results[i] for i in range(len(results))]
+
+
+@dataclass
+class BoundedExecutor(AsyncExecutor):
+    """Wraps an `executor`, such that the invocations it has in flight never exceed the given
+    `limits`. A `call` blocks until capacity is available. A `map` submits as many elements as
+    capacity allows, and queues the rest, to be submitted as earlier invocations complete.
+
+    Tasks bind the executor to their own name and tags as they submit (see
+    `AsyncExecutor.for_task`), and all executors so bound share the counts of the one `limiter`.
+
+    Examples:
+
+    ```python
+    >>> from ecoscope_workflows_core.executors import ThreadPoolAsyncExecutor
+    >>> limits = ConcurrencyLimits(max_in_flight=2)
+    >>> executor = BoundedExecutor(ThreadPoolAsyncExecutor(), limits)
+    >>> futures = executor.map(lambda a: a * 2, [{"a": i} for i in range(5)])
+    >>> len(futures.queued) <= 3
+    True
+    >>> futures.gather()
+    [0, 2, 4, 6, 8]
+
+    ```
+    """
+
+    executor: AsyncExecutor
+    limits: ConcurrencyLimits
+    poll_interval: float = 0.05
+    limiter: Limiter = field(init=False)
+    caps: dict[Key, int] = field(init=False)
+
+    def __post_init__(self):
+        self.limiter = Limiter(self.limits)
+        self.caps = self.limits.caps(None, [])
+
+    @classmethod
+    def from_env(cls, executor: AsyncExecutor) -> AsyncExecutor:
+        """Wrap `executor` in the limits configured by the environment, if any, or otherwise
+        return it as is."""
+        limits = ConcurrencyLimits.from_env()
+        return executor if limits is None else cls(executor, limits)
+
+    def for_task(
+        self,
+        name: str | Sequence[str],
+        tags: Sequence[str],
+        resources: TaskResources,
+    ) -> "BoundedExecutor":
+        bound = replace(self, executor=self.executor.for_task(name, tags, resources))
+        bound.limiter = self.limiter
+        bound.caps = self.limits.caps(name, tags)
+        return bound
+
+    def close(self) -> None:
+        self.executor.close()
+
+    def call(
+        self,
+        func: Callable[P, R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[R]:
+        while self.limiter.available(self.caps) < 1:
+            time.sleep(self.poll_interval)
+        future = self.executor.call(func, *args, **kwargs)
+        self.limiter.acquire(self.caps, 1, lambda: int(future.done()))
+        return future
+
+    def map(
+        self,
+        func: Callable[..., R],
+        iterable: Iterable[T],
+    ) -> BoundedFutureSequence[R]:
+        return BoundedFutureSequence(self, func, list(iterable))
@@ -1,6 +1,6 @@
 import functools
 import inspect
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Callable, Iterable, Sequence
 
 try:
@@ -12,23 +12,84 @@ except ImportError:
         "Please install the `lithops` package to use the `LithopsExecutor`."
     )
 
-from .base import AsyncExecutor, Future, FutureSequence, mapvalues_wrapper, P, R, T
+from .base import (
+    AsyncExecutor,
+    Future,
+    FutureSequence,
+    TaskResources,
+    mapvalues_wrapper,
+    P,
+    R,
+    T,
+)
+
+
+def _is_done(future: ResponseFuture) -> bool:
+    # lithops' job monitor marks futures as ready in a background thread once their status is
+    # available, so checking state does not make a request to the storage backend. (futures
+    # only become "success" or "done" once their status or result has been read.)
+    return not (future.new or future.invoked or future.running)
+
+
+def _cancel(fexec: FunctionExecutor | None, futures: Sequence[ResponseFuture]) -> None:
+    # lithops futures cannot be cancelled individually, but the compute backend can stop the
+    # calls of whole jobs. (note that some backends, e.g. localhost, stop all jobs at once.)
+    job_keys = sorted({f.job_key for f in futures if not _is_done(f)})
+    if fexec is not None and job_keys:
+        fexec.compute_handler.clear(job_keys=job_keys)
 
 
 @dataclass(frozen=True)
 class LithopsFuture(Future[R]):
     future: ResponseFuture
+    fexec: FunctionExecutor | None = None
 
     def gather(self, *args, **kwargs) -> R:
         return self.future.result(*args, **kwargs)
 
+    def done(self) -> bool:
+        return _is_done(self.future)
+
+    def cancel(self) -> None:
+        _cancel(self.fexec, [self.future])
+
 
 @dataclass(frozen=True)
 class LithopsFuturesSequence(FutureSequence[R]):
     futures: FuturesList
+    fexec: FunctionExecutor | None = None
 
     def gather(self, *args, **kwargs) -> Sequence[R]:
-        return self.futures.get_result(*args, **kwargs)
+        if self.fexec is not None and (
+            len(self.futures) == 1 or self.fexec.backend == "localhost"
+        ):
+            # results are read future by future, as `FunctionExecutor.get_result` clears the
+            # compute backend once its own job completes, which for localhost drops the queued
+            # calls of any other job submitted in the meantime (e.g. by a pipelined `Graph`).
+            # (`get_result` also unwraps the result of a single future, unless the executor's
+            # last call happened to be a `map`.) temporary data is instead cleaned up by
+            # `LithopsExecutor.close`, or on exit.
+            return [f.result(*args, **kwargs) for f in self.futures]
+        # remote backends clear only the given jobs, so the statuses and results of all the
+        # futures are fetched in one batch, by a pool of threads, rather than one by one
+        if self.fexec is None:
+            return self.futures.get_result(*args, **kwargs)
+        return self.fexec.get_result(self.futures, *args, **kwargs)
+
+    def done(self) -> bool:
+        return all(_is_done(f) for f in self.futures)
+
+    def cancel(self) -> None:
+        _cancel(self.fexec, self.futures)
+
+    def completed(self) -> Sequence[int]:
+        return [i for i, f in enumerate(self.futures) if _is_done(f)]
+
+    def started(self) -> Sequence[int]:
+        return [i for i, f in enumerate(self.futures) if not (f.new or f.invoked)]
+
+    def gather_at(self, index: int, *args, **kwargs) -> R:
+        return self.futures[index].result(*args, **kwargs)
 
 
 def _create_custom_signature(partial_func: functools.partial) -> inspect.Signature:
@@ -63,7 +124,33 @@ def wrap(func) -> Callable[P, R]:
 
 @dataclass
 class LithopsExecutor(AsyncExecutor):
+    """Runs tasks with a Lithops `FunctionExecutor`. Unless `runtime_memory` (in MB) or
+    `timeout` (in seconds) are given, invocations use the defaults of the Lithops config; each
+    task's `TaskResources` hints override these for invocations of that task.
+    """
+
     fexec: FunctionExecutor = field(default_factory=FunctionExecutor)
+    runtime_memory: int | None = None
+    timeout: int | None = None
+
+    def for_task(
+        self,
+        name: str | Sequence[str],
+        tags: Sequence[str],
+        resources: TaskResources,
+    ) -> "LithopsExecutor":
+        if resources.memory is None and resources.timeout is None:
+            return self
+        return replace(
+            self,
+            runtime_memory=resources.memory or self.runtime_memory,
+            timeout=resources.timeout or self.timeout,
+        )
+
+    def close(self) -> None:
+        """Clean up the temporary storage of completed jobs, and stop the job monitor."""
+        self.fexec.clean()
+        self.fexec.__exit__(None, None, None)
 
     def call(
         self,
@@ -75,8 +162,13 @@ class LithopsExecutor(AsyncExecutor):
             raise NotImplementedError(
                 "Only keyword arguments are currently supported by `LithopsExecutor.call`."
             )
-        future = self.fexec.call_async(wrap(func), data=kwargs)
-        return LithopsFuture(future=future)
+        future = self.fexec.call_async(
+            wrap(func),
+            data=kwargs,
+            runtime_memory=self.runtime_memory,
+            timeout=self.timeout,
+        )
+        return LithopsFuture(future=future, fexec=self.fexec)
 
     def map(
         self,
@@ -87,5 +179,10 @@ class LithopsExecutor(AsyncExecutor):
             iterdata = [{"kv": e} for e in iterable]
         else:
             iterdata = iterable  # type: ignore[assignment]
-        futures = self.fexec.map(wrap(func), iterdata)
-        return LithopsFuturesSequence(futures=futures)
+        futures = self.fexec.map(
+            wrap(func),
+            iterdata,
+            runtime_memory=self.runtime_memory,
+            timeout=self.timeout,
+        )
+        return LithopsFuturesSequence(futures=futures, fexec=self.fexec)
@@ -0,0 +1,275 @@
+import concurrent.futures
+import functools
+import multiprocessing
+import pickle
+import weakref
+from dataclasses import dataclass, field, replace
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+try:
+    import cloudpickle  # type: ignore[import-untyped]
+except ImportError:
+    raise ImportError(
+        "Please install the `cloudpickle` package to use the `ProcessPoolAsyncExecutor`."
+    )
+
+from .base import (
+    AsyncExecutor,
+    Future,
+    FutureSequence,
+    TaskResources,
+    mapvalues_wrapper,
+    workers_for,
+    P,
+    R,
+    T,
+)
+
+DEFAULT_MIN_SHARED_BYTES = 1 << 20
+
+
+@dataclass(frozen=True)
+class _SharedBuffer:
+    name: str
+    size: int
+
+
+@dataclass(frozen=True)
+class _Payload:
+    """A pickled object, with its out-of-band buffers (i.e. the memory backing numpy arrays,
+    and therefore the columns of (Geo)DataFrames) either inlined, if they are small, or placed
+    in shared memory. Only the (small) pickle stream and shared memory segment names then
+    travel through the process pool's pipes."""
+
+    data: bytes
+    buffers: list[bytes | _SharedBuffer]
+
+    @property
+    def shared(self) -> tuple[_SharedBuffer, ...]:
+        return tuple(b for b in self.buffers if isinstance(b, _SharedBuffer))
+
+
+def _dump(obj: Any, min_shared_bytes: int) -> _Payload:
+    pickle_buffers: list[pickle.PickleBuffer] = []
+    data = cloudpickle.dumps(obj, protocol=5, buffer_callback=pickle_buffers.append)
+    buffers: list[bytes | _SharedBuffer] = []
+    try:
+        for pb in pickle_buffers:
+            raw = pb.raw()
+            if raw.nbytes == 0 or raw.nbytes < min_shared_bytes:
+                buffers.append(raw.tobytes())
+                continue
+            shm = SharedMemory(create=True, size=raw.nbytes)
+            shm.buf[: raw.nbytes] = raw
+            shm.close()
+            # ownership passes to the receiving process, which unlinks the segment on load
+            # (or, if the payload is never loaded, see `_release_when_done`)
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+            buffers.append(_SharedBuffer(shm.name, raw.nbytes))
+    except BaseException:
+        _release(buffers)
+        raise
+    return _Payload(data, buffers)
+
+
+def _read_shared(buffer: _SharedBuffer) -> bytearray:
+    shm = SharedMemory(name=buffer.name)
+    try:
+        # copied out of the segment, so that it can be unlinked immediately, rather than
+        # when the last array referencing it is garbage collected
+        return bytearray(shm.buf[: buffer.size])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _load(payload: _Payload) -> Any:
+    buffers = [
+        _read_shared(b) if isinstance(b, _SharedBuffer) else bytearray(b)
+        for b in payload.buffers
+    ]
+    return pickle.loads(payload.data, buffers=buffers)
+
+
+def _release(buffers: Iterable[bytes | _SharedBuffer]) -> None:
+    # unlink the shared memory segments of a payload which will not be loaded (or which may
+    # already have been, in which case its segments are already gone)
+    for b in buffers:
+        if not isinstance(b, _SharedBuffer):
+            continue
+        try:
+            shm = SharedMemory(name=b.name)
+        except FileNotFoundError:
+            continue
+        shm.close()
+        shm.unlink()
+
+
+def _release_when_done(
+    future: concurrent.futures.Future,
+    arguments: Sequence[_SharedBuffer],
+    gathered: dict,
+) -> None:
+    """Once `future` is done, release the segments of its `arguments` (if the call never ran,
+    or failed before loading them), and of its result (unless it was gathered).
+    Otherwise, a result which is never gathered (e.g. that of a cancelled call, or of the
+    other elements of a map which failed) would be held in shared memory until reboot."""
+
+    def release(f: concurrent.futures.Future) -> None:
+        _release(arguments)
+        if f.cancelled() or f.exception() is not None or "result" in gathered:
+            return
+        _release(f.result().buffers)
+
+    future.add_done_callback(release)
+
+
+def _run(payload: _Payload, min_shared_bytes: int) -> _Payload:
+    func, args, kwargs = _load(payload)
+    return _dump(func(*args, **kwargs), min_shared_bytes)
+
+
+@dataclass(frozen=True)
+class ProcessPoolFuture(Future[R]):
+    future: concurrent.futures.Future
+    # the shared memory segments of the call's arguments
+    arguments: Sequence[_SharedBuffer] = field(default=(), repr=False, compare=False)
+    _gathered: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _finalizer: weakref.finalize = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # the segments of a result which is never gathered are released once this future is
+        # cancelled, or garbage collected
+        finalizer = weakref.finalize(
+            self, _release_when_done, self.future, self.arguments, self._gathered
+        )
+        object.__setattr__(self, "_finalizer", finalizer)
+
+    def gather(self, *args, **kwargs) -> R:
+        # shared memory segments are unlinked when loaded, so the result is only loaded once
+        if "result" not in self._gathered:
+            self._gathered["result"] = _load(self.future.result(*args, **kwargs))
+        return self._gathered["result"]
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def cancel(self) -> None:
+        # worker processes are not interrupted, so only calls not yet started are cancelled
+        self.future.cancel()
+        self._finalizer()
+
+
+@dataclass(frozen=True)
+class ProcessPoolFuturesSequence(FutureSequence[R]):
+    futures: Sequence[ProcessPoolFuture[R]]
+
+    def gather(self, *args, **kwargs) -> Sequence[R]:
+        return [f.gather(*args, **kwargs) for f in self.futures]
+
+    def done(self) -> bool:
+        return all(f.done() for f in self.futures)
+
+    def cancel(self) -> None:
+        for f in self.futures:
+            f.cancel()
+
+    def completed(self) -> Sequence[int]:
+        return [i for i, f in enumerate(self.futures) if f.done()]
+
+    def started(self) -> Sequence[int]:
+        return [
+            i
+            for i, f in enumerate(self.futures)
+            if f.future.running() or f.future.done()
+        ]
+
+    def gather_at(self, index: int, *args, **kwargs) -> R:
+        return self.futures[index].gather(*args, **kwargs)
+
+    def as_completed(self, poll_interval: float = 0.05) -> Iterator[tuple[int, R]]:
+        indices = {f.future: i for i, f in enumerate(self.futures)}
+        for f in concurrent.futures.as_completed(indices):
+            yield indices[f], self.futures[indices[f]].gather()
+
+
+@functools.cache
+def _shared_pool(
+    max_workers: int | None = None,
+) -> concurrent.futures.ProcessPoolExecutor:
+    # spawn rather than fork, as the parent process is typically running other threads
+    # (e.g. thread pool workers, or lithops job monitors), which fork does not play well with
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+@dataclass
+class ProcessPoolAsyncExecutor(AsyncExecutor):
+    """Runs tasks in a pool of worker processes on the current machine, for CPU-bound tasks
+    which do not release the GIL. Task functions are serialized with `cloudpickle`, and their
+    arguments and results are pickled with protocol 5, with each out-of-band buffer of at
+    least `min_shared_bytes` passed between processes through shared memory. Large
+    (Geo)DataFrames are therefore not streamed through the pool's pipes.
+
+    Unless a `pool` is given, all instances share a single process-wide pool. Tasks with CPU or
+    memory hints (see `TaskResources`) are instead run in a shared pool with only as many
+    workers as fit on this machine.
+
+    Examples:
+
+    ```python
+    >>> import operator
+    >>> executor = ProcessPoolAsyncExecutor()
+    >>> executor.call(operator.add, 1, 2).gather()
+    3
+
+    ```
+    """
+
+    pool: concurrent.futures.ProcessPoolExecutor = field(default_factory=_shared_pool)
+    min_shared_bytes: int = DEFAULT_MIN_SHARED_BYTES
+
+    def for_task(
+        self,
+        name: str | Sequence[str],
+        tags: Sequence[str],
+        resources: TaskResources,
+    ) -> "ProcessPoolAsyncExecutor":
+        workers = workers_for(resources)
+        return self if workers is None else replace(self, pool=_shared_pool(workers))
+
+    def _submit(
+        self,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> ProcessPoolFuture:
+        payload = _dump((func, args, kwargs), self.min_shared_bytes)
+        return ProcessPoolFuture(
+            future=self.pool.submit(_run, payload, self.min_shared_bytes),
+            arguments=payload.shared,
+        )
+
+    def call(
+        self,
+        func: Callable[P, R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> ProcessPoolFuture[R]:
+        return self._submit(func, args, kwargs)
+
+    def map(
+        self,
+        func: Callable[..., R],
+        iterable: Iterable[T],
+    ) -> ProcessPoolFuturesSequence[R]:
+        # as for lithops, each element is a dict of keyword arguments, except for
+        # `mapvalues`, where each element is a `(key, kwargs)` tuple for the wrapper
+        if isinstance(func, mapvalues_wrapper):
+            futures = [self._submit(func, (e,), {}) for e in iterable]
+        else:
+            futures = [self._submit(func, (), e) for e in iterable]  # type: ignore[arg-type]
+        return ProcessPoolFuturesSequence(futures=futures)
@@ -1,12 +1,92 @@
-from typing import Callable, Iterable, Sequence
+import concurrent.futures
+import functools
+import multiprocessing
+from typing import Callable, Iterable, Literal, Sequence
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .base import SyncExecutor, P, R
 
+PoolKind = Literal["threads", "processes"]
+
+
+class PythonExecutorSettings(BaseSettings):
+    """Configures the worker pool of `PythonExecutor.from_env`, e.g.
+    `ECOSCOPE_WORKFLOWS_PYTHON_EXECUTOR_POOL=threads`. `map` is serial if `pool` is unset."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ecoscope_workflows_python_executor_",
+        case_sensitive=False,
+    )
+
+    pool: PoolKind | None = None
+    max_workers: int | None = None
+
+
+@functools.cache
+def _pool(kind: PoolKind, max_workers: int | None) -> concurrent.futures.Executor:
+    # pools are shared by all executors of the same kind and size, and live for the process
+    match kind:
+        case "threads":
+            return concurrent.futures.ThreadPoolExecutor(
+                max_workers, thread_name_prefix="ecoscope-workflows"
+            )
+        case "processes":
+            return concurrent.futures.ProcessPoolExecutor(
+                max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
 
 class PythonExecutor(SyncExecutor):
+    """Runs tasks in the current process. By default, `map` (and therefore `SyncTask.map`
+    and `SyncTask.mapvalues`) calls the function on each element in turn. If a `pool` is
+    given, elements are instead mapped concurrently over a pool of (at most `max_workers`)
+    threads or processes. Either way, results are returned in the order of the elements.
+
+    For a process pool, functions are serialized with `cloudpickle`, and (Geo)DataFrames are
+    passed through shared memory, as for the `ProcessPoolAsyncExecutor`.
+
+    Examples:
+
+    ```python
+    >>> PythonExecutor().map(lambda x: x * 2, [1, 2, 3])
+    [2, 4, 6]
+    >>> PythonExecutor(pool="threads", max_workers=2).map(lambda x: x * 2, [1, 2, 3])
+    [2, 4, 6]
+
+    ```
+    """
+
+    def __init__(self, pool: PoolKind | None = None, max_workers: int | None = None):
+        self.pool = pool
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_env(cls) -> "PythonExecutor":
+        settings = PythonExecutorSettings()
+        return cls(pool=settings.pool, max_workers=settings.max_workers)
+
     def call(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
         return func(*args, **kwargs)
 
     def map(self, func: Callable[..., R], iterable: Iterable[R]) -> Sequence[R]:
-        mapper = map(func, iterable)
-        return list(mapper)
+        if self.pool is None:
+            mapper = map(func, iterable)
+            return list(mapper)
+        pool = _pool(self.pool, self.max_workers)
+        if self.pool == "threads":
+            return list(pool.map(func, iterable))
+
+        from .processes import DEFAULT_MIN_SHARED_BYTES, ProcessPoolFuture, _dump, _run
+
+        futures = []
+        for e in iterable:
+            payload = _dump((func, (e,), {}), DEFAULT_MIN_SHARED_BYTES)
+            future = pool.submit(_run, payload, DEFAULT_MIN_SHARED_BYTES)
+            futures.append(ProcessPoolFuture(future=future, arguments=payload.shared))
+        try:
+            return [f.gather() for f in futures]
+        finally:
+            # if any element failed, the results of the others are not gathered
+            for f in futures:
+                f.cancel()
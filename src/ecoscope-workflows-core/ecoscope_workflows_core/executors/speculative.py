@@ -0,0 +1,191 @@
+import logging
+import statistics
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Iterable, Sequence
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from .base import AsyncExecutor, Future, FutureSequence, TaskResources, P, R, T
+
+logger = logging.getLogger(__name__)
+
+
+class SpeculationSettings(BaseSettings):
+    """Configures `SpeculativeExecutor.from_env`. Speculation is enabled by setting
+    `ECOSCOPE_WORKFLOWS_SPECULATION_ENABLED=true`."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ecoscope_workflows_speculation_",
+        case_sensitive=False,
+    )
+
+    enabled: bool = False
+    quantile: float = Field(default=0.75, gt=0, le=1)
+    multiple: float = Field(default=2.0, gt=1)
+
+
+class SpeculativeFutureSequence(FutureSequence[R]):
+    """The future for a `map` whose stragglers are resubmitted. Once at least `quantile` of
+    the elements have completed, each element which has been running for more than `multiple`
+    times the median duration of the completed elements is submitted a second time. The result
+    of whichever copy completes first is used. The losing copy is cancelled if it is a backup.
+    Elements of the original `map` cannot be cancelled individually, so a losing original is
+    instead gathered (and discarded) by the first poll which finds it completed, releasing
+    whatever holds its result; any still running once this future is no longer polled are
+    left to the wrapped executor to release, as for any other ungathered result.
+
+    Elements are timed from when they start running (see `FutureSequence.started`), rather
+    than from submission, so that elements still queued behind others (e.g. by a wrapped
+    `BoundedExecutor`) are neither counted as stragglers nor resubmitted. As starts and
+    completions are only observed by polls (via `done`, `completed`, or `gather`), each
+    element is taken to have started at the last poll which found it not yet started.
+    """
+
+    def __init__(
+        self, executor: "SpeculativeExecutor", func: Callable, elements: list[Any]
+    ):
+        self.executor = executor
+        self.func = func
+        self.elements = elements
+        self.primary = executor.executor.map(func, elements)
+        self.polled = time.monotonic()
+        self.starts: dict[int, float] = {}
+        self.backups: dict[int, FutureSequence] = {}
+        # the duration of each completed element, and the copy which completed first
+        self.durations: dict[int, float] = {}
+        self.winners: dict[int, FutureSequence] = {}
+        # elements of the primary which lost to their backup, but have yet to complete
+        self.losers: set[int] = set()
+
+    def _collect(self, completed: Sequence[int]) -> None:
+        for i in self.losers.intersection(completed):
+            self.losers.discard(i)
+            try:
+                self.primary.gather_at(i)
+            except Exception:
+                pass
+
+    def _poll(self) -> None:
+        now = time.monotonic()
+        completed = self.primary.completed()
+        for i in self.primary.started():
+            self.starts.setdefault(i, self.polled)
+        self.polled = now
+        self._collect(completed)
+        done = [(i, self.primary) for i in completed] + [
+            (i, backup) for i, backup in self.backups.items() if backup.completed()
+        ]
+        for i, copy in done:
+            if i in self.winners:
+                continue
+            self.winners[i] = copy
+            self.durations[i] = now - self.starts.get(i, now)
+            if copy is self.primary and i in self.backups:
+                self.backups.pop(i).cancel()
+            elif copy is not self.primary:
+                self.losers.add(i)
+        n = len(self.elements)
+        if len(self.winners) == n or len(self.winners) < self.executor.quantile * n:
+            return
+        threshold = self.executor.multiple * statistics.median(self.durations.values())
+        for i, started in self.starts.items():
+            if i in self.winners or i in self.backups or now - started <= threshold:
+                continue
+            logger.info(f"Resubmitting straggler element {i} of {n}")
+            self.backups[i] = self.executor.executor.map(self.func, [self.elements[i]])
+
+    def _index_in(self, copy: FutureSequence, index: int) -> int:
+        return index if copy is self.primary else 0
+
+    def done(self) -> bool:
+        self._poll()
+        return len(self.winners) == len(self.elements)
+
+    def completed(self) -> Sequence[int]:
+        self._poll()
+        return sorted(self.winners)
+
+    def cancel(self) -> None:
+        self.primary.cancel()
+        for backup in self.backups.values():
+            backup.cancel()
+        self.losers.clear()
+
+    def gather_at(self, index: int, *args, **kwargs) -> R:
+        while index not in self.winners:
+            time.sleep(self.executor.poll_interval)
+            self._poll()
+        winner = self.winners[index]
+        return winner.gather_at(self._index_in(winner, index), *args, **kwargs)
+
+    def gather(self, *args, **kwargs) -> Sequence[R]:
+        return [self.gather_at(i, *args, **kwargs) for i in range(len(self.elements))]
+
+
+@dataclass
+class SpeculativeExecutor(AsyncExecutor):
+    """Wraps an `executor`, such that straggling elements of each `map` are speculatively
+    re-executed (see `SpeculativeFutureSequence`). As an element may run more than once, only
+    tasks hinted to be free of side effects (with `TaskResources(pure=True)`) are speculated,
+    and never those tagged `io` (see `registry.TaskTag`). All other tasks are mapped by the
+    wrapped executor as usual, as are all `call`s.
+
+    Examples:
+
+    ```python
+    >>> from ecoscope_workflows_core.executors import ThreadPoolAsyncExecutor
+    >>> executor = SpeculativeExecutor(ThreadPoolAsyncExecutor(), quantile=0.5)
+    >>> executor.map(lambda a: a * 2, [{"a": 1}, {"a": 2}]).gather()
+    [2, 4]
+
+    ```
+    """
+
+    executor: AsyncExecutor
+    quantile: float = 0.75
+    multiple: float = 2.0
+    poll_interval: float = 0.05
+    speculate: bool = True
+
+    @classmethod
+    def from_env(cls, executor: AsyncExecutor) -> AsyncExecutor:
+        """Wrap `executor` for speculation if it is enabled by the environment, or otherwise
+        return it as is."""
+        settings = SpeculationSettings()
+        if not settings.enabled:
+            return executor
+        return cls(executor, quantile=settings.quantile, multiple=settings.multiple)
+
+    def for_task(
+        self,
+        name: str | Sequence[str],
+        tags: Sequence[str],
+        resources: TaskResources,
+    ) -> "SpeculativeExecutor":
+        return replace(
+            self,
+            executor=self.executor.for_task(name, tags, resources),
+            speculate=self.speculate and resources.pure and "io" not in tags,
+        )
+
+    def close(self) -> None:
+        self.executor.close()
+
+    def call(
+        self,
+        func: Callable[P, R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[R]:
+        return self.executor.call(func, *args, **kwargs)
+
+    def map(
+        self,
+        func: Callable[..., R],
+        iterable: Iterable[T],
+    ) -> FutureSequence[R]:
+        if not self.speculate:
+            return self.executor.map(func, iterable)
+        return SpeculativeFutureSequence(self, func, list(iterable))
@@ -0,0 +1,125 @@
+import concurrent.futures
+import functools
+from dataclasses import dataclass, field, replace
+from typing import Callable, Iterable, Iterator, Sequence
+
+from .base import (
+    AsyncExecutor,
+    Future,
+    FutureSequence,
+    TaskResources,
+    mapvalues_wrapper,
+    workers_for,
+    P,
+    R,
+    T,
+)
+
+
+@dataclass(frozen=True)
+class ThreadPoolFuture(Future[R]):
+    future: concurrent.futures.Future
+
+    def gather(self, *args, **kwargs) -> R:
+        return self.future.result(*args, **kwargs)
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def cancel(self) -> None:
+        # threads cannot be interrupted, so only calls which have not yet started are cancelled
+        self.future.cancel()
+
+
+@dataclass(frozen=True)
+class ThreadPoolFuturesSequence(FutureSequence[R]):
+    futures: Sequence[concurrent.futures.Future]
+
+    def gather(self, *args, **kwargs) -> Sequence[R]:
+        return [f.result(*args, **kwargs) for f in self.futures]
+
+    def done(self) -> bool:
+        return all(f.done() for f in self.futures)
+
+    def cancel(self) -> None:
+        for f in self.futures:
+            f.cancel()
+
+    def completed(self) -> Sequence[int]:
+        return [i for i, f in enumerate(self.futures) if f.done()]
+
+    def started(self) -> Sequence[int]:
+        return [i for i, f in enumerate(self.futures) if f.running() or f.done()]
+
+    def gather_at(self, index: int, *args, **kwargs) -> R:
+        return self.futures[index].result(*args, **kwargs)
+
+    def as_completed(self, poll_interval: float = 0.05) -> Iterator[tuple[int, R]]:
+        indices = {f: i for i, f in enumerate(self.futures)}
+        for f in concurrent.futures.as_completed(self.futures):
+            yield indices[f], f.result()
+
+
+@functools.cache
+def _shared_pool(
+    max_workers: int | None = None,
+) -> concurrent.futures.ThreadPoolExecutor:
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers, thread_name_prefix="ecoscope-workflows"
+    )
+
+
+@dataclass
+class ThreadPoolAsyncExecutor(AsyncExecutor):
+    """Runs tasks concurrently in a pool of threads in the current process. This suits tasks
+    which spend most of their time waiting on network I/O, or in code which releases the GIL
+    (e.g. shapely and numpy), without the serialization and storage overhead of Lithops.
+
+    Unless a `pool` is given, all instances share a single process-wide pool, so that setting
+    this executor on each task of a workflow does not create one pool per task. Tasks with CPU
+    or memory hints (see `TaskResources`) are instead run in a shared pool with only as many
+    workers as fit on this machine.
+
+    Examples:
+
+    ```python
+    >>> executor = ThreadPoolAsyncExecutor()
+    >>> executor.call(lambda a, b: a + b, a=1, b=2).gather()
+    3
+    >>> executor.map(lambda a: a * 2, [{"a": 1}, {"a": 2}]).gather()
+    [2, 4]
+
+    ```
+    """
+
+    pool: concurrent.futures.ThreadPoolExecutor = field(default_factory=_shared_pool)
+
+    def for_task(
+        self,
+        name: str | Sequence[str],
+        tags: Sequence[str],
+        resources: TaskResources,
+    ) -> "ThreadPoolAsyncExecutor":
+        workers = workers_for(resources)
+        return self if workers is None else replace(self, pool=_shared_pool(workers))
+
+    def call(
+        self,
+        func: Callable[P, R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> ThreadPoolFuture[R]:
+        return ThreadPoolFuture(future=self.pool.submit(func, *args, **kwargs))
+
+    def map(
+        self,
+        func: Callable[..., R],
+        iterable: Iterable[T],
+    ) -> ThreadPoolFuturesSequence[R]:
+        # as for lithops, each element is a dict of keyword arguments, except for
+        # `mapvalues`, where each element is a `(key, kwargs)` tuple for the wrapper
+        if isinstance(func, mapvalues_wrapper):
+            futures = [self.pool.submit(func, e) for e in iterable]
+        else:
+            futures = [self.pool.submit(func, **e) for e in iterable]  # type: ignore[arg-type]
+        return ThreadPoolFuturesSequence(futures=futures)
@@ -1,7 +1,92 @@
 import functools
+import hashlib
 import subprocess
-import sys
-from typing import Callable
+import tempfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable, Iterator, Sequence
+
+# formatted sources, by hash of the ruff version and the unformatted source
+_formatted_cache: dict[str, str] = {}
+
+
+@functools.cache
+def _ruff_bin() -> str:
+    from ruff.__main__ import find_ruff_bin
+
+    return str(find_ruff_bin())
+
+
+@functools.cache
+def _ruff_version() -> str:
+    return subprocess.check_output([_ruff_bin(), "--version"], encoding="utf-8")
+
+
+def _cache_key(source: str) -> str:
+    return hashlib.sha256(f"{_ruff_version()}\0{source}".encode()).hexdigest()
+
+
+def ruff_format_all(sources: Sequence[str]) -> list[str]:
+    """Format, and then lint (with fixes), each of the `sources` with ruff, returning the
+    results in the same order. All sources which are not already cached (by content hash)
+    are written to a temporary tree, and formatted and linted by a single run each of
+    `ruff format` and `ruff check --fix`, rather than by a pair of runs per source.
+
+    Examples:
+
+    ```python
+    >>> ruff_format_all(["x=1", "y = {'a':1}"])
+    ['x = 1\\n', 'y = {"a": 1}\\n']
+
+    ```
+    """
+    keys = [_cache_key(source) for source in sources]
+    pending = {k: s for k, s in zip(keys, sources) if k not in _formatted_cache}
+    if pending:
+        with tempfile.TemporaryDirectory() as tmp:
+            # files are named by index, as ruff's rules may depend on file names (e.g. for
+            # `__init__.py`), which the sources' eventual names should not affect
+            paths = {k: Path(tmp) / f"{i}.py" for i, k in enumerate(pending)}
+            for k, path in paths.items():
+                path.write_text(pending[k])
+            # `--isolated`, so that the output does not depend on any ruff configuration
+            # which happens to be found around the temporary tree
+            ruff = [_ruff_bin()]
+            subprocess.check_output(ruff + ["format", "--isolated", "-q", tmp])
+            subprocess.check_output(
+                ruff + ["check", "--isolated", "--fix", "--exit-zero", "-q", tmp]
+            )
+            for k, path in paths.items():
+                _formatted_cache[k] = path.read_text()
+    return [_formatted_cache[k] for k in keys]
+
+
+class DeferredFormatting:
+    """The outputs of `ruff_formatted` functions collected while formatting is deferred."""
+
+    def __init__(self):
+        self.sources: list[str] = []
+
+    def format(self) -> dict[str, str]:
+        """Format all of the collected outputs at once, returning a mapping of each
+        unformatted output to its formatted equivalent."""
+        return dict(zip(self.sources, ruff_format_all(self.sources)))
+
+
+_deferred: ContextVar[DeferredFormatting | None] = ContextVar("_deferred", default=None)
+
+
+@contextmanager
+def deferred_formatting() -> Iterator[DeferredFormatting]:
+    """Within this context, functions decorated with `ruff_formatted` return their output
+    unformatted, and collect it to be formatted together, by `DeferredFormatting.format`."""
+    deferred = DeferredFormatting()
+    token = _deferred.set(deferred)
+    try:
+        yield deferred
+    finally:
+        _deferred.reset(token)
 
 
 def ruff_formatted(returns_str_func: Callable[..., str]) -> Callable:
@@ -10,17 +95,11 @@ def ruff_formatted(returns_str_func: Callable[..., str]) -> Callable:
     @functools.wraps(returns_str_func)
     def wrapper(*args, **kwargs):
         unformatted = returns_str_func(*args, **kwargs)
-        # https://github.com/astral-sh/ruff/issues/8401#issuecomment-1788806462
-        formatted = subprocess.check_output(
-            [sys.executable, "-m", "ruff", "format", "-s", "-"],
-            input=unformatted,
-            encoding="utf-8",
-        )
-        linted = subprocess.check_output(
-            [sys.executable, "-m", "ruff", "check", "--fix", "--exit-zero", "-s", "-"],
-            input=formatted,
-            encoding="utf-8",
-        )
-        return linted
+        deferred = _deferred.get()
+        if deferred is not None:
+            deferred.sources.append(unformatted)
+            return unformatted
+        [formatted] = ruff_format_all([unformatted])
+        return formatted
 
     return wrapper
@@ -1,10 +1,32 @@
+import inspect
 import logging
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, replace
 from graphlib import TopologicalSorter
-from typing import Any, Literal, Sequence
+from typing import Any, Callable, Literal, Sequence
 
+from pydantic import PositiveFloat
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ecoscope_workflows_core.cache import (
+    ResultCache,
+    hash_key,
+    partial_keywords,
+    task_reference,
+)
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.dataplane import ByReference, DataPlane, resolve
 from ecoscope_workflows_core.decorators import AsyncTask
-from ecoscope_workflows_core.executors import Future, FutureSequence
+from ecoscope_workflows_core.executors import (
+    AsyncExecutor,
+    Future,
+    FutureSequence,
+    PythonExecutor,
+    TaskResources,
+)
+from ecoscope_workflows_core.placement import CostPlacement
+from ecoscope_workflows_core.priority import CriticalPathPriority
+from ecoscope_workflows_core.retry import RetryPolicy, submit_with_retries
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +49,173 @@ class Node:
     partial: dict[str, Any | Dependency] = field(default_factory=dict)
     method: Literal["call", "map", "mapvalues"] = "call"
     kwargs: dict[str, Any | Dependency] = field(default_factory=dict)
+    # if None, the default policy for the node's task (see `RetryPolicy.for_task`)
+    retry: RetryPolicy | None = None
+
+
+@dataclass(frozen=True)
+class _Resolved(Future):
+    """A future for a node result which is already available, e.g. from a cache."""
+
+    value: Any
+
+    def gather(self, *args, **kwargs) -> Any:
+        return self.value
+
+
+@dataclass(frozen=True)
+class _Inline(Future):
+    """A future for a node result which was computed inline on the driver."""
+
+    value: Any
+
+    def gather(self, *args, **kwargs) -> Any:
+        return self.value
+
+
+@dataclass(frozen=True)
+class _Link:
+    func: Callable
+    static: dict[str, Any]
+    argname: str
+    tags: list[str] = field(default_factory=list)
+
+
+class FusedChain:
+    """A composite of a linear chain of task functions, such that the whole chain is run by a
+    single executor invocation. The `head` function is called with the arguments passed to the
+    chain, and each subsequent function is called with its own static arguments, plus the result
+    of the previous function as its `argname` argument. The chain takes on the signature of its
+    `head`, so that executors (and `mapvalues`) see the same parameters as for the head alone.
+    The `names` and `tags` of the tasks in the chain are exposed, so that executors can apply
+    the limits of each of them (see `executors.BoundedExecutor`).
+    """
+
+    def __init__(
+        self, head: Callable, links: list[_Link], head_tags: Sequence[str] = ()
+    ):
+        self.head = head
+        self.links = links
+        self.head_tags = list(head_tags)
+        self.__signature__ = inspect.signature(head)
+        refs = [task_reference(f) for f in [head] + [link.func for link in links]]
+        # the static arguments of the links are not visible to `cache.partial_keywords`,
+        # so they are hashed into the qualname, to distinguish otherwise identical chains
+        statics = hash_key([link.static for link in links])[:16]
+        self.__qualname__ = f"FusedChain({' -> '.join(refs)})[{statics}]"
+
+    def __call__(self, **kwargs):
+        result = self.head(**kwargs)
+        for link in self.links:
+            result = link.func(**link.static, **{link.argname: result})
+        return result
+
+    @property
+    def names(self) -> list[str]:
+        """The function name of each task in the chain, in order."""
+        funcs = [self.head] + [link.func for link in self.links]
+        return [task_reference(f).rsplit(".", 1)[-1] for f in funcs]
+
+    @property
+    def tags(self) -> list[str]:
+        """The tags of every task in the chain."""
+        tags = list(self.head_tags)
+        for link in self.links:
+            tags += [t for t in link.tags if t not in tags]
+        return tags
+
+
+def _fused_resources(head: TaskResources, link: TaskResources) -> TaskResources:
+    """The resource hints of a fused chain, which runs both the `head` and the `link` in the
+    same invocation: the larger of their memory, CPU, timeout, and backoff hints, and the fewer
+    of their retries. The chain is only `cheap` or `pure` if both of them are.
+
+    Examples:
+
+    ```python
+    >>> _fused_resources(
+    ...     TaskResources(memory=512, cheap=True, pure=True),
+    ...     TaskResources(timeout=60, retries=1, pure=True),
+    ... )
+    TaskResources(memory=512, cpus=None, timeout=60, retries=1, backoff=None, cheap=False, pure=True)
+
+    ```
+    """
+
+    def merged(a: Any, b: Any, choose: Callable) -> Any:
+        return a if b is None else b if a is None else choose(a, b)
+
+    return TaskResources(
+        memory=merged(head.memory, link.memory, max),
+        cpus=merged(head.cpus, link.cpus, max),
+        timeout=merged(head.timeout, link.timeout, max),
+        retries=merged(head.retries, link.retries, min),
+        backoff=merged(head.backoff, link.backoff, max),
+        cheap=head.cheap and link.cheap,
+        pure=head.pure and link.pure,
+    )
+
+
+class _Pipelined(FutureSequence):
+    """The future for a `"map"` or `"mapvalues"` node which is fed by the elements of its
+    upstream `source` node as they complete, rather than once all of them have. Each call to
+    `feed` passes the newly completed elements of the source to `submit`, which submits the node
+    over those elements alone. The results of all such submissions are reassembled in the
+    order of the source's elements.
+    """
+
+    def __init__(
+        self,
+        source: FutureSequence,
+        submit: Callable[[list[Any]], FutureSequence],
+    ):
+        self.source = source
+        self.submit = submit
+        self.parts: list[tuple[list[int], FutureSequence]] = []
+        self.fed: set[int] = set()
+        self.size: int | None = None
+
+    def feed(self) -> None:
+        """Submit the elements of the source which have completed since the last feed,
+        without blocking."""
+        if self.size is not None:
+            return
+        finished = self.source.done()
+        indices = sorted(i for i in self.source.completed() if i not in self.fed)
+        if indices:
+            elements = [self.source.gather_at(i) for i in indices]
+            self.parts.append((indices, self.submit(elements)))
+            self.fed.update(indices)
+        if finished:
+            self.size = len(self.fed)
+
+    def done(self) -> bool:
+        self.feed()
+        return self.size is not None and all(part.done() for _, part in self.parts)
+
+    def completed(self) -> Sequence[int]:
+        self.feed()
+        return [indices[j] for indices, part in self.parts for j in part.completed()]
+
+    def cancel(self) -> None:
+        # the source is cancelled in its own right, if it is still outstanding
+        self.size = len(self.fed)
+        for _, part in self.parts:
+            part.cancel()
+
+    def gather_at(self, index: int, *args, **kwargs) -> Any:
+        for indices, part in self.parts:
+            if index in indices:
+                return part.gather_at(indices.index(index), *args, **kwargs)
+        raise IndexError(f"Element {index} has not been submitted")
+
+    def gather(self, *args, **kwargs) -> Sequence[Any]:
+        self.source.gather()
+        self.feed()
+        results: dict[int, Any] = {}
+        for indices, part in self.parts:
+            results.update(zip(indices, part.gather(*args, **kwargs)))
+        return [results[i] for i in range(len(results))]
 
 
 Dependencies = dict[str, list[str]]  # TODO: `set` instead of `list`
@@ -67,42 +256,618 @@ def gather_dependencies(
     return gathered_dict, global_gathered_dict
 
 
+Scheduler = Literal["waves", "as-completed"]
+
+
+class RunSettings(BaseSettings):
+    """Configures run-level limits from the environment, e.g.
+    `ECOSCOPE_WORKFLOWS_RUN_DEADLINE=1800` for a `Graph.deadline` of 30 minutes."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ecoscope_workflows_run_",
+        case_sensitive=False,
+    )
+
+    deadline: PositiveFloat | None = None
+
+
 @dataclass
 class Graph:
+    """A DAG of `Node`s, keyed by name, with `dependencies` mapping each node name to the
+    names of the nodes whose results it requires.
+
+    The `scheduler` determines how the graph reacts to node completions:
+
+    - `"waves"`: all currently-ready nodes are submitted, and then all of them are gathered
+      before the next set of ready nodes is computed. One slow node therefore holds up every
+      other node submitted in the same wave.
+    - `"as-completed"`: outstanding futures are polled every `poll_interval` seconds, and each
+      node is marked as done the moment its own future resolves. Downstream nodes are
+      submitted as soon as all of their own inputs are available, so the wall-clock time of
+      a run approaches the duration of its critical path.
+
+    If a `cache` is given, each node is first looked up by its content-addressed cache key (see
+    `ecoscope_workflows_core.cache`), and is only submitted on a cache miss. Similarly, if an
+    enabled `checkpoint` is given, the result of each completed node is checkpointed under the
+    checkpoint's run ID, and nodes already checkpointed by a prior attempt of the same run are
+    restored rather than re-submitted. Once the run completes, its checkpoint is discarded,
+    unless the checkpoint is to `keep_completed` runs.
+
+    Ready nodes are submitted in order of name, unless a `priority` is given, in which case
+    they are submitted in descending order of their longest downstream path (see
+    `ecoscope_workflows_core.priority`). This matters when the executor's concurrency is
+    limited, as nodes on the critical path then start before nodes with slack. The duration of
+    each executed node is recorded on the `priority`, so that subsequent runs are ranked by
+    historical durations.
+
+    If `fuse_chains` is True, linear chains of nodes, in which each node is the sole consumer of
+    its sole upstream node, are collapsed into one node per chain before execution (see
+    `Graph.fused`), so that each chain costs one executor invocation rather than one per node.
+
+    If an `executor` is given, it serves as a session executor for the run: every node is
+    submitted to it, in place of the executor of the node's own task, and it is closed when the
+    run ends, whether or not the run succeeds. This avoids the fixed cost of configuring (e.g.)
+    a Lithops `FunctionExecutor` per node, and cleans up the session's temporary storage.
+    (Note that tasks' own executors are still created when they are assigned, so tasks
+    should be assigned the session executor itself, rather than the name of an executor.)
+
+    If a `dataplane` is given, large (Geo)DataFrame results are written to it by the workers
+    which produce them, and are passed downstream by reference (see
+    `ecoscope_workflows_core.dataplane`), rather than through the driver. The results written
+    to the data plane are deleted when the run ends. Results persisted by the `cache` or
+    `checkpoint` first have their frames copied to data plane storage owned by the cache entry
+    (deleted when the entry is evicted) or the checkpoint (deleted when the checkpoint of the
+    completed run is discarded).
+
+    If `pipeline` is True (with the `"as-completed"` scheduler only), a `"map"` or
+    `"mapvalues"` node whose sole input is the result of another `"map"` or `"mapvalues"` node
+    is submitted element by element, as each element of its upstream result completes (see
+    `FutureSequence.as_completed`). Per-element work downstream (e.g. persisting each grouped
+    map) then starts while other elements upstream are still running, rather than waiting on a
+    barrier at the end of every mapped stage.
+
+    If a `placement` is given, nodes which it expects to be cheap are run inline on the driver
+    (with a `PythonExecutor`), rather than paying the invocation latency of the executor, and
+    the durations of inline runs are recorded on the `placement` (see
+    `ecoscope_workflows_core.placement`).
+
+    Failed nodes are retried per the `retry` policy of each `Node`, which by default is
+    derived from the tags and resource hints of the node's task (see
+    `ecoscope_workflows_core.retry`). For `"map"` and `"mapvalues"` nodes, only the failed
+    elements are retried. A node which fails when run inline is retried on the executor.
+
+    If any node fails (after its retries, if any), all outstanding work is cancelled (see
+    `Future.cancel`) before the failure is raised, as none of it can contribute to the result
+    of the run any longer. Likewise, if a `deadline` (in seconds from the start of the run) is
+    given, and the run has not completed by then, all outstanding work is cancelled and a
+    `TimeoutError` is raised.
+
+    With either scheduler, the gathered result of each node is released as soon as the last
+    of its consumers (per `dependencies`) has been submitted, so peak memory is bounded by the
+    live working set of the graph, rather than the sum of all intermediate results.
+    """
+
     dependencies: Dependencies
     nodes: Nodes
+    scheduler: Scheduler = "waves"
+    poll_interval: float = 0.05
+    cache: ResultCache | None = None
+    checkpoint: Checkpoint | None = None
+    priority: CriticalPathPriority | None = None
+    fuse_chains: bool = False
+    executor: AsyncExecutor | None = None
+    dataplane: DataPlane | None = None
+    pipeline: bool = False
+    placement: CostPlacement | None = None
+    deadline: float | None = None
 
     # TODO: __post_init__ to validate that all dependencies are in nodes
 
+    @property
+    def terminal_nodes(self) -> list[str]:
+        """Names of nodes whose results are not consumed by any other node."""
+        upstream = {dep for deps in self.dependencies.values() for dep in deps}
+        return sorted(n for n in set(self.dependencies) | upstream if n not in upstream)
+
+    @property
+    def consumer_counts(self) -> dict[str, int]:
+        """The number of downstream nodes which consume the result of each node."""
+        counts: dict[str, int] = {}
+        for deps in self.dependencies.values():
+            for dep in set(deps):
+                counts[dep] = counts.get(dep, 0) + 1
+        return counts
+
+    def _link(self, name: str, upstream: str) -> _Link | None:
+        """The link by which node `name` can be appended to a chain ending in its `upstream`
+        node, or None if `name` consumes `upstream` in a way which cannot be fused."""
+        node, up = self.nodes[name], self.nodes[upstream]
+        if (
+            node.method != up.method
+            or node.method not in ("call", "mapvalues")
+            or type(node.async_task) is not type(up.async_task)
+            or type(node.async_task.executor) is not type(up.async_task.executor)
+        ):
+            return None
+        arguments = node.partial | node.kwargs
+        dependent = {
+            k: v
+            for k, v in arguments.items()
+            if isinstance(v, (DependsOn, DependsOnSequence))
+        }
+        if node.method == "call":
+            if len(dependent) != 1:
+                return None
+            [(argname, dep)] = dependent.items()
+            if dep != DependsOn(upstream):
+                return None
+            static = {k: v for k, v in arguments.items() if k != argname}
+            return _Link(node.async_task.func, static, argname, node.async_task.tags)
+        # mapvalues: each element of the upstream result is passed through the chain in turn
+        argnames = node.kwargs.get("argnames")
+        if isinstance(argnames, str):
+            argnames = [argnames]
+        if (
+            set(node.kwargs) != {"argnames", "argvalues"}
+            or list(dependent) != ["argvalues"]
+            or node.kwargs["argvalues"] != DependsOn(upstream)
+            or not argnames
+            or len(argnames) != 1
+        ):
+            return None
+        return _Link(
+            node.async_task.func,
+            dict(node.partial),
+            argnames[0],
+            node.async_task.tags,
+        )
+
+    def fused(self) -> "Graph":
+        """Return a copy of this graph in which each linear chain of nodes (i.e. a node whose
+        only consumer is a node for which it is the only upstream, and so on) is collapsed
+        into a single node, named for the last node in the chain. Nodes are only fused if they
+        share a method (`"call"` or `"mapvalues"`) and executor type; for `"mapvalues"` nodes,
+        each key-value pair is passed through the entire chain in a single invocation. The tags
+        and resource hints of the fused node are those of the whole chain (see
+        `_fused_resources`).
+
+        Examples:
+
+        ```python
+        >>> from ecoscope_workflows_core.decorators import task
+        >>> @task
+        ... def inc(x: int) -> int:
+        ...     return x + 1
+        >>> @task
+        ... def add(x: int, y: int) -> int:
+        ...     return x + y
+        >>> graph = Graph(
+        ...     dependencies={"a": [], "b": ["a"], "c": ["b"], "d": ["a", "c"]},
+        ...     nodes={
+        ...         "a": Node(inc, {"x": 0}),
+        ...         "b": Node(inc, {"x": DependsOn("a")}),
+        ...         "c": Node(inc, {"x": DependsOn("b")}),
+        ...         "d": Node(add, {"x": DependsOn("a"), "y": DependsOn("c")}),
+        ...     },
+        ... )
+        >>> graph.fused().dependencies
+        {'a': [], 'c': ['a'], 'd': ['a', 'c']}
+
+        ```
+        """
+        dependencies = {k: list(v) for k, v in self.dependencies.items()}
+        nodes = dict(self.nodes)
+        graph = replace(self, dependencies=dependencies, nodes=nodes, fuse_chains=False)
+        counts = self.consumer_counts
+        for name in TopologicalSorter(self.dependencies).static_order():
+            upstream = set(dependencies.get(name, []))
+            if len(upstream) != 1:
+                continue
+            [up] = upstream
+            link = graph._link(name, up) if counts[up] == 1 else None
+            if link is None:
+                continue
+            head = nodes.pop(up)
+            chain = (
+                FusedChain(
+                    head.async_task.func.head,
+                    head.async_task.func.links + [link],
+                    head.async_task.func.head_tags,
+                )
+                if isinstance(head.async_task.func, FusedChain)
+                else FusedChain(head.async_task.func, [link], head.async_task.tags)
+            )
+            tail = nodes[name].async_task
+            tags = head.async_task.tags + [
+                t for t in tail.tags if t not in head.async_task.tags
+            ]
+            resources = _fused_resources(head.async_task.resources, tail.resources)
+            nodes[name] = replace(
+                head,
+                async_task=replace(
+                    head.async_task, func=chain, tags=tags, resources=resources
+                ),
+            )
+            dependencies[name] = dependencies.pop(up, [])
+            logger.debug(f"Fused node '{up}' into '{name}'")
+        return graph
+
+    def _task(self, name: str) -> AsyncTask:
+        """The task of node `name`, as it is to be submitted for this run."""
+        node = self.nodes[name]
+        task = (
+            node.async_task
+            if self.executor is None
+            else node.async_task.set_executor(self.executor)
+        )
+        if self.dataplane is not None:
+            task = replace(task, func=ByReference(task.func, self.dataplane))
+        return task
+
+    def _retry_policy(self, name: str, task: AsyncTask) -> RetryPolicy:
+        node = self.nodes[name]
+        if node.retry is not None:
+            return node.retry
+        return RetryPolicy.for_task(task.tags, task.resources)
+
+    def _submit(
+        self,
+        name: str,
+        futures: FuturesDict,
+        global_gathered_dict: GlobalGatheredDict,
+    ) -> Future | FutureSequence:
+        logger.info(f"Executing node: '{name}'")
+        node = self.nodes[name]
+        task = self._task(name)
+        hydrated_kwargs, global_gathered_dict = gather_dependencies(
+            node.kwargs,
+            futures,
+            global_gathered_dict,
+        )
+        hydrated_partial, global_gathered_dict = gather_dependencies(
+            node.partial,
+            futures,
+            global_gathered_dict,
+        )
+        partial = getattr(task, "partial")(**hydrated_partial)
+        policy = self._retry_policy(name, task)
+        if self.placement is not None and self.placement.inline(
+            name,
+            task.tags,
+            [hydrated_partial, hydrated_kwargs],
+            task.resources,
+            method=node.method,
+        ):
+            logger.info(f"Running node inline: '{name}'")
+            start = time.perf_counter()
+            inline_method = getattr(partial.set_executor(PythonExecutor()), node.method)
+            try:
+                result = inline_method(**hydrated_kwargs)
+            except Exception as e:
+                if policy.attempts == 0 or not policy.retryable(e):
+                    raise
+                logger.warning(f"Node '{name}' failed inline, retrying remotely: {e!r}")
+                policy = replace(policy, attempts=policy.attempts - 1)
+            else:
+                self.placement.record(name, time.perf_counter() - start)
+                return _Inline(result)
+        callable_method = getattr(partial, node.method)
+        return submit_with_retries(
+            name,
+            policy,
+            callable_method,
+            hydrated_kwargs,
+            mapped=node.method != "call",
+            poll_interval=self.poll_interval,
+        )
+
+    def _pipeline_source(self, name: str) -> str | None:
+        """The name of the upstream node whose elements can be fed to node `name` one by one
+        as they complete, or None if `name` cannot be pipelined."""
+        node = self.nodes[name]
+        upstream = set(self.dependencies.get(name, []))
+        if len(upstream) != 1 or node.method not in ("map", "mapvalues"):
+            return None
+        [up] = upstream
+        if (
+            self.nodes[up].method not in ("map", "mapvalues")
+            or set(node.kwargs) != {"argnames", "argvalues"}
+            or node.kwargs["argvalues"] != DependsOn(up)
+            or any(
+                isinstance(v, (DependsOn, DependsOnSequence))
+                for v in node.partial.values()
+            )
+        ):
+            return None
+        return up
+
+    def _pipeline(self, name: str, source: FutureSequence) -> _Pipelined:
+        logger.info(f"Pipelining node: '{name}'")
+        node = self.nodes[name]
+        task = self._task(name)
+        method = getattr(task.partial(**node.partial), node.method)
+        policy = self._retry_policy(name, task)
+        argnames = node.kwargs["argnames"]
+        return _Pipelined(
+            source,
+            lambda elements: submit_with_retries(  # type: ignore[arg-type, return-value]
+                name,
+                policy,
+                method,
+                {"argnames": argnames, "argvalues": elements},
+                mapped=True,
+                poll_interval=self.poll_interval,
+            ),
+        )
+
+    def _cache_key(self, name: str, cache_keys: dict[str, str]) -> str:
+        node = self.nodes[name]
+
+        def keyed(v: Any | Dependency) -> Any:
+            match v:
+                case DependsOn():
+                    return {"depends_on": cache_keys[v.node_name]}
+                case DependsOnSequence():
+                    return [keyed(x) for x in v]
+                case _:
+                    return v
+
+        return hash_key(
+            task_reference(node.async_task.func),
+            partial_keywords(node.async_task.func),
+            node.method,
+            {k: keyed(v) for k, v in node.partial.items()},
+            {k: keyed(v) for k, v in node.kwargs.items()},
+        )
+
+    def _restorable(self, cache_keys: dict[str, str]) -> set[str]:
+        """The nodes whose results are available from the checkpoint or cache (which are not
+        yet read). Fills in the cache key of every node, as downstream keys depend on them."""
+        restorable: set[str] = set()
+        for name in TopologicalSorter(self.dependencies).static_order():
+            if self.cache is not None:
+                cache_keys[name] = self._cache_key(name, cache_keys)
+            if (self.checkpoint is not None and name in self.checkpoint) or (
+                self.cache is not None and cache_keys[name] in self.cache
+            ):
+                restorable.add(name)
+        return restorable
+
+    def _unneeded(self, restorable: set[str]) -> set[str]:
+        """The nodes whose results need be neither restored nor computed, as none of their
+        consumers is run (i.e. each is either restored itself, or is also unneeded). With no
+        `restorable` nodes, every node is needed.
+
+        Examples:
+
+        ```python
+        >>> graph = Graph(
+        ...     dependencies={"a": [], "b": ["a"], "c": ["b"], "d": ["a", "c"]},
+        ...     nodes={},
+        ... )
+        >>> sorted(graph._unneeded({"a", "c"}))
+        ['b']
+        >>> sorted(graph._unneeded({"c", "d"}))
+        ['a', 'b', 'c']
+
+        ```
+        """
+        consumers: dict[str, set[str]] = {}
+        for name, deps in self.dependencies.items():
+            for dep in deps:
+                consumers.setdefault(dep, set()).add(name)
+        needed = set(self.terminal_nodes)
+        order = list(TopologicalSorter(self.dependencies).static_order())
+        for name in reversed(order):
+            if any(c in needed - restorable for c in consumers.get(name, ())):
+                needed.add(name)
+        return set(order) - needed
+
+    def _restore(self, name: str, cache_keys: dict[str, str]) -> _Resolved | None:
+        """Restore the result of node `name` from the checkpoint or cache, if available."""
+        if self.checkpoint is not None:
+            restored, value = self.checkpoint.restore(name)
+            if restored:
+                return _Resolved(value)
+        if self.cache is not None:
+            hit, value = self.cache.get(cache_keys[name])
+            if hit:
+                logger.info(f"Restored node from cache: '{name}'")
+                return _Resolved(value)
+        return None
+
+    def _persist(self, name: str, value: Any, cache_keys: dict[str, str]) -> None:
+        if self.checkpoint is not None and self.checkpoint.enabled:
+            owner = f"checkpoints/{self.checkpoint.run_id}"
+            self.checkpoint.save(name, self._adopt(value, owner))
+        if self.cache is not None:
+            owner = f"cache/{cache_keys[name]}"
+            self.cache.put(cache_keys[name], self._adopt(value, owner))
+
+    def _adopt(self, value: Any, owner: str) -> Any:
+        # the run's own data plane results are deleted when it ends, so results which are
+        # persisted reference copies of their frames, which are deleted along with them
+        return value if self.dataplane is None else self.dataplane.adopt(value, owner)
+
+    def _release_inputs(
+        self,
+        name: str,
+        refcounts: dict[str, int],
+        global_gathered_dict: GlobalGatheredDict,
+    ) -> None:
+        """Decrement the reference count of each input to the node `name`, which has just
+        been submitted, and release the gathered values which have no remaining consumers.
+        Without this, every intermediate result would stay in memory for the entire run."""
+        for dep in set(self.dependencies.get(name, [])):
+            refcounts[dep] -= 1
+            if refcounts[dep] == 0:
+                logger.debug(f"Releasing result of node: '{dep}'")
+                global_gathered_dict.pop(dep, None)
+
+    def _wait(
+        self,
+        futures: FuturesDict,
+        pipelines: dict[str, _Pipelined | _Resolved],
+        deadline_at: float | None = None,
+    ) -> list[str]:
+        """Block until at least one outstanding future has completed (or, for the `"waves"`
+        scheduler, until all of them have), and return the names of the completed nodes.
+        While waiting, pipelined nodes which are not yet ready are fed the elements of their
+        upstream results which have completed in the meantime. Raises a `TimeoutError` if
+        the (monotonic) `deadline_at` passes first."""
+        if self.scheduler == "waves" and deadline_at is None:
+            return sorted(futures)
+        while True:
+            if deadline_at is not None and time.monotonic() > deadline_at:
+                raise TimeoutError(f"Run exceeded its deadline of {self.deadline}s")
+            for pipelined in pipelines.values():
+                if isinstance(pipelined, _Pipelined):
+                    pipelined.feed()
+            completed = [name for name, future in futures.items() if future.done()]
+            if self.scheduler == "waves":
+                if len(completed) == len(futures):
+                    return sorted(completed)
+            elif completed:
+                return sorted(completed)
+            time.sleep(self.poll_interval)
+
+    def _cancel(
+        self,
+        futures: FuturesDict,
+        pipelines: dict[str, _Pipelined | _Resolved],
+    ) -> None:
+        """Cancel the work of all outstanding (i.e. submitted, but not yet gathered) nodes."""
+        outstanding = {
+            name: future
+            for name, future in (futures | pipelines).items()
+            if not isinstance(future, (_Resolved, _Inline))
+        }
+        if outstanding:
+            logger.warning(f"Cancelling outstanding nodes: {sorted(outstanding)}")
+        for name, future in outstanding.items():
+            try:
+                future.cancel()
+            except Exception as e:
+                logger.warning(f"Failed to cancel node '{name}': {e!r}")
+
     def execute(self) -> Any | Sequence[Any]:
+        if self.fuse_chains:
+            return self.fused().execute()
+        try:
+            result = self._execute()
+            if self.dataplane is not None:
+                result = resolve(result)
+            # only once the result is resolved, as it may reference a cache entry, or the
+            # checkpoint, which is deleted here
+            if self.checkpoint is not None:
+                self.checkpoint.complete()
+            if self.cache is not None:
+                self.cache.evict()
+                logger.info(f"Result cache stats: {self.cache.stats}")
+            return result
+        finally:
+            if self.executor is not None:
+                self.executor.close()
+            if self.dataplane is not None:
+                self.dataplane.cleanup()
+
+    def _execute(self) -> Any | Sequence[Any]:
+        terminal_nodes = self.terminal_nodes
+        if len(terminal_nodes) > 1:
+            raise NotImplementedError("Multiple terminal nodes are not yet supported")
         ts = TopologicalSorter(self.dependencies)
         ts.prepare()
         futures: FuturesDict = {}
         global_gathered_dict: GlobalGatheredDict = {}
-        while ts.is_active():
-            ready = [name for name in ts.get_ready()]
-            for name in sorted(ready):
-                logger.info(f"Executing node: '{name}'")
-                node = self.nodes[name]
-                hydrated_kwargs, global_gathered_dict = gather_dependencies(
-                    node.kwargs,
-                    futures,
-                    global_gathered_dict,
-                )
-                hydrated_partial, global_gathered_dict = gather_dependencies(
-                    node.partial,
-                    futures,
-                    global_gathered_dict,
+        refcounts = self.consumer_counts
+        cache_keys: dict[str, str] = {}
+        # restored results are only read if they are consumed by a node which runs
+        unneeded = (
+            self._unneeded(self._restorable(cache_keys))
+            if self.cache is not None or self.checkpoint is not None
+            else set()
+        )
+        ranks = self.priority.ranks(self.dependencies) if self.priority else {}
+        started: dict[str, float] = {}
+        # nodes started ahead of being ready, by feeding them their upstream's elements
+        pipelines: dict[str, _Pipelined | _Resolved] = {}
+        pipelined_from: dict[str, list[str]] = {}
+        if self.pipeline and self.scheduler == "as-completed":
+            for name in sorted(self.nodes):
+                if (up := self._pipeline_source(name)) is not None:
+                    pipelined_from.setdefault(up, []).append(name)
+
+        def start_pipelines(name: str, future: Future | FutureSequence) -> None:
+            if not isinstance(future, FutureSequence):
+                return
+            for consumer in pipelined_from.get(name, []):
+                if consumer in unneeded:
+                    pipelines[consumer] = _Resolved(None)
+                    continue
+                restored = self._restore(consumer, cache_keys)
+                if restored is not None:
+                    pipelines[consumer] = restored
+                    continue
+                started[consumer] = time.monotonic()
+                pipelines[consumer] = self._pipeline(consumer, future)
+                start_pipelines(consumer, pipelines[consumer])
+
+        deadline_at = (
+            None if self.deadline is None else time.monotonic() + self.deadline
+        )
+        try:
+            while ts.is_active():
+                ready = ts.get_ready()
+                ordered = (
+                    self.priority.order(ready, ranks)
+                    if self.priority
+                    else sorted(ready)
                 )
-                partial = getattr(node.async_task, "partial")(**hydrated_partial)
-                callable_method = getattr(partial, node.method)
-                future = callable_method(**hydrated_kwargs)
-                futures[name] = future
-            for name in ready:
-                ts.done(name)
-
-        # here, all nodes in ready are terminal nodes
-        terminal_node_result = [futures[n].gather() for n in ready]
-        if len(terminal_node_result) > 1:
-            raise NotImplementedError("Multiple terminal nodes are not yet supported")
-        return terminal_node_result.pop(0)
+                for name in ordered:
+                    if name in pipelines:
+                        futures[name] = pipelines.pop(name)
+                    elif name in unneeded:
+                        logger.debug(f"Skipping unneeded node: '{name}'")
+                        futures[name] = _Resolved(None)
+                    else:
+                        restored = self._restore(name, cache_keys)
+                        if restored is not None:
+                            futures[name] = restored
+                        elif unneeded & set(self.dependencies.get(name, [])):
+                            raise RuntimeError(
+                                f"The result of node '{name}' is no longer available to "
+                                "restore (e.g. it was evicted from the cache mid-run)"
+                            )
+                        else:
+                            started[name] = time.monotonic()
+                            futures[name] = self._submit(
+                                name, futures, global_gathered_dict
+                            )
+                            start_pipelines(name, futures[name])
+                    self._release_inputs(name, refcounts, global_gathered_dict)
+                if not futures:
+                    raise RuntimeError(
+                        "Graph is active but no nodes are ready or running."
+                    )
+                for name in self._wait(futures, pipelines, deadline_at):
+                    # popped only once gathered, so that a failed node is cancelled too
+                    future = futures[name]
+                    global_gathered_dict[name] = future.gather()
+                    futures.pop(name)
+                    if not isinstance(future, _Resolved):
+                        self._persist(name, global_gathered_dict[name], cache_keys)
+                        if self.priority is not None:
+                            self.priority.record(name, time.monotonic() - started[name])
+                    logger.info(f"Completed node: '{name}'")
+                    ts.done(name)
+        except BaseException:
+            # fail fast: none of the outstanding work can contribute to the result any longer
+            self._cancel(futures, pipelines)
+            raise
+
+        if self.priority is not None:
+            self.priority.save()
+        if self.placement is not None:
+            self.placement.save()
+
+        return global_gathered_dict[terminal_nodes[0]]
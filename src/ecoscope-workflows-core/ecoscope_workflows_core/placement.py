@@ -0,0 +1,204 @@
+"""Cost-based placement of `Graph` nodes, either inline on the driver or on the executor.
+
+Many nodes (e.g. setting groupers or a time range, or assembling widgets) take microseconds to
+run, but if submitted to a remote executor such as Lithops, each pays seconds of invocation
+latency. A placement policy instead runs such nodes inline on the driver, and only submits
+nodes which are expected to be expensive to the executor.
+"""
+
+import dataclasses
+import datetime
+import enum
+import json
+import logging
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Sequence
+
+from pydantic import BaseModel
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ecoscope_workflows_core.cache import frame_format
+from ecoscope_workflows_core.dataplane import ResultRef
+from ecoscope_workflows_core.executors import TaskResources
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SECONDS = 0.05
+DEFAULT_MAX_PAYLOAD_BYTES = 1 << 16
+
+# values of these types are measured by `sys.getsizeof`, as they hold no references to others
+_SCALARS = (
+    str,
+    bytes,
+    bytearray,
+    int,
+    float,
+    complex,
+    type(None),
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    enum.Enum,
+)
+
+
+class PlacementSettings(BaseSettings):
+    """Configures cost-based placement from the environment. Placement is enabled by setting
+    `ECOSCOPE_WORKFLOWS_PLACEMENT_ENABLED=true`. If `ECOSCOPE_WORKFLOWS_PLACEMENT_DURATIONS_FILE`
+    is set, the durations of nodes run inline are loaded from (and, at the end of each run,
+    saved to) that JSON file. Without it, no durations are known at the start of each run,
+    so placement relies on the size of each node's inputs alone."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ecoscope_workflows_placement_",
+        case_sensitive=False,
+    )
+
+    enabled: bool = False
+    durations_file: str | None = None
+    max_seconds: float = DEFAULT_MAX_SECONDS
+    max_payload_bytes: int = DEFAULT_MAX_PAYLOAD_BYTES
+
+
+def payload_bytes(value: Any) -> int:
+    """An estimate of the in-memory size of `value`. Lists, tuples, sets, dicts, dataclasses,
+    and pydantic models are measured recursively, through each of their items or fields, and
+    (Geo)DataFrames and arrays are measured deeply. A `ResultRef` is taken to be arbitrarily
+    large, as only frames larger than the data plane's threshold are passed by reference, as
+    is any other object, as its size cannot be known.
+
+    Examples:
+
+    ```python
+    >>> payload_bytes({"a": [1, 2]}) < 1024
+    True
+    >>> payload_bytes([ResultRef("/tmp/x.parquet", "parquet")]) == sys.maxsize
+    True
+    >>> payload_bytes(object()) == sys.maxsize
+    True
+
+    ```
+    """
+    return min(_payload_bytes(value, set()), sys.maxsize)
+
+
+def _payload_bytes(value: Any, seen: set[int]) -> int:
+    if isinstance(value, _SCALARS):
+        return sys.getsizeof(value)
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    match value:
+        case ResultRef():
+            return sys.maxsize
+        case list() | tuple() | set() | frozenset():
+            return sum(_payload_bytes(v, seen) for v in value)
+        case dict():
+            return sum(
+                _payload_bytes(k, seen) + _payload_bytes(v, seen)
+                for k, v in value.items()
+            )
+        case BaseModel():
+            return sum(_payload_bytes(v, seen) for _, v in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return sum(
+            _payload_bytes(getattr(value, f.name), seen)
+            for f in dataclasses.fields(value)
+        )
+    if frame_format(value) is not None:
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(getattr(value, "nbytes", None), int):  # e.g. numpy arrays
+        return value.nbytes
+    return sys.maxsize
+
+
+@dataclass
+class CostPlacement:
+    """Places each node inline on the driver if it is expected to be cheap, and on the
+    executor otherwise. Nodes tagged `io` are never run inline, as they may block the driver
+    on the network. Nodes whose task is hinted as `cheap` (see `TaskResources`) are always run
+    inline. Other `map` and `mapvalues` nodes are never run inline, as their elements would run
+    one after another on the driver, rather than concurrently. For other nodes, if the node has
+    previously run inline, it is run inline again if that took at most `max_seconds`.
+    Otherwise, a node is expected to be cheap if the total size of its inputs (see
+    `payload_bytes`) is at most `max_payload_bytes`.
+
+    The first run of a node which is expensive, but which has small inputs, is therefore inline;
+    its duration is recorded, so that subsequent runs (given a `path` at which to save
+    durations) place it on the executor.
+
+    Examples:
+
+    ```python
+    >>> placement = CostPlacement()
+    >>> placement.inline("groupers", [], {"groupers": ["month"]})
+    True
+    >>> placement.inline("observations", ["io"], {"since": "2024-01-01"})
+    False
+    >>> placement.inline("widgets", [], {"argvalues": [1, 2]}, method="map")
+    False
+    >>> placement.record("groupers", 2.5)
+    >>> placement.inline("groupers", [], {"groupers": ["month"]})
+    False
+
+    ```
+    """
+
+    durations: dict[str, float] = field(default_factory=dict)
+    path: Path | None = None
+    max_seconds: float = DEFAULT_MAX_SECONDS
+    max_payload_bytes: int = DEFAULT_MAX_PAYLOAD_BYTES
+
+    @classmethod
+    def from_file(cls, path: str | Path, **kwargs) -> "CostPlacement":
+        path = Path(path)
+        durations = json.loads(path.read_text()) if path.exists() else {}
+        return cls(durations=durations, path=path, **kwargs)
+
+    @classmethod
+    def from_env(cls) -> "CostPlacement | None":
+        settings = PlacementSettings()
+        if not settings.enabled:
+            return None
+        kwargs = {
+            "max_seconds": settings.max_seconds,
+            "max_payload_bytes": settings.max_payload_bytes,
+        }
+        if not settings.durations_file:
+            return cls(**kwargs)  # type: ignore[arg-type]
+        return cls.from_file(settings.durations_file, **kwargs)
+
+    def inline(
+        self,
+        name: str,
+        tags: Sequence[str],
+        inputs: Any,
+        resources: TaskResources | None = None,
+        method: str = "call",
+    ) -> bool:
+        """Whether to run the node `name`, with the given `tags` and `inputs`, inline. The
+        `method` is that of the node (see `graph.Node`)."""
+        if "io" in tags:
+            return False
+        if resources is not None and resources.cheap:
+            return True
+        if method != "call":
+            return False
+        if name in self.durations:
+            return self.durations[name] <= self.max_seconds
+        return payload_bytes(inputs) <= self.max_payload_bytes
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record the duration of an inline run of the node `name`."""
+        if seconds > self.max_seconds:
+            logger.info(
+                f"Node '{name}' took {seconds:.3f}s inline; it will next be placed remotely"
+            )
+        self.durations[name] = seconds
+
+    def save(self) -> None:
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.durations, indent=2, sort_keys=True))
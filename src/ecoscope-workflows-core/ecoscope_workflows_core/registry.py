@@ -3,25 +3,36 @@ entry points. This design is heavily inspired by the `fsspec` package's `registr
 to which we owe a debt of gratitude.
 """
 
+import copy
+import hashlib
+import importlib.util
+import json
+import logging
+import os
 import types
 from dataclasses import dataclass
 from enum import Enum
 from importlib import import_module
-from importlib.metadata import entry_points
+from importlib.metadata import EntryPoint, entry_points
 from inspect import getmembers, ismodule
-from typing import Annotated, Any, Generator, get_args
+from pathlib import Path
+from typing import Annotated, Any, Generator, Sequence, get_args
 
+import pydantic
 import ruamel.yaml
 from pydantic import (
     BaseModel,
     Field,
     FieldSerializationInfo,
+    PrivateAttr,
     TypeAdapter,
     field_serializer,
 )
 from pydantic.functional_validators import AfterValidator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from ecoscope_workflows_core.decorators import SyncTask
+from ecoscope_workflows_core.executors import TaskResources
 from ecoscope_workflows_core.jsonschema import SurfacesDescriptionSchema
 from ecoscope_workflows_core.util import (
     import_task_from_reference,
@@ -29,12 +40,17 @@ from ecoscope_workflows_core.util import (
     validate_importable_reference,
 )
 
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
 
 @dataclass
 class _KnownTaskArgs:
     name: str
     anchor: str
     tags: list[str]
+    resources: TaskResources
 
 
 def recurse_into_tasks(
@@ -49,6 +65,7 @@ def recurse_into_tasks(
                 name=name,
                 anchor=module.__name__,
                 tags=obj.tags or [],
+                resources=obj.resources,
             )
         elif ismodule(obj):
             yield from recurse_into_tasks(obj)
@@ -56,12 +73,16 @@ def recurse_into_tasks(
             continue
 
 
-def collect_task_entries() -> dict[str, "KnownTask"]:
+def _ecoscope_workflows_entry_points() -> list[EntryPoint]:
     eps = entry_points()
     assert hasattr(eps, "select")  # Python >= 3.10
-    ecoscope_workflows_eps = eps.select(group="ecoscope_workflows")
+    return sorted(eps.select(group="ecoscope_workflows"), key=lambda ep: ep.value)
+
+
+def import_task_entries(eps: Sequence[EntryPoint]) -> dict[str, "KnownTask"]:
+    """Collect the known tasks of the given entry points, by importing their task modules."""
     known_tasks: dict[str, "KnownTask"] = {}
-    for ep in ecoscope_workflows_eps:
+    for ep in eps:
         # a bit redundant with `util.import_task_from_reference`
         anchor, tasks_pkg_name = ep.value.rsplit(".", 1)
         root = import_module(anchor)
@@ -75,12 +96,135 @@ def collect_task_entries() -> dict[str, "KnownTask"]:
                 # of KnownTask is strange? Maybe we should just pass them directly.
                 importable_reference=f"{kta.anchor}.{kta.name}",
                 tags=[TaskTag(t) for t in kta.tags],
+                resources=kta.resources,
             )
             for kta in known_task_args
         }
     return known_tasks
 
 
+class RegistrySettings(BaseSettings):
+    """Configures the registry manifest cache from the environment. The manifest is cached in
+    `ECOSCOPE_WORKFLOWS_REGISTRY_CACHE_DIR` (by default, `ecoscope-workflows` in the user's
+    cache directory), unless `ECOSCOPE_WORKFLOWS_REGISTRY_MANIFEST=false`."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ecoscope_workflows_registry_",
+        case_sensitive=False,
+    )
+
+    manifest: bool = True
+    cache_dir: str | None = None
+
+    @property
+    def manifest_path(self) -> Path:
+        cache_dir = (
+            Path(self.cache_dir)
+            if self.cache_dir
+            else Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+            / "ecoscope-workflows"
+        )
+        return cache_dir / "registry-manifest.json"
+
+
+def _package_dirs(ep: EntryPoint) -> list[Path]:
+    # the directories of the top-level package of the entry point, in which its tasks, and
+    # everything they import from their own distribution, are defined
+    spec = importlib.util.find_spec(ep.module.split(".")[0])
+    if spec is None:
+        return []
+    return [Path(p) for p in spec.submodule_search_locations or []]
+
+
+def _source_fingerprint(ep: EntryPoint) -> list[Any]:
+    # the version of a distribution installed in editable mode does not change with its
+    # source, so for such distributions the modification times of the source are hashed too.
+    # only the entry point's package is walked, rather than the whole project (which may hold
+    # e.g. tests, examples, or virtual environments)
+    dist = ep.dist
+    direct_url = json.loads((dist and dist.read_text("direct_url.json")) or "{}")
+    if not direct_url.get("dir_info", {}).get("editable"):
+        return []
+    return sorted(
+        (str(p.relative_to(pkg.parent)), p.stat().st_mtime_ns, p.stat().st_size)
+        for pkg in _package_dirs(ep)
+        for p in pkg.rglob("*.py")
+    )
+
+
+def manifest_key(eps: Sequence[EntryPoint]) -> str:
+    """A hash of the entry points, and the names and versions of the distributions which
+    provide them (plus, for editable installs, the state of their source), which changes
+    whenever any task may have been added, removed, or changed. The version of pydantic is
+    hashed too, as it generates the cached parameter schemas."""
+    h = hashlib.sha256()
+    h.update(f"{MANIFEST_VERSION}\0{pydantic.VERSION}".encode())
+    for ep in eps:
+        dist = ep.dist
+        entry = [ep.name, ep.value, dist and dist.name, dist and dist.version]
+        h.update(json.dumps(entry + _source_fingerprint(ep)).encode())
+    return h.hexdigest()
+
+
+def load_manifest(path: Path, key: str) -> dict[str, "KnownTask"] | None:
+    """The known tasks cached in the manifest at `path`, if it exists and was written for
+    the same `key`, or None otherwise."""
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if manifest.get("key") != key:
+        logger.info("Registry manifest is stale, re-collecting tasks")
+        return None
+    known_tasks = {}
+    for name, entry in manifest["tasks"].items():
+        kt = KnownTask(**{k: v for k, v in entry.items() if k != "parameters"})
+        kt._parameters_jsonschema = entry["parameters"]
+        known_tasks[name] = kt
+    return known_tasks
+
+
+def save_manifest(path: Path, key: str, known_tasks: dict[str, "KnownTask"]) -> None:
+    tasks = {}
+    for name, kt in known_tasks.items():
+        try:
+            parameters = kt.parameters_jsonschema()
+        except Exception as e:  # e.g. annotations which cannot be represented in JSON
+            logger.warning(f"Parameters of task '{name}' cannot be cached: {e!r}")
+            parameters = None
+        tasks[name] = {
+            "importable_reference": kt.importable_reference,
+            "tags": [tag.value for tag in kt.tags],
+            "resources": kt.resources.model_dump(mode="json", exclude_defaults=True),
+            "parameters": parameters,
+        }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"key": key, "tasks": tasks}))
+        tmp.replace(path)  # atomically, as concurrent processes may be reading it
+    except OSError as e:
+        logger.warning(f"Registry manifest could not be written to {path}: {e!r}")
+
+
+def collect_task_entries() -> dict[str, "KnownTask"]:
+    """Collect the known tasks of all `ecoscope_workflows` entry points. Unless disabled
+    (see `RegistrySettings`), tasks are served from the cached registry manifest, without
+    importing any task code, as long as the manifest is current; otherwise, tasks are
+    collected by importing their modules, and the manifest is rewritten."""
+    eps = _ecoscope_workflows_entry_points()
+    settings = RegistrySettings()
+    if not settings.manifest:
+        return import_task_entries(eps)
+    key = manifest_key(eps)
+    path = settings.manifest_path
+    known_tasks = load_manifest(path, key)
+    if known_tasks is None:
+        known_tasks = import_task_entries(eps)
+        save_manifest(path, key, known_tasks)
+    return known_tasks
+
+
 ImportableReference = Annotated[str, AfterValidator(validate_importable_reference)]
 
 
@@ -91,6 +235,14 @@ class TaskTag(str, Enum):
 class KnownTask(BaseModel):
     importable_reference: ImportableReference
     tags: list[TaskTag] = Field(default_factory=list)
+    resources: TaskResources = Field(default_factory=TaskResources)
+    # the JSON schema of the task's parameters, once generated, or if known without importing
+    # the task (i.e. if this task was loaded from the registry manifest)
+    _parameters_jsonschema: dict | None = PrivateAttr(default=None)
+    # the schemas derived from it, by the (sorted) args omitted from each
+    _omitted_parameters_jsonschemas: dict[tuple[str, ...], dict] = PrivateAttr(
+        default_factory=dict
+    )
 
     @field_serializer("importable_reference")
     def serialize_importable_reference(self, v: Any, info: FieldSerializationInfo):
@@ -128,22 +280,33 @@ class KnownTask(BaseModel):
         return import_task_from_reference(self.anchor, self.function)
 
     def parameters_jsonschema(self, omit_args: list[str] | None = None) -> dict:
-        # NOTE: SurfacesDescriptionSchema is a workaround for https://github.com/pydantic/pydantic/issues/9404
-        # Once that issue is closed, we can remove SurfaceDescriptionSchema and use the default schema_generator.
-        schema = TypeAdapter(
-            self.task.func,
-            config={"arbitrary_types_allowed": True},
-        ).json_schema(schema_generator=SurfacesDescriptionSchema)
-        if omit_args:
-            schema["properties"] = {
-                arg: schema["properties"][arg]
-                for arg in schema["properties"]
-                if arg not in omit_args
-            }
-            schema["required"] = [
-                arg for arg in schema["required"] if arg not in omit_args
-            ]
-        return schema
+        """The JSON schema of the task's parameters, less any `omit_args`. Schemas are only
+        generated once per task (and derived once per set of `omit_args`), and each call
+        returns a copy, which the caller is free to modify."""
+        key = tuple(sorted(set(omit_args or [])))
+        if key not in self._omitted_parameters_jsonschemas:
+            schema = copy.deepcopy(self._full_parameters_jsonschema())
+            if omit_args:
+                schema["properties"] = {
+                    arg: schema["properties"][arg]
+                    for arg in schema["properties"]
+                    if arg not in omit_args
+                }
+                schema["required"] = [
+                    arg for arg in schema["required"] if arg not in omit_args
+                ]
+            self._omitted_parameters_jsonschemas[key] = schema
+        return copy.deepcopy(self._omitted_parameters_jsonschemas[key])
+
+    def _full_parameters_jsonschema(self) -> dict:
+        if self._parameters_jsonschema is None:
+            # NOTE: SurfacesDescriptionSchema is a workaround for https://github.com/pydantic/pydantic/issues/9404
+            # Once that issue is closed, we can remove SurfaceDescriptionSchema and use the default schema_generator.
+            self._parameters_jsonschema = TypeAdapter(
+                self.task.func,
+                config={"arbitrary_types_allowed": True},
+            ).json_schema(schema_generator=SurfacesDescriptionSchema)
+        return self._parameters_jsonschema
 
     @property
     def params_annotations(self) -> dict[str, tuple]:
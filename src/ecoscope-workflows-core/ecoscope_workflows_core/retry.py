@@ -0,0 +1,330 @@
+"""Retries of failed `Graph` nodes.
+
+A transient failure of any one node (e.g. a 502 from EarthRanger, a 503 from GCS, or an
+evicted Lithops worker) would otherwise fail the whole run. Each node is instead retried per
+its `RetryPolicy`, which by default is derived from the tags and resource hints of its task
+(see `RetryPolicy.for_task`): tasks tagged `io` (or hinted with a `backoff`) are retried with
+exponential backoff, plus random jitter, so that many failed elements do not retry at once; tasks
+hinted as `pure` (i.e. which are safe to run twice) are resubmitted immediately, and other
+tasks, which may have side effects, are not retried unless they ask to be. Errors which are
+deterministic (e.g. a pydantic `ValidationError`, or a `TypeError`), and so would only recur on
+a retry, are never retried (see `DETERMINISTIC_ERRORS`).
+
+For `"map"` and `"mapvalues"` nodes, only the failed elements are resubmitted; the results of
+the elements which succeeded are kept.
+"""
+
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+from pydantic import NonNegativeFloat, NonNegativeInt, ValidationError
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ecoscope_workflows_core.executors import Future, FutureSequence, TaskResources
+
+logger = logging.getLogger(__name__)
+
+# errors raised by bugs, or by invalid inputs, rather than by the environment; the same
+# invocation would only raise them again
+DETERMINISTIC_ERRORS: tuple[type[BaseException], ...] = (
+    ValidationError,
+    TypeError,
+    AttributeError,
+    NameError,
+    LookupError,
+    ArithmeticError,
+    AssertionError,
+    NotImplementedError,
+    ImportError,
+)
+
+
+class RetrySettings(BaseSettings):
+    """Configures the default retry policies of `RetryPolicy.for_task` from the environment,
+    e.g. `ECOSCOPE_WORKFLOWS_RETRY_IO_ATTEMPTS=5`. Retries are disabled entirely by
+    `ECOSCOPE_WORKFLOWS_RETRY_ENABLED=false`."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ecoscope_workflows_retry_",
+        case_sensitive=False,
+    )
+
+    enabled: bool = True
+    io_attempts: NonNegativeInt = 3
+    io_backoff: NonNegativeFloat = 1.0
+    pure_attempts: NonNegativeInt = 1
+    max_backoff: NonNegativeFloat = 60.0
+    jitter: NonNegativeFloat = 0.1
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry a failed node (or element) up to `attempts` times, waiting `backoff` seconds
+    before the first retry, and `multiplier` times longer before each retry after that (but
+    never longer than `max_backoff` seconds). Each delay is lengthened by a random fraction of
+    up to `jitter` of itself. Failures which raise any of the `deterministic` errors are not
+    retried.
+
+    Examples:
+
+    ```python
+    >>> policy = RetryPolicy(attempts=3, backoff=1.0)
+    >>> [policy.delay(retry) for retry in (1, 2, 3)]
+    [1.0, 2.0, 4.0]
+    >>> RetryPolicy.for_task(["io"], TaskResources())
+    RetryPolicy(attempts=3, backoff=1.0, multiplier=2.0, max_backoff=60.0, jitter=0.1)
+    >>> RetryPolicy.for_task([], TaskResources(retries=2, backoff=0.5)).backoff
+    0.5
+    >>> RetryPolicy.for_task([], TaskResources(pure=True)).attempts
+    1
+    >>> RetryPolicy.for_task([], TaskResources()).attempts
+    0
+    >>> policy.retryable(ConnectionError()), policy.retryable(KeyError("time"))
+    (True, False)
+
+    ```
+    """
+
+    attempts: int = 0
+    backoff: float = 0.0
+    multiplier: float = 2.0
+    max_backoff: float = 60.0
+    jitter: float = 0.0
+    deterministic: tuple[type[BaseException], ...] = field(
+        default=DETERMINISTIC_ERRORS, repr=False
+    )
+
+    @classmethod
+    def for_task(cls, tags: Sequence[str], resources: TaskResources) -> "RetryPolicy":
+        """The default policy for a task with the given `tags` and `resources`. The number of
+        attempts given by `resources.retries`, and the backoff given by `resources.backoff`,
+        if any, take precedence over the defaults."""
+        settings = RetrySettings()
+        if not settings.enabled:
+            return cls()
+        if "io" in tags:
+            attempts, backoff = settings.io_attempts, settings.io_backoff
+        elif resources.pure:
+            attempts, backoff = settings.pure_attempts, 0.0
+        else:
+            attempts, backoff = 0, 0.0
+        if resources.retries is not None:
+            attempts = resources.retries
+        if resources.backoff is not None:
+            backoff = resources.backoff
+        return cls(
+            attempts,
+            backoff,
+            max_backoff=settings.max_backoff,
+            jitter=settings.jitter if backoff else 0.0,
+        )
+
+    def delay(self, retry: int) -> float:
+        """The number of seconds to wait before the (1-indexed) `retry`."""
+        delay = self.backoff * self.multiplier ** (retry - 1)
+        if self.jitter:
+            delay *= 1 + random.uniform(0, self.jitter)
+        return min(delay, self.max_backoff)
+
+    def retryable(self, error: BaseException) -> bool:
+        """Whether a failure which raised `error` may succeed if retried."""
+        return not isinstance(error, self.deterministic)
+
+
+class RetryingFuture(Future):
+    """The future for a `"call"` node which is resubmitted (by `submit`) on failure, per the
+    `policy`. Failures are observed, and retries submitted, as the future is polled."""
+
+    def __init__(
+        self,
+        name: str,
+        submit: Callable[[], Future],
+        policy: RetryPolicy,
+        poll_interval: float = 0.05,
+    ):
+        self.name = name
+        self.submit = submit
+        self.policy = policy
+        self.poll_interval = poll_interval
+        self.retries = 0
+        self.future: Future | None = None
+        self.retry_at = 0.0
+        self.settled = False
+        self.value: Any = None
+        self.error: BaseException | None = None
+        self._poll()
+
+    def _fail(self, error: Exception) -> None:
+        self.future = None
+        if self.retries >= self.policy.attempts or not self.policy.retryable(error):
+            self.error, self.settled = error, True
+            return
+        self.retries += 1
+        delay = self.policy.delay(self.retries)
+        logger.warning(
+            f"Retrying node '{self.name}' (retry {self.retries} of {self.policy.attempts}) "
+            f"in {delay:.1f}s, after: {error!r}"
+        )
+        self.retry_at = time.monotonic() + delay
+
+    def _poll(self) -> None:
+        if self.settled:
+            return
+        if self.future is None:
+            if time.monotonic() < self.retry_at:
+                return
+            try:
+                self.future = self.submit()
+            except Exception as e:
+                return self._fail(e)
+        if not self.future.done():
+            return
+        try:
+            self.value, self.settled = self.future.gather(), True
+        except Exception as e:
+            self._fail(e)
+
+    def done(self) -> bool:
+        self._poll()
+        return self.settled
+
+    def cancel(self) -> None:
+        self.settled = True
+        if self.future is not None:
+            self.future.cancel()
+
+    def gather(self, *args, **kwargs) -> Any:
+        while not self.done():
+            time.sleep(self.poll_interval)
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class RetryingFutureSequence(FutureSequence):
+    """The future for a `"map"` or `"mapvalues"` node whose failed elements are resubmitted
+    (by passing just those `elements` to `submit`) per the `policy`. Each element is retried
+    independently of the others, but elements which become due for a retry at the same time
+    are resubmitted together."""
+
+    def __init__(
+        self,
+        name: str,
+        submit: Callable[[list[Any]], FutureSequence],
+        elements: list[Any],
+        policy: RetryPolicy,
+        poll_interval: float = 0.05,
+    ):
+        self.name = name
+        self.submit = submit
+        self.elements = elements
+        self.policy = policy
+        self.poll_interval = poll_interval
+        # the parts submitted so far, each with the indices of its elements which are unsettled
+        self.parts: list[tuple[list[int], FutureSequence, set[int]]] = []
+        self.retries: dict[int, int] = {}
+        self.pending: dict[
+            int, float
+        ] = {}  # the time at which each failed element is due
+        self.results: dict[int, Any] = {}
+        self.errors: dict[int, BaseException] = {}
+        self._resubmit(list(range(len(elements))))
+
+    def _fail(self, index: int, error: Exception) -> None:
+        retries = self.retries.get(index, 0)
+        if retries >= self.policy.attempts or not self.policy.retryable(error):
+            self.errors[index] = error
+            return
+        self.retries[index] = retries + 1
+        self.pending[index] = time.monotonic() + self.policy.delay(retries + 1)
+
+    def _resubmit(self, indices: list[int]) -> None:
+        try:
+            part = self.submit([self.elements[i] for i in indices])
+        except Exception as e:
+            for i in indices:
+                self._fail(i, e)
+            return
+        self.parts.append((indices, part, set(range(len(indices)))))
+
+    def _poll(self) -> None:
+        failed = len(self.pending)
+        for indices, part, unsettled in self.parts:
+            try:
+                completed = part.completed()
+            except Exception:
+                # e.g. the default `completed`, which gathers all elements at once
+                completed = range(len(indices)) if part.done() else []
+            for j in [j for j in completed if j in unsettled]:
+                unsettled.discard(j)
+                try:
+                    self.results[indices[j]] = part.gather_at(j)
+                except Exception as e:
+                    self._fail(indices[j], e)
+        self.parts = [p for p in self.parts if p[2]]
+        if len(self.pending) > failed:
+            logger.warning(
+                f"Retrying {len(self.pending)} failed element(s) of node '{self.name}'"
+            )
+        now = time.monotonic()
+        due = sorted(i for i, at in self.pending.items() if at <= now)
+        if due:
+            for i in due:
+                del self.pending[i]
+            self._resubmit(due)
+
+    def done(self) -> bool:
+        self._poll()
+        return len(self.results) + len(self.errors) == len(self.elements)
+
+    def completed(self) -> Sequence[int]:
+        self._poll()
+        return sorted(self.results.keys() | self.errors.keys())
+
+    def cancel(self) -> None:
+        self.pending.clear()
+        for _, part, _ in self.parts:
+            part.cancel()
+        self.parts = []
+
+    def gather_at(self, index: int, *args, **kwargs) -> Any:
+        while index not in self.results and index not in self.errors:
+            time.sleep(self.poll_interval)
+            self._poll()
+        if index in self.errors:
+            raise self.errors[index]
+        return self.results[index]
+
+    def gather(self, *args, **kwargs) -> Sequence[Any]:
+        while not self.done():
+            time.sleep(self.poll_interval)
+        if self.errors:
+            raise self.errors[min(self.errors)]
+        return [self.results[i] for i in range(len(self.elements))]
+
+
+def submit_with_retries(
+    name: str,
+    policy: RetryPolicy,
+    method: Callable[..., Future | FutureSequence],
+    kwargs: dict[str, Any],
+    mapped: bool = False,
+    poll_interval: float = 0.05,
+) -> Future | FutureSequence:
+    """Submit `method` (the `call`, or if `mapped` the `map` or `mapvalues`, method of a
+    node's task) with `kwargs`, such that the result is retried per the `policy`."""
+    if policy.attempts == 0:
+        return method(**kwargs)
+    if mapped:
+        argnames = kwargs["argnames"]
+        return RetryingFutureSequence(
+            name,
+            lambda elements: method(argnames=argnames, argvalues=elements),
+            list(kwargs["argvalues"]),
+            policy,
+            poll_interval,
+        )
+    return RetryingFuture(name, lambda: method(**kwargs), policy, poll_interval)
@@ -5,6 +5,7 @@ from pydantic import Field
 
 from ecoscope_workflows_core.annotations import AnyDataFrame
 from ecoscope_workflows_core.decorators import task
+from ecoscope_workflows_core.executors import TaskResources
 
 ColumnName = Annotated[str, Field(description="Column to aggregate")]
 
@@ -71,7 +72,7 @@ Operations = Literal[
 ]
 
 
-@task
+@task(resources=TaskResources(cheap=True, pure=True))
 def apply_arithmetic_operation(
     a: Annotated[float | int, Field(description="The first number")],
     b: Annotated[float | int, Field(description="The second number")],
@@ -5,6 +5,7 @@ from typing import Annotated
 from pydantic import Field
 
 from ecoscope_workflows_core.decorators import task
+from ecoscope_workflows_core.executors import TaskResources
 
 
 @dataclass
@@ -14,7 +15,7 @@ class TimeRange:
     time_format: str = "%d %b %Y %H:%M:%S %Z"
 
 
-@task
+@task(resources=TaskResources(cheap=True, pure=True))
 def set_time_range(
     since: Annotated[datetime, Field(description="The start time")],
     until: Annotated[datetime, Field(description="The end time")],
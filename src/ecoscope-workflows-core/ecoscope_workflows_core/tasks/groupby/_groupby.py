@@ -6,6 +6,7 @@ from pydantic.json_schema import SkipJsonSchema
 
 from ecoscope_workflows_core.annotations import AnyDataFrame
 from ecoscope_workflows_core.decorators import task
+from ecoscope_workflows_core.executors import TaskResources
 from ecoscope_workflows_core.indexes import CompositeFilter, IndexName, IndexValue
 
 
@@ -40,7 +41,7 @@ class Grouper:
     help_text: str | SkipJsonSchema[None] = None
 
 
-@task
+@task(resources=TaskResources(cheap=True, pure=True))
 def set_groupers(
     groupers: Annotated[
         list[Grouper],
@@ -5,14 +5,17 @@ from pydantic import Field
 from pydantic.json_schema import SkipJsonSchema
 
 from ecoscope_workflows_core.decorators import task
+from ecoscope_workflows_core.executors import TaskResources
 from ecoscope_workflows_core.serde import _persist_text
 
 
 # TODO: Unlike the tasks in `._earthranger`, this is not tagged with `tags=["io"]`,
 # because in the end to end test that tag is used to determine which tasks to mock.
 # Ultimately, we should make the mocking process less brittle, but to get his PR merged,
-# I'm going to leave this as is for now.
-@task
+# I'm going to leave this as is for now. As it is not tagged `io`, its retries (with the
+# same backoff as for `io` tasks) are set explicitly instead; persisting the same text to
+# the same path again is harmless.
+@task(resources=TaskResources(memory=256, retries=3, backoff=1.0))
 def persist_text(
     text: Annotated[str, Field(description="Text to persist")],
     # TODO: get root path from environment variable or other deployment-level config (not user-provided)
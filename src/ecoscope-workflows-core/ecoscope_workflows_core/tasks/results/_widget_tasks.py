@@ -3,6 +3,7 @@ from typing import Annotated
 from pydantic import Field
 
 from ecoscope_workflows_core.decorators import task
+from ecoscope_workflows_core.executors import TaskResources
 from ecoscope_workflows_core.indexes import CompositeFilter
 from ecoscope_workflows_core.tasks.results._widget_types import (
     GroupedWidget,
@@ -14,7 +15,7 @@ from ecoscope_workflows_core.tasks.results._widget_types import (
 from ecoscope_workflows_core.tasks.transformation._unit import Quantity
 
 
-@task
+@task(resources=TaskResources(cheap=True, pure=True))
 def create_map_widget_single_view(
     title: Annotated[str, Field(description="The title of the widget")],
     data: Annotated[
@@ -141,7 +142,7 @@ def create_single_value_widget_single_view(
     )
 
 
-@task
+@task(resources=TaskResources(cheap=True, pure=True))
 def merge_widget_views(
     widgets: Annotated[
         list[WidgetSingleView],
@@ -28,8 +28,16 @@ def create_task_magicmock(anchor: str, func_name: str) -> MockSyncTask:
         return example_return
 
     mock_func.__signature__ = inspect.signature(task.func)  # type: ignore[attr-defined]
-
-    return MockSyncTask(func=mock_func, tags=task.tags, executor=task.executor)
+    # give each mock a distinct importable reference, so that results of different mocked tasks
+    # (or of a mocked task and its real counterpart) never share `cache.task_reference` keys
+    mock_func.__qualname__ = f"mock_{func_name}"
+
+    return MockSyncTask(
+        func=mock_func,
+        tags=task.tags,
+        resources=task.resources,
+        executor=task.executor,
+    )
 
 
 class Assertions(BaseModel):
@@ -43,7 +51,9 @@ class TestCase(BaseModel):
     assertions: Assertions
 
 
-ExecutionMode = Literal["async", "sequential"]  # TODO: move to executors module
+ExecutionMode = Literal[
+    "async", "sequential", "threads"
+]  # TODO: move to executors module
 
 
 def run_cli_test_case(
@@ -57,7 +67,7 @@ def run_cli_test_case(
 
     Args:
         entrypoint (str): The entrypoint of the workflow.
-        execution_mode (ExecutionMode): The execution mode to test. One of "async" or "sequential".
+        execution_mode (ExecutionMode): The execution mode to test. One of "async", "sequential" or "threads".
         mock_io (bool): Whether or not to mock IO with 3rd party services; for testing only.
         case (TestCase): The test case to run. Test cases are defined by the `test-cases.yaml` file.
         tmp_path (Path): The temporary directory to use for the test.
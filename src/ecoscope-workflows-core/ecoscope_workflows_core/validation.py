@@ -0,0 +1,168 @@
+"""The depth to which (Geo)DataFrames are validated at task boundaries.
+
+Tasks called via `_Task.validate` have their inputs and outputs validated by pydantic, and any
+inputs or outputs annotated as `annotations.DataFrame[...]` are in turn validated by pandera.
+By default (`full`), that means every row check of the schema is run against every row of the
+frame, on the way in to and out of each task. For large frames passed between trusted internal
+tasks, that may be much of the cost of a run, so the depth of frame validation can instead be
+reduced for a run, to one of:
+
+- `schema-only`: the columns and dtypes of frames are validated, but rows are not checked.
+- `sample`: as for `schema-only`, plus the row checks are run against a random sample of (at
+  most `sample_rows`) rows of each frame.
+- `off`: frames are not validated.
+
+In every mode, all other parameters (e.g. those given by the user) are still strictly validated.
+"""
+
+import functools
+import inspect
+import typing
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Literal
+
+from pydantic import PositiveInt
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+ValidationMode = Literal["full", "schema-only", "sample", "off"]
+
+DEFAULT_SAMPLE_ROWS = 1000
+
+
+class ValidationSettings(BaseSettings):
+    """Configures the validation mode of tasks from the environment, e.g.
+    `ECOSCOPE_WORKFLOWS_VALIDATION_MODE=schema-only`."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ecoscope_workflows_validation_",
+        case_sensitive=False,
+    )
+
+    mode: ValidationMode = "full"
+    sample_rows: PositiveInt = DEFAULT_SAMPLE_ROWS
+
+
+@contextmanager
+def frame_validation(mode: ValidationMode) -> Iterator[None]:
+    """Within this context, pandera validates frames to the depth of `mode` (with `sample`
+    validating the schema only; see `ValidatedCall` for the sampled row checks)."""
+    # pandera (and so pandas) is imported only once frames are validated
+    from pandera.config import ValidationDepth, config_context
+
+    match mode:
+        case "full":
+            yield
+        case "schema-only" | "sample":
+            with config_context(validation_depth=ValidationDepth.SCHEMA_ONLY):
+                yield
+        case "off":
+            with config_context(validation_enabled=False):
+                yield
+
+
+def _frame_schema(annotation: Any) -> Any | None:
+    # the schema model of a `DataFrame[Schema]` annotation, unless the schema is generic
+    from ecoscope_workflows_core.annotations import is_subscripted_pandera_dataframe
+
+    if not is_subscripted_pandera_dataframe(annotation):
+        return None
+    (schema,) = typing.get_args(annotation)
+    return None if isinstance(schema, typing.TypeVar) else schema
+
+
+class ValidatedCall:
+    """A function validated by `pydantic.validate_call` (the `validator`), called with frames
+    validated to the depth of `mode`. As the mode is held by the callable itself (rather than
+    read from the environment as it is called), it applies wherever the task is executed.
+
+    Examples:
+
+    ```python
+    >>> from pydantic import validate_call
+    >>> validated = ValidatedCall(validate_call(lambda a: a), mode="off")
+    >>> validated(a=1)
+    1
+
+    ```
+    """
+
+    def __init__(
+        self,
+        validator: Callable,
+        mode: ValidationMode,
+        sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    ):
+        self.validator = validator
+        self.mode = mode
+        self.sample_rows = sample_rows
+        # so that, e.g., `cache.task_reference` can find the underlying function
+        self.__wrapped__ = validator
+
+    @functools.cached_property
+    def _schemas(self) -> tuple[inspect.Signature, dict[str, Any], Any | None]:
+        func = inspect.unwrap(self.validator)
+        while isinstance(func, functools.partial):
+            func = inspect.unwrap(func.func)
+        hints = typing.get_type_hints(func)
+        schemas = {
+            name: schema
+            for name, hint in hints.items()
+            if name != "return" and (schema := _frame_schema(hint)) is not None
+        }
+        return inspect.signature(func), schemas, _frame_schema(hints.get("return"))
+
+    def _check_sample(self, schema: Any, value: Any) -> None:
+        from pandera.config import ValidationDepth, config_context
+        from pandera.errors import SchemaError, SchemaErrors
+
+        if value is None:
+            return
+        sample = value.sample(n=min(self.sample_rows, len(value)))
+        with config_context(validation_depth=ValidationDepth.DATA_ONLY):
+            try:
+                schema.validate(sample)
+            except (SchemaError, SchemaErrors) as e:
+                raise ValueError(f"Sampled rows failed validation: {e}") from e
+
+    def __call__(self, *args, **kwargs):
+        if self.mode != "sample":
+            with frame_validation(self.mode):
+                return self.validator(*args, **kwargs)
+        signature, schemas, return_schema = self._schemas
+        if schemas:
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+            for name, schema in schemas.items():
+                if name in arguments:
+                    self._check_sample(schema, arguments[name])
+        with frame_validation(self.mode):
+            result = self.validator(*args, **kwargs)
+        if return_schema is not None:
+            self._check_sample(return_schema, result)
+        return result
+
+
+# bounded, so that the validators of short-lived (e.g. partial) functions are eventually released
+@functools.lru_cache(maxsize=1024)
+def _validated_call(
+    validator: Callable, mode: ValidationMode, sample_rows: int
+) -> ValidatedCall:
+    return ValidatedCall(validator, mode, sample_rows)
+
+
+def with_validation_mode(
+    validator: Callable,
+    mode: ValidationMode | None = None,
+) -> Callable:
+    """Apply `mode` (or, if not given, the mode configured by the environment) to the frames
+    validated by `validator`. In `full` mode, `validator` is returned as is. Otherwise, the
+    same `ValidatedCall` is returned for each (`validator`, `mode`, and sample size), so that
+    anything memoized per task function (e.g. its call plan) is reused across calls.
+    """
+    settings = ValidationSettings()
+    mode = mode or settings.mode
+    if mode == "full":
+        return validator
+    try:
+        return _validated_call(validator, mode, settings.sample_rows)
+    except TypeError:  # not hashable
+        return ValidatedCall(validator, mode, settings.sample_rows)
@@ -0,0 +1,171 @@
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from ecoscope_workflows_core.cache import (
+    LocalDirectoryResultStore,
+    ResultCache,
+    hash_key,
+)
+from ecoscope_workflows_core.decorators import task
+from ecoscope_workflows_core.executors import Future
+from ecoscope_workflows_core.graph import DependsOn, Graph, Node
+
+
+class ValueFuture(Future[int]):
+    def __init__(self, value):
+        self.value = value
+
+    def gather(self):
+        return self.value
+
+
+@pytest.mark.parametrize(
+    "value, suffix",
+    [
+        ("<div>map</div>", ".json"),
+        ({"a": [1, 2]}, ".json"),
+        ([("x", 1), ("y", 2)], ".pickle"),
+        ({1, 2, 3}, ".pickle"),
+    ],
+)
+def test_local_directory_store_roundtrip(tmp_path, value, suffix):
+    store = LocalDirectoryResultStore(tmp_path)
+    store.put("abc", value)
+    assert store.get("abc") == value
+    assert [p.suffix for p in tmp_path.iterdir()] == [suffix]
+    assert "abc" in store
+    store.delete("abc")
+    assert "abc" not in store
+    with pytest.raises(KeyError):
+        store.get("abc")
+
+
+def test_local_directory_store_dataframe_as_parquet(tmp_path):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    store = LocalDirectoryResultStore(tmp_path)
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    store.put("df", df)
+    assert [p.suffix for p in tmp_path.iterdir()] == [".parquet"]
+    pd.testing.assert_frame_equal(store.get("df"), df)
+
+
+def test_result_cache_stats_and_eviction(tmp_path):
+    cache = ResultCache(store=LocalDirectoryResultStore(tmp_path), max_size_bytes=20)
+    assert cache.get("a") == (False, None)
+    cache.put("a", "x" * 10)
+    cache.put("b", "y" * 10)
+    assert cache.get("a") == (True, "x" * 10)
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.writes) == (1, 1, 2)
+    # make "a" older than "b", so it is evicted first
+    os.utime(tmp_path / "a.json", (time.time() - 10, time.time() - 10))
+    assert cache.evict() == ["a"]
+    assert cache.stats.evictions == 1
+    assert "b" in cache.store
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    # room for two of the (12 byte) entries
+    cache = ResultCache(store=LocalDirectoryResultStore(tmp_path), max_size_bytes=30)
+    cache.put("a", "x" * 10)
+    cache.put("b", "y" * 10)
+    # "a" was written first, but was read since "b" was written
+    os.utime(tmp_path / "a.json", (time.time() - 10, time.time() - 10))
+    os.utime(tmp_path / "b.json", (time.time() - 5, time.time() - 5))
+    assert cache.get("a") == (True, "x" * 10)
+    cache.put("c", "z" * 10)
+    assert cache.evict() == ["b"]
+    assert "a" in cache.store
+    # reads do not extend the lifetime of entries
+    assert cache.store.entry("a").mtime < time.time() - 9
+
+
+def test_result_cache_max_age(tmp_path):
+    cache = ResultCache(store=LocalDirectoryResultStore(tmp_path), max_age_seconds=5)
+    cache.put("a", 1)
+    os.utime(tmp_path / "a.json", (time.time() - 10, time.time() - 10))
+    assert cache.get("a") == (False, None)
+    assert "a" not in cache.store
+
+
+def test_hash_key_depends_on_all_parts():
+    assert hash_key("f", {"x": 1}) == hash_key("f", {"x": 1})
+    assert hash_key("f", {"x": 1}) != hash_key("g", {"x": 1})
+    assert hash_key("f", {"x": object}) == hash_key("f", {"x": object})
+
+
+@dataclass
+class Tagged:
+    tags: set[str]
+
+
+def test_hash_key_is_stable_across_processes():
+    # sets of strings iterate in a different order in each process (unless `PYTHONHASHSEED`
+    # is fixed), so they must not be hashed by their pickle
+    script = (
+        "from ecoscope_workflows_core.cache import hash_key; "
+        "print(hash_key({'ab', 'cd', 'ef', 'gh'}, frozenset('xyz'), {1: {'a', 'b'}}))"
+    )
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            env=os.environ | {"PYTHONHASHSEED": str(seed)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        for seed in range(4)
+    }
+    assert len(keys) == 1
+    assert hash_key({"x", "y"}) == hash_key({"y", "x"})
+    assert hash_key(Tagged({"a", "b"})) == hash_key(Tagged({"b", "a"}))
+    assert hash_key(Tagged({"a"})) != hash_key(Tagged({"b"}))
+    assert hash_key({1: "a"}) != hash_key({"1": "a"})
+
+
+def test_graph_reuses_cached_results(tmp_path):
+    calls: list[str] = []
+
+    @task
+    def load(n: int) -> ValueFuture:
+        calls.append("load")
+        return ValueFuture(list(range(n)))
+
+    @task
+    def total(x: list[int]) -> ValueFuture:
+        calls.append("total")
+        return ValueFuture(sum(x))
+
+    @task
+    def style(x: int, color: str) -> ValueFuture:
+        calls.append("style")
+        return ValueFuture(f"{color}: {x}")
+
+    def run(color: str) -> str:
+        dependencies = {"load": [], "total": ["load"], "style": ["total"]}
+        nodes = {
+            "load": Node(load, {"n": 4}),
+            "total": Node(total, {"x": DependsOn("load")}),
+            "style": Node(style, {"x": DependsOn("total"), "color": color}),
+        }
+        cache = ResultCache(store=LocalDirectoryResultStore(tmp_path))
+        graph = Graph(dependencies, nodes, cache=cache)
+        result = graph.execute()
+        return result, cache.stats
+
+    result, stats = run("red")
+    assert result == "red: 6"
+    assert calls == ["load", "total", "style"]
+    assert (stats.hits, stats.misses) == (0, 3)
+
+    calls.clear()
+    result, stats = run("blue")
+    assert result == "blue: 6"
+    assert calls == ["style"]
+    # "load" is not read from the cache, as its only consumer, "total", is restored
+    assert (stats.hits, stats.misses) == (1, 1)
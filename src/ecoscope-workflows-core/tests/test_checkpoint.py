@@ -0,0 +1,139 @@
+import pytest
+
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.decorators import task
+from ecoscope_workflows_core.executors import Future
+from ecoscope_workflows_core.graph import DependsOn, Graph, Node
+
+
+class ValueFuture(Future[int]):
+    def __init__(self, value):
+        self.value = value
+
+    def gather(self):
+        return self.value
+
+
+def test_checkpoint_from_env_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("ECOSCOPE_WORKFLOWS_CHECKPOINT_DIR", raising=False)
+    checkpoint = Checkpoint.from_env()
+    assert not checkpoint.enabled
+    assert checkpoint.restore_or_call("x", lambda: 1) == 1
+    assert checkpoint.restore("x") == (False, None)
+
+
+def test_checkpoint_from_env_resume(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_CHECKPOINT_DIR", tmp_path.as_posix())
+    first = Checkpoint.from_env()
+    assert first.enabled
+    first.save("x", {"a": 1})
+    assert tmp_path.joinpath(first.run_id).is_dir()
+
+    # a new run does not see checkpoints from the first run ...
+    assert Checkpoint.from_env().restore("x") == (False, None)
+    # ... unless it resumes it by run ID
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_CHECKPOINT_RUN_ID", first.run_id)
+    assert Checkpoint.from_env().restore("x") == (True, {"a": 1})
+
+
+def test_graph_resume_failed_run(tmp_path):
+    calls: list[str] = []
+    fail = True
+
+    @task
+    def load(n: int) -> ValueFuture:
+        calls.append("load")
+        return ValueFuture(n)
+
+    @task
+    def flaky_upload(x: int) -> ValueFuture:
+        calls.append("upload")
+        if fail:
+            raise ValueError("upload failed")
+        return ValueFuture(x * 10)
+
+    dependencies = {"load": [], "upload": ["load"]}
+    nodes = {
+        "load": Node(load, {"n": 4}),
+        "upload": Node(flaky_upload, {"x": DependsOn("load")}),
+    }
+    checkpoint = Checkpoint.from_dir(tmp_path)
+    with pytest.raises(ValueError, match="upload failed"):
+        Graph(dependencies, nodes, checkpoint=checkpoint).execute()
+    assert calls == ["load", "upload"]
+
+    calls.clear()
+    fail = False
+    resumed = Checkpoint.from_dir(tmp_path, run_id=checkpoint.run_id)
+    assert Graph(dependencies, nodes, checkpoint=resumed).execute() == 40
+    assert calls == ["upload"]
+
+
+def test_graph_resume_restores_only_needed_results(tmp_path):
+    fail = True
+
+    @task
+    def load(n: int) -> ValueFuture:
+        return ValueFuture(n)
+
+    @task
+    def scale(x: int) -> ValueFuture:
+        return ValueFuture(x * 10)
+
+    @task
+    def flaky_upload(x: int) -> ValueFuture:
+        if fail:
+            raise ValueError("upload failed")
+        return ValueFuture(f"uploaded {x}")
+
+    dependencies = {"load": [], "scale": ["load"], "upload": ["scale"]}
+    nodes = {
+        "load": Node(load, {"n": 4}),
+        "scale": Node(scale, {"x": DependsOn("load")}),
+        "upload": Node(flaky_upload, {"x": DependsOn("scale")}),
+    }
+    checkpoint = Checkpoint.from_dir(tmp_path)
+    with pytest.raises(ValueError, match="upload failed"):
+        Graph(dependencies, nodes, checkpoint=checkpoint).execute()
+
+    fail = False
+    resumed = Checkpoint.from_dir(tmp_path, run_id=checkpoint.run_id)
+    read: list[str] = []
+    get = resumed.store.get
+
+    def spy(key: str):
+        read.append(key)
+        return get(key)
+
+    resumed.store.get = spy  # type: ignore[method-assign]
+    assert Graph(dependencies, nodes, checkpoint=resumed).execute() == "uploaded 40"
+    # the result of "load" is never read, as "scale" is restored rather than rerun
+    assert "scale" in read
+    assert "load" not in read
+
+
+def test_checkpoint_resume_with_changed_inputs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_CHECKPOINT_DIR", tmp_path.as_posix())
+    inputs = {"spec": "abc", "params": {"load": {"n": 4}}}
+    first = Checkpoint.from_env(inputs=inputs)
+    first.save("load", 4)
+
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_CHECKPOINT_RUN_ID", first.run_id)
+    assert Checkpoint.from_env(inputs=inputs).restore("load") == (True, 4)
+    # results checkpointed for other params (or another spec) are never restored
+    changed = {"spec": "abc", "params": {"load": {"n": 5}}}
+    with pytest.raises(ValueError, match="inputs .* have changed"):
+        Checkpoint.from_env(inputs=changed)
+    with pytest.raises(ValueError, match="inputs .* have changed"):
+        Checkpoint.from_env(inputs=inputs | {"spec": "def"})
+
+
+@pytest.mark.parametrize("keep_completed", [False, True])
+def test_checkpoint_complete(tmp_path, keep_completed: bool):
+    checkpoint = Checkpoint.from_dir(tmp_path, keep_completed=keep_completed)
+    checkpoint.verify({"params": {}})
+    checkpoint.restore_or_call("x", lambda: 1)
+    checkpoint.complete()
+    assert tmp_path.joinpath(checkpoint.run_id).exists() == keep_completed
@@ -0,0 +1,186 @@
+import shutil
+from textwrap import dedent
+
+import click
+import pytest
+import ruamel.yaml
+from click.testing import CliRunner
+
+from ecoscope_workflows_core.__main__ import compile_many, compile_spec, find_specs
+from ecoscope_workflows_core.artifacts import (
+    FINGERPRINTS_FILENAME,
+    load_fingerprints,
+    save_fingerprints,
+    stale_artifacts,
+)
+from ecoscope_workflows_core.compiler import TEMPLATES, DagCompiler, Spec
+
+yaml = ruamel.yaml.YAML(typ="safe")
+
+SPEC = dedent(
+    """\
+    id: incremental
+    requirements:
+      - name: ecoscope-workflows-core
+        version: "*"
+        channel: file:///tmp/ecoscope-workflows/release/artifacts/
+    workflow:
+      - name: Set Groupers
+        id: groupers
+        task: set_groupers
+      - name: Set Time Range
+        id: time_range
+        task: set_time_range
+    """
+)
+
+
+def _compiler(spec_text: str = SPEC, **kws) -> DagCompiler:
+    return DagCompiler(spec=Spec(**yaml.load(spec_text)), **kws)
+
+
+def test_artifact_fingerprints_stable():
+    assert _compiler().get_artifact_fingerprints() == (
+        _compiler().get_artifact_fingerprints()
+    )
+
+
+def test_artifact_fingerprints_template_changed(tmp_path):
+    templates = tmp_path / "templates"
+    shutil.copytree(TEMPLATES, templates)
+    before = _compiler(jinja_templates_dir=templates).get_artifact_fingerprints()
+    with templates.joinpath("pkg", "dags", "run_async.jinja2").open("a") as f:
+        f.write("\n# changed\n")
+    after = _compiler(jinja_templates_dir=templates).get_artifact_fingerprints()
+    assert {k for k in after if after[k] != before[k]} == {
+        "ecoscope_workflows_incremental_workflow/dags/run_async.py",
+        "ecoscope_workflows_incremental_workflow/dags/run_async_mock_io.py",
+    }
+
+
+def test_artifact_fingerprints_spec_changed():
+    before = _compiler().get_artifact_fingerprints()
+    # renaming a task changes every artifact, but not the dependencies
+    renamed = _compiler(SPEC.replace("Set Groupers", "Groupers"))
+    after = renamed.get_artifact_fingerprints()
+    assert {k for k in after if after[k] == before[k]} == {"pixi.lock"}
+    # whereas changing a requirement changes the dependencies
+    pinned = _compiler(SPEC.replace('version: "*"', 'version: "1.0.0"'))
+    assert pinned.get_artifact_fingerprints()["pixi.lock"] != before["pixi.lock"]
+
+
+def test_sequential_dag_completes_checkpoint():
+    dag = _compiler().render_dag("sequential")
+    spec_sha256 = _compiler().spec.sha256
+    # the checkpoint is verified against the run's inputs, and completed once all tasks are
+    assert f'"spec": "{spec_sha256}",\n            "params": params_dict,' in dag
+    assert dag.index("checkpoint.complete()") > dag.index("time_range = ")
+
+
+def test_stale_artifacts(tmp_path):
+    assert load_fingerprints(tmp_path) == {}
+    tmp_path.joinpath("README.md").write_text("# README")
+    save_fingerprints(tmp_path, {"README.md": "a", "Dockerfile": "b"})
+    assert load_fingerprints(tmp_path) == {"README.md": "a", "Dockerfile": "b"}
+    # the Dockerfile was never written
+    assert stale_artifacts(tmp_path, {"README.md": "a", "Dockerfile": "b"}) == {
+        "Dockerfile"
+    }
+    assert stale_artifacts(tmp_path, {"README.md": "c"}) == {"README.md"}
+
+
+@pytest.mark.skipif(shutil.which("dot") is None, reason="requires graphviz")
+def test_compile_incremental(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    tmp_path.joinpath("spec.yaml").write_text(SPEC)
+    release_dir = tmp_path / "ecoscope-workflows-incremental-workflow"
+
+    def compile_incremental(spec_text: str = SPEC):
+        compile_spec(spec_text, "spec.yaml", False, False, False, incremental=True)
+
+    compile_incremental()
+    fingerprints = load_fingerprints(release_dir)
+    # not locked, so the lockfile remains stale
+    assert "pixi.lock" not in fingerprints
+    readme = release_dir / "README.md"
+    readme.write_text("edited")
+    compile_incremental()
+    assert readme.read_text() == "edited"
+    # an artifact which is removed is regenerated, but nothing else is rewritten
+    release_dir.joinpath("Dockerfile").unlink()
+    compile_incremental()
+    assert release_dir.joinpath("Dockerfile").exists()
+    assert readme.read_text() == "edited"
+    assert load_fingerprints(release_dir) == fingerprints
+    # a changed spec regenerates its artifacts
+    compile_incremental(SPEC.replace("Set Groupers", "Groupers"))
+    assert readme.read_text() != "edited"
+    assert release_dir.joinpath(FINGERPRINTS_FILENAME).exists()
+
+
+@pytest.mark.skipif(shutil.which("dot") is None, reason="requires graphviz")
+def test_compile_spec_resolves_release_dir_up_front(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    tmp_path.joinpath("spec.yaml").write_text(SPEC)
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    generate_artifacts = DagCompiler.generate_artifacts
+
+    def generate_then_chdir(self, spec_relpath: str):
+        # as if another thread (e.g. of `compile-many`) changed the working directory
+        artifacts = generate_artifacts(self, spec_relpath)
+        monkeypatch.chdir(elsewhere)
+        return artifacts
+
+    monkeypatch.setattr(DagCompiler, "generate_artifacts", generate_then_chdir)
+    compile_spec(SPEC, "spec.yaml", False, False, False)
+    assert tmp_path.joinpath("ecoscope-workflows-incremental-workflow").is_dir()
+    assert not any(elsewhere.iterdir())
+
+
+def test_find_specs(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    for name in ("a", "b"):
+        tmp_path.joinpath("examples", name).mkdir(parents=True)
+        tmp_path.joinpath("examples", name, "spec.yaml").write_text(SPEC)
+    tmp_path.joinpath("other.yaml").write_text(SPEC)
+    expected = ["examples/a/spec.yaml", "examples/b/spec.yaml"]
+    assert find_specs(["examples"]) == expected
+    assert find_specs(["examples/*"]) == expected
+    assert find_specs(["examples/*/spec.yaml", "examples/a"]) == expected
+    assert find_specs(["other.yaml", "examples/b"]) == [
+        "other.yaml",
+        "examples/b/spec.yaml",
+    ]
+    with pytest.raises(click.BadParameter, match="No specs found for 'missing'"):
+        find_specs(["missing"])
+
+
+@pytest.mark.skipif(shutil.which("dot") is None, reason="requires graphviz")
+def test_compile_many(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    for name in ("a", "b"):
+        tmp_path.joinpath("examples", name).mkdir(parents=True)
+        spec = SPEC.replace("id: incremental", f"id: incremental_{name}")
+        tmp_path.joinpath("examples", name, "spec.yaml").write_text(spec)
+    result = CliRunner().invoke(
+        compile_many, ["examples", "--no-lock", "--workers", "2"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "examples/a/spec.yaml" in result.output
+    assert "Compiled 2 spec(s) with 2 worker(s)" in result.output
+    for name in ("a", "b"):
+        release_dir = (
+            tmp_path
+            / "examples"
+            / name
+            / f"ecoscope-workflows-incremental-{name}-workflow"
+        )
+        assert release_dir.joinpath("pixi.toml").exists()
+    # each spec is compiled (or fails) independently of the others
+    result = CliRunner().invoke(compile_many, ["examples", "--no-lock"])
+    assert result.exit_code == 1
+    assert result.output.count("FileExistsError") == 2
+    assert (
+        "Failed to compile: examples/a/spec.yaml, examples/b/spec.yaml" in result.output
+    )
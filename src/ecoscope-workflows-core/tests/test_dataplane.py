@@ -0,0 +1,161 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ecoscope_workflows_core.cache import LocalDirectoryResultStore, ResultCache
+from ecoscope_workflows_core.checkpoint import Checkpoint
+from ecoscope_workflows_core.dataplane import DataPlane, ResultRef, find_refs, resolve
+from ecoscope_workflows_core.decorators import task
+from ecoscope_workflows_core.graph import DependsOn, Graph, Node
+
+
+@pytest.fixture
+def large_df() -> pd.DataFrame:
+    return pd.DataFrame({"x": range(10_000)})
+
+
+def test_offload_threshold(tmp_path: Path, large_df: pd.DataFrame):
+    plane = DataPlane(tmp_path.as_posix(), min_bytes=1024)
+    small_df = large_df.head(2)
+    assert plane.offload(small_df) is small_df
+    assert plane.offload("not a frame") == "not a frame"
+    ref = plane.offload(large_df)
+    assert isinstance(ref, ResultRef)
+    assert Path(ref.uri).parent == tmp_path / plane.run_id
+    pd.testing.assert_frame_equal(resolve(ref), large_df)
+
+
+def test_offload_nested(tmp_path: Path, large_df: pd.DataFrame):
+    plane = DataPlane(tmp_path.as_posix(), min_bytes=1024)
+    offloaded = plane.offload([("a", large_df), ("b", large_df)])
+    assert [k for k, _ in offloaded] == ["a", "b"]
+    assert all(isinstance(ref, ResultRef) for _, ref in offloaded)
+    for (_, df), (_, expected) in zip(resolve(offloaded), [("a", large_df)] * 2):
+        pd.testing.assert_frame_equal(df, expected)
+    plane.cleanup()
+    assert not (tmp_path / plane.run_id).exists()
+
+
+def test_offload_dict(tmp_path: Path, large_df: pd.DataFrame):
+    plane = DataPlane(tmp_path.as_posix(), min_bytes=1024)
+    offloaded = plane.offload({"a": large_df, "b": [large_df], "c": 1})
+    assert isinstance(offloaded["a"], ResultRef)
+    assert isinstance(offloaded["b"][0], ResultRef)
+    assert offloaded["c"] == 1
+    assert len(find_refs(offloaded)) == 2
+    resolved = resolve(offloaded)
+    pd.testing.assert_frame_equal(resolved["a"], large_df)
+    pd.testing.assert_frame_equal(resolved["b"][0], large_df)
+
+
+def _graph(plane: DataPlane, executor, **kwargs) -> Graph:
+    received: list[type] = []
+
+    @task
+    def make(n: int) -> pd.DataFrame:
+        return pd.DataFrame({"x": range(n)})
+
+    @task
+    def split(df: pd.DataFrame) -> list[tuple[str, pd.DataFrame]]:
+        received.append(type(df))
+        return [("even", df[df.x % 2 == 0]), ("odd", df[df.x % 2 == 1])]
+
+    @task
+    def total(df: pd.DataFrame) -> int:
+        received.append(type(df))
+        return int(df.x.sum())
+
+    @task
+    def combine(totals: list[tuple[str, int]]) -> dict[str, int]:
+        return dict(totals)
+
+    dependencies = {
+        "make": [],
+        "split": ["make"],
+        "total": ["split"],
+        "combine": ["total"],
+    }
+    nodes = {
+        "make": Node(make.set_executor(executor), {"n": 10_000}),
+        "split": Node(split.set_executor(executor), {"df": DependsOn("make")}),
+        "total": Node(
+            total.set_executor(executor),
+            method="mapvalues",
+            kwargs={"argnames": ["df"], "argvalues": DependsOn("split")},
+        ),
+        "combine": Node(combine.set_executor(executor), {"totals": DependsOn("total")}),
+    }
+    graph = Graph(dependencies, nodes, dataplane=plane, **kwargs)
+    graph.received = received  # type: ignore[attr-defined]
+    return graph
+
+
+def test_graph_dataplane(tmp_path: Path):
+    plane = DataPlane(tmp_path.as_posix(), min_bytes=1024)
+    graph = _graph(plane, "threads", scheduler="as-completed")
+    expected = {"even": sum(range(0, 10_000, 2)), "odd": sum(range(1, 10_000, 2))}
+    assert graph.execute() == expected
+    # frames are resolved for the task functions, which never see references
+    assert graph.received == [pd.DataFrame] * 3  # type: ignore[attr-defined]
+    # intermediate results are cleaned up at the end of the run
+    assert not (tmp_path / plane.run_id).exists()
+
+
+def test_graph_dataplane_persisted_for_checkpoint(tmp_path: Path):
+    plane = DataPlane((tmp_path / "plane").as_posix(), min_bytes=1024)
+    checkpoint = Checkpoint.from_dir(tmp_path / "checkpoints", keep_completed=True)
+    graph = _graph(plane, "threads", checkpoint=checkpoint)
+    graph.execute()
+    # the checkpoint holds a reference, which must outlive the run to be resumable
+    restored, ref = checkpoint.restore("make")
+    assert restored
+    assert isinstance(ref, ResultRef)
+    assert len(resolve(ref)) == 10_000
+    # to a copy owned by the checkpoint, as the run's own results are cleaned up
+    assert (
+        Path(ref.uri).parent == tmp_path / "plane" / "checkpoints" / checkpoint.run_id
+    )
+    assert not (tmp_path / "plane" / plane.run_id).exists()
+    checkpoint.discard()
+    assert not Path(ref.uri).exists()
+    assert not (tmp_path / "checkpoints" / checkpoint.run_id).exists()
+
+
+def test_graph_dataplane_completed_checkpoint_discarded(tmp_path: Path):
+    plane = DataPlane((tmp_path / "plane").as_posix(), min_bytes=1024)
+    checkpoint = Checkpoint.from_dir(tmp_path / "checkpoints")
+    _graph(plane, "threads", checkpoint=checkpoint).execute()
+    assert checkpoint.restore("make") == (False, None)
+    assert not (tmp_path / "checkpoints" / checkpoint.run_id).exists()
+    # nothing at all is left in the data plane
+    assert not any(p.is_file() for p in (tmp_path / "plane").rglob("*"))
+
+
+def test_graph_dataplane_cached_results_evicted(tmp_path: Path):
+    cache = ResultCache(store=LocalDirectoryResultStore(tmp_path / "cache"))
+
+    def run() -> Graph:
+        plane = DataPlane((tmp_path / "plane").as_posix(), min_bytes=1024)
+        graph = _graph(plane, "threads", cache=cache)
+        assert graph.execute()["odd"] == sum(range(1, 10_000, 2))
+        assert not (tmp_path / "plane" / plane.run_id).exists()
+        return graph
+
+    run()
+    refs = [r for e in cache.store.entries() for r in cache.store.references(e.key)]
+    # "make" and both elements of "split" are persisted by reference
+    assert len(refs) == 3
+    assert all(Path(r.uri).exists() for r in refs)
+    # and are restored from the cache in later runs
+    assert run().received == []  # type: ignore[attr-defined]
+    cache.max_size_bytes = 0
+    cache.evict()
+    assert not any(Path(r.uri).exists() for r in refs)
+    assert not any(p.is_file() for p in (tmp_path / "plane").rglob("*"))
+
+
+def test_graph_dataplane_lithops(tmp_path: Path):
+    plane = DataPlane(tmp_path.as_posix(), min_bytes=1024)
+    graph = _graph(plane, "lithops")
+    assert graph.execute()["odd"] == sum(range(1, 10_000, 2))
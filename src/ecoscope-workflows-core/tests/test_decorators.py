@@ -3,6 +3,7 @@ from dataclasses import FrozenInstanceError
 import pytest
 
 from ecoscope_workflows_core.decorators import task
+from ecoscope_workflows_core.executors import TaskResources
 
 
 def test_frozen():
@@ -165,3 +166,34 @@ def test_partial_validate_chain():
         return a
 
     assert f.partial(a="1").validate().call() == 1
+
+
+def test_resources():
+    @task(resources=TaskResources(memory=2048, timeout=600))
+    def f(a: int) -> int:
+        return a
+
+    assert f.resources == TaskResources(memory=2048, timeout=600)
+    # resources are carried through the task's transformations
+    assert f.validate().partial(a=1).resources == f.resources
+    assert f.set_executor("threads").set_executor("python").resources == f.resources
+    # tasks without hints have the default (empty) resources
+    assert task(lambda: None).resources == TaskResources()
+
+
+def test_call_plan_memoized():
+    @task
+    def f(a: int, b: int = 2) -> int:
+        return a + b
+
+    # plans and validators are built once per function, and shared by derived tasks
+    assert f.plan is f.set_executor("threads").plan
+    assert f.validate().func is f.validate().func
+    assert dict(f.plan.defaults) == {"b": 2}
+
+    # partials derive their defaults from the plan of the function they wrap
+    g = f.partial(b=3)
+    assert dict(g.plan.defaults) == {"b": 3}
+    assert g.plan is g.plan
+    assert g.map(argnames="a", argvalues=[1, 2]) == [4, 5]
+    assert f.validate().call("1") == 3
@@ -1,9 +1,27 @@
+import concurrent.futures
+import gc
+import os
+import threading
+import time
 from dataclasses import FrozenInstanceError
+from multiprocessing.shared_memory import SharedMemory
 
+import pandas as pd
 import pytest
 
 from ecoscope_workflows_core.decorators import task
-from ecoscope_workflows_core.executors import LithopsExecutor, PythonExecutor
+from ecoscope_workflows_core.executors import (
+    BoundedExecutor,
+    ConcurrencyLimits,
+    LithopsExecutor,
+    ProcessPoolAsyncExecutor,
+    PythonExecutor,
+    SpeculativeExecutor,
+    TaskResources,
+    ThreadPoolAsyncExecutor,
+)
+from ecoscope_workflows_core.executors.processes import _dump, _load, _SharedBuffer
+from ecoscope_workflows_core.graph import DependsOn, Graph, Node
 
 
 def test_default_python_executor():
@@ -97,3 +115,502 @@ def test_lithops_executor_mapvalues():
         [("x", 1), ("y", 2), ("z", 3)],
     )
     assert future.gather() == [("x", 2), ("y", 4), ("z", 6)]
+
+
+def test_threads_executor_shares_pool():
+    @task
+    def f(a: int) -> int:
+        return a
+
+    assert isinstance(f.set_executor("threads").executor, ThreadPoolAsyncExecutor)
+    assert (
+        f.set_executor("threads").executor.pool
+        is f.set_executor("threads").executor.pool
+    )
+
+
+def test_threads_executor_validate_partial_map():
+    @task
+    def f(a: int, b: int) -> int:
+        return a + b
+
+    future = (
+        f.validate()
+        .partial(a="1")
+        .set_executor("threads")
+        .map(argnames=["b"], argvalues=[("1",), ("2",), ("3",)])
+    )
+    assert future.gather() == [2, 3, 4]
+    assert future.done()
+
+
+def test_threads_executor_mapvalues():
+    @task
+    def f(a: int) -> int:
+        return a * 2
+
+    future = f.set_executor("threads").mapvalues(
+        ["a"],
+        [("x", 1), ("y", 2), ("z", 3)],
+    )
+    assert future.gather() == [("x", 2), ("y", 4), ("z", 6)]
+
+
+def test_threads_executor_runs_branches_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    @task
+    def wait(name: str) -> str:
+        # both branches must be running at the same time to pass the barrier
+        barrier.wait()
+        return name
+
+    @task
+    def join(a: str, b: str) -> str:
+        return a + b
+
+    dependencies = {"A": [], "B": [], "C": ["A", "B"]}
+    nodes = {
+        "A": Node(wait.set_executor("threads"), {"name": "a"}),
+        "B": Node(wait.set_executor("threads"), {"name": "b"}),
+        "C": Node(
+            join.set_executor("threads"), {"a": DependsOn("A"), "b": DependsOn("B")}
+        ),
+    }
+    graph = Graph(dependencies, nodes, scheduler="as-completed")
+    assert graph.execute() == "ab"
+
+
+def test_processes_payload_shares_large_buffers():
+    df = pd.DataFrame({"x": range(100_000), "y": [1.5] * 100_000})
+    payload = _dump({"df": df}, min_shared_bytes=1024)
+    assert any(isinstance(b, _SharedBuffer) for b in payload.buffers)
+    # the frame's columns travel out-of-band, not in the pickle stream itself
+    assert len(payload.data) < 10_000
+    loaded = _load(payload)["df"]
+    pd.testing.assert_frame_equal(loaded, df)
+    # loaded arrays are writable copies, independent of the (now unlinked) segment
+    loaded.loc[0, "x"] = -1
+    assert loaded.loc[0, "x"] == -1
+
+
+def _segment_exists(name: str) -> bool:
+    try:
+        shm = SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    shm.close()
+    return True
+
+
+def _wait_released(names: list[str], timeout: float = 5.0) -> bool:
+    # segments are released by a callback once the call is done, so may take a moment
+    deadline = time.monotonic() + timeout
+    while any(_segment_exists(n) for n in names):
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+def _frame(n: int) -> pd.DataFrame:
+    return pd.DataFrame({"x": range(n)})
+
+
+def _frame_unless_zero(n: int) -> pd.DataFrame:
+    if n == 0:
+        raise ValueError("zero")
+    time.sleep(0.2)
+    return pd.DataFrame({"x": range(n)})
+
+
+def test_processes_executor_releases_results_never_gathered():
+    executor = ProcessPoolAsyncExecutor(min_shared_bytes=1024)
+    cancelled = executor.call(_frame, 100_000)
+    names = [b.name for b in cancelled.future.result().shared]
+    assert names and all(_segment_exists(n) for n in names)
+    cancelled.cancel()
+    assert _wait_released(names)
+    # as are those of futures which are dropped without being gathered
+    dropped = executor.call(_frame, 100_000)
+    names = [b.name for b in dropped.future.result().shared]
+    del dropped
+    gc.collect()
+    assert _wait_released(names)
+    # whereas gathering a result releases its segments as it is loaded
+    gathered = executor.call(_frame, 100_000)
+    assert len(gathered.gather()) == 100_000
+    gathered.cancel()
+    assert len(gathered.gather()) == 100_000
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="requires /dev/shm")
+def test_python_executor_process_pool_releases_results_on_failure():
+    def segments() -> set[str]:
+        return {n for n in os.listdir("/dev/shm") if n.startswith("psm_")}
+
+    before = segments()
+    executor = PythonExecutor(pool="processes", max_workers=2)
+    with pytest.raises(ValueError, match="zero"):
+        executor.map(_frame_unless_zero, [0, 300_000, 300_000])
+    # the results of the elements which succeeded are never gathered, but are released
+    # (once the elements, which are still running as the first fails, are done)
+    time.sleep(1.0)
+    assert not segments() - before
+
+
+def test_processes_executor_validate_partial():
+    @task
+    def f(a: int, b: int) -> int:
+        return a + b
+
+    future = f.validate().partial(b="2").set_executor("processes").call(a="1")
+    assert isinstance(future.gather(), int)
+    assert future.gather() == 3
+
+
+def test_processes_executor_dataframe_mapvalues():
+    @task
+    def total(df: pd.DataFrame, column: str) -> pd.DataFrame:
+        return df[[column]].sum().to_frame().T
+
+    executor = ProcessPoolAsyncExecutor(min_shared_bytes=1024)
+    frames = [(str(i), pd.DataFrame({"x": range(i * 10_000)})) for i in (1, 2)]
+    future = (
+        total.partial(column="x")
+        .set_executor(executor)
+        .mapvalues(argnames=["df"], argvalues=frames)
+    )
+    gathered = future.gather()
+    assert [k for k, _ in gathered] == ["1", "2"]
+    assert [int(v["x"].iloc[0]) for _, v in gathered] == [
+        sum(range(10_000)),
+        sum(range(20_000)),
+    ]
+
+
+@pytest.mark.parametrize("pool", ["threads", "processes"])
+def test_python_executor_pool_preserves_order(pool):
+    @task
+    def f(a: int, b: int) -> int:
+        # later elements finish first, but results must still come back in order
+        import time
+
+        time.sleep((5 - a) * 0.01)
+        return a * b
+
+    executor = PythonExecutor(pool=pool, max_workers=4)
+    mapped = (
+        f.partial(b=10).set_executor(executor).map(argnames="a", argvalues=range(5))
+    )
+    assert mapped == [0, 10, 20, 30, 40]
+    mapped_values = (
+        f.partial(b=2)
+        .set_executor(executor)
+        .mapvalues(argnames=["a"], argvalues=[("x", 3), ("y", 1), ("z", 2)])
+    )
+    assert mapped_values == [("x", 6), ("y", 2), ("z", 4)]
+
+
+def test_python_executor_from_env(monkeypatch):
+    assert PythonExecutor.from_env().pool is None
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_PYTHON_EXECUTOR_POOL", "threads")
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_PYTHON_EXECUTOR_MAX_WORKERS", "2")
+    executor = PythonExecutor.from_env()
+    assert (executor.pool, executor.max_workers) == ("threads", 2)
+    assert executor.map(lambda kw: kw["a"] + 1, [{"a": 1}, {"a": 2}]) == [2, 3]
+
+
+@pytest.mark.parametrize("executor", ["threads", "processes", "lithops"])
+def test_futures_sequence_as_completed(executor):
+    @task
+    def f(seconds: float) -> float:
+        import time
+
+        time.sleep(seconds)
+        return seconds
+
+    futures = f.set_executor(executor).map(
+        argnames="seconds", argvalues=[0.5, 0.0, 0.1]
+    )
+    pairs = list(futures.as_completed(poll_interval=0.01))
+    assert sorted(pairs) == [(0, 0.5), (1, 0.0), (2, 0.1)]
+    if executor == "threads":
+        # the slowest element is yielded last, rather than first. (workers of the other
+        # executors start up one by one, so the order in which they complete is unreliable)
+        assert pairs[-1] == (0, 0.5)
+    assert futures.gather() == [0.5, 0.0, 0.1]
+
+
+class ConcurrencyProbe:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def __call__(self, x: int) -> int:
+        import time
+
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        return x
+
+
+@pytest.mark.parametrize(
+    "limits, tags, expected_peak",
+    [
+        (ConcurrencyLimits(max_in_flight=2), [], 2),
+        (ConcurrencyLimits(tags={"io": 1}), ["io"], 1),
+        # untagged tasks are not limited by tag caps (only by the size of the thread pool)
+        (ConcurrencyLimits(tags={"io": 1}), [], None),
+        (ConcurrencyLimits(tasks={"probe": 3}), [], 3),
+    ],
+)
+def test_bounded_executor_caps_in_flight(limits, tags, expected_peak):
+    probe = ConcurrencyProbe()
+
+    def probe_func(x: int) -> int:
+        return probe(x)
+
+    probe_func.__name__ = probe_func.__qualname__ = "probe"
+    executor = BoundedExecutor(ThreadPoolAsyncExecutor(), limits, poll_interval=0.01)
+    mapped = (
+        task(probe_func, tags=tags)
+        .set_executor(executor)
+        .mapvalues(argnames="x", argvalues=[(str(i), i) for i in range(6)])
+    )
+    assert mapped.gather() == [(str(i), i) for i in range(6)]
+    if expected_peak is None:
+        assert probe.peak > 1
+    else:
+        assert probe.peak == expected_peak
+
+
+def test_bounded_executor_caps_fused_chain_members():
+    probe = ConcurrencyProbe()
+
+    def probe_func(x: int) -> int:
+        return probe(x)
+
+    def label(x: int) -> str:
+        return f"x={x}"
+
+    probe_func.__name__ = probe_func.__qualname__ = "probe"
+    executor = BoundedExecutor(
+        ThreadPoolAsyncExecutor(),
+        ConcurrencyLimits(tasks={"probe": 1}),
+        poll_interval=0.01,
+    )
+    graph = Graph(
+        dependencies={"probed": [], "labelled": ["probed"]},
+        nodes={
+            "probed": Node(
+                task(probe_func, tags=["io"]).set_executor(executor),
+                method="mapvalues",
+                kwargs={
+                    "argnames": "x",
+                    "argvalues": [(str(i), i) for i in range(4)],
+                },
+            ),
+            "labelled": Node(
+                task(label).set_executor(executor),
+                method="mapvalues",
+                kwargs={"argnames": "x", "argvalues": DependsOn("probed")},
+            ),
+        },
+    )
+    [(_, fused)] = graph.fused().nodes.items()
+    assert fused.async_task.func.names == ["probe", "label"]
+    assert fused.async_task.func.tags == ["io"]
+    # the chain is capped as its (capped) head task would be alone
+    assert graph.execute() == [(str(i), f"x={i}") for i in range(4)]
+    assert probe.peak == 1
+
+
+def test_bounded_executor_call_blocks_until_capacity():
+    probe = ConcurrencyProbe()
+    executor = BoundedExecutor(
+        ThreadPoolAsyncExecutor(),
+        ConcurrencyLimits(max_in_flight=1),
+        poll_interval=0.01,
+    )
+    futures = [executor.call(probe, x=i) for i in range(3)]
+    assert [f.gather() for f in futures] == [0, 1, 2]
+    assert probe.peak == 1
+
+
+def test_bounded_executor_from_env(monkeypatch):
+    executor = ThreadPoolAsyncExecutor()
+    assert BoundedExecutor.from_env(executor) is executor
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_CONCURRENCY_TAGS", '{"io": 4}')
+    bounded = BoundedExecutor.from_env(executor)
+    assert isinstance(bounded, BoundedExecutor)
+    assert bounded.limits == ConcurrencyLimits(tags={"io": 4})
+
+
+@pytest.mark.parametrize(
+    "tags, pure, attempts",
+    [
+        ([], True, 2),
+        (["io"], True, 1),
+        # tasks which are not known to be free of side effects are never run twice
+        ([], False, 1),
+    ],
+)
+def test_speculative_executor_resubmits_stragglers(tags, pure, attempts):
+    lock = threading.Lock()
+    calls: dict[int, int] = {}
+
+    def straggle(x: int) -> int:
+        import time
+
+        with lock:
+            calls[x] = calls.get(x, 0) + 1
+            first = calls[x] == 1
+        # the first attempt at element 0 straggles, but a second attempt does not
+        time.sleep(1.0 if (x == 0 and first) else 0.05)
+        return x * 10
+
+    executor = SpeculativeExecutor(
+        ThreadPoolAsyncExecutor(), quantile=0.5, multiple=2.0, poll_interval=0.01
+    )
+    start = time.monotonic()
+    mapped = (
+        task(straggle, tags=tags, resources=TaskResources(pure=pure))
+        .set_executor(executor)
+        .map(argnames="x", argvalues=range(4))
+    )
+    assert mapped.gather() == [0, 10, 20, 30]
+    assert calls[0] == attempts
+    assert all(calls[x] == 1 for x in (1, 2, 3))
+    if attempts == 2:
+        assert time.monotonic() - start < 0.8
+
+
+def test_speculative_executor_times_elements_from_their_start():
+    def slow(x: int) -> int:
+        import time
+
+        time.sleep(0.2)
+        return x
+
+    # only one element runs at a time, so the last elements wait far longer than `multiple`
+    # times the median duration before they start, but none of them straggles once started
+    bounded = BoundedExecutor(
+        ThreadPoolAsyncExecutor(),
+        ConcurrencyLimits(max_in_flight=1),
+        poll_interval=0.01,
+    )
+    executor = SpeculativeExecutor(
+        bounded, quantile=0.25, multiple=1.5, poll_interval=0.01
+    )
+    futures = executor.map(slow, [{"x": i} for i in range(6)])
+    assert futures.gather() == list(range(6))
+    assert futures.backups == {}
+
+
+def test_speculative_executor_collects_losing_elements():
+    release = threading.Event()
+
+    def straggle(x: int, attempt: list[int] = []) -> int:
+        attempt.append(x)
+        if attempt.count(x) == 1 and x == 0:
+            release.wait(5)
+        return x
+
+    executor = SpeculativeExecutor(
+        ThreadPoolAsyncExecutor(), quantile=0.5, multiple=2.0, poll_interval=0.01
+    )
+    futures = executor.map(straggle, [{"x": i} for i in range(3)])
+    assert futures.gather() == [0, 1, 2]
+    # the original element 0 lost to its backup, and is collected once it completes
+    assert futures.losers == {0}
+    release.set()
+    while futures.losers:
+        futures.completed()
+        time.sleep(0.01)
+
+
+def test_executors_for_task_resources():
+    hints = TaskResources(memory=4096, timeout=900, cpus=1)
+    lithops = LithopsExecutor()
+    bound = lithops.for_task("f", [], hints)
+    assert (bound.runtime_memory, bound.timeout) == (4096, 900)
+    assert bound.fexec is lithops.fexec
+    # without hints, the config's defaults apply
+    assert lithops.for_task("f", [], TaskResources()) is lithops
+
+    threads = ThreadPoolAsyncExecutor()
+    assert threads.for_task("f", [], TaskResources()) is threads
+    sized = threads.for_task("f", [], TaskResources(cpus=os.cpu_count()))
+    assert sized.pool._max_workers == 1
+    assert sized.call(lambda: 1).gather() == 1
+
+
+def test_lithops_executor_runtime_memory_per_task(monkeypatch):
+    @task(resources=TaskResources(memory=512))
+    def f(a: int) -> int:
+        return a * 2
+
+    executor = LithopsExecutor()
+    submitted: list[dict] = []
+    fexec_map = executor.fexec.map
+
+    def spy(*args, **kwargs):
+        submitted.append(kwargs)
+        return fexec_map(*args, **kwargs)
+
+    # (the localhost backend does not itself record the memory requested per invocation)
+    monkeypatch.setattr(executor.fexec, "map", spy)
+    futures = f.set_executor(executor).map(argnames="a", argvalues=[1, 2])
+    assert futures.gather() == [2, 4]
+    assert submitted[0]["runtime_memory"] == 512
+
+
+@pytest.mark.parametrize("backend, batched", [("localhost", False), ("remote", True)])
+def test_lithops_executor_gather_batched_for_remote_backends(
+    monkeypatch, backend, batched
+):
+    executor = LithopsExecutor()
+    batches: list[int] = []
+    get_result = executor.fexec.get_result
+
+    def spy(fs, *args, **kwargs):
+        batches.append(len(fs))
+        return get_result(fs, *args, **kwargs)
+
+    monkeypatch.setattr(executor.fexec, "get_result", spy)
+    # (the localhost backend stands in for a remote one, as nothing else is running)
+    monkeypatch.setattr(executor.fexec, "backend", backend)
+    futures = executor.map(lambda a: a * 2, [{"a": 1}, {"a": 2}, {"a": 3}])
+    assert futures.gather() == [2, 4, 6]
+    assert batches == ([3] if batched else [])
+
+
+def test_thread_pool_cancel_pending():
+    executor = ThreadPoolAsyncExecutor(pool=concurrent.futures.ThreadPoolExecutor(1))
+    futures = executor.map(lambda a: time.sleep(a), [{"a": 0.2}] * 4)
+    futures.cancel()
+    # the running element completes, but those not yet started are cancelled
+    assert [f.cancelled() for f in futures.futures] == [False, True, True, True]
+
+
+def test_lithops_executor_cancel_clears_jobs(monkeypatch):
+    executor = LithopsExecutor()
+    cleared: list[list[str]] = []
+    monkeypatch.setattr(
+        executor.fexec.compute_handler,
+        "clear",
+        lambda job_keys=None, exception=None: cleared.append(job_keys),
+    )
+    futures = executor.map(lambda a: time.sleep(a), [{"a": 0.5}, {"a": 0.5}])
+    futures.cancel()
+    assert cleared == [[futures.futures[0].job_key]]
+    futures.gather()
+    # completed futures have nothing to cancel
+    futures.cancel()
+    assert len(cleared) == 1
@@ -0,0 +1,45 @@
+import subprocess
+
+from ecoscope_workflows_core import formatting
+from ecoscope_workflows_core.formatting import (
+    deferred_formatting,
+    ruff_format_all,
+    ruff_formatted,
+)
+
+
+@ruff_formatted
+def render(source: str) -> str:
+    return source
+
+
+def test_ruff_format_all_matches_ruff_formatted():
+    sources = ["import os\nx=1", "def f( a ):\n  return {'a':a}", "x=1"]
+    assert ruff_format_all(sources) == [render(s) for s in sources]
+    assert ruff_format_all(sources)[0] == "\nx = 1\n"
+
+
+def test_ruff_format_all_runs_ruff_once_per_batch(monkeypatch):
+    calls = []
+    check_output = subprocess.check_output
+
+    def counting_check_output(args, *a, **kw):
+        calls.append(args[1])
+        return check_output(args, *a, **kw)
+
+    formatting._ruff_version()
+    monkeypatch.setattr(subprocess, "check_output", counting_check_output)
+    sources = [f"y{i}=[{i},{i+1}]" for i in range(5)]
+    assert ruff_format_all(sources) == [f"y{i} = [{i}, {i+1}]\n" for i in range(5)]
+    assert calls == ["format", "check"]
+    # formatted sources are cached by content
+    assert render(sources[3]) == "y3 = [3, 4]\n"
+    assert calls == ["format", "check"]
+
+
+def test_deferred_formatting():
+    with deferred_formatting() as deferred:
+        assert render("a=1") == "a=1"
+        assert render("b=2") == "b=2"
+    assert render("c=3") == "c = 3\n"
+    assert deferred.format() == {"a=1": "a = 1\n", "b=2": "b = 2\n"}
@@ -1,10 +1,37 @@
+import concurrent.futures
+import sys
+import threading
+import time
+from collections import Counter
+import weakref
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Sequence, TypeVar
 
+import pandas as pd
+import pytest
+from pydantic import BaseModel, ConfigDict, ValidationError
+
 from ecoscope_workflows_core.decorators import task
-from ecoscope_workflows_core.executors import Future, FutureSequence, LithopsExecutor
-from ecoscope_workflows_core.graph import DependsOn, DependsOnSequence, Graph, Node
+from ecoscope_workflows_core.executors import (
+    AsyncExecutor,
+    Future,
+    FutureSequence,
+    LithopsExecutor,
+    TaskResources,
+    ThreadPoolAsyncExecutor,
+)
+from ecoscope_workflows_core.executors.base import mapvalues_wrapper
+from ecoscope_workflows_core.graph import (
+    DependsOn,
+    DependsOnSequence,
+    Graph,
+    Node,
+    Scheduler,
+)
+from ecoscope_workflows_core.placement import CostPlacement, payload_bytes
+from ecoscope_workflows_core.priority import CriticalPathPriority
+from ecoscope_workflows_core.retry import RetryPolicy
 
 T = TypeVar("T")
 
@@ -244,3 +271,700 @@ def test_graph_tasks_lithops_partial_map_same_executor_instance():
     graph = Graph(dependencies, nodes)
     results = graph.execute()
     assert set(results) == {0, 1, 2}  # order is not guaranteed
+
+
+@dataclass(frozen=True)
+class ThreadedFuture(Future[T]):
+    future: concurrent.futures.Future
+
+    def gather(self) -> T:
+        return self.future.result()
+
+    def done(self) -> bool:
+        return self.future.done()
+
+
+@pytest.mark.parametrize("scheduler", ["waves", "as-completed"])
+def test_graph_scheduler(scheduler: Scheduler):
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+    submitted: list[str] = []
+
+    @task
+    def sleep_then_return(name: str, seconds: float, x: int = 0) -> ThreadedFuture[int]:
+        submitted.append(name)
+
+        def f():
+            time.sleep(seconds)
+            return x + 1
+
+        return ThreadedFuture(pool.submit(f))
+
+    @task
+    def add(x: int, y: int) -> PassthroughFuture[int]:
+        submitted.append("D")
+        return PassthroughFuture(x + y)
+
+    dependencies = {"A": [], "B": [], "C": ["B"], "D": ["A", "C"]}
+    nodes = {
+        "A": Node(sleep_then_return, {"name": "A", "seconds": 0.5}),
+        "B": Node(sleep_then_return, {"name": "B", "seconds": 0.0}),
+        "C": Node(
+            sleep_then_return, {"name": "C", "seconds": 0.0, "x": DependsOn("B")}
+        ),
+        "D": Node(add, {"x": DependsOn("A"), "y": DependsOn("C")}),
+    }
+    graph = Graph(dependencies, nodes, scheduler=scheduler)
+    assert graph.execute() == 3
+    pool.shutdown()
+    assert submitted[:2] == ["A", "B"]
+    assert submitted[-1] == "D"
+
+
+def test_graph_as_completed_does_not_wait_for_slow_sibling():
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+    events: list[str] = []
+
+    @task
+    def slow() -> ThreadedFuture[int]:
+        def f():
+            time.sleep(0.5)
+            events.append("slow finished")
+            return 1
+
+        return ThreadedFuture(pool.submit(f))
+
+    @task
+    def fast(x: int = 0) -> PassthroughFuture[int]:
+        events.append("fast submitted")
+        return PassthroughFuture(x + 1)
+
+    @task
+    def add(x: int, y: int) -> PassthroughFuture[int]:
+        return PassthroughFuture(x + y)
+
+    dependencies = {"A": [], "B": [], "C": ["B"], "D": ["A", "C"]}
+    nodes = {
+        "A": Node(slow),
+        "B": Node(fast),
+        "C": Node(fast, {"x": DependsOn("B")}),
+        "D": Node(add, {"x": DependsOn("A"), "y": DependsOn("C")}),
+    }
+    graph = Graph(dependencies, nodes, scheduler="as-completed")
+    assert graph.execute() == 3
+    pool.shutdown()
+    # the downstream of the fast branch is submitted before the slow node finishes
+    assert events == ["fast submitted", "fast submitted", "slow finished"]
+
+
+def test_graph_multiple_terminal_nodes_raises():
+    @task
+    def inc(x: int) -> PassthroughFuture[int]:
+        return PassthroughFuture(x + 1)
+
+    dependencies = {"B": ["A"], "C": ["A"]}
+    nodes = {
+        "A": Node(inc, {"x": 1}),
+        "B": Node(inc, {"x": DependsOn("A")}),
+        "C": Node(inc, {"x": DependsOn("A")}),
+    }
+    with pytest.raises(NotImplementedError, match="Multiple terminal nodes"):
+        Graph(dependencies, nodes).execute()
+
+
+class Box:
+    def __init__(self, value: int):
+        self.value = value
+
+
+@dataclass(frozen=True)
+class BoxFuture(Future[Box]):
+    box: Box
+
+    def gather(self) -> Box:
+        return self.box
+
+
+def test_graph_releases_consumed_results():
+    refs: dict[str, weakref.ref] = {}
+    alive_at_submission: dict[str, dict[str, bool]] = {}
+
+    @task
+    def make(name: str, x: Box | None = None, y: Box | None = None) -> BoxFuture:
+        alive_at_submission[name] = {k: r() is not None for k, r in refs.items()}
+        box = Box((x.value if x else 0) + (y.value if y else 0) + 1)
+        refs[name] = weakref.ref(box)
+        return BoxFuture(box)
+
+    dependencies = {"A": [], "B": ["A"], "C": ["A", "B"], "D": ["C"]}
+    nodes = {
+        "A": Node(make, {"name": "A"}),
+        "B": Node(make, {"name": "B", "x": DependsOn("A")}),
+        "C": Node(make, {"name": "C", "x": DependsOn("A"), "y": DependsOn("B")}),
+        "D": Node(make, {"name": "D", "x": DependsOn("C")}),
+    }
+    result = Graph(dependencies, nodes).execute()
+    assert result.value == 5
+    # "A" is still needed by "C" when "B" is submitted
+    assert alive_at_submission["B"] == {"A": True}
+    # but by the time "D" is submitted, only its own input "C" remains
+    assert alive_at_submission["D"] == {"A": False, "B": False, "C": True}
+
+
+def test_graph_priority_submits_critical_path_first(tmp_path):
+    submitted: list[str] = []
+
+    @task
+    def step(name: str, **kw: int) -> PassthroughFuture[int]:
+        submitted.append(name)
+        return PassthroughFuture(1 + sum(kw.values()))
+
+    # "a_settings" sorts first by name, but "get_events_data" heads the longest path
+    dependencies = {
+        "a_settings": [],
+        "get_events_data": [],
+        "events_feature_density": ["get_events_data"],
+        "grouped_fd_ecomap": ["events_feature_density"],
+        "dashboard": ["a_settings", "grouped_fd_ecomap"],
+    }
+    nodes = {
+        name: Node(step, {"name": name} | {d: DependsOn(d) for d in deps})
+        for name, deps in dependencies.items()
+    }
+    assert Graph(dependencies, nodes).execute() == 5
+    assert submitted[:2] == ["a_settings", "get_events_data"]
+
+    submitted.clear()
+    priority = CriticalPathPriority.from_file(tmp_path / "durations.json")
+    assert Graph(dependencies, nodes, priority=priority).execute() == 5
+    assert submitted[:2] == ["get_events_data", "a_settings"]
+    # durations of executed nodes are recorded for subsequent runs
+    assert set(CriticalPathPriority.from_file(priority.path).durations) == set(nodes)
+
+
+class ResultFuture(Future[T]):
+    def __init__(self, result: T):
+        self.result = result
+
+    def gather(self) -> T:
+        return self.result
+
+
+class ResultFutureSequence(FutureSequence[T]):
+    def __init__(self, results: Sequence[T]):
+        self.results = results
+
+    def gather(self) -> Sequence[T]:
+        return self.results
+
+
+class CountingExecutor(AsyncExecutor):
+    def __init__(self):
+        self.invocations = 0
+
+    def call(self, func, *args, **kwargs):
+        self.invocations += 1
+        return ResultFuture(func(*args, **kwargs))
+
+    def map(self, func, iterable):
+        iterable = list(iterable)
+        self.invocations += len(iterable)
+        if isinstance(func, mapvalues_wrapper):
+            return ResultFutureSequence([func(e) for e in iterable])
+        return ResultFutureSequence([func(**e) for e in iterable])
+
+
+def _fusable_graph(executor: AsyncExecutor | str, fuse_chains: bool) -> Graph:
+    @task
+    def groups(n: int) -> list[tuple[str, int]]:
+        return [(str(i), i) for i in range(n)]
+
+    @task
+    def scale(x: int, factor: int) -> int:
+        return x * factor
+
+    @task
+    def inc(x: int) -> int:
+        return x + 1
+
+    @task
+    def total(values: list[tuple[str, int]], offset: int = 0) -> int:
+        return sum(v for _, v in values) + offset
+
+    dependencies = {
+        "groups": [],
+        "scaled": ["groups"],
+        "incremented": ["scaled"],
+        "total": ["incremented"],
+        "result": ["total"],
+    }
+    nodes = {
+        "groups": Node(groups.validate().set_executor(executor), {"n": 3}),
+        "scaled": Node(
+            scale.validate().set_executor(executor),
+            partial={"factor": 10},
+            method="mapvalues",
+            kwargs={"argnames": ["x"], "argvalues": DependsOn("groups")},
+        ),
+        "incremented": Node(
+            inc.validate().set_executor(executor),
+            method="mapvalues",
+            kwargs={"argnames": "x", "argvalues": DependsOn("scaled")},
+        ),
+        "total": Node(
+            total.validate().set_executor(executor),
+            {"values": DependsOn("incremented"), "offset": 100},
+        ),
+        "result": Node(
+            inc.validate().set_executor(executor), {"x": DependsOn("total")}
+        ),
+    }
+    return Graph(dependencies, nodes, fuse_chains=fuse_chains)
+
+
+def test_graph_fused():
+    fused = _fusable_graph(CountingExecutor(), fuse_chains=False).fused()
+    # the "mapvalues" and "call" chains are each collapsed into their last node
+    assert fused.dependencies == {
+        "groups": [],
+        "incremented": ["groups"],
+        "result": ["incremented"],
+    }
+
+
+def test_graph_fused_merges_resources():
+    @task(resources=TaskResources(memory=512, cheap=True, pure=True))
+    def load(x: int) -> int:
+        return x
+
+    @task(resources=TaskResources(memory=4096, timeout=600, pure=True))
+    def transform(x: int) -> int:
+        return x + 1
+
+    @task(resources=TaskResources(memory=1024, timeout=60, cheap=True))
+    def describe(x: int) -> str:
+        return str(x)
+
+    dependencies = {"load": [], "transform": ["load"], "describe": ["transform"]}
+    executor = CountingExecutor()
+    nodes = {
+        "load": Node(load.set_executor(executor), {"x": 1}),
+        "transform": Node(transform.set_executor(executor), {"x": DependsOn("load")}),
+        "describe": Node(
+            describe.set_executor(executor), {"x": DependsOn("transform")}
+        ),
+    }
+    fused = Graph(dependencies, nodes).fused()
+    assert list(fused.nodes) == ["describe"]
+    assert fused.nodes["describe"].async_task.resources == TaskResources(
+        memory=4096, timeout=600, cheap=False, pure=False
+    )
+    assert fused.execute() == "2"
+    assert executor.invocations == 1
+
+
+@pytest.mark.parametrize("fuse_chains", [True, False])
+def test_graph_fuse_chains_invocations(fuse_chains: bool):
+    executor = CountingExecutor()
+    assert _fusable_graph(executor, fuse_chains).execute() == 134
+    # 1 + 3 + 3 + 1 + 1 invocations unfused, versus 1 + 3 + 1 fused
+    assert executor.invocations == (5 if fuse_chains else 9)
+
+
+def test_graph_fuse_chains_lithops():
+    assert _fusable_graph("lithops", fuse_chains=True).execute() == 134
+
+
+class ClosingExecutor(CountingExecutor):
+    def __init__(self):
+        super().__init__()
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_graph_session_executor(fail: bool):
+    session = ClosingExecutor()
+
+    @task
+    def inc(x: int) -> int:
+        if fail:
+            raise ValueError("boom")
+        return x + 1
+
+    dependencies = {"A": [], "B": ["A"]}
+    nodes = {
+        # nodes' own executors are unused, in favor of the session executor
+        "A": Node(inc.set_executor(CountingExecutor()), {"x": 1}),
+        "B": Node(inc.set_executor(CountingExecutor()), {"x": DependsOn("A")}),
+    }
+    graph = Graph(dependencies, nodes, executor=session)
+    if fail:
+        with pytest.raises(ValueError, match="boom"):
+            graph.execute()
+    else:
+        assert graph.execute() == 3
+        assert session.invocations == 2
+    assert all(n.async_task.executor.invocations == 0 for n in nodes.values())
+    assert session.closed
+
+
+def test_graph_session_executor_lithops():
+    @task
+    def inc(x: int) -> int:
+        return x + 1
+
+    session = LithopsExecutor()
+    dependencies = {"A": [], "B": ["A"], "C": ["B"]}
+    nodes = {
+        "A": Node(inc.set_executor(session), {"x": 1}),
+        "B": Node(inc.set_executor(session), {"x": DependsOn("A")}),
+        "C": Node(inc.set_executor(session), {"x": DependsOn("B")}),
+    }
+    graph = Graph(dependencies, nodes, scheduler="as-completed", executor=session)
+    assert graph.execute() == 4
+    assert len(session.fexec.futures) == 3
+
+
+def _pipelined_graph(executor: AsyncExecutor, events: list[str]) -> Graph:
+    @task
+    def groups() -> list[tuple[str, float]]:
+        return [("slow", 0.5), ("fast", 0.0), ("faster", 0.0)]
+
+    @task
+    def render(seconds: float) -> float:
+        time.sleep(seconds)
+        return seconds
+
+    @task
+    def persist(seconds: float, suffix: str) -> str:
+        events.append(f"persisted {seconds}")
+        return f"{seconds}{suffix}"
+
+    dependencies = {"groups": [], "render": ["groups"], "persist": ["render"]}
+    nodes = {
+        "groups": Node(groups.set_executor(executor)),
+        "render": Node(
+            render.set_executor(executor),
+            method="mapvalues",
+            kwargs={"argnames": ["seconds"], "argvalues": DependsOn("groups")},
+        ),
+        "persist": Node(
+            persist.set_executor(executor),
+            partial={"suffix": "s"},
+            method="mapvalues",
+            kwargs={"argnames": ["seconds"], "argvalues": DependsOn("render")},
+        ),
+    }
+    return Graph(
+        dependencies,
+        nodes,
+        scheduler="as-completed",
+        poll_interval=0.01,
+        executor=executor,
+        pipeline=True,
+    )
+
+
+def test_graph_pipeline_starts_downstream_elements_early():
+    events: list[str] = []
+    graph = _pipelined_graph(ThreadPoolAsyncExecutor(), events)
+    assert graph.execute() == [("slow", "0.5s"), ("fast", "0.0s"), ("faster", "0.0s")]
+    # the fast groups are persisted while the slow group is still rendering
+    assert events == ["persisted 0.0", "persisted 0.0", "persisted 0.5"]
+
+
+def test_graph_pipeline_lithops():
+    graph = _pipelined_graph(LithopsExecutor(), [])
+    assert graph.execute() == [("slow", "0.5s"), ("fast", "0.0s"), ("faster", "0.0s")]
+
+
+def test_graph_placement_runs_cheap_nodes_inline(tmp_path):
+    @task
+    def inc(x: int) -> int:
+        return x + 1
+
+    @task
+    def slow_inc(x: int) -> int:
+        time.sleep(0.1)
+        return x + 1
+
+    @task(tags=["io"])
+    def fetch(x: int) -> int:
+        return x + 1
+
+    def graph(executor: CountingExecutor, placement: CostPlacement) -> Graph:
+        dependencies = {"A": [], "B": ["A"], "C": ["B"], "D": ["C"]}
+        nodes = {
+            "A": Node(fetch.set_executor(executor), {"x": 0}),
+            "B": Node(inc.set_executor(executor), {"x": DependsOn("A")}),
+            "C": Node(slow_inc.set_executor(executor), {"x": DependsOn("B")}),
+            "D": Node(
+                inc.set_executor(executor),
+                method="map",
+                kwargs={
+                    "argnames": "x",
+                    "argvalues": DependsOnSequence([DependsOn("C")]),
+                },
+            ),
+        }
+        return Graph(dependencies, nodes, placement=placement)
+
+    path = tmp_path / "placement.json"
+    executor = CountingExecutor()
+    assert graph(executor, CostPlacement.from_file(path)).execute() == [4]
+    # only the io-tagged node, and the (single element of the) mapped node, which is not
+    # hinted as cheap, are submitted to the executor on the first run
+    assert executor.invocations == 2
+    # the slow node was recorded as such, and so is placed on the executor on the next run
+    executor = CountingExecutor()
+    assert graph(executor, CostPlacement.from_file(path)).execute() == [4]
+    assert executor.invocations == 3
+
+
+def test_placement_payload_bytes_measures_wrapped_frames():
+    @dataclass
+    class Layer:
+        df: pd.DataFrame
+        name: str
+
+    class Model(BaseModel):
+        model_config = ConfigDict(arbitrary_types_allowed=True)
+
+        layers: list[Layer]
+
+    df = pd.DataFrame({"x": range(100_000)})
+    assert payload_bytes(Layer(df, "a")) > 100_000 * 8
+    assert payload_bytes(Model(layers=[Layer(df, "a")])) > 100_000 * 8
+    assert payload_bytes(Model(layers=[])) < 1024
+    # objects which cannot be measured are taken to be large
+    assert payload_bytes({"f": threading.Lock()}) == sys.maxsize
+    placement = CostPlacement()
+    assert not placement.inline("ecomap", [], [{"layer": Layer(df, "a")}])
+    # mapped nodes are only run inline if hinted as cheap
+    assert not placement.inline("scale", [], [{"argvalues": [1]}], method="map")
+    assert placement.inline(
+        "scale", [], [{"argvalues": [1]}], TaskResources(cheap=True), method="map"
+    )
+
+
+def test_placement_is_opt_in(monkeypatch):
+    assert CostPlacement.from_env() is None
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_PLACEMENT_ENABLED", "true")
+    assert isinstance(CostPlacement.from_env(), CostPlacement)
+
+
+def _flaky_graph(
+    attempts: Counter, fail: dict[int, int], scheduler: Scheduler, **node_kwargs
+) -> Graph:
+    """A graph which uploads each of 6 elements, of which element `i` fails its first
+    `fail[i]` attempts."""
+
+    @task
+    def groups(n: int) -> list[tuple[str, int]]:
+        return [(str(i), i) for i in range(n)]
+
+    @task(tags=["io"])
+    def upload(x: int) -> int:
+        attempts[x] += 1
+        if attempts[x] <= fail.get(x, 0):
+            raise ConnectionError(f"Upload of {x} failed")
+        return x * 10
+
+    executor = ThreadPoolAsyncExecutor()
+    dependencies = {"groups": [], "upload": ["groups"]}
+    nodes = {
+        "groups": Node(groups.set_executor(executor), {"n": 6}),
+        "upload": Node(
+            upload.set_executor(executor),
+            method="mapvalues",
+            kwargs={"argnames": "x", "argvalues": DependsOn("groups")},
+            **node_kwargs,
+        ),
+    }
+    return Graph(dependencies, nodes, scheduler=scheduler, poll_interval=0.01)
+
+
+@pytest.mark.parametrize("scheduler", ["waves", "as-completed"])
+def test_graph_retries_only_failed_elements(scheduler: Scheduler):
+    attempts: Counter = Counter()
+    policy = RetryPolicy(attempts=2, backoff=0.01)
+    graph = _flaky_graph(attempts, {2: 1, 5: 2}, scheduler, retry=policy)
+    assert graph.execute() == [(str(i), i * 10) for i in range(6)]
+    assert attempts == {0: 1, 1: 1, 2: 2, 3: 1, 4: 1, 5: 3}
+
+
+def test_graph_retries_exhausted_raises():
+    attempts: Counter = Counter()
+    policy = RetryPolicy(attempts=1)
+    graph = _flaky_graph(attempts, {3: 2}, "as-completed", retry=policy)
+    with pytest.raises(ConnectionError, match="Upload of 3 failed"):
+        graph.execute()
+    assert attempts[3] == 2
+
+
+def test_graph_retry_policy_default_from_tags(monkeypatch):
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_RETRY_IO_BACKOFF", "0.01")
+    attempts: Counter = Counter()
+    # io-tagged tasks are retried by default
+    assert _flaky_graph(attempts, {1: 3}, "as-completed").execute()[1] == ("1", 10)
+    assert attempts[1] == 4
+    # unless retries are disabled
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_RETRY_ENABLED", "false")
+    attempts.clear()
+    with pytest.raises(ConnectionError):
+        _flaky_graph(attempts, {1: 1}, "as-completed").execute()
+    assert attempts[1] == 1
+
+
+def test_graph_retries_call_node():
+    attempts: Counter = Counter()
+
+    @task(resources=TaskResources(pure=True))
+    def flaky(x: int) -> int:
+        attempts[x] += 1
+        if attempts[x] == 1:
+            raise RuntimeError("Worker evicted")
+        return x + 1
+
+    executor = ThreadPoolAsyncExecutor()
+    graph = Graph(
+        {"A": []},
+        {"A": Node(flaky.set_executor(executor), {"x": 1})},
+        scheduler="as-completed",
+    )
+    # pure tasks are resubmitted (once) by default
+    assert graph.execute() == 2
+    assert attempts[1] == 2
+
+
+@pytest.mark.parametrize("method", ["call", "map"])
+def test_graph_does_not_retry_deterministic_errors(method):
+    attempts: Counter = Counter()
+
+    class Params(BaseModel):
+        x: int
+
+    @task(resources=TaskResources(pure=True, retries=3))
+    def parse(x: str) -> int:
+        attempts[x] += 1
+        return Params(x=x).x
+
+    executor = ThreadPoolAsyncExecutor()
+    node = (
+        Node(parse.set_executor(executor), {"x": "one"})
+        if method == "call"
+        else Node(
+            parse.set_executor(executor),
+            method="map",
+            kwargs={"argnames": "x", "argvalues": ["1", "one"]},
+        )
+    )
+    graph = Graph({"A": []}, {"A": node}, scheduler="as-completed")
+    with pytest.raises(ValidationError):
+        graph.execute()
+    assert attempts["one"] == 1
+
+
+def test_persist_text_is_retried_with_backoff(monkeypatch, tmp_path):
+    from ecoscope_workflows_core.tasks.io import _persist, persist_text
+
+    policy = RetryPolicy.for_task(persist_text.tags, persist_text.resources)
+    assert policy.attempts == 3
+    assert 1.0 <= policy.delay(1) < policy.delay(2)
+
+    attempts: list[float] = []
+    persist = _persist._persist_text
+
+    def flaky_persist(text: str, root_path: str, filename: str) -> str:
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise ConnectionError("503 Service Unavailable")
+        return persist(text, root_path, filename)
+
+    monkeypatch.setattr(_persist, "_persist_text", flaky_persist)
+    node = Node(
+        persist_text.set_executor(ThreadPoolAsyncExecutor()),
+        {"text": "<html/>", "root_path": str(tmp_path), "filename": "a.html"},
+    )
+    graph = Graph({"A": []}, {"A": node}, scheduler="as-completed", poll_interval=0.01)
+    assert graph.execute().endswith("a.html")
+    assert len(attempts) == 2
+    assert attempts[1] - attempts[0] >= 1.0
+
+
+def _failing_graph(ran: list[int], scheduler: Scheduler) -> Graph:
+    @task
+    def fail() -> int:
+        time.sleep(0.05)
+        raise ValueError("Node failed")
+
+    @task
+    def slow(x: int) -> int:
+        time.sleep(0.1)
+        ran.append(x)
+        return x
+
+    @task
+    def combine(a: int, b: list[int]) -> int:
+        return a + sum(b)
+
+    # one worker, so that the slow elements are queued behind each other
+    executor = ThreadPoolAsyncExecutor(pool=concurrent.futures.ThreadPoolExecutor(1))
+    dependencies = {"A": [], "B": [], "C": ["A", "B"]}
+    nodes = {
+        "A": Node(fail.set_executor(ThreadPoolAsyncExecutor())),
+        "B": Node(
+            slow.set_executor(executor),
+            method="map",
+            kwargs={"argnames": "x", "argvalues": list(range(10))},
+        ),
+        "C": Node(
+            combine.set_executor(executor),
+            {"a": DependsOn("A"), "b": DependsOn("B")},
+        ),
+    }
+    return Graph(dependencies, nodes, scheduler=scheduler, poll_interval=0.01)
+
+
+@pytest.mark.parametrize("scheduler", ["waves", "as-completed"])
+def test_graph_failure_cancels_outstanding_work(scheduler: Scheduler):
+    ran: list[int] = []
+    with pytest.raises(ValueError, match="Node failed"):
+        _failing_graph(ran, scheduler).execute()
+    time.sleep(0.3)
+    # the elements of the sibling map which had not started by the failure never run
+    assert len(ran) < 10
+
+
+@pytest.mark.parametrize("scheduler", ["waves", "as-completed"])
+def test_graph_deadline_cancels_outstanding_work(scheduler: Scheduler):
+    ran: list[int] = []
+
+    @task
+    def slow(x: int) -> int:
+        time.sleep(0.1)
+        ran.append(x)
+        return x
+
+    executor = ThreadPoolAsyncExecutor(pool=concurrent.futures.ThreadPoolExecutor(1))
+    graph = Graph(
+        {"A": []},
+        {
+            "A": Node(
+                slow.set_executor(executor),
+                method="map",
+                kwargs={"argnames": "x", "argvalues": list(range(20))},
+            )
+        },
+        scheduler=scheduler,
+        poll_interval=0.01,
+        deadline=0.25,
+    )
+    start = time.monotonic()
+    with pytest.raises(TimeoutError, match="deadline"):
+        graph.execute()
+    assert time.monotonic() - start < 1
+    time.sleep(0.3)
+    assert len(ran) < 20
@@ -0,0 +1,98 @@
+import json
+import subprocess
+import sys
+
+import pydantic
+import pytest
+
+from ecoscope_workflows_core.registry import (
+    RegistrySettings,
+    _ecoscope_workflows_entry_points,
+    _package_dirs,
+    _source_fingerprint,
+    collect_task_entries,
+    import_task_entries,
+    load_manifest,
+    manifest_key,
+    save_manifest,
+)
+
+
+@pytest.fixture
+def manifest_path(monkeypatch, tmp_path):
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_REGISTRY_CACHE_DIR", str(tmp_path))
+    return RegistrySettings().manifest_path
+
+
+def test_manifest_roundtrip(manifest_path):
+    eps = _ecoscope_workflows_entry_points()
+    imported = import_task_entries(eps)
+    key = manifest_key(eps)
+    save_manifest(manifest_path, key, imported)
+
+    loaded = load_manifest(manifest_path, key)
+    assert loaded is not None
+    assert loaded.keys() == imported.keys()
+    for name, kt in loaded.items():
+        expected = imported[name]
+        assert kt.importable_reference == expected.importable_reference
+        assert (kt.tags, kt.resources) == (expected.tags, expected.resources)
+        assert kt.parameters_jsonschema() == expected.parameters_jsonschema()
+    # omitting args does not alter the cached schema
+    schema = loaded["set_groupers"].parameters_jsonschema(omit_args=["groupers"])
+    assert "groupers" not in schema["properties"]
+    assert "groupers" in loaded["set_groupers"].parameters_jsonschema()["properties"]
+
+
+def test_manifest_invalidated_by_key(manifest_path):
+    eps = _ecoscope_workflows_entry_points()
+    save_manifest(manifest_path, "stale", import_task_entries(eps))
+    assert load_manifest(manifest_path, manifest_key(eps)) is None
+    # collecting rewrites the stale manifest
+    collect_task_entries()
+    assert json.loads(manifest_path.read_text())["key"] == manifest_key(eps)
+
+
+def test_manifest_key_fingerprints_package_source_only(monkeypatch):
+    eps = _ecoscope_workflows_entry_points()
+    key = manifest_key(eps)
+    [core] = [ep for ep in eps if ep.value == "ecoscope_workflows_core.tasks"]
+    [pkg] = _package_dirs(core)
+    assert pkg.name == "ecoscope_workflows_core"
+    assert all(
+        path.startswith("ecoscope_workflows_core/")
+        for path, *_ in _source_fingerprint(core)
+    )
+    # the key changes with the version of pydantic, which generates the cached schemas
+    monkeypatch.setattr(pydantic, "VERSION", "0.0.0")
+    assert manifest_key(eps) != key
+
+
+def test_manifest_disabled(monkeypatch, manifest_path):
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_REGISTRY_MANIFEST", "false")
+    assert collect_task_entries()
+    assert not manifest_path.exists()
+
+
+def test_known_tasks_from_manifest_without_importing_tasks(manifest_path):
+    collect_task_entries()
+    code = (
+        "import sys\n"
+        "from ecoscope_workflows_core.registry import known_tasks\n"
+        "assert 'set_groupers' in known_tasks\n"
+        "tasks = [m for m in sys.modules if m.startswith('ecoscope_workflows') and '.tasks' in m]\n"
+        "assert not tasks, tasks\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_parameters_jsonschema_memoized(monkeypatch):
+    kt = import_task_entries(_ecoscope_workflows_entry_points())["set_groupers"]
+    schema = kt.parameters_jsonschema()
+    # the schema is only generated once, and each call returns an independent copy
+    monkeypatch.setattr(type(kt), "task", property(lambda self: 1 / 0))
+    schema["properties"].clear()
+    assert "groupers" in kt.parameters_jsonschema()["properties"]
+    omitted = kt.parameters_jsonschema(omit_args=["groupers"])
+    assert omitted["properties"] == {}
+    assert omitted == kt.parameters_jsonschema(omit_args=["groupers", "groupers"])
@@ -0,0 +1,93 @@
+import pandas as pd
+import pandera as pa
+import pandera.typing as pa_typing
+import pytest
+from pydantic import ValidationError
+
+from ecoscope_workflows_core.annotations import (
+    DataFrame,
+    JsonSerializableDataFrameModel,
+)
+from ecoscope_workflows_core.decorators import task
+from ecoscope_workflows_core.validation import ValidatedCall
+
+
+class PositiveSchema(JsonSerializableDataFrameModel):
+    a: pa_typing.Series[int] = pa.Field(ge=0)
+
+
+@task
+def total(df: DataFrame[PositiveSchema], offset: int) -> int:
+    return int(df["a"].sum()) + offset
+
+
+@pytest.fixture
+def negative_row():
+    return pd.DataFrame({"a": [1, 2, -3]})
+
+
+@pytest.fixture
+def wrong_dtype():
+    return pd.DataFrame({"a": ["x", "y"]})
+
+
+def test_validation_mode_full(negative_row, wrong_dtype):
+    assert total.validate().func is total.validate("full").func
+    with pytest.raises(ValidationError):
+        total.validate().call(df=negative_row, offset=0)
+    with pytest.raises(ValidationError):
+        total.validate().call(df=wrong_dtype, offset=0)
+
+
+def test_validation_mode_schema_only(negative_row, wrong_dtype):
+    validated = total.validate("schema-only")
+    assert isinstance(validated.func, ValidatedCall)
+    # rows are not checked, but columns and dtypes are
+    assert validated.call(df=negative_row, offset=0) == 0
+    with pytest.raises(ValidationError):
+        validated.call(df=wrong_dtype, offset=0)
+
+
+def test_validation_mode_is_memoized(monkeypatch):
+    validated = total.validate("schema-only")
+    # the same callable, and so the same call plan, is reused for each mode
+    assert validated.func is total.validate("schema-only").func
+    assert validated.plan is total.validate("schema-only").plan
+    assert validated.func is not total.validate("off").func
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_VALIDATION_SAMPLE_ROWS", "10")
+    sampled = total.validate("sample").func
+    assert sampled.sample_rows == 10
+    assert sampled is total.validate("sample").func
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_VALIDATION_SAMPLE_ROWS", "20")
+    assert total.validate("sample").func.sample_rows == 20
+
+
+def test_validation_mode_sample(negative_row):
+    # the sample covers every row of a small frame
+    with pytest.raises(ValueError, match="Sampled rows failed validation"):
+        total.validate("sample").call(df=negative_row, offset=0)
+    assert total.validate("sample").call(df=negative_row.iloc[:2], offset=1) == 4
+
+
+def test_validation_mode_off(wrong_dtype):
+    assert total.validate("off").call(df=pd.DataFrame({"a": [-1]}), offset=0) == -1
+    # other parameters are still validated (and parsed)
+    assert total.validate("off").call(df=pd.DataFrame({"a": [1]}), offset="2") == 3
+    with pytest.raises(ValidationError):
+        total.validate("off").call(df=wrong_dtype, offset="x")
+
+
+def test_validation_mode_from_env(monkeypatch, negative_row):
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_VALIDATION_MODE", "schema-only")
+    assert total.validate().call(df=negative_row, offset=0) == 0
+    # the mode is fixed when the task is validated, wherever it is later called
+    validated = total.validate()
+    monkeypatch.setenv("ECOSCOPE_WORKFLOWS_VALIDATION_MODE", "full")
+    assert validated.call(df=negative_row, offset=0) == 0
+
+
+def test_validation_mode_map(negative_row):
+    validated = total.validate("schema-only").set_executor("threads")
+    assert validated.partial(offset=1).map(
+        argnames="df", argvalues=[negative_row]
+    ).gather() == [1]
@@ -8,6 +8,7 @@ from ecoscope_workflows_core.annotations import (
     JsonSerializableDataFrameModel,
 )
 from ecoscope_workflows_core.decorators import task
+from ecoscope_workflows_core.executors import TaskResources
 from pydantic import Field
 
 
@@ -17,7 +18,7 @@ class TimeDensityReturnGDFSchema(JsonSerializableDataFrameModel):
     area_sqkm: pa_typing.Series[float] = pa.Field()
 
 
-@task
+@task(resources=TaskResources(memory=4096, pure=True))
 def calculate_time_density(
     trajectory_gdf: Annotated[
         AnyGeoDataFrame,
@@ -754,6 +754,8 @@ def test_per_taskinstance_omit_args():
         "groupers": ["return"],
         "split_obs": ["return", "df", "groupers"],
     }
+    # computed once per compiler
+    assert dc.per_taskinstance_omit_args is dc.per_taskinstance_omit_args
 
 
 def test_duplicate_argnames_dont_result_in_omissions():